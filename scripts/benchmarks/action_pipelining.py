@@ -0,0 +1,80 @@
+"""Remote training step of the duet MNIST example, with and without Client.pipeline.
+
+The model is a smaller MLP and the batch is random so nothing has to be
+downloaded; the number of actions per step is what matters here.
+
+Run with: python scripts/benchmarks/action_pipelining.py
+"""
+# stdlib
+import time
+from typing import Any
+
+# third party
+import torch as th
+
+# syft absolute
+import syft as sy
+
+STEPS = 20
+
+
+class SyNet(sy.Module):
+    def __init__(self, torch_ref: Any) -> None:
+        super(SyNet, self).__init__(torch_ref=torch_ref)
+        self.fc1 = self.torch_ref.nn.Linear(784, 128)
+        self.fc2 = self.torch_ref.nn.Linear(128, 10)
+
+    def forward(self, x: Any) -> Any:
+        x = self.fc1(x)
+        x = self.torch_ref.nn.functional.relu(x)
+        x = self.fc2(x)
+        output = self.torch_ref.nn.functional.log_softmax(x, dim=1)
+        return output
+
+
+def bench_action_pipelining() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    client = alice.get_root_client()
+    remote_torch = client.torch
+
+    model = SyNet(torch_ref=th).send(client)
+    optimizer = remote_torch.optim.SGD(model.parameters(), lr=0.1)
+    data_ptr = th.rand(64, 784).send(client)
+    target_ptr = th.randint(0, 10, (64,)).send(client)
+
+    def train_step() -> Any:
+        optimizer.zero_grad()
+        output = model(data_ptr)
+        loss = remote_torch.nn.functional.nll_loss(output, target_ptr)
+        loss.backward()
+        optimizer.step()
+        return loss
+
+    def pipelined_train_step() -> Any:
+        with client.pipeline():
+            return train_step()
+
+    results = {}
+    steps = {
+        "one message per action": train_step,
+        "pipelined": pipelined_train_step,
+    }
+    for name, step in steps.items():
+        message_counter = alice.message_counter
+        start = time.perf_counter()
+        for _ in range(STEPS):
+            loss = step()
+        seconds = (time.perf_counter() - start) / STEPS
+        messages = (alice.message_counter - message_counter) / STEPS
+        results[name] = (seconds, messages)
+
+    print()
+    for name, (seconds, messages) in results.items():
+        print(f"{name:>25}: {seconds * 1e3:8.2f} ms/step {messages:6.1f} msgs/step")
+
+    assert loss.get() is not None
+    assert results["pipelined"][1] < results["one message per action"][1]
+
+
+if __name__ == "__main__":
+    bench_action_pipelining()
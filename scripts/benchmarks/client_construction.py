@@ -0,0 +1,49 @@
+"""Client construction time and memory per 100 clients.
+
+Every client used to rebuild the whole lib_ast with create_lib_ast and then walk
+it to attach itself, now they all share sy.lib_ast through an AttributeProxy.
+The time of one create_lib_ast is printed for comparison.
+
+Run with: python scripts/benchmarks/client_construction.py
+"""
+# stdlib
+import resource
+import sys
+import time
+
+# syft absolute
+import syft as sy
+from syft.lib import create_lib_ast
+
+NUMBER = 100
+
+
+def max_rss_mb() -> float:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes on linux
+    return max_rss / 2 ** 20 if sys.platform == "darwin" else max_rss / 2 ** 10
+
+
+def bench_client_construction() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice.get_client()
+
+    rss_before = max_rss_mb()
+    start = time.perf_counter()
+    clients = [alice.get_client() for _ in range(NUMBER)]
+    seconds = time.perf_counter() - start
+    rss = max_rss_mb() - rss_before
+
+    start = time.perf_counter()
+    create_lib_ast()
+    rebuild_seconds = time.perf_counter() - start
+
+    print()
+    print(f"{NUMBER} clients: {seconds * 1e3:10.1f} ms {rss:8.1f} MB max RSS growth")
+    print(f"   one create_lib_ast: {rebuild_seconds * 1e3:10.1f} ms")
+
+    assert len({id(client.torch.attr) for client in clients}) == 1
+
+
+if __name__ == "__main__":
+    bench_client_construction()
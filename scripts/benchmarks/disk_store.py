@@ -0,0 +1,97 @@
+"""Sustained SaveObjectAction throughput on a Domain backed by a DiskObjectStore.
+
+"commit every write" is what the DiskObjectStore always did before write-behind.
+The writes are also timed on the store alone, without the message handling.
+
+Run with: python scripts/benchmarks/disk_store.py
+"""
+# stdlib
+from pathlib import Path
+import tempfile
+import time
+from typing import Any
+from typing import Dict
+
+# third party
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.common.uid import UID
+from syft.core.node.common.action.save_object_action import SaveObjectAction
+from syft.core.store.store_disk import DiskObjectStore
+from syft.core.store.storeable_object import StorableObject
+
+NUMBER = 500
+
+
+def actions_per_second(db_path: str, store_options: Dict[str, Any]) -> float:
+    domain = sy.Domain(name="alice", db_path=db_path, store_options=store_options)
+    client = domain.get_root_client()
+
+    msgs = [
+        SaveObjectAction(
+            id_at_location=UID(), obj=th.rand(16, 16), address=client.address
+        ).sign(signing_key=client.signing_key)
+        for _ in range(NUMBER)
+    ]
+
+    start = time.perf_counter()
+    for msg in msgs:
+        domain.recv_immediate_msg_without_reply(msg=msg)
+    domain.store.commit(blocking=True)
+    seconds = time.perf_counter() - start
+
+    assert len(domain.store) == NUMBER
+    domain.store.close()
+    return NUMBER / seconds
+
+
+def writes_per_second(db_path: str, store_options: Dict[str, Any]) -> float:
+    store = DiskObjectStore(db_path=db_path, **store_options)
+    objs = [StorableObject(id=UID(), data=th.rand(16, 16)) for _ in range(NUMBER)]
+
+    start = time.perf_counter()
+    for obj in objs:
+        store[obj.id] = obj
+    store.commit(blocking=True)
+    seconds = time.perf_counter() - start
+
+    store.close()
+    return NUMBER / seconds
+
+
+def bench_disk_store(tmp_path: Path) -> None:
+    results = {}
+    for name, store_options in [
+        ("commit every write", {}),
+        ("write-behind 100", {"commit_every": 100, "commit_interval": 1.0}),
+        (
+            "WAL, write-behind 100",
+            {
+                "journal_mode": "WAL",
+                "synchronous": "NORMAL",
+                "commit_every": 100,
+                "commit_interval": 1.0,
+            },
+        ),
+        ("WAL, synchronous=FULL", {"journal_mode": "WAL", "synchronous": "FULL"}),
+    ]:
+        results[name] = (
+            actions_per_second(
+                db_path=str(tmp_path / f"{name}.sqlite"), store_options=store_options
+            ),
+            writes_per_second(
+                db_path=str(tmp_path / f"{name} store.sqlite"),
+                store_options=store_options,
+            ),
+        )
+
+    print()
+    for name, (msgs_per_sec, writes_per_sec) in results.items():
+        print(f"{name:>25}: {msgs_per_sec:10.1f} msg/s {writes_per_sec:10.1f} writes/s")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        bench_disk_store(tmp_path=Path(tmp_dir))
@@ -0,0 +1,108 @@
+"""Time for two Duet peers to connect through the signaling server of
+grid/example_nodes/network.py running locally, with the signaling messages
+pushed over websockets and polled over HTTP.
+
+Run with: python scripts/benchmarks/duet_signaling.py
+"""
+# stdlib
+from contextlib import contextmanager
+import os
+from pathlib import Path
+import socket
+import subprocess
+import sys
+import threading
+import time
+from typing import Iterator
+from typing import List
+
+# third party
+import requests
+
+# syft absolute
+import syft as sy
+from syft.core.node.domain.domain import Domain
+from syft.grid.duet import WebRTCDuet
+from syft.grid.duet.om_signaling_client import register
+
+CONNECTIONS = 5
+NETWORK = Path(sy.__file__).parent / "grid" / "example_nodes" / "network.py"
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def run_network() -> Iterator[str]:
+    port = free_port()
+    node = subprocess.Popen(  # nosec
+        [sys.executable, str(NETWORK)],
+        env={**os.environ, "PORT": str(port), "WS_PORT": str(free_port())},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    while True:
+        try:
+            requests.get(url + "/metadata")
+            break
+        except requests.ConnectionError:
+            time.sleep(0.1)
+
+    try:
+        yield url
+    finally:
+        node.terminate()
+        node.wait()
+
+
+def time_to_connected(url: str, push: bool) -> float:
+    launcher = register(url=url, push=push)
+    joiner = register(url=url, push=push)
+    assert launcher.pushed == joiner.pushed == push
+
+    def join() -> None:
+        WebRTCDuet(
+            node=Domain(name="Joiner"),
+            target_id=launcher.duet_id,
+            signaling_client=joiner,
+            offer=False,
+        )
+
+    start = time.perf_counter()
+    thread = threading.Thread(target=join)
+    thread.start()
+    duet = WebRTCDuet(
+        node=Domain(name="Launcher"),
+        target_id=joiner.duet_id,
+        signaling_client=launcher,
+        offer=True,
+    )
+    thread.join()
+    elapsed = time.perf_counter() - start
+
+    launcher.close()
+    joiner.close()
+    duet.close()
+    return elapsed
+
+
+def bench_duet_signaling(url: str) -> None:
+    print(f"\ntypecheck mode: {sy.get_typecheck_mode()}")
+    for push in [True, False]:
+        times: List[float] = [
+            time_to_connected(url=url, push=push) for _ in range(CONNECTIONS)
+        ]
+        times.sort()
+        print(
+            f"{'pushed' if push else 'polled'}: connected in "
+            + f"{times[len(times) // 2] * 1000:.0f} ms (median of {CONNECTIONS})"
+        )
+
+
+if __name__ == "__main__":
+    with run_network() as url:
+        bench_duet_signaling(url=url)
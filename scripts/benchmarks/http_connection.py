@@ -0,0 +1,98 @@
+"""Throughput of messages sent over an HTTPConnection to the Flask node of
+grid/example_nodes/network.py running locally, one at a time and with
+requests in flight at once.
+
+Run with: python scripts/benchmarks/http_connection.py
+"""
+# stdlib
+from contextlib import contextmanager
+import os
+from pathlib import Path
+import socket
+import subprocess
+import sys
+import time
+from typing import Iterator
+
+# third party
+from nacl.signing import SigningKey
+import requests
+
+# syft absolute
+import syft as sy
+from syft.core.io.address import Address
+from syft.core.node.network.client import NetworkClient
+from syft.grid.connections.http_connection import HTTPConnection
+from syft.grid.services.signaling_service import RegisterNewPeerMessage
+
+REQUESTS = 500
+NETWORK = Path(sy.__file__).parent / "grid" / "example_nodes" / "network.py"
+
+
+@contextmanager
+def run_network() -> Iterator[str]:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+
+    node = subprocess.Popen(  # nosec
+        [sys.executable, str(NETWORK)],
+        env={**os.environ, "PORT": str(port)},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    while True:
+        try:
+            requests.get(url + "/metadata")
+            break
+        except requests.ConnectionError:
+            time.sleep(0.1)
+
+    try:
+        yield url
+    finally:
+        node.terminate()
+        node.wait()
+
+
+def register(conn: HTTPConnection) -> RegisterNewPeerMessage:
+    spec_location, _, _ = NetworkClient.deserialize_client_metadata_from_node(
+        metadata=conn._get_metadata()
+    )
+    return RegisterNewPeerMessage(
+        address=Address(network=spec_location), reply_to=Address()
+    ).sign(signing_key=SigningKey.generate())
+
+
+def bench_http_connection(url: str) -> None:
+    print(f"\ntypecheck mode: {sy.get_typecheck_mode()}")
+
+    conn = HTTPConnection(url=url)
+    msg = register(conn)
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        conn.send_immediate_msg_with_reply(msg=msg)
+    elapsed = time.perf_counter() - start
+    conn.close()
+    print(
+        f"one at a time: {REQUESTS / elapsed:.0f} requests/s, "
+        + f"{elapsed * 1000 / REQUESTS:.2f} ms per request"
+    )
+
+    for in_flight in [4, 16]:
+        conn = HTTPConnection(url=url, pool_size=in_flight, concurrent=True)
+        start = time.perf_counter()
+        futures = [
+            conn.submit_immediate_msg_with_reply(msg=msg) for _ in range(REQUESTS)
+        ]
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - start
+        conn.close()
+        print(f"{in_flight:2} in flight: {REQUESTS / elapsed:.0f} requests/s")
+
+
+if __name__ == "__main__":
+    with run_network() as url:
+        bench_http_connection(url=url)
@@ -0,0 +1,64 @@
+"""Time to import syft and to get a first client, in a fresh interpreter.
+
+The lib_ast is built lazily, so the script also times building all of it the
+way import syft used to: every module, class, method and Pointer class.
+
+Run with: python scripts/benchmarks/import_time.py
+"""
+# stdlib
+import json
+import subprocess
+import sys
+
+BENCH_SCRIPT = """
+import json
+import time
+
+start = time.perf_counter()
+import syft as sy
+import_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+vm = sy.VirtualMachine(name="alice")
+client = vm.get_root_client()
+client_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+lib_ast = sy.lib.create_lib_ast()
+lazy_seconds = time.perf_counter() - start
+for klass in lib_ast.classes:
+    klass.pointer_type
+lib_ast.methods
+eager_seconds = time.perf_counter() - start
+
+print(
+    json.dumps(
+        {
+            "import syft": import_seconds,
+            "first client": client_seconds,
+            "create_lib_ast": lazy_seconds,
+            "create_lib_ast, built": eager_seconds,
+        }
+    )
+)
+"""
+
+
+def bench_import_time() -> None:
+    output = subprocess.run(
+        [sys.executable, "-c", BENCH_SCRIPT],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+    results = json.loads(output.strip().splitlines()[-1])
+
+    print()
+    for name, seconds in results.items():
+        print(f"{name:>25}: {seconds * 1e3:10.1f} ms")
+
+    assert results["create_lib_ast"] < results["create_lib_ast, built"]
+
+
+if __name__ == "__main__":
+    bench_import_time()
@@ -0,0 +1,70 @@
+"""Messages sent, objects left in the store and latency of common tensor methods
+with literal arguments, like x.view(-1, 28 * 28), on a VirtualMachine.
+
+Run with: python scripts/benchmarks/inline_args.py
+"""
+# stdlib
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+# third party
+import torch as th
+
+# syft absolute
+import syft as sy
+
+ROUNDS = 50
+
+OPS: Dict[str, Callable[[Any], Any]] = {
+    "x.view(-1, 28 * 28)": lambda x: x.view(-1, 28 * 28),
+    "x.sum(dim=1)": lambda x: x.sum(dim=1),
+    "x.add(1)": lambda x: x.add(1),
+    "x * 0.5": lambda x: x * 0.5,
+    "x.transpose(0, 1)": lambda x: x.transpose(0, 1),
+    "x.clamp(min=0, max=1)": lambda x: x.clamp(min=0, max=1),
+}
+
+
+def run_op(op: Callable[[Any], Any]) -> Tuple[float, float, int]:
+    alice = sy.VirtualMachine(name="alice")
+    client = alice.get_root_client()
+    x = th.rand(4, 28, 28).send(client)
+
+    # the actions and the garbage collection of the argument pointers
+    received: List[Any] = []
+    for name in ["recv_immediate_msg_without_reply", "recv_eventual_msg_without_reply"]:
+        recv = getattr(alice, name)
+
+        def counting_recv(msg: Any, recv: Callable = recv) -> None:
+            received.append(msg)
+            recv(msg=msg)
+
+        setattr(alice, name, counting_recv)
+
+    results = []
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        # keep the results so only the arguments can be left behind
+        results.append(op(x))
+    ms = (time.perf_counter() - start) * 1000 / ROUNDS
+
+    left_behind = len(alice.store) - 1 - len(results)
+    return len(received) / ROUNDS, ms, left_behind
+
+
+def bench_inline_args() -> None:
+    print()
+    for name, op in OPS.items():
+        messages, ms, left_behind = run_op(op=op)
+        print(
+            f"{name:24} {messages:.0f} messages, {ms:.2f} ms, "
+            + f"{left_behind} objects left behind after {ROUNDS} calls"
+        )
+
+
+if __name__ == "__main__":
+    bench_inline_args()
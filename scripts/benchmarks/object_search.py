@@ -0,0 +1,90 @@
+"""Searches a store holding many objects for the few a key is allowed to find, by
+scanning every object like the search service used to and with the indexes.
+
+Run with: python scripts/benchmarks/object_search.py
+"""
+# stdlib
+from pathlib import Path
+import tempfile
+import time
+from typing import Callable
+from typing import List
+
+# third party
+from nacl.signing import SigningKey
+from nacl.signing import VerifyKey
+import torch as th
+
+# syft absolute
+from syft.core.common.group import VerifyAll
+from syft.core.common.uid import UID
+from syft.core.store import DiskObjectStore
+from syft.core.store import ObjectStore
+from syft.core.store.store_memory import MemoryStore
+from syft.core.store.storeable_object import StorableObject
+
+OBJECTS = 2000
+SEARCHABLE_EVERY = 100
+SEARCHES = 5
+
+
+def fill(store: ObjectStore, verify_key: VerifyKey) -> None:
+    for i in range(OBJECTS):
+        search_permissions = {verify_key: UID()} if i % SEARCHABLE_EVERY == 0 else {}
+        obj = StorableObject(
+            id=UID(),
+            data=th.tensor([i]),
+            tags=[f"tag{i % 10}"],
+            read_permissions={},
+            search_permissions=search_permissions,
+        )
+        store[obj.id] = obj
+
+
+def scan(store: ObjectStore, verify_key: VerifyKey) -> List[StorableObject]:
+    results = []
+    for obj in store.get_objects_of_type(obj_type=object):
+        keys = obj.search_permissions.keys()
+        if verify_key in keys or any(isinstance(key, VerifyAll) for key in keys):
+            results.append(obj)
+    return results
+
+
+def index(store: ObjectStore, verify_key: VerifyKey) -> List[StorableObject]:
+    return store.search(searchable_by=verify_key)
+
+
+def ms_per_search(
+    search: Callable[[ObjectStore, VerifyKey], List[StorableObject]],
+    store: ObjectStore,
+    verify_key: VerifyKey,
+) -> float:
+    start = time.perf_counter()
+    for _ in range(SEARCHES):
+        found = search(store, verify_key)
+    elapsed = time.perf_counter() - start
+    assert len(found) == OBJECTS // SEARCHABLE_EVERY
+    return elapsed / SEARCHES * 1000
+
+
+def bench_object_search(tmp_path: Path) -> None:
+    verify_key = SigningKey.generate().verify_key
+    stores = {
+        "MemoryStore": MemoryStore(),
+        "DiskObjectStore": DiskObjectStore(
+            db_path=str(tmp_path / "disk.sqlite"), commit_every=OBJECTS
+        ),
+    }
+
+    print()
+    for name, store in stores.items():
+        fill(store=store, verify_key=verify_key)
+        scanned = ms_per_search(search=scan, store=store, verify_key=verify_key)
+        indexed = ms_per_search(search=index, store=store, verify_key=verify_key)
+        print(f"{name:>16}: scan {scanned:8.2f} ms, index {indexed:8.2f} ms")
+        assert indexed < scanned
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        bench_object_search(tmp_path=Path(tmp_dir))
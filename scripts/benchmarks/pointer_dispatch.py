@@ -0,0 +1,51 @@
+"""Client side cost of a pointer method call like ptr.add(ptr), without sending
+the action, so only the dispatch through the generated Pointer class, creating the
+result pointer and the RunClassMethodAction are measured. Typechecking dominates
+unless SYFT_TYPECHECK_MODE=off is set.
+
+Run with: python scripts/benchmarks/pointer_dispatch.py
+"""
+# stdlib
+import time
+from typing import Any
+
+# third party
+import torch as th
+
+# syft absolute
+import syft as sy
+
+CALLS = 10_000
+
+
+def bench_pointer_dispatch() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    client = alice.get_root_client()
+    ptr = th.tensor([1, 2, 3]).send(client)
+    # keep the results alive so garbage collection isn't measured either
+    results = []
+
+    def drop(msg: Any) -> None:
+        pass
+
+    client.send_immediate_msg_without_reply = drop  # type: ignore
+
+    print(f"\ntypecheck mode: {sy.get_typecheck_mode()}")
+    for name, call in [
+        ("ptr.add(ptr)", lambda: ptr.add(ptr)),
+        ("ptr.T", lambda: ptr.T),
+        ("ptr.id_at_location", lambda: ptr.id_at_location),
+    ]:
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            results.append(call())
+        us = (time.perf_counter() - start) * 1_000_000 / CALLS
+        print(f"{name:20} {us:8.2f} µs per call")
+        for result in results:
+            if hasattr(result, "gc_enabled"):
+                result.gc_enabled = False
+        results.clear()
+
+
+if __name__ == "__main__":
+    bench_pointer_dispatch()
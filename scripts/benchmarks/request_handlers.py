@@ -0,0 +1,71 @@
+"""The CPU an idle Domain uses while its event loop runs, and how long it takes to
+handle requests when a Domain has many handlers for other request names.
+
+Run with: python scripts/benchmarks/request_handlers.py
+"""
+# stdlib
+import asyncio
+import time
+
+# third party
+import torch as th
+
+# syft absolute
+from syft.core.node.domain import Domain
+from syft.core.node.domain.service import RequestMessage
+
+DOMAINS = 10
+IDLE_SECS = 2.0
+HANDLERS = 500
+REQUESTS = 50
+
+
+def bench_idle_domains() -> None:
+    async def idle() -> float:
+        domains = [Domain(name=f"domain {i}") for i in range(DOMAINS)]
+        for domain in domains:
+            domain.get_root_client().requests.add_handler(action="accept")
+        start = time.process_time()
+        await asyncio.sleep(IDLE_SECS)
+        return time.process_time() - start
+
+    cpu_secs = asyncio.get_event_loop().run_until_complete(idle())
+    print()
+    print(f"{DOMAINS} idle domains: {cpu_secs:.3f} CPU s in {IDLE_SECS} s")
+
+
+def bench_handlers_per_request() -> None:
+    domain = Domain(name="remote domain")
+    root_client = domain.get_root_client()
+    handlers = [
+        {"action": "deny", "name": f"other {i}", "timeout_secs": -1}
+        for i in range(HANDLERS)
+    ]
+    handlers.append({"action": "accept", "name": "mine", "timeout_secs": -1})
+    domain.request_handlers = handlers
+
+    # keep the pointers so that the objects are not garbage collected
+    ptrs = [th.tensor([i]).send(root_client) for i in range(REQUESTS)]
+    requests = [
+        RequestMessage(
+            name="mine",
+            object_id=ptr.id_at_location,
+            address=domain.address,
+            owner_address=domain.address,
+            requester_verify_key=root_client.verify_key,
+        )
+        for ptr in ptrs
+    ]
+    start = time.perf_counter()
+    for request in requests:
+        domain.requests.append(request)
+    elapsed = (time.perf_counter() - start) / REQUESTS * 1000
+
+    assert len(domain.requests) == 0
+    print()
+    print(f"{HANDLERS + 1} handlers: {elapsed:.2f} ms per request until handled")
+
+
+if __name__ == "__main__":
+    bench_idle_domains()
+    bench_handlers_per_request()
@@ -0,0 +1,59 @@
+"""The latency between a data owner approving a request and a blocking
+Pointer.get(request_block=True) returning the data on a virtual Domain, with the
+status pushed by the Domain and with polling.
+
+Run with: python scripts/benchmarks/request_latency.py
+"""
+# stdlib
+import threading
+import time
+from typing import List
+
+# third party
+import torch as th
+
+# syft absolute
+from syft.core.node.domain import Domain
+
+ROUNDS = 5
+APPROVE_AFTER_SECS = 0.3
+
+
+def approve_then_get_ms(push: bool) -> float:
+    latencies: List[float] = []
+    for _ in range(ROUNDS):
+        domain = Domain(name="remote domain")
+        client = domain.get_root_client()
+        if not push:
+            client.add_request_status_listener = lambda **kwargs: False
+        ptr = th.tensor([1, 2, 3]).send(client)
+        approved_at: List[float] = []
+
+        def approve() -> None:
+            time.sleep(APPROVE_AFTER_SECS)
+            domain.requests[0].owner_client_if_available = client
+            approved_at.append(time.perf_counter())
+            domain.requests[0].accept()
+
+        thread = threading.Thread(target=approve)
+        thread.start()
+        result = ptr.get(request_block=True, timeout_secs=30, name="benchmark")
+        latencies.append(time.perf_counter() - approved_at[0])
+        thread.join()
+        assert result is not None
+
+    return sum(latencies) / len(latencies) * 1000
+
+
+def bench_approve_then_get() -> None:
+    pushed = approve_then_get_ms(push=True)
+    polled = approve_then_get_ms(push=False)
+
+    print()
+    print(f"approve -> get, pushed: {pushed:8.1f} ms")
+    print(f"approve -> get, polled: {polled:8.1f} ms")
+    assert pushed < polled
+
+
+if __name__ == "__main__":
+    bench_approve_then_get()
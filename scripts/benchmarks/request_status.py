@@ -0,0 +1,66 @@
+"""Checks the status of an accepted request on a Domain holding many objects, by
+scanning the permissions of every object like get_request_status used to and with
+the request indexes.
+
+Run with: python scripts/benchmarks/request_status.py
+"""
+# stdlib
+import time
+
+# third party
+import torch as th
+
+# syft absolute
+from syft.core.common.uid import UID
+from syft.core.node.domain import Domain
+from syft.core.node.domain.service import RequestStatus
+
+OBJECTS = 1000
+CHECKS = 20
+
+
+def scan_status(domain: Domain, request_id: UID) -> RequestStatus:
+    for req in domain.requests:
+        if req.request_id == request_id:
+            return RequestStatus.Pending
+    for obj_id in domain.store.keys():
+        obj = domain.store[obj_id]
+        if request_id in obj.read_permissions.values():
+            return RequestStatus.Accepted
+        if request_id in obj.search_permissions.values():
+            return RequestStatus.Accepted
+    return RequestStatus.Rejected
+
+
+def bench_request_status() -> None:
+    domain = Domain(name="remote domain")
+    root_client = domain.get_root_client()
+    ptrs = [th.tensor([i]).send(root_client) for i in range(OBJECTS)]
+
+    # the last object sent is the slowest to find by scanning
+    ptrs[-1].request(name="My Request", reason="benchmark")
+    request_id = domain.requests[0].id
+    domain.requests[0].owner_client_if_available = root_client
+    domain.requests[0].accept()
+
+    start = time.perf_counter()
+    for _ in range(CHECKS):
+        assert scan_status(domain=domain, request_id=request_id) == (
+            RequestStatus.Accepted
+        )
+    scanned = (time.perf_counter() - start) / CHECKS * 1000
+
+    start = time.perf_counter()
+    for _ in range(CHECKS):
+        assert domain.get_request_status(message_request_id=request_id) == (
+            RequestStatus.Accepted
+        )
+    indexed = (time.perf_counter() - start) / CHECKS * 1000
+
+    print()
+    print(f"{OBJECTS} objects: scan {scanned:8.3f} ms, index {indexed:8.3f} ms")
+    assert indexed < scanned
+
+
+if __name__ == "__main__":
+    bench_request_status()
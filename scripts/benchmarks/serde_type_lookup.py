@@ -0,0 +1,79 @@
+"""Micro-benchmark of the obj_type -> class lookup done for every deserialized message.
+
+Run with: python scripts/benchmarks/serde_type_lookup.py
+"""
+# stdlib
+import pydoc
+import timeit
+from typing import Any
+
+# third party
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.common.serde.deserialize import lookup_serializable_type
+from syft.core.common.uid import UID
+from syft.core.node.common.action.save_object_action import SaveObjectAction
+from syft.proto.util.data_message_pb2 import DataMessage
+from syft.util import index_syft_by_module_name
+
+NUMBER = 200
+
+
+def _deserialize_by_module_walk(blob: bytes) -> Any:
+    # the from_bytes path of _deserialize as it was before the type registry
+    data_message = DataMessage()
+    data_message.ParseFromString(blob)
+    obj_type = index_syft_by_module_name(fully_qualified_name=data_message.obj_type)
+    proto = obj_type.get_protobuf_schema()()
+    proto.ParseFromString(data_message.content)
+    return type(proto).schema2type._proto2object(proto=proto)
+
+
+def _best_per_call(stmt: Any) -> float:
+    return min(timeit.repeat(stmt, number=NUMBER, repeat=3)) / NUMBER
+
+
+def bench_serde_type_lookup() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    msg = SaveObjectAction(
+        id_at_location=UID(), obj=th.tensor([1, 2, 3]), address=alice.address
+    )
+    blob = msg.serialize(to_bytes=True)
+    data_message = DataMessage()
+    data_message.ParseFromString(blob)
+    obj_type = data_message.obj_type
+    storable_type = "syft.lib.torch.uppercase_tensor.TorchTensorWrapper"
+
+    results = {
+        "module walk lookup": _best_per_call(
+            lambda: index_syft_by_module_name(fully_qualified_name=obj_type)
+        ),
+        "registry lookup": _best_per_call(
+            lambda: lookup_serializable_type(fully_qualified_name=obj_type)
+        ),
+        "pydoc.locate storable lookup": _best_per_call(
+            lambda: pydoc.locate(storable_type)
+        ),
+        "registry storable lookup": _best_per_call(
+            lambda: lookup_serializable_type(fully_qualified_name=storable_type)
+        ),
+        "message deserialize before": _best_per_call(
+            lambda: _deserialize_by_module_walk(blob=blob)
+        ),
+        "message deserialize after": _best_per_call(
+            lambda: sy.deserialize(blob=blob, from_bytes=True)
+        ),
+    }
+
+    print()
+    for name, seconds in results.items():
+        print(f"{name:>30}: {seconds * 1e6:10.2f} us")
+
+    assert results["registry lookup"] < results["module walk lookup"]
+    assert results["registry storable lookup"] < results["pydoc.locate storable lookup"]
+
+
+if __name__ == "__main__":
+    bench_serde_type_lookup()
@@ -0,0 +1,78 @@
+"""Cost of checking the signature of inbound SignedMessages.
+
+Run with: python scripts/benchmarks/signature_verification.py
+"""
+# stdlib
+import timeit
+
+# third party
+from nacl.signing import SigningKey
+
+# syft absolute
+from syft.core.common.message import verify_signed_messages
+from syft.core.common.signature import set_verification_workers
+from syft.core.common.signature import signature_cache
+from syft.core.io.address import Address
+from syft.core.node.common.service.repr_service import ReprMessage
+
+NUMBER = 200
+BATCH_SIZE = 256
+
+
+def bench_signature_verification() -> None:
+    signing_key = SigningKey.generate()
+    sig_msg = ReprMessage(address=Address()).sign(signing_key=signing_key)
+    batch = [
+        ReprMessage(address=Address()).sign(signing_key=signing_key)
+        for _ in range(BATCH_SIZE)
+    ]
+
+    def uncached_is_valid() -> None:
+        signature_cache.clear()
+        sig_msg.is_valid
+
+    def verify_batch(workers: int) -> float:
+        set_verification_workers(workers=workers)
+        try:
+            return min(
+                timeit.repeat(
+                    lambda: (signature_cache.clear(), verify_signed_messages(batch)),
+                    number=1,
+                    repeat=5,
+                )
+            )
+        finally:
+            set_verification_workers(workers=0)
+
+    results = {
+        "verify_key.verify": min(
+            timeit.repeat(
+                lambda: signing_key.verify_key.verify(
+                    sig_msg.serialized_message, sig_msg.signature
+                ),
+                number=NUMBER,
+                repeat=3,
+            )
+        )
+        / NUMBER,
+        "is_valid, cache miss": min(
+            timeit.repeat(uncached_is_valid, number=NUMBER, repeat=3)
+        )
+        / NUMBER,
+        "is_valid, cache hit": min(
+            timeit.repeat(lambda: sig_msg.is_valid, number=NUMBER, repeat=3)
+        )
+        / NUMBER,
+        f"batch of {BATCH_SIZE}, inline": verify_batch(workers=0),
+        f"batch of {BATCH_SIZE}, 4 workers": verify_batch(workers=4),
+    }
+
+    print()
+    for name, seconds in results.items():
+        print(f"{name:>30}: {seconds * 1e6:10.2f} us")
+
+    assert results["is_valid, cache hit"] < results["is_valid, cache miss"]
+
+
+if __name__ == "__main__":
+    bench_signature_verification()
@@ -0,0 +1,55 @@
+"""Time for a forwarding node to find where a SignedMessage is going.
+
+Before the routing header the address could only be read by deserializing the
+signed message, which for a SaveObjectAction means deserializing the tensor.
+
+Run with: python scripts/benchmarks/signed_message_routing.py
+"""
+# stdlib
+import timeit
+
+# third party
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.common.uid import UID
+from syft.core.node.common.action.save_object_action import SaveObjectAction
+from syft.proto.util.data_message_pb2 import DataMessage
+from syft.util import get_fully_qualified_name
+
+NUMBER = 50
+
+
+def bench_signed_message_routing() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    client = alice.get_root_client()
+
+    msg = SaveObjectAction(
+        id_at_location=UID(), obj=th.rand(512, 512), address=client.address
+    ).sign(signing_key=client.signing_key)
+
+    blob = msg.serialize(to_bytes=True)
+    proto = msg.proto()
+    proto.ClearField("address")
+    legacy_blob = DataMessage(
+        obj_type=get_fully_qualified_name(obj=msg), content=proto.SerializeToString()
+    ).SerializeToString()
+
+    def route(data: bytes) -> None:
+        assert sy.deserialize(blob=data, from_bytes=True).address == client.address
+
+    results = {
+        "routing header": timeit.timeit(lambda: route(blob), number=NUMBER),
+        "no routing header": timeit.timeit(lambda: route(legacy_blob), number=NUMBER),
+    }
+
+    print()
+    for name, seconds in results.items():
+        print(f"{name:>25}: {seconds / NUMBER * 1e3:8.3f} ms/msg")
+
+    assert results["routing header"] < results["no routing header"]
+
+
+if __name__ == "__main__":
+    bench_signed_message_routing()
@@ -0,0 +1,73 @@
+"""Reads from a DiskObjectStore and a TieredObjectStore when most reads go to a
+small hot set of objects.
+
+Run with: python scripts/benchmarks/tiered_store.py
+"""
+# stdlib
+from pathlib import Path
+import random
+import tempfile
+import time
+
+# third party
+import torch as th
+
+# syft absolute
+from syft.core.common.uid import UID
+from syft.core.store import DiskObjectStore
+from syft.core.store import ObjectStore
+from syft.core.store import TieredObjectStore
+from syft.core.store.storeable_object import StorableObject
+
+OBJECTS = 200
+HOT_OBJECTS = 20
+READS = 2000
+# a 64x64 float tensor is 16KB, so the hot set fits in memory
+TENSOR_BYTES = 64 * 64 * 4
+
+
+def reads_per_second(store: ObjectStore) -> float:
+    ids = []
+    for _ in range(OBJECTS):
+        obj = StorableObject(
+            id=UID(), data=th.rand(64, 64), read_permissions={}, search_permissions={}
+        )
+        store[obj.id] = obj
+        ids.append(obj.id)
+
+    rng = random.Random(0)
+    hot_ids = ids[:HOT_OBJECTS]
+    keys = [
+        rng.choice(hot_ids) if rng.random() < 0.9 else rng.choice(ids)
+        for _ in range(READS)
+    ]
+
+    start = time.perf_counter()
+    for key in keys:
+        store[key]
+    return READS / (time.perf_counter() - start)
+
+
+def bench_tiered_store(tmp_path: Path) -> None:
+    disk_store = DiskObjectStore(db_path=str(tmp_path / "disk.sqlite"))
+    tiered_store = TieredObjectStore(
+        max_memory_bytes=2 * HOT_OBJECTS * TENSOR_BYTES,
+        db_path=str(tmp_path / "tiered.sqlite"),
+    )
+
+    results = {
+        "DiskObjectStore": reads_per_second(store=disk_store),
+        "TieredObjectStore": reads_per_second(store=tiered_store),
+    }
+
+    print()
+    for name, per_second in results.items():
+        print(f"{name:>25}: {per_second:10.1f} reads/s")
+    print(f"{'':>25}  {tiered_store.stats}")
+
+    assert results["TieredObjectStore"] > results["DiskObjectStore"]
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        bench_tiered_store(tmp_path=Path(tmp_dir))
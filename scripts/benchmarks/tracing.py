@@ -0,0 +1,61 @@
+"""Messages/sec through Node.recv_immediate_msg_with_reply with tracing off and on.
+
+"formatted, no handler" builds every debug message and hands it to loguru which
+has no handler to write it to, which is what every message paid for before the
+hot path checked tracer.enabled.
+
+Run with: python scripts/benchmarks/tracing.py
+"""
+# stdlib
+import time
+
+# third party
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.node.common.service.obj_search_service import ObjectSearchMessage
+from syft.tracing import tracer
+
+NUMBER = 300
+
+
+def bench_tracing() -> None:
+    vm = sy.VirtualMachine(name="alice")
+    client = vm.get_root_client()
+    th.tensor([1, 2, 3]).send(client, searchable=True)
+
+    msg = ObjectSearchMessage(address=vm.address, reply_to=client.address).sign(
+        signing_key=client.signing_key
+    )
+
+    def messages_per_second() -> float:
+        for _ in range(20):
+            vm.recv_immediate_msg_with_reply(msg=msg)
+        start = time.perf_counter()
+        for _ in range(NUMBER):
+            vm.recv_immediate_msg_with_reply(msg=msg)
+        return NUMBER / (time.perf_counter() - start)
+
+    results = {}
+    for name, settings in [
+        ("off", {}),
+        ("formatted, no handler", {"log": True}),
+        ("recording", {"record": True}),
+    ]:
+        tracer.configure(**settings)
+        try:
+            results[name] = messages_per_second()
+        finally:
+            tracer.configure(log=False, record=False)
+            tracer.clear()
+
+    print()
+    for name, msgs_per_sec in results.items():
+        print(f"{name:>25}: {msgs_per_sec:10.1f} msg/s")
+
+    assert results["off"] > results["formatted, no handler"]
+
+
+if __name__ == "__main__":
+    bench_tracing()
@@ -0,0 +1,72 @@
+"""Throughput of Node.recv_immediate_msg_with_reply in each typechecking mode.
+
+The "off" mode only removes the decorators completely when it is set before syft
+is imported, so every mode is measured in a fresh interpreter with the
+SYFT_TYPECHECK_MODE environment variable set.
+
+Run with: python scripts/benchmarks/typecheck_mode.py
+"""
+# stdlib
+import os
+import subprocess
+import sys
+
+# syft absolute
+from syft.decorators.typecheck import TYPECHECK_MODE_ENV_VAR
+from syft.decorators.typecheck import TYPECHECK_MODES
+
+BENCH_SCRIPT = """
+import time
+
+import torch as th
+
+import syft as sy
+from syft.core.node.common.service.obj_search_service import ObjectSearchMessage
+
+assert sy.get_typecheck_mode() == "{mode}"
+
+vm = sy.VirtualMachine(name="alice")
+client = vm.get_root_client()
+th.tensor([1, 2, 3]).send(client, searchable=True)
+
+msg = ObjectSearchMessage(address=vm.address, reply_to=client.address).sign(
+    signing_key=client.signing_key
+)
+
+for _ in range(50):
+    vm.recv_immediate_msg_with_reply(msg=msg)
+
+start = time.perf_counter()
+for _ in range({number}):
+    vm.recv_immediate_msg_with_reply(msg=msg)
+print({number} / (time.perf_counter() - start))
+"""
+
+NUMBER = 500
+
+
+def _messages_per_second(mode: str) -> float:
+    env = dict(os.environ)
+    env[TYPECHECK_MODE_ENV_VAR] = mode
+    output = subprocess.run(
+        [sys.executable, "-c", BENCH_SCRIPT.format(mode=mode, number=NUMBER)],
+        env=env,
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def bench_typecheck_modes() -> None:
+    results = {mode: _messages_per_second(mode=mode) for mode in TYPECHECK_MODES}
+
+    print()
+    for mode, msgs_per_sec in results.items():
+        print(f"{mode:>12}: {msgs_per_sec:10.1f} msg/s")
+
+    assert results["off"] > results["full"]
+
+
+if __name__ == "__main__":
+    bench_typecheck_modes()
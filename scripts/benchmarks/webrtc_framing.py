@@ -0,0 +1,94 @@
+"""Sustained throughput, channel messages and peak memory of sending tensors of
+different sizes over a WebRTCConnection, on an aiortc pair in this process.
+
+Run with: python scripts/benchmarks/webrtc_framing.py
+"""
+# stdlib
+import asyncio
+import time
+import tracemalloc
+from typing import Any
+from typing import List
+from typing import Tuple
+
+# third party
+from nacl.signing import SigningKey
+import torch as th
+
+# syft absolute
+from syft.core.common.uid import UID
+from syft.core.node.common.action.save_object_action import SaveObjectAction
+from syft.core.node.domain.domain import Domain
+from syft.grid.connections.webrtc import WebRTCConnection
+
+# bytes per tensor, number of tensors
+WORKLOADS = [(1024, 1000), (1024 * 1024, 32), (32 * 1024 * 1024, 1)]
+
+
+def get_loopback_pair() -> Tuple[WebRTCConnection, WebRTCConnection, SigningKey]:
+    signing_key = SigningKey.generate()
+    domain = Domain(name="responder")
+    domain.root_verify_key = signing_key.verify_key
+
+    requester = WebRTCConnection(node=Domain(name="requester"))
+    responder = WebRTCConnection(node=domain)
+
+    offer_payload = asyncio.run(requester._set_offer())
+    answer_payload = asyncio.run(responder._set_answer(payload=offer_payload))
+    asyncio.run(requester._process_answer(payload=answer_payload))
+
+    while requester.channel.readyState != "open" or responder.channel is None:  # type: ignore
+        time.sleep(0.01)
+    return requester, responder, signing_key
+
+
+def send_tensors(size: int, count: int) -> Tuple[float, int]:
+    requester, responder, signing_key = get_loopback_pair()
+    sent: List[int] = []
+    send = requester.channel.send  # type: ignore
+
+    def counting_send(data: Any) -> None:
+        sent.append(len(data))
+        send(data)
+
+    requester.channel.send = counting_send  # type: ignore
+    ids = [UID() for _ in range(count)]
+    msgs = [
+        SaveObjectAction(
+            id_at_location=id_at_location,
+            obj=th.rand(size // 4),
+            address=responder.node.address,
+        ).sign(signing_key=signing_key)
+        for id_at_location in ids
+    ]
+
+    start = time.perf_counter()
+    for msg in msgs:
+        requester.send_immediate_msg_without_reply(msg=msg)
+    # the node stores the tensors in the order they were sent
+    while ids[-1] not in responder.node.store:
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+
+    requester.close()
+    return size * count / elapsed / 2 ** 20, len(sent)
+
+
+def bench_webrtc_framing() -> None:
+    print()
+    for size, count in WORKLOADS:
+        throughput, frames = send_tensors(size=size, count=count)
+
+        tracemalloc.start()
+        send_tensors(size=size, count=count)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"{count:4} x {size // 1024:6} KiB: {throughput:6.1f} MiB/s, "
+            + f"{frames:5} channel messages, peak {peak / 2 ** 20:6.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    bench_webrtc_framing()
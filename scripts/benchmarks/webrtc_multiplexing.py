@@ -0,0 +1,81 @@
+"""Throughput and latency of N threads sending requests at the same time over one
+WebRTCConnection, on an aiortc pair in this process.
+
+Run with: python scripts/benchmarks/webrtc_multiplexing.py
+"""
+# stdlib
+import asyncio
+import threading
+import time
+from typing import List
+from typing import Tuple
+
+# third party
+from nacl.signing import SigningKey
+
+# syft absolute
+import syft as sy
+from syft.core.io.address import Address
+from syft.core.io.location import SpecificLocation
+from syft.core.node.common.service.obj_search_service import ObjectSearchMessage
+from syft.core.node.domain.domain import Domain
+from syft.grid.connections.webrtc import WebRTCConnection
+
+REQUESTS = 256
+
+
+def get_loopback_pair() -> Tuple[WebRTCConnection, WebRTCConnection, SigningKey]:
+    signing_key = SigningKey.generate()
+    domain = Domain(name="responder")
+    domain.root_verify_key = signing_key.verify_key
+
+    requester = WebRTCConnection(node=Domain(name="requester"))
+    responder = WebRTCConnection(node=domain)
+
+    offer_payload = asyncio.run(requester._set_offer())
+    answer_payload = asyncio.run(responder._set_answer(payload=offer_payload))
+    asyncio.run(requester._process_answer(payload=answer_payload))
+
+    while requester.channel.readyState != "open" or responder.channel is None:  # type: ignore
+        time.sleep(0.01)
+    return requester, responder, signing_key
+
+
+def run_requesters(requesters: int) -> Tuple[float, float]:
+    requester, responder, signing_key = get_loopback_pair()
+    latencies: List[float] = []
+
+    def send_requests() -> None:
+        reply_to = Address(vm=SpecificLocation())
+        for _ in range(REQUESTS // requesters):
+            msg = ObjectSearchMessage(
+                address=responder.node.address, reply_to=reply_to
+            ).sign(signing_key=signing_key)
+            start = time.perf_counter()
+            requester.send_immediate_msg_with_reply(msg=msg)
+            latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=send_requests) for _ in range(requesters)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    requester.close()
+    return len(latencies) / elapsed, sum(latencies) * 1000 / len(latencies)
+
+
+def bench_webrtc_multiplexing() -> None:
+    print(f"\ntypecheck mode: {sy.get_typecheck_mode()}")
+    for requesters in [1, 4, 16]:
+        throughput, latency_ms = run_requesters(requesters=requesters)
+        print(
+            f"{requesters:2} requesters: {throughput:.0f} requests/s, "
+            + f"{latency_ms:.2f} ms per request"
+        )
+
+
+if __name__ == "__main__":
+    bench_webrtc_multiplexing()
@@ -0,0 +1,82 @@
+"""Latency of small requests sent over a WebRTCConnection while a large tensor is
+being sent over it, on an aiortc pair in this process.
+
+Run with: python scripts/benchmarks/webrtc_priority.py
+"""
+# stdlib
+import asyncio
+import time
+from typing import List
+from typing import Tuple
+
+# third party
+from nacl.signing import SigningKey
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.common.uid import UID
+from syft.core.io.address import Address
+from syft.core.node.common.action.save_object_action import SaveObjectAction
+from syft.core.node.common.service.obj_search_service import ObjectSearchMessage
+from syft.core.node.domain.domain import Domain
+from syft.grid.connections.webrtc import WebRTCConnection
+
+SIZE = 32 * 1024 * 1024
+
+
+def get_loopback_pair() -> Tuple[WebRTCConnection, WebRTCConnection, SigningKey]:
+    signing_key = SigningKey.generate()
+    domain = Domain(name="responder")
+    domain.root_verify_key = signing_key.verify_key
+
+    requester = WebRTCConnection(node=Domain(name="requester"))
+    responder = WebRTCConnection(node=domain)
+
+    offer_payload = asyncio.run(requester._set_offer())
+    answer_payload = asyncio.run(responder._set_answer(payload=offer_payload))
+    asyncio.run(requester._process_answer(payload=answer_payload))
+
+    while requester.channel.readyState != "open" or responder.channel is None:  # type: ignore
+        time.sleep(0.01)
+    return requester, responder, signing_key
+
+
+def requests_during_transfer() -> Tuple[List[float], float]:
+    requester, responder, signing_key = get_loopback_pair()
+    id_at_location = UID()
+    msg = SaveObjectAction(
+        id_at_location=id_at_location,
+        obj=th.rand(SIZE // 4),
+        address=responder.node.address,
+    ).sign(signing_key=signing_key)
+
+    latencies: List[float] = []
+    start = time.perf_counter()
+    requester.send_immediate_msg_without_reply(msg=msg)
+    while id_at_location not in responder.node.store:
+        search = ObjectSearchMessage(
+            address=responder.node.address, reply_to=Address()
+        ).sign(signing_key=signing_key)
+        sent = time.perf_counter()
+        requester.send_immediate_msg_with_reply(msg=search)
+        latencies.append(time.perf_counter() - sent)
+    elapsed = time.perf_counter() - start
+
+    requester.close()
+    return latencies, elapsed
+
+
+def bench_webrtc_priority() -> None:
+    print(f"\ntypecheck mode: {sy.get_typecheck_mode()}")
+    latencies, elapsed = requests_during_transfer()
+    latencies.sort()
+    print(
+        f"{SIZE // 2 ** 20} MiB sent in {elapsed:.2f} s, {len(latencies)} requests "
+        + f"meanwhile: p50 {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+        + f"max {latencies[-1] * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    bench_webrtc_priority()
@@ -70,6 +70,8 @@ from syft.core.node.vm.vm import VirtualMachine  # noqa: F401
 from syft.core.node.vm.vm import VirtualMachineClient  # noqa: F401
 
 # Convenience Functions
+from syft.decorators import get_typecheck_mode  # noqa: F401
+from syft.decorators import set_typecheck_mode  # noqa: F401
 from syft.decorators import type_hints  # noqa: F401
 from syft.grid.duet import duet  # noqa: F401
 from syft.grid.duet import join_duet  # noqa: F401
@@ -77,6 +79,7 @@ from syft.grid.duet import launch_duet  # noqa: F401
 
 # Convenience Objects
 from syft.lib import lib_ast  # noqa: F401
+from syft.tracing import tracer  # noqa: F401
 
 # syft relative
 # Package Imports
@@ -125,5 +128,9 @@ def logging(
             backtrace=True,
             level="TRACE",
         )
+        # the debug messages on the message hot path are only built when
+        # the tracer is logging
+        tracer.configure(log=True)
     else:
+        tracer.configure(log=False)
         logger.remove()
@@ -6,3 +6,4 @@ from . import globals  # noqa: F401
 from . import klass  # noqa: F401
 from . import method  # noqa: F401
 from . import module  # noqa: F401
+from . import proxy  # noqa: F401
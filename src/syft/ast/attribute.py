@@ -1,10 +1,13 @@
 # stdlib
 from abc import ABC
-from typing import Any
+from abc import abstractmethod
+from threading import RLock
 from typing import Callable as CallableT
+from typing import ClassVar
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 # syft relative
@@ -12,7 +15,10 @@ from .. import ast
 
 
 class Attribute(ABC):
-    client: Optional[Any]
+    # the lib_ast is shared between the user thread and the threads of the
+    # connections, which all build it lazily, so the whole tree is built under one
+    # lock. It is reentrant because building one Attribute builds its children.
+    _lock: ClassVar[RLock] = RLock()
 
     def __init__(
         self,
@@ -25,17 +31,47 @@ class Attribute(ABC):
         self.name = name  # __add__
         self.path_and_name = path_and_name  # torch.Tensor.__add__
         self.ref = ref  # <the actual add method object>
-        self.attrs: Dict[
+        self._attrs: Dict[
             str, Union[ast.callable.Callable, CallableT]
         ] = {}  # any attrs of __add__ ... is none in this case
+        # paths given to add_path which have not been added to attrs yet
+        self._pending_paths: List[Tuple[List[str], int, Optional[str]]] = []
         self.return_type_name = return_type_name
         self.is_property = is_property
 
-    def set_client(self, client: Any) -> None:
-        self.client = client
-        for _, attr in self.attrs.items():
-            if hasattr(attr, "set_client"):
-                attr.set_client(client=client)  # type: ignore
+    @property
+    def attrs(self) -> Dict[str, Union["ast.callable.Callable", CallableT]]:
+        # the AST is built lazily, add_path only queues the path and the children
+        # of an Attribute are created the first time somebody looks at them
+        if self._pending_paths:
+            self.materialize()
+        return self._attrs
+
+    def add_path(
+        self, path: List[str], index: int, return_type_name: Optional[str] = None
+    ) -> None:
+        with self._lock:
+            self._pending_paths.append((path, index, return_type_name))
+
+    def materialize(self) -> None:
+        """Add the queued paths to attrs, their children are still queued until
+        they are used themselves"""
+        with self._lock:
+            # another thread may have built this Attribute while we waited
+            pending_paths = self._pending_paths
+            for path, index, return_type_name in pending_paths:
+                self._add_path(
+                    path=path, index=index, return_type_name=return_type_name
+                )
+            # only clear the queue once attrs is complete, so other threads keep
+            # waiting for the lock instead of reading a partly built attrs
+            self._pending_paths = []
+
+    @abstractmethod
+    def _add_path(
+        self, path: List[str], index: int, return_type_name: Optional[str] = None
+    ) -> None:
+        pass
 
     @property
     def classes(self) -> List["ast.klass.Class"]:
@@ -44,6 +80,10 @@ class Attribute(ABC):
         if isinstance(self, ast.klass.Class):
             out.append(self)
 
+        # only modules contain classes, so the methods of a class are not built
+        if not isinstance(self, ast.module.Module):
+            return out
+
         for _, ref in self.attrs.items():
             sub_prop = getattr(ref, "classes", None)
             if sub_prop is not None:
@@ -72,6 +112,9 @@ class Attribute(ABC):
         if isinstance(self, ast.function.Function):
             out.append(self)
 
+        if not isinstance(self, ast.module.Module):
+            return out
+
         for _, ref in self.attrs.items():
             sub_prop = getattr(ref, "functions", None)
             if sub_prop is not None:
@@ -86,6 +129,9 @@ class Attribute(ABC):
         if isinstance(self, ast.module.Module):
             out.append(self)
 
+        if not isinstance(self, ast.module.Module):
+            return out
+
         for _, ref in self.attrs.items():
             sub_prop = getattr(ref, "modules", None)
             if sub_prop is not None:
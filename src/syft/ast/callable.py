@@ -12,55 +12,24 @@ from .. import lib
 from ..core.node.common.action.function_or_constructor_action import (
     RunFunctionOrConstructorAction,
 )
+from ..core.pointer.pointer import Pointer
 from .util import module_type
 from .util import unsplit
 
 
 class Callable(ast.attribute.Attribute):
-    client: Optional[Any]
 
     """A method, function, or constructor which can be directly executed"""
 
+    # the pointer class of the return type, looked up by the first run_on_client
+    _return_pointer_type: Optional[type] = None
+
     def __call__(
         self,
         *args: Tuple[Any, ...],
         return_callable: bool = False,
         **kwargs: Any,
     ) -> Optional[Union["Callable", CallableT]]:
-        if (
-            hasattr(self, "client")
-            and self.client is not None
-            and return_callable is False
-        ):
-            return_tensor_type_pointer_type = self.client.lib_ast(
-                path=self.return_type_name, return_callable=True
-            ).pointer_type
-
-            ptr = return_tensor_type_pointer_type(client=self.client)
-
-            # first downcast anything primitive which is not already PyPrimitive
-            (
-                downcast_args,
-                downcast_kwargs,
-            ) = lib.python.util.downcast_args_and_kwargs(args=args, kwargs=kwargs)
-
-            # then we convert anything which isnt a pointer into a pointer
-            pointer_args, pointer_kwargs = ast.klass.pointerize_args_and_kwargs(
-                args=downcast_args, kwargs=downcast_kwargs, client=self.client
-            )
-
-            if self.path_and_name is not None:
-                msg = RunFunctionOrConstructorAction(
-                    path=self.path_and_name,
-                    args=pointer_args,
-                    kwargs=pointer_kwargs,
-                    id_at_location=ptr.id_at_location,
-                    address=self.client.address,
-                )
-
-                self.client.send_immediate_msg_without_reply(msg=msg)
-                return ptr
-
         path = kwargs["path"]
         index = kwargs["index"]
 
@@ -73,11 +42,53 @@ class Callable(ast.attribute.Attribute):
                 path=path, index=index + 1, return_callable=return_callable
             )
 
-    def add_path(
+    def run_on_client(
+        self, client: Any, *args: Tuple[Any, ...], **kwargs: Any
+    ) -> Optional[Pointer]:
+        """Run this callable on the node behind client and return a pointer to the
+        result. The AST is shared by all clients, so the client is passed in by the
+        AttributeProxy which was used to get here, like client.torch.zeros."""
+        if self.path_and_name is None:
+            return None
+
+        # the lib_ast is shared by all clients, so the pointer class of the result
+        # is only looked up once
+        return_tensor_type_pointer_type = self._return_pointer_type
+        if return_tensor_type_pointer_type is None:
+            return_tensor_type_pointer_type = client.lib_ast(
+                path=self.return_type_name, return_callable=True
+            ).pointer_type
+            self._return_pointer_type = return_tensor_type_pointer_type
+
+        ptr = return_tensor_type_pointer_type(client=client)
+
+        # first downcast anything primitive which is not already PyPrimitive
+        (
+            downcast_args,
+            downcast_kwargs,
+        ) = lib.python.util.downcast_args_and_kwargs(args=args, kwargs=kwargs)
+
+        # then we convert anything which isnt a pointer into a pointer
+        pointer_args, pointer_kwargs = ast.klass.pointerize_args_and_kwargs(
+            args=downcast_args, kwargs=downcast_kwargs, client=client
+        )
+
+        msg = RunFunctionOrConstructorAction(
+            path=self.path_and_name,
+            args=pointer_args,
+            kwargs=pointer_kwargs,
+            id_at_location=ptr.id_at_location,
+            address=client.address,
+        )
+
+        client.send_immediate_msg_without_reply(msg=msg)
+        return ptr
+
+    def _add_path(
         self, path: List[str], index: int, return_type_name: Optional[str] = None
     ) -> None:
         if index < len(path):
-            if path[index] not in self.attrs:
+            if path[index] not in self._attrs:
 
                 attr_ref = getattr(self.ref, path[index])
 
@@ -88,7 +99,7 @@ class Callable(ast.attribute.Attribute):
                     if type(attr_ref).__name__ in ["getset_descriptor", "_tuplegetter"]:
                         is_property = True
 
-                    self.attrs[path[index]] = ast.method.Method(
+                    self._attrs[path[index]] = ast.method.Method(
                         name=path[index],
                         path_and_name=unsplit(path[: index + 1]),
                         ref=attr_ref,
@@ -27,12 +27,37 @@ class Globals(Module):
     ) -> Optional[Union[Callable, CallableT]]:
         if isinstance(path, str):
             path = path.split(".")
-        return self.attrs[path[index]](
-            path=path,
-            index=index + 1,
-            return_callable=return_callable,
-            obj_type=obj_type,
-        )
+        try:
+            return self.attrs[path[index]](
+                path=path,
+                index=index + 1,
+                return_callable=return_callable,
+                obj_type=obj_type,
+            )
+        except KeyError:
+            if obj_type is None or obj_type in self.lookup_cache:
+                raise
+            # obj_type is only added to the lookup_cache when the module holding it
+            # is built, so build all of them and try again
+            self.materialize_modules()
+            if obj_type not in self.lookup_cache:
+                raise
+            return self(
+                path=path,
+                index=index,
+                return_callable=return_callable,
+                obj_type=obj_type,
+            )
+
+    def materialize_modules(self) -> None:
+        """Build every module of the AST, which adds all of their classes to the
+        lookup_cache"""
+        modules: List[Module] = [self]
+        while modules:
+            module = modules.pop()
+            for attr in module.attrs.values():
+                if isinstance(attr, Module):
+                    modules.append(attr)
 
     def add_path(
         self,
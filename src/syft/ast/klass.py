@@ -1,4 +1,5 @@
 # stdlib
+from types import MethodType
 from typing import Any
 from typing import Callable as CallableT
 from typing import Dict
@@ -16,12 +17,90 @@ from ..ast.callable import Callable
 from ..core.common.serde.serializable import Serializable
 from ..core.common.serde.serialize import _serialize
 from ..core.common.uid import UID
+from ..core.node.common.action.inline_args import isinlineable
 from ..core.node.common.action.run_class_method_action import RunClassMethodAction
 from ..core.node.common.action.save_object_action import SaveObjectAction
 from ..core.pointer.pointer import Pointer
 from ..util import aggressive_set_attr
 
 
+class PointerMethod:
+    """A method of a generated Pointer class which runs path_and_name on the object
+    the pointer points to, with a RunClassMethodAction, and returns a pointer to the
+    result.
+
+    The lib_ast is shared by all clients, so the pointer class of the result is
+    looked up the first time the method is called and kept on the descriptor. It
+    can't be looked up when the Pointer class is created, because the pointer
+    classes of the return types, like TensorPointer itself, may not exist yet."""
+
+    __slots__ = ("path_and_name", "return_type_name", "_return_pointer_type")
+
+    def __init__(self, path_and_name: str, return_type_name: Optional[str]) -> None:
+        self.path_and_name = path_and_name
+        self.return_type_name = return_type_name
+        self._return_pointer_type: Optional[type] = None
+
+    def __get__(self, ptr: Any, owner: Optional[type] = None) -> Any:
+        if ptr is None:
+            return self
+        return MethodType(self, ptr)
+
+    def return_pointer_type(self, client: Any) -> type:
+        pointer_type = self._return_pointer_type
+        if pointer_type is None:
+            # we want to get the return type which matches the path_and_name so we
+            # ask lib_ast for the pointer klass of its return type name
+            pointer_type = client.lib_ast(
+                self.return_type_name, return_callable=True
+            ).pointer_type
+            self._return_pointer_type = pointer_type
+        return pointer_type
+
+    def __call__(self, __self: Any, *args: Tuple[Any, ...], **kwargs: Any) -> object:
+        client = __self.client
+        result = self.return_pointer_type(client=client)(client=client)
+
+        # QUESTION can the id_at_location be None?
+        result_id_at_location = getattr(result, "id_at_location", None)
+        if result_id_at_location is not None:
+
+            # first downcast anything primitive which is not already PyPrimitive
+            (
+                downcast_args,
+                downcast_kwargs,
+            ) = lib.python.util.downcast_args_and_kwargs(args=args, kwargs=kwargs)
+
+            # then we convert anything which isnt a pointer into a pointer
+            pointer_args, pointer_kwargs = pointerize_args_and_kwargs(
+                args=downcast_args, kwargs=downcast_kwargs, client=client
+            )
+
+            cmd = RunClassMethodAction(
+                path=self.path_and_name,
+                _self=__self,
+                args=pointer_args,
+                kwargs=pointer_kwargs,
+                id_at_location=result_id_at_location,
+                address=client.address,
+            )
+            client.send_immediate_msg_without_reply(msg=cmd)
+
+        return result
+
+
+class PointerProperty(PointerMethod):
+    """A property of a generated Pointer class, getting it on a pointer runs it
+    immediately and returns a pointer to the result"""
+
+    __slots__ = ()
+
+    def __get__(self, ptr: Any, owner: Optional[type] = None) -> Any:
+        if ptr is None:
+            return self
+        return self(ptr)
+
+
 class Class(Callable):
     def __init__(
         self,
@@ -39,79 +118,27 @@ class Class(Callable):
 
     @property
     def pointer_type(self) -> Union[Callable, CallableT]:
-        return getattr(self, self.pointer_name)
+        # Pointer classes are only created the first time they are needed, when
+        # an object of this class is sent or returned by a remote method
+        pointer_type = getattr(self, self.pointer_name, None)
+        if pointer_type is None:
+            with self._lock:
+                # check again, another thread may have created it while we waited
+                # and there must only ever be one Pointer class per path
+                pointer_type = getattr(self, self.pointer_name, None)
+                if pointer_type is None:
+                    self.create_pointer_class()
+                    pointer_type = getattr(self, self.pointer_name)
+        return pointer_type
 
     def create_pointer_class(self) -> None:
-        def get_run_class_method(
-            attr_path_and_name: str,
-        ) -> object:  # TODO: tighten to return Callable
-            """It might seem hugely un-necessary to have these methods nested in this way.
-            However, it has to do with ensuring that the scope of attr_path_and_name is local
-            and not global. If we do not put a get_run_class_method around run_class_method then
-            each run_class_method will end up referencing the same attr_path_and_name variable
-            and all methods will actually end up calling the same method. However, if we return
-            the function object itself then it includes the current attr_path_and_name as an internal
-            variable and when we call get_run_class_method multiple times it returns genuinely
-            different methods each time with a different internal attr_path_and_name variable."""
-
-            def run_class_method(
-                __self: Any,
-                *args: Tuple[Any, ...],
-                **kwargs: Any,
-            ) -> object:
-                # we want to get the return type which matches the attr_path_and_name
-                # so we ask lib_ast for the return type name that matches out
-                # attr_path_and_name and then use that to get the actual pointer klass
-                # then set the result to that pointer klass
-                return_type_name = __self.client.lib_ast(
-                    attr_path_and_name, return_callable=True
-                ).return_type_name
-                resolved_pointer_type = __self.client.lib_ast(
-                    return_type_name, return_callable=True
-                )
-                result = resolved_pointer_type.pointer_type(client=__self.client)
-
-                # QUESTION can the id_at_location be None?
-                result_id_at_location = getattr(result, "id_at_location", None)
-                if result_id_at_location is not None:
-
-                    # first downcast anything primitive which is not already PyPrimitive
-                    (
-                        downcast_args,
-                        downcast_kwargs,
-                    ) = lib.python.util.downcast_args_and_kwargs(
-                        args=args, kwargs=kwargs
-                    )
-
-                    # then we convert anything which isnt a pointer into a pointer
-                    pointer_args, pointer_kwargs = pointerize_args_and_kwargs(
-                        args=downcast_args, kwargs=downcast_kwargs, client=__self.client
-                    )
-
-                    cmd = RunClassMethodAction(
-                        path=attr_path_and_name,
-                        _self=__self,
-                        args=pointer_args,
-                        kwargs=pointer_kwargs,
-                        id_at_location=result_id_at_location,
-                        address=__self.client.address,
-                    )
-                    __self.client.send_immediate_msg_without_reply(msg=cmd)
-
-                return result
-
-            return run_class_method
-
-        attrs = {}
-        _props: List[str] = []
+        # the methods and properties are descriptors which know the path they run
+        # and cache the pointer class of their result, so a call on a pointer does
+        # no lookups in the lib_ast
+        attrs: Dict[str, Any] = {}
         for attr_name, attr in self.attrs.items():
             attr_path_and_name = getattr(attr, "path_and_name", None)
 
-            # if the Method.is_property == True
-            # we need to add this attribute name into the _props list
-            is_property = getattr(attr, "is_property", False)
-            if is_property:
-                _props.append(attr_name)
             # QUESTION: Could path_and_name be None?
             # It seems as though attrs can contain
             # Union[Callable, CallableT]
@@ -119,22 +146,17 @@ class Class(Callable):
             # where CallableT is typing.Callable == any function, method, lambda
             # so we have to check for path_and_name
             if attr_path_and_name is not None:
-                attrs[attr_name] = get_run_class_method(attr_path_and_name)
-
-        def getattribute(__self: Any, name: str) -> Any:
-            # we need to override the __getattribute__ of our Pointer class
-            # so that if you ever access a property on a Pointer it will not just
-            # get the wrapped run_class_method but also execute it immediately
-            # object.__getattribute__ is the way we prevent infinite recursion
-            attr = object.__getattribute__(__self, name)
-            props = object.__getattribute__(__self, "_props")
-
-            # if the attr key name is in the _props list from above then we know
-            # we should execute it immediately and return the result
-            if name in props:
-                return attr()
-
-            return attr
+                # if the Method.is_property == True accessing it on the pointer runs
+                # it immediately
+                descriptor = (
+                    PointerProperty
+                    if getattr(attr, "is_property", False)
+                    else PointerMethod
+                )
+                attrs[attr_name] = descriptor(
+                    path_and_name=attr_path_and_name,
+                    return_type_name=getattr(attr, "return_type_name", None),
+                )
 
         # here we can ensure that the fully qualified name of the Pointer klass is
         # consistent between versions of python and matches our other klasses in
@@ -152,8 +174,6 @@ class Class(Callable):
 
         klass_pointer = type(self.pointer_name, (Pointer,), attrs)
         setattr(klass_pointer, "path_and_name", self.path_and_name)
-        setattr(klass_pointer, "_props", _props)
-        setattr(klass_pointer, "__getattribute__", getattribute)
         setattr(self, self.pointer_name, klass_pointer)
 
     def create_send_method(outer_self: Any) -> None:
@@ -167,7 +187,7 @@ class Class(Callable):
             id_at_location = UID()
 
             # Step 1: create pointer which will point to result
-            ptr = getattr(outer_self, outer_self.pointer_name)(
+            ptr = outer_self.pointer_type(
                 client=client,
                 id_at_location=id_at_location,
                 tags=self.tags if hasattr(self, "tags") else list(),
@@ -266,9 +286,10 @@ def pointerize_args_and_kwargs(
     # method invocation
     pointer_args = []
     pointer_kwargs = {}
+    # small literals, like the ints of a shape, are sent inline with the action
     for arg in args:
         # check if its already a pointer
-        if not ispointer(arg):
+        if not ispointer(arg) and not isinlineable(value=arg):
             arg_ptr = convert_param_to_remote_pointer(param=arg, client=client)
             pointer_args.append(arg_ptr)
         else:
@@ -276,7 +297,7 @@ def pointerize_args_and_kwargs(
 
     for k, arg in kwargs.items():
         # check if its already a pointer
-        if not ispointer(arg):
+        if not ispointer(arg) and not isinlineable(value=arg):
             arg_ptr = convert_param_to_remote_pointer(param=arg, client=client)
             pointer_kwargs[k] = arg_ptr
         else:
@@ -29,7 +29,7 @@ class Module(ast.attribute.Attribute):
     ) -> None:
         self.__setattr__(attr_name, attr)
         if attr is not None:
-            self.attrs[attr_name] = attr
+            self._attrs[attr_name] = attr
 
     def __call__(
         self,
@@ -45,7 +45,15 @@ class Module(ast.attribute.Attribute):
         if isinstance(path, str):
             path = path.split(".")
 
-        resolved = self.attrs[path[index]](
+        attrs = self.attrs
+        if obj_type is not None and path[index] not in attrs:
+            # building this level of the AST may have just added obj_type to the
+            # lookup_cache, like torch.nn.Linear for torch.nn.modules.linear.Linear
+            cached_path = self.lookup_cache.get(obj_type, None)
+            if cached_path is not None and cached_path[:index] == path[:index]:
+                path = cached_path
+
+        resolved = attrs[path[index]](
             path=path,
             index=index + 1,
             return_callable=return_callable,
@@ -60,14 +68,22 @@ class Module(ast.attribute.Attribute):
 
         return out
 
-    def add_path(
+    def __getattr__(self, name: str) -> Any:
+        # add_attr sets the attributes when the lazy AST is built, so look them up
+        # in attrs if they haven't been built yet
+        if name not in ("_attrs", "_pending_paths"):
+            attrs = self.attrs
+            if name in attrs:
+                return attrs[name]
+        raise AttributeError(f"{type(self).__name__} has no attribute {name}")
+
+    def _add_path(
         self,
         path: List[str],
         index: int,
         return_type_name: Optional[str] = None,
-        framework_reference: Optional[Union[Callable, CallableT]] = None,
     ) -> None:
-        if path[index] not in self.attrs:
+        if path[index] not in self._attrs:
             attr_ref = getattr(self.ref, path[index])
 
             if isinstance(attr_ref, module_type):
@@ -112,7 +128,7 @@ class Module(ast.attribute.Attribute):
                     ),
                 )
 
-        attr = self.attrs[path[index]]
+        attr = self._attrs[path[index]]
         attr_ref = getattr(self.ref, path[index], None)
         if attr_ref is not None and attr_ref not in self.lookup_cache:
             self.lookup_cache[attr_ref] = path
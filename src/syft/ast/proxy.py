@@ -0,0 +1,57 @@
+# stdlib
+from typing import Any
+from typing import List
+
+# syft relative
+from .attribute import Attribute
+from .callable import Callable
+from .module import Module
+
+
+class AttributeProxy:
+    """A view of a node of the shared lib_ast which is bound to a client.
+
+    The AST and the Pointer classes generated from it are built once when syft is
+    imported and are shared by every client. Instead of copying the AST for each
+    client, client.torch, client.lib_ast etc. return an AttributeProxy which
+    carries the client and wraps every attribute it hands out in another proxy,
+    so that client.torch.zeros(3) knows which node to run on."""
+
+    __slots__ = ("attr", "client")
+
+    def __init__(self, attr: Attribute, client: Any) -> None:
+        object.__setattr__(self, "attr", attr)
+        object.__setattr__(self, "client", client)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = self.attr
+        if name in attr.attrs:
+            return bind(attr=attr.attrs[name], client=self.client)
+        return getattr(attr, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("The lib_ast is shared between clients and is read only")
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        attr = self.attr
+        # a Module looks up a path like client.lib_ast("torch.Tensor") and a
+        # Callable runs on the client like client.torch.Tensor([1, 2])
+        if isinstance(attr, Module):
+            return bind(attr=attr(*args, **kwargs), client=self.client)
+        if isinstance(attr, Callable):
+            return attr.run_on_client(self.client, *args, **kwargs)
+        raise TypeError(f"{attr.path_and_name} is not callable")
+
+    def __dir__(self) -> List[str]:
+        return list(self.attr.attrs.keys())
+
+    def __repr__(self) -> str:
+        return repr(self.attr)
+
+
+def bind(attr: Any, client: Any) -> Any:
+    """Wrap the AST nodes in an AttributeProxy for client, everything else like the
+    refs to the real torch objects is returned as is"""
+    if isinstance(attr, Attribute):
+        return AttributeProxy(attr=attr, client=client)
+    return attr
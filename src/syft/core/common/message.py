@@ -1,14 +1,12 @@
 # stdlib
-import sys
 from typing import Generic
+from typing import List
 from typing import Optional
 from typing import Type
 from typing import TypeVar
 
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
-from loguru import logger
-from nacl.exceptions import BadSignatureError
 from nacl.signing import SigningKey
 from nacl.signing import VerifyKey
 
@@ -18,12 +16,21 @@ from ...core.common.uid import UID
 from ...core.io.address import Address
 from ...decorators.syft_decorator_impl import syft_decorator
 from ...proto.core.auth.signed_message_pb2 import SignedMessage as SignedMessage_PB
+from ...tracing import tracer
 from ...util import get_fully_qualified_name
 from ..common.serde.deserialize import _deserialize
+from ..common.serde.deserialize import lookup_serializable_type
+from ..common.serde.envelope import length_delimited_header
+from .signature import get_verify_key
+from .signature import signature_cache
+from .signature import verify_signatures
 
 # this generic type for SignedMessage
 SignedMessageT = TypeVar("SignedMessageT")
 
+# field number of the serialized inner message in SignedMessage_PB
+SIGNED_MESSAGE_FIELD = SignedMessage_PB.DESCRIPTOR.fields_by_name["message"].number
+
 
 class AbstractMessage(ObjectWithID, Generic[SignedMessageT]):
     """"""
@@ -47,10 +54,18 @@ class AbstractMessage(ObjectWithID, Generic[SignedMessageT]):
         return f"{self.icon} ({self.class_name})"
 
     def post_init(self) -> None:
+        tracer.trace(
+            event="message.create",
+            message=self._creation_log,
+            msg_type=self.class_name,
+            msg_id=self.id,
+        )
+
+    def _creation_log(self) -> str:
         init_reason = "Creating"
         if "signed" in self.class_name.lower():
             init_reason += " Signed"
-        logger.debug(f"> {init_reason} {self.pprint} {self.id.emoji()}")
+        return f"> {init_reason} {self.pprint} {self.id.emoji()}"
 
 
 class SyftMessage(AbstractMessage):
@@ -84,10 +99,15 @@ class SyftMessage(AbstractMessage):
             A :class:`SignedMessage`
 
         """
-        logger.debug(
-            f"> Signing with {self.address.key_emoji(key=signing_key.verify_key)}"
+        tracer.trace(
+            event="message.sign",
+            message=lambda: "> Signing with "
+            + self.address.key_emoji(key=signing_key.verify_key),
+            msg_type=self.class_name,
+            msg_id=self.id,
         )
-        signed_message = signing_key.sign(self.serialize(to_bytes=True))
+        blob = self.serialize(to_bytes=True)
+        signed_message = signing_key.sign(blob)
 
         # signed_type will be the final subclass callee's closest parent signed_type
         # for example ReprMessage -> ImmediateSyftMessageWithoutReply.signed_type
@@ -98,7 +118,8 @@ class SyftMessage(AbstractMessage):
             obj_type=get_fully_qualified_name(obj=self),
             signature=signed_message.signature,
             verify_key=signing_key.verify_key,
-            message=signed_message.message,
+            # signed_message.message is a copy of blob so we keep the original
+            message=blob,
         )
 
 
@@ -146,16 +167,19 @@ class SignedMessage(SyftMessage):
 
     @property
     def is_valid(self) -> bool:
-        try:
-            _ = self.verify_key.verify(self.serialized_message, self.signature)
-        except BadSignatureError:
-            return False
-
-        return True
+        return signature_cache.verify(
+            verify_key=self.verify_key,
+            signature=self.signature,
+            message=self.serialized_message,
+        )
 
     @syft_decorator(typechecking=True)
     def _object2proto(self) -> SignedMessage_PB:
-        logger.debug(f"> {self.icon} -> Proto 🔢 {self.id}")
+        tracer.trace(
+            event="message.to_proto",
+            message=lambda: f"> {self.icon} -> Proto 🔢 {self.id}",
+            msg_id=self.id,
+        )
 
         # obj_type will be the final subclass callee for example ReprMessage
         return SignedMessage_PB(
@@ -164,35 +188,74 @@ class SignedMessage(SyftMessage):
             signature=bytes(self.signature),
             verify_key=bytes(self.verify_key),
             message=self.serialized_message,
+            address=self.address.proto(),
         )
 
+    def _object2chunks(self) -> List[bytes]:
+        # the serialized message is usually the bulk of a SignedMessage, rather than
+        # copying it into a SignedMessage_PB to serialize it again we serialize the other
+        # fields and write the message field straight after them, protobuf messages
+        # can be concatenated field by field so the result is the same. The routing
+        # header has the highest field number so it goes after the message
+        proto = SignedMessage_PB(
+            msg_id=self.id.proto(),
+            obj_type=self.obj_type,
+            signature=bytes(self.signature),
+            verify_key=bytes(self.verify_key),
+        )
+        chunks = [proto.SerializeToString()]
+        if len(self.serialized_message) > 0:
+            chunks.append(
+                length_delimited_header(
+                    field_number=SIGNED_MESSAGE_FIELD,
+                    length=len(self.serialized_message),
+                )
+            )
+            chunks.append(self.serialized_message)
+        chunks.append(
+            SignedMessage_PB(address=self.address.proto()).SerializeToString()
+        )
+        return chunks
+
     @staticmethod
     @syft_decorator(typechecking=True)
     def _proto2object(proto: SignedMessage_PB) -> SignedMessageT:
-        # TODO: horrible temp hack, need to rethink address on SignedMessage
-        sub_message = _deserialize(blob=proto.message, from_bytes=True)
-        address = sub_message.address
+        # the address is read from the routing header so the message itself is only
+        # deserialized when someone asks for it, nodes which just forward the
+        # message to someone else never need to
+        sub_message = None
+        if proto.HasField("address"):
+            address = _deserialize(blob=proto.address)
+        else:
+            # sent by a peer which doesn't write the routing header yet
+            sub_message = _deserialize(blob=proto.message, from_bytes=True)
+            address = sub_message.address
 
         # proto.obj_type is final subclass callee for example ReprMessage
         # but we want the associated signed_type which is
         # ReprMessage -> ImmediateSyftMessageWithoutReply.signed_type
         # == SignedImmediateSyftMessageWithoutReply
-        module_parts = proto.obj_type.split(".")
-        klass = module_parts.pop()
-        obj_type = getattr(sys.modules[".".join(module_parts)], klass)
+        obj_type = lookup_serializable_type(fully_qualified_name=proto.obj_type)
+        if not issubclass(obj_type, SyftMessage):
+            raise TypeError(
+                "Deserializing SignedMessage. "
+                + f"Expected a SyftMessage obj_type. Got {proto.obj_type}"
+            )
         obj = obj_type.signed_type(
             msg_id=_deserialize(blob=proto.msg_id),
             address=address,
             obj_type=proto.obj_type,
             signature=proto.signature,
-            verify_key=VerifyKey(proto.verify_key),
+            verify_key=get_verify_key(proto.verify_key),
             message=proto.message,
         )
+        obj.cached_deseralized_message = sub_message
 
-        icon = "🤷🏾‍♀️"
-        if hasattr(obj, "icon"):
-            icon = obj.icon
-        logger.debug(f"> {icon} <- 🔢 Proto")
+        tracer.trace(
+            event="message.from_proto",
+            message=lambda: f"> {getattr(obj, 'icon', '🤷🏾‍♀️')} <- 🔢 Proto",
+            msg_id=obj.id,
+        )
 
         if type(obj) != obj_type.signed_type:
             raise TypeError(
@@ -207,6 +270,22 @@ class SignedMessage(SyftMessage):
         return SignedMessage_PB
 
 
+def verify_signed_messages(msgs: List[SignedMessage]) -> List[bool]:
+    """Verify the signatures of a batch of inbound messages at once.
+
+    The signatures are checked on the verification worker pool when one has been
+    set with signature.set_verification_workers. The results are cached, so
+    calling this on queued messages before they reach Node.process_message
+    means is_valid is only a cache lookup there.
+
+    :return: the is_valid of each message, in the same order as msgs
+    :rtype: List[bool]
+    """
+    return verify_signatures(
+        batch=[(msg.verify_key, msg.signature, msg.serialized_message) for msg in msgs]
+    )
+
+
 class SignedImmediateSyftMessageWithReply(SignedMessage):
     """"""
 
@@ -1,19 +1,37 @@
 # stdlib
+from typing import Type
 from typing import Union
+from typing import cast
 
 # third party
 from google.protobuf.message import Message
 
 # syft relative
 from ....decorators.syft_decorator_impl import syft_decorator
-from ....proto.util.data_message_pb2 import DataMessage
 from ....util import index_syft_by_module_name
+from .envelope import read_data_message
+from .serializable import SERIALIZABLE_TYPES
 from .serializable import Serializable
 
 
+def lookup_serializable_type(fully_qualified_name: str) -> Type[Serializable]:
+    """Get the Serializable subclass for an obj_type string
+
+    Classes are registered by MetaSerializable when they are created so this is
+    normally a single dict hit. Anything which is not in the registry falls back
+    to walking the syft module tree."""
+    try:
+        return cast(Type[Serializable], SERIALIZABLE_TYPES[fully_qualified_name])
+    except KeyError:
+        return cast(
+            Type[Serializable],
+            index_syft_by_module_name(fully_qualified_name=fully_qualified_name),
+        )
+
+
 @syft_decorator(typechecking=True)
 def _deserialize(
-    blob: Union[str, dict, bytes, Message],
+    blob: Union[str, dict, bytes, bytearray, memoryview, Message],
     from_proto: bool = True,
     from_bytes: bool = False,
 ) -> Union[Serializable, object]:
@@ -24,6 +42,8 @@ def _deserialize(
         1. An Message object is passed, this will transform a protobuf message into its
         associated class. the from_proto has to be set (it is by default).
         2. Bytes are passed. This requires the from_bytes flag set the schema_type specified.
+        A bytearray or a memoryview (for example a slice of a larger receive buffer) can be
+        passed instead of bytes, the payload is then parsed without being copied first.
         We cannot (and we should not) be able to get the schema_type from the binary
         representation.
 
@@ -36,7 +56,7 @@ def _deserialize(
             TypeError if you are are trying to deserialize an unsupported type.
 
     :param blob: this parameter is the data to be deserialized from various formats.
-    :type blob: Union[str, dict, bytes, Messages]
+    :type blob: Union[str, dict, bytes, bytearray, memoryview, Messages]
     :param from_proto: set this flag to True if you want to deserialize a protobuf message.
     :param from_bytes: set this flag to True if you want to deserialize a binary object.
     :type from_bytes: bool
@@ -45,12 +65,12 @@ def _deserialize(
     """
 
     if from_bytes:
-        data_message = DataMessage()
-        data_message.ParseFromString(blob)
-        obj_type = index_syft_by_module_name(fully_qualified_name=data_message.obj_type)
+        # content is a memoryview into blob so it's parsed without being copied
+        obj_type_name, content = read_data_message(blob=blob)  # type: ignore
+        obj_type = lookup_serializable_type(fully_qualified_name=obj_type_name)
         protobuf_type = obj_type.get_protobuf_schema()
         blob = protobuf_type()
-        blob.ParseFromString(data_message.content)  # type: ignore
+        blob.ParseFromString(content)
 
     try:
         # lets try to lookup the type we are deserializing
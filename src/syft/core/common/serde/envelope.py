@@ -0,0 +1,126 @@
+"""The binary envelope written by serialize(to_bytes=True).
+
+Every object serialized to bytes is wrapped in a DataMessage which carries the
+fully qualified name of the object's type (obj_type) and its serialized proto
+(content). Building a DataMessage and serializing it means the content is
+serialized once for the object and copied again for the envelope, and objects
+which carry already serialized payloads (like SignedMessage) pay for it once more.
+
+Instead, the functions below write and read the DataMessage wire format
+directly: the envelope header is encoded by hand and the content is appended
+after it, so the content is only copied once into the output. Reading returns a
+memoryview of the content so it can be parsed without an intermediate copy.
+The bytes are exactly what DataMessage.SerializeToString() would produce, so
+DataMessage can still be used on either side.
+"""
+
+# stdlib
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+# syft relative
+from ....proto.util.data_message_pb2 import DataMessage
+
+# protobuf wire type of string, bytes and embedded message fields
+LENGTH_DELIMITED = 2
+
+OBJ_TYPE_FIELD = DataMessage.DESCRIPTOR.fields_by_name["obj_type"].number
+CONTENT_FIELD = DataMessage.DESCRIPTOR.fields_by_name["content"].number
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode a non negative int as a protobuf base 128 varint"""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def decode_varint(buffer: memoryview, pos: int) -> Tuple[int, int]:
+    """Decode the varint starting at pos, returns the value and the next position"""
+    result = 0
+    shift = 0
+    while True:
+        if pos >= len(buffer):
+            raise ValueError("Truncated varint in DataMessage.")
+        byte = buffer[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def length_delimited_header(field_number: int, length: int) -> bytes:
+    """The key and length which precede a bytes/string/message field on the wire"""
+    return encode_varint((field_number << 3) | LENGTH_DELIMITED) + encode_varint(
+        length
+    )
+
+
+def data_message_header(obj_type: str, content_length: int) -> bytes:
+    """Everything in a serialized DataMessage which comes before the content bytes"""
+    obj_type_bytes = obj_type.encode("utf-8")
+    header = b""
+    # like protobuf, we skip fields which hold the proto3 default value
+    if obj_type_bytes:
+        header += length_delimited_header(
+            field_number=OBJ_TYPE_FIELD, length=len(obj_type_bytes)
+        )
+        header += obj_type_bytes
+    if content_length:
+        header += length_delimited_header(
+            field_number=CONTENT_FIELD, length=content_length
+        )
+    return header
+
+
+def write_data_message(
+    obj_type: str, chunks: Sequence[Union[bytes, memoryview]], buffer: bytearray
+) -> int:
+    """Append a DataMessage whose content is the concatenation of chunks to buffer
+
+    :return: the number of bytes written
+    :rtype: int
+    """
+    start = len(buffer)
+    buffer += data_message_header(
+        obj_type=obj_type, content_length=sum(len(chunk) for chunk in chunks)
+    )
+    for chunk in chunks:
+        buffer += chunk
+    return len(buffer) - start
+
+
+def read_data_message(
+    blob: Union[bytes, bytearray, memoryview]
+) -> Tuple[str, memoryview]:
+    """Split a serialized DataMessage into its obj_type and a view of its content"""
+    view = memoryview(blob)
+    obj_type = ""
+    content = view[0:0]
+    pos = 0
+    end = len(view)
+    while pos < end:
+        key, pos = decode_varint(buffer=view, pos=pos)
+        if key & 0x7 != LENGTH_DELIMITED:
+            # not something we write, let protobuf deal with it
+            data_message = DataMessage()
+            data_message.ParseFromString(view)
+            return data_message.obj_type, memoryview(data_message.content)
+
+        length, pos = decode_varint(buffer=view, pos=pos)
+        if pos + length > end:
+            raise ValueError("Truncated DataMessage.")
+
+        field_number = key >> 3
+        if field_number == OBJ_TYPE_FIELD:
+            obj_type = str(view[pos : pos + length], "utf-8")
+        elif field_number == CONTENT_FIELD:
+            content = view[pos : pos + length]
+        pos += length
+
+    return obj_type, content
@@ -1,6 +1,7 @@
 # stdlib
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Tuple
 from typing import Type
 from typing import Union
@@ -8,7 +9,6 @@ from typing import Union
 # third party
 from google.protobuf.message import Message
 from google.protobuf.reflection import GeneratedProtocolMessageType
-from loguru import logger
 
 # Fixes python3.6
 # however API changed between versions so typing_extensions smooths this over:
@@ -17,9 +17,17 @@ from typing_extensions import GenericMeta as GenericM  # type: ignore
 
 # syft relative
 from ....decorators import syft_decorator
-from ....proto.util.data_message_pb2 import DataMessage
+from ....tracing import tracer
 from ....util import get_fully_qualified_name
 from ....util import random_name
+from .envelope import data_message_header
+from .envelope import write_data_message
+
+# Every subclass of Serializable indexed by its fully qualified name (the same
+# string get_fully_qualified_name produces for an instance). MetaSerializable
+# fills this in as each class is created so that deserialization can go from
+# an obj_type string to the class with a single dict lookup.
+SERIALIZABLE_TYPES: Dict[str, Type] = {}
 
 
 # GenericMeta Fixes python 3.6
@@ -43,6 +51,7 @@ class MetaSerializable(GenericM):
         cls: Type, name: str, bases: Tuple[Type, ...], dct: Dict[str, Any]
     ) -> "MetaSerializable":
         x = super().__new__(cls, name, bases, dct)
+        SERIALIZABLE_TYPES[f"{x.__module__}.{name}"] = x
         try:
             protobuf_schema = dct["get_protobuf_schema"].__get__("")()
             protobuf_schema.schema2type = x
@@ -258,14 +267,19 @@ class Serializable(metaclass=MetaSerializable):
         """
 
         if to_bytes:
-            logger.debug(f"Serializing {type(self)}")
-            # indent=None means no white space or \n in the serialized version
-            # this is compatible with json.dumps(x, indent=None)
-            blob = self._object2proto().SerializeToString()
-            blob = DataMessage(
-                obj_type=get_fully_qualified_name(obj=self), content=blob
+            tracer.trace(
+                event="serde.serialize",
+                message=lambda: f"Serializing {type(self)}",
+                obj_type=type(self).__name__,
+            )
+            # the DataMessage envelope header is written directly in front of the
+            # content so the content is only copied once, see serde/envelope.py
+            chunks = self._object2chunks()
+            header = data_message_header(
+                obj_type=get_fully_qualified_name(obj=self),
+                content_length=sum(len(chunk) for chunk in chunks),
             )
-            return blob.SerializeToString()
+            return b"".join([header, *chunks])
 
         elif to_proto:
             return type(self)._object2proto(self)
@@ -276,6 +290,38 @@ class Serializable(metaclass=MetaSerializable):
                             to_proto, to_bytes."""
             )
 
+    def _object2chunks(self) -> List[bytes]:
+        """The serialized proto of this object as a list of byte strings
+
+        The bytes sent on the wire are the concatenation of these chunks. By default this
+        is just the serialized proto but classes which hold large payloads which are
+        already serialized (like SignedMessage) can return them as a separate chunk so
+        that they are copied straight into the output instead of being serialized again.
+
+        :return: the chunks of the serialized proto
+        :rtype: List[bytes]
+        """
+        return [type(self)._object2proto(self).SerializeToString()]
+
+    @syft_decorator(typechecking=True)
+    def serialize_into(self, buffer: bytearray) -> int:
+        """Serialize the object to bytes, appending them to an existing buffer.
+
+        The bytes written are the same as serialize(to_bytes=True) returns but they are
+        written in a single pass into buffer which lets a caller put many objects into
+        one buffer without creating an intermediate bytes object for each of them.
+
+        :param buffer: the buffer to append the serialized object to
+        :type buffer: bytearray
+        :return: the number of bytes written
+        :rtype: int
+        """
+        return write_data_message(
+            obj_type=get_fully_qualified_name(obj=self),
+            chunks=self._object2chunks(),
+            buffer=buffer,
+        )
+
     @staticmethod
     def random_name() -> str:
         return random_name()
@@ -0,0 +1,154 @@
+"""Helpers which make checking the signature of inbound messages cheaper.
+
+Every SignedMessage received by a node carries the signer's verify key and an
+ed25519 signature. Checking that signature is one of the most expensive steps
+on the receiving path, so:
+
+- verify keys are interned, a sender's VerifyKey is only built once no matter
+  how many messages it sends
+- signatures which have already been verified are remembered in a bounded LRU
+  cache so the same message is never verified twice
+- batches of messages can be verified on a pool of worker threads, libsodium
+  releases the GIL while it verifies so the workers run in parallel
+"""
+
+# stdlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
+import threading
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# third party
+from nacl.exceptions import BadSignatureError
+from nacl.signing import VerifyKey
+
+VERIFY_KEY_CACHE_SIZE = 1024
+SIGNATURE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=VERIFY_KEY_CACHE_SIZE)
+def get_verify_key(key: bytes) -> VerifyKey:
+    """Return the interned VerifyKey for the given raw key bytes"""
+    return VerifyKey(key)
+
+
+class SignatureCache:
+    """A bounded LRU record of the signatures which have been verified.
+
+    Entries are keyed by (signature, verify key) and hold a digest of the signed
+    bytes, so a valid signature replayed next to a different message is not
+    mistaken for a verified one. Only successful verifications are stored.
+    """
+
+    def __init__(self, max_size: int = SIGNATURE_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[bytes, bytes], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _digest(message: Union[bytes, bytearray, memoryview]) -> bytes:
+        return hashlib.blake2b(message, digest_size=32).digest()
+
+    def verify(
+        self,
+        verify_key: VerifyKey,
+        signature: bytes,
+        message: Union[bytes, bytearray, memoryview],
+    ) -> bool:
+        """Check signature against message, skipping the check if it was seen before"""
+        key = (bytes(signature), bytes(verify_key))
+        digest = self._digest(message)
+
+        with self._lock:
+            if self._entries.get(key) == digest:
+                self._entries.move_to_end(key)
+                return True
+
+        try:
+            verify_key.verify(bytes(message), bytes(signature))
+        except (BadSignatureError, ValueError):
+            return False
+
+        with self._lock:
+            self._entries[key] = digest
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+signature_cache = SignatureCache()
+
+# number of threads used by verify_signatures, 0 verifies in the calling thread
+_verification_workers = [0]
+_verification_executor: List[Optional[ThreadPoolExecutor]] = [None]
+_executor_lock = threading.Lock()
+
+
+def set_verification_workers(workers: int) -> None:
+    """Set how many worker threads verify batches of signatures, 0 disables the pool"""
+    if workers < 0:
+        raise ValueError(f"workers must be 0 or more. Got {workers}.")
+
+    with _executor_lock:
+        executor = _verification_executor[0]
+        _verification_executor[0] = None
+        _verification_workers[0] = workers
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def get_verification_workers() -> int:
+    return _verification_workers[0]
+
+
+def _get_executor() -> Optional[ThreadPoolExecutor]:
+    with _executor_lock:
+        if _verification_workers[0] == 0:
+            return None
+        if _verification_executor[0] is None:
+            _verification_executor[0] = ThreadPoolExecutor(
+                max_workers=_verification_workers[0],
+                thread_name_prefix="syft-verify",
+            )
+        return _verification_executor[0]
+
+
+def verify_signatures(
+    batch: List[Tuple[VerifyKey, bytes, Union[bytes, bytearray, memoryview]]]
+) -> List[bool]:
+    """Verify a batch of (verify_key, signature, message) in parallel
+
+    Uses the worker pool when one is configured with set_verification_workers and
+    there is more than one item, otherwise verifies them one after the other.
+    Every valid signature is added to the cache.
+
+    :return: whether each signature is valid, in the same order as batch
+    :rtype: List[bool]
+    """
+    executor = _get_executor() if len(batch) > 1 else None
+    if executor is None:
+        return [
+            signature_cache.verify(
+                verify_key=verify_key, signature=signature, message=message
+            )
+            for verify_key, signature, message in batch
+        ]
+
+    futures = [
+        executor.submit(signature_cache.verify, verify_key, signature, message)
+        for verify_key, signature, message in batch
+    ]
+    return [future.result() for future in futures]
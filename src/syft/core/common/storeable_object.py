@@ -1,3 +1,7 @@
+# stdlib
+from typing import List
+from typing import Optional
+
 # syft relative
 from .serde.serializable import Serializable
 from .uid import UID
@@ -7,6 +11,8 @@ class AbstractStorableObject(Serializable):
 
     data: object
     id: UID
+    description: Optional[str]
+    tags: Optional[List[str]]
 
     @property
     def icon(self) -> str:
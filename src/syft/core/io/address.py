@@ -6,13 +6,13 @@ from typing import Union
 
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
-from loguru import logger
 from nacl.signing import SigningKey
 from nacl.signing import VerifyKey
 
 # syft relative
 from ...decorators.syft_decorator_impl import syft_decorator
 from ...proto.core.io.address_pb2 import Address as Address_PB
+from ...tracing import tracer
 from ...util import key_emoji as key_emoji_util
 from ..common.serde.deserialize import _deserialize
 from ..common.serde.serializable import Serializable
@@ -101,7 +101,11 @@ class Address(Serializable):
         return output
 
     def post_init(self) -> None:
-        logger.debug(f"> Creating {self.pprint}")
+        tracer.trace(
+            event="address.create",
+            message=lambda: f"> Creating {self.pprint}",
+            address_id=getattr(self, "id", None),
+        )
 
     @syft_decorator(typechecking=True)
     def key_emoji(self, key: Union[bytes, SigningKey, VerifyKey]) -> str:
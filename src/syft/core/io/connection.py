@@ -1,3 +1,7 @@
+# stdlib
+from typing import Any
+from typing import Callable
+
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
 
@@ -5,7 +9,9 @@ from google.protobuf.reflection import GeneratedProtocolMessageType
 from ...core.common.message import SignedEventualSyftMessageWithoutReply
 from ...core.common.message import SignedImmediateSyftMessageWithReply
 from ...core.common.message import SignedImmediateSyftMessageWithoutReply
+from ...core.common.uid import UID
 from ...decorators import syft_decorator
+from .address import Address
 
 
 class BidirectionalConnection(object):
@@ -43,6 +49,20 @@ class BidirectionalConnection(object):
     ) -> None:
         raise NotImplementedError
 
+    def add_request_status_listener(
+        self, address: Address, request_id: UID, callback: Callable[[Any], None]
+    ) -> bool:
+        """Ask the node at address to call callback with the RequestStatus of a request
+        once it is accepted or denied. Returns False if the status can't be pushed over
+        this connection, then it has to be polled."""
+        return False
+
+    def remove_request_status_listener(
+        self, address: Address, request_id: UID, callback: Callable[[Any], None]
+    ) -> None:
+        """Forget a callback given to add_request_status_listener, like when the
+        client stopped waiting for the request"""
+
     @syft_decorator(typechecking=True)
     def _object2proto(self) -> None:
         raise NotImplementedError
@@ -111,6 +131,20 @@ class ClientConnection(object):
     ) -> None:
         raise NotImplementedError
 
+    def add_request_status_listener(
+        self, address: Address, request_id: UID, callback: Callable[[Any], None]
+    ) -> bool:
+        """Ask the node at address to call callback with the RequestStatus of a request
+        once it is accepted or denied. Returns False if the status can't be pushed over
+        this connection, then it has to be polled."""
+        return False
+
+    def remove_request_status_listener(
+        self, address: Address, request_id: UID, callback: Callable[[Any], None]
+    ) -> None:
+        """Forget a callback given to add_request_status_listener, like when the
+        client stopped waiting for the request"""
+
     @syft_decorator(typechecking=True)
     def _object2proto(self) -> None:
         raise NotImplementedError
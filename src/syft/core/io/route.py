@@ -84,20 +84,24 @@ node, propagating the model to all node which asked for it.
 """
 
 # stdlib
+from typing import Any
+from typing import Callable
 from typing import List
 from typing import Union
 
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
-from loguru import logger
 
 # syft relative
 from ...decorators import syft_decorator
 from ...proto.core.io.route_pb2 import SoloRoute as SoloRoute_PB
+from ...tracing import tracer
 from ..common.message import SignedEventualSyftMessageWithoutReply
 from ..common.message import SignedImmediateSyftMessageWithReply
 from ..common.message import SignedImmediateSyftMessageWithoutReply
 from ..common.object import ObjectWithID
+from ..common.uid import UID
+from .address import Address
 from .connection import BidirectionalConnection
 from .connection import ClientConnection
 from .location import Location
@@ -148,6 +152,16 @@ class Route(ObjectWithID):
     ) -> None:
         raise NotImplementedError
 
+    def add_request_status_listener(
+        self, address: Address, request_id: UID, callback: Callable[[Any], None]
+    ) -> bool:
+        return False
+
+    def remove_request_status_listener(
+        self, address: Address, request_id: UID, callback: Callable[[Any], None]
+    ) -> None:
+        pass
+
 
 class SoloRoute(Route):
     def __init__(
@@ -161,7 +175,11 @@ class SoloRoute(Route):
     def send_immediate_msg_without_reply(
         self, msg: SignedImmediateSyftMessageWithoutReply
     ) -> None:
-        logger.debug(f"> Routing {msg.pprint} via {self.pprint}")
+        tracer.trace(
+            event="route.send",
+            message=lambda: f"> Routing {msg.pprint} via {self.pprint}",
+            msg_id=msg.id,
+        )
         self.connection.send_immediate_msg_without_reply(msg=msg)
 
     def send_eventual_msg_without_reply(
@@ -174,6 +192,20 @@ class SoloRoute(Route):
     ) -> SignedImmediateSyftMessageWithoutReply:
         return self.connection.send_immediate_msg_with_reply(msg=msg)
 
+    def add_request_status_listener(
+        self, address: Address, request_id: UID, callback: Callable[[Any], None]
+    ) -> bool:
+        return self.connection.add_request_status_listener(
+            address=address, request_id=request_id, callback=callback
+        )
+
+    def remove_request_status_listener(
+        self, address: Address, request_id: UID, callback: Callable[[Any], None]
+    ) -> None:
+        self.connection.remove_request_status_listener(
+            address=address, request_id=request_id, callback=callback
+        )
+
     @syft_decorator(typechecking=True)
     def _object2proto(self) -> SoloRoute_PB:
         return SoloRoute_PB(
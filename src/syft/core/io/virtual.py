@@ -4,6 +4,10 @@ Replacing this object with an actual network connection object
 (such as one powered by P2P tech, web sockets, or HTTP) should
 execute the exact same functionality but do so over a network"""
 
+# stdlib
+from typing import Any
+from typing import Callable
+
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
 from typing_extensions import final
@@ -20,7 +24,9 @@ from ..common.message import SignedEventualSyftMessageWithoutReply
 from ..common.message import SignedImmediateSyftMessageWithReply
 from ..common.message import SignedImmediateSyftMessageWithoutReply
 from ..common.serde.deserialize import _deserialize
+from ..common.uid import UID
 from ..node.abstract.node import AbstractNode
+from .address import Address
 from .connection import ClientConnection
 from .connection import ServerConnection
 
@@ -88,6 +94,24 @@ class VirtualClientConnection(ClientConnection):
     ) -> None:
         return self.server.recv_eventual_msg_without_reply(msg=msg)
 
+    def add_request_status_listener(
+        self, address: Address, request_id: UID, callback: Callable[[Any], None]
+    ) -> bool:
+        # the node is in this process, so if it holds the request it can call back
+        node = self.server.node
+        requests = getattr(node, "requests", None)
+        if requests is None or address.target_id.id != node.id:
+            return False
+        requests.add_listener(request_id=request_id, callback=callback)
+        return True
+
+    def remove_request_status_listener(
+        self, address: Address, request_id: UID, callback: Callable[[Any], None]
+    ) -> None:
+        requests = getattr(self.server.node, "requests", None)
+        if requests is not None:
+            requests.remove_listener(request_id=request_id, callback=callback)
+
     @syft_decorator(typechecking=True)
     def _object2proto(self) -> VirtualClientConnection_PB:
         return VirtualClientConnection_PB(server=self.server._object2proto())
@@ -1,5 +1,6 @@
 # stdlib
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -32,6 +33,7 @@ class AbstractNode(Address):
     in_memory_client_registry: Dict[Any, Any]
     # TODO: remove hacky signaling_msgs when SyftMessages become Storable.
     signaling_msgs: Dict[Any, Any]
+    signaling_listeners: Dict[str, List[Callable[[], None]]]
 
     @syft_decorator(typechecking=True)
     def __init__(
@@ -47,7 +49,8 @@ class AbstractNode(Address):
         )
 
     store: ObjectStore
-    requests: List
+    requests: Any  # Cant import RequestQueue (circular reference)
+    leases: Any  # Cant import ObjectLeases (circular reference)
     lib_ast: Any  # Cant import Globals (circular reference)
     """"""
 
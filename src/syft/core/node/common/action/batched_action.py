@@ -0,0 +1,142 @@
+# stdlib
+from typing import List
+from typing import Optional
+from typing import Union
+
+# third party
+from google.protobuf.reflection import GeneratedProtocolMessageType
+from loguru import logger
+from nacl.signing import VerifyKey
+
+# syft relative
+from .....decorators.syft_decorator_impl import syft_decorator
+from .....proto.core.node.common.action.batched_action_pb2 import (
+    BatchedActionMessage as BatchedActionMessage_PB,
+)
+from ....common.serde.deserialize import _deserialize
+from ....common.uid import UID
+from ....io.address import Address
+from ...abstract.node import AbstractNode
+from .common import EventualActionWithoutReply
+from .common import ImmediateActionWithoutReply
+
+BatchableAction = Union[ImmediateActionWithoutReply, EventualActionWithoutReply]
+
+
+class BatchedActionMessage(ImmediateActionWithoutReply):
+    """
+    A list of actions which are sent, signed and executed together. A client which
+    is pipelining (see :meth:`Client.pipeline`) queues the actions it would have
+    sent one by one and sends them in a BatchedActionMessage instead, so the whole
+    batch costs a single signature and a single round trip.
+
+    Only actions without a reply can be batched, batches can't be nested and every
+    action has to be addressed to the same node as the batch, so a batch can't slip
+    an action for another node past the routing of the receiving node. The actions
+    run one after the other as soon as the batch arrives, so an eventual action
+    (like GarbageCollectObjectAction) runs with the semantics of an immediate one,
+    which is still within what "eventual" promises. An action which raises is
+    logged and the rest of the batch still runs, as if each had been sent on its own.
+
+    Attributes:
+         actions: the actions to execute, in the order they were queued. None of them
+            can expect a reply.
+    """
+
+    def __init__(
+        self,
+        actions: List[BatchableAction],
+        address: Address,
+        msg_id: Optional[UID] = None,
+    ):
+        for action in actions:
+            if not isinstance(
+                action, (ImmediateActionWithoutReply, EventualActionWithoutReply)
+            ) or isinstance(action, BatchedActionMessage):
+                raise TypeError(
+                    "BatchedActionMessage can only batch actions without a reply. "
+                    + f"Got {type(action)}"
+                )
+            if action.address != address:
+                raise ValueError(
+                    "BatchedActionMessage can only batch actions addressed to "
+                    + f"{address}. Got {action.pprint} addressed to {action.address}"
+                )
+        self.actions = actions
+        super().__init__(address=address, msg_id=msg_id)
+
+    @property
+    def pprint(self) -> str:
+        return f"BatchedActionMessage({len(self.actions)} actions)"
+
+    def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
+        # the batch is signed as a whole so every action runs with the batch's
+        # verify_key, exactly as if it had been sent on its own. The node only
+        # executes batches addressed to it and __init__ (which deserialization goes
+        # through) rejects actions addressed elsewhere, so every action is for it
+        for action in self.actions:
+            try:
+                action.execute_action(node=node, verify_key=verify_key)
+            except Exception as e:
+                logger.error(f"Exception executing {action} in {self.pprint}. {e}")
+
+    @syft_decorator(typechecking=True)
+    def _object2proto(self) -> BatchedActionMessage_PB:
+        """Returns a protobuf serialization of self.
+
+        As a requirement of all objects which inherit from Serializable,
+        this method transforms the current object into the corresponding
+        Protobuf object so that it can be further serialized.
+
+        :return: returns a protobuf object
+        :rtype: BatchedActionMessage_PB
+
+        .. note::
+            This method is purely an internal method. Please use object.serialize() or one of
+            the other public serialization methods if you wish to serialize an
+            object.
+        """
+
+        return BatchedActionMessage_PB(
+            msg_id=self.id.serialize(),
+            address=self.address.serialize(),
+            actions=[action.serialize(to_bytes=True) for action in self.actions],
+        )
+
+    @staticmethod
+    def _proto2object(proto: BatchedActionMessage_PB) -> "BatchedActionMessage":
+        """Creates a BatchedActionMessage from a protobuf
+
+        As a requirement of all objects which inherit from Serializable,
+        this method transforms a protobuf object into an instance of this class.
+
+        :return: returns an instance of BatchedActionMessage
+        :rtype: BatchedActionMessage
+
+        .. note::
+            This method is purely an internal method. Please use syft.deserialize()
+            if you wish to deserialize an object.
+        """
+
+        return BatchedActionMessage(
+            actions=[
+                _deserialize(blob=action, from_bytes=True) for action in proto.actions
+            ],
+            address=_deserialize(blob=proto.address),
+            msg_id=_deserialize(blob=proto.msg_id),
+        )
+
+    @staticmethod
+    def get_protobuf_schema() -> GeneratedProtocolMessageType:
+        """Return the type of protobuf object which stores a class of this type
+
+        As a part of serialization and deserialization, we need the ability to
+        lookup the protobuf object type directly from the object type. This
+        static method allows us to do this.
+
+        :return: the type of protobuf object which corresponds to this class.
+        :rtype: GeneratedProtocolMessageType
+
+        """
+
+        return BatchedActionMessage_PB
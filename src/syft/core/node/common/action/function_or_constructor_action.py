@@ -23,6 +23,12 @@ from ....pointer.pointer import Pointer
 from ....store.storeable_object import StorableObject
 from ...abstract.node import AbstractNode
 from .common import ImmediateActionWithoutReply
+from .inline_args import args_from_proto
+from .inline_args import args_to_proto
+from .inline_args import inline_read_permissions
+from .inline_args import isinlineable
+from .inline_args import kwargs_from_proto
+from .inline_args import kwargs_to_proto
 
 
 class RunFunctionOrConstructorAction(ImmediateActionWithoutReply):
@@ -34,9 +40,11 @@ class RunFunctionOrConstructorAction(ImmediateActionWithoutReply):
     Attributes:
          path: the dotted path to the function to call
          args: args to pass to the function. They should be pointers to objects
-            located on the :class:`Node` that will execute the action.
+            located on the :class:`Node` that will execute the action, or small
+            literals which are sent inline.
          kwargs: kwargs to pass to the function. They should be pointers to objects
-            located on the :class:`Node` that will execute the action.
+            located on the :class:`Node` that will execute the action, or small
+            literals which are sent inline.
     """
 
     def __init__(
@@ -59,8 +67,9 @@ class RunFunctionOrConstructorAction(ImmediateActionWithoutReply):
 
     @staticmethod
     def intersect_keys(
-        left: Union[Dict[VerifyKey, UID], None], right: Dict[VerifyKey, UID]
-    ) -> Dict[VerifyKey, UID]:
+        left: Union[Dict[VerifyKey, Optional[UID]], None],
+        right: Dict[VerifyKey, Optional[UID]],
+    ) -> Dict[VerifyKey, Optional[UID]]:
         # FIXME duplicated in run_class_method_action.py
         # get the intersection of the dict keys, the value is the request_id
         # if the request_id is different for some reason we still want to keep it,
@@ -75,15 +84,22 @@ class RunFunctionOrConstructorAction(ImmediateActionWithoutReply):
     def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
         method = node.lib_ast(self.path)
 
-        result_read_permissions: Union[None, Dict[VerifyKey, UID]] = None
+        result_read_permissions: Union[None, Dict[VerifyKey, Optional[UID]]] = None
 
         resolved_args = list()
         for arg in self.args:
             if not isinstance(arg, Pointer):
-                raise ValueError(
-                    f"args attribute of RunFunctionOrConstructorAction should only contain Pointers. "
-                    f"Got {arg} of type {type(arg)}"
+                if not isinlineable(value=arg):
+                    raise ValueError(
+                        f"args attribute of RunFunctionOrConstructorAction should only contain Pointers "
+                        f"or inline literals. Got {arg} of type {type(arg)}"
+                    )
+                result_read_permissions = self.intersect_keys(
+                    result_read_permissions,
+                    inline_read_permissions(node=node, verify_key=verify_key),
                 )
+                resolved_args.append(arg)
+                continue
 
             r_arg = node.store.get_object(key=arg.id_at_location)
             result_read_permissions = self.intersect_keys(
@@ -94,10 +110,17 @@ class RunFunctionOrConstructorAction(ImmediateActionWithoutReply):
         resolved_kwargs = {}
         for arg_name, arg in self.kwargs.items():
             if not isinstance(arg, Pointer):
-                raise ValueError(
-                    f"kwargs attribute of RunFunctionOrConstructorAction should only contain Pointers. "
-                    f"Got {arg} of type {type(arg)}"
+                if not isinlineable(value=arg):
+                    raise ValueError(
+                        f"kwargs attribute of RunFunctionOrConstructorAction should only contain Pointers "
+                        f"or inline literals. Got {arg} of type {type(arg)}"
+                    )
+                result_read_permissions = self.intersect_keys(
+                    result_read_permissions,
+                    inline_read_permissions(node=node, verify_key=verify_key),
                 )
+                resolved_kwargs[arg_name] = arg
+                continue
 
             r_arg = node.store.get_object(key=arg.id_at_location)
             result_read_permissions = self.intersect_keys(
@@ -144,6 +167,7 @@ class RunFunctionOrConstructorAction(ImmediateActionWithoutReply):
             )
 
         node.store[self.id_at_location] = result
+        node.leases.track(verify_key=verify_key, key=self.id_at_location)
 
     @syft_decorator(typechecking=True)
     def _object2proto(self) -> RunFunctionOrConstructorAction_PB:
@@ -161,13 +185,17 @@ class RunFunctionOrConstructorAction(ImmediateActionWithoutReply):
             the other public serialization methods if you wish to serialize an
             object.
         """
+        args, inline_args = args_to_proto(args=self.args)
+        kwargs, inline_kwargs = kwargs_to_proto(kwargs=self.kwargs)
         return RunFunctionOrConstructorAction_PB(
             path=self.path,
-            args=[x.serialize() for x in self.args],
-            kwargs={k: v.serialize() for k, v in self.kwargs.items()},
+            args=args,
+            kwargs=kwargs,
             id_at_location=self.id_at_location.serialize(),
             address=self.address.serialize(),
             msg_id=self.id.serialize(),
+            inline_args=inline_args,
+            inline_kwargs=inline_kwargs,
         )
 
     @staticmethod
@@ -189,8 +217,8 @@ class RunFunctionOrConstructorAction(ImmediateActionWithoutReply):
 
         return RunFunctionOrConstructorAction(
             path=proto.path,
-            args=tuple(_deserialize(blob=x) for x in proto.args),
-            kwargs={k: _deserialize(blob=v) for k, v in proto.kwargs.items()},
+            args=args_from_proto(pointers=proto.args, inline=proto.inline_args),
+            kwargs=kwargs_from_proto(pointers=proto.kwargs, inline=proto.inline_kwargs),
             id_at_location=_deserialize(blob=proto.id_at_location),
             address=_deserialize(blob=proto.address),
             msg_id=_deserialize(blob=proto.msg_id),
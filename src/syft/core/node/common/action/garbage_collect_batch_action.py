@@ -0,0 +1,73 @@
+# stdlib
+from typing import List
+from typing import Optional
+
+# third party
+from google.protobuf.reflection import GeneratedProtocolMessageType
+from loguru import logger
+from nacl.signing import VerifyKey
+
+# syft relative
+from .....decorators.syft_decorator_impl import syft_decorator
+from .....proto.core.node.common.action.garbage_collect_batch_pb2 import (
+    GarbageCollectBatchAction as GarbageCollectBatchAction_PB,
+)
+from ....common.serde.deserialize import _deserialize
+from ....common.uid import UID
+from ....io.address import Address
+from ...abstract.node import AbstractNode
+from .common import EventualActionWithoutReply
+
+
+class GarbageCollectBatchAction(EventualActionWithoutReply):
+    """
+    Deletes the objects of many garbage collected pointers at once. A client which
+    batches its garbage collection (see :meth:`Client.gc_batch_size`) collects the ids
+    of the pointers which were deleted and sends them in one of these instead of a
+    GarbageCollectObjectAction for each.
+    """
+
+    def __init__(
+        self,
+        ids_at_location: List[UID],
+        address: Address,
+        msg_id: Optional[UID] = None,
+    ):
+        super().__init__(address=address, msg_id=msg_id)
+        self.ids_at_location = ids_at_location
+
+    @property
+    def pprint(self) -> str:
+        return f"GarbageCollectBatchAction({len(self.ids_at_location)} objects)"
+
+    def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
+        try:
+            node.store.delete_many(keys=self.ids_at_location)
+            for id_at_location in self.ids_at_location:
+                node.leases.release(key=id_at_location)
+        except Exception as e:
+            logger.critical(
+                "> GarbageCollectBatchAction deletion exception "
+                + f"{len(self.ids_at_location)} objects {e}"
+            )
+
+    @syft_decorator(typechecking=True)
+    def _object2proto(self) -> GarbageCollectBatchAction_PB:
+        return GarbageCollectBatchAction_PB(
+            ids_at_location=[uid.serialize() for uid in self.ids_at_location],
+            address=self.address.serialize(),
+        )
+
+    @staticmethod
+    @syft_decorator(typechecking=True)
+    def _proto2object(
+        proto: GarbageCollectBatchAction_PB,
+    ) -> "GarbageCollectBatchAction":
+        return GarbageCollectBatchAction(
+            ids_at_location=[_deserialize(blob=uid) for uid in proto.ids_at_location],
+            address=_deserialize(blob=proto.address),
+        )
+
+    @staticmethod
+    def get_protobuf_schema() -> GeneratedProtocolMessageType:
+        return GarbageCollectBatchAction_PB
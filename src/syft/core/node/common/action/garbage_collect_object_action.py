@@ -28,6 +28,7 @@ class GarbageCollectObjectAction(EventualActionWithoutReply):
     def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
         try:
             node.store.delete(key=self.id_at_location)
+            node.leases.release(key=self.id_at_location)
         except Exception as e:
             logger.critical(
                 "> GarbageCollectObjectAction deletion exception "
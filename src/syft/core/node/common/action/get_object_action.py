@@ -16,6 +16,7 @@ from .....proto.core.node.common.action.get_object_pb2 import (
     GetObjectResponseMessage as GetObjectResponseMessage_PB,
 )
 from .....proto.core.store.store_object_pb2 import StorableObject as StorableObject_PB
+from .....tracing import tracer
 from ....common.message import ImmediateSyftMessageWithoutReply
 from ....common.serde.deserialize import _deserialize
 from ....common.uid import UID
@@ -187,8 +188,11 @@ class GetObjectAction(ImmediateActionWithReply):
                 try:
                     # TODO: send EventualActionWithoutReply to delete the object at the node's
                     # convenience instead of definitely having to delete it now
-                    logger.debug(
-                        f"Calling delete on Object with ID {self.id_at_location} in store."
+                    tracer.trace(
+                        event="get_object.delete",
+                        message=lambda: "Calling delete on Object with ID "
+                        + f"{self.id_at_location} in store.",
+                        id_at_location=self.id_at_location,
                     )
                     node.store.delete(key=self.id_at_location)
                 except Exception as e:
@@ -197,10 +201,18 @@ class GetObjectAction(ImmediateActionWithReply):
                     )
                     logger.critical(log)
             else:
-                logger.debug(f"Copying Object with ID {self.id_at_location} in store.")
+                tracer.trace(
+                    event="get_object.copy",
+                    message=lambda: f"Copying Object with ID {self.id_at_location} "
+                    + "in store.",
+                    id_at_location=self.id_at_location,
+                )
 
-            logger.debug(
-                f"Returning Object with ID: {self.id_at_location} {type(storeable_object.data)}"
+            tracer.trace(
+                event="get_object.return",
+                message=lambda: f"Returning Object with ID: {self.id_at_location} "
+                + f"{type(obj)}",
+                id_at_location=self.id_at_location,
             )
             return msg
         except Exception as e:
@@ -0,0 +1,116 @@
+# stdlib
+from collections import UserDict
+from collections import UserList
+from collections import UserString
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# third party
+from nacl.signing import VerifyKey
+
+# syft relative
+from ....common.serde.deserialize import _deserialize
+from ....common.serde.serialize import _serialize
+from ....common.uid import UID
+from ....pointer.pointer import Pointer
+from ...abstract.node import AbstractNode
+
+# literal arguments up to this estimated size are sent inside the action, bigger ones
+# are saved on the node first and passed as a pointer
+INLINE_MAX_BYTES = 1024
+
+# the estimated size of a number, a bool or None
+_SCALAR_BYTES = 16
+
+
+def _literal_size(value: Any, budget: int) -> Optional[int]:
+    # an estimate of the size of a literal, None if it isn't one or is over budget
+    if isinstance(value, (UserString, str)):
+        size = len(value)
+    elif isinstance(value, (UserList, UserDict, list, tuple, dict)):
+        items = value.items() if isinstance(value, (UserDict, dict)) else [value]
+        size = _SCALAR_BYTES
+        for item in items:
+            for element in item:
+                element_size = _literal_size(value=element, budget=budget - size)
+                if element_size is None:
+                    return None
+                size += element_size
+    elif value is None or isinstance(value, (bool, int, float, complex)):
+        size = _SCALAR_BYTES
+    elif type(value).__name__ == "_SyNone":
+        size = _SCALAR_BYTES
+    else:
+        return None
+    return size if size <= budget else None
+
+
+def isinlineable(value: Any, max_bytes: int = INLINE_MAX_BYTES) -> bool:
+    """Whether value is a small literal, like the ints of a shape or a dim=1, which
+    can be sent inside an action instead of being saved on the node first. Only
+    values which were downcast to a PyPrimitive are sent inline."""
+    # syft relative
+    from .....lib.python.primitive_interface import PyPrimitive
+
+    if not isinstance(value, PyPrimitive):
+        return False
+    return _literal_size(value=value, budget=max_bytes) is not None
+
+
+def args_to_proto(
+    args: Union[Tuple[Any, ...], List[Any]]
+) -> Tuple[List[Any], Dict[int, bytes]]:
+    """Split args into the serialized pointers and the serialized inline values by
+    their position"""
+    pointers = []
+    inline = {}
+    for index, arg in enumerate(args):
+        if isinstance(arg, Pointer):
+            pointers.append(arg.serialize())
+        else:
+            inline[index] = _serialize(obj=arg, to_bytes=True)
+    return pointers, inline
+
+
+def args_from_proto(pointers: Any, inline: Any) -> Tuple[Any, ...]:
+    args = []
+    remaining = iter(pointers)
+    for index in range(len(pointers) + len(inline)):
+        if index in inline:
+            args.append(_deserialize(blob=inline[index], from_bytes=True))
+        else:
+            args.append(_deserialize(blob=next(remaining)))
+    return tuple(args)
+
+
+def kwargs_to_proto(kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, bytes]]:
+    pointers = {}
+    inline = {}
+    for name, arg in kwargs.items():
+        if isinstance(arg, Pointer):
+            pointers[name] = arg.serialize()
+        else:
+            inline[name] = _serialize(obj=arg, to_bytes=True)
+    return pointers, inline
+
+
+def kwargs_from_proto(pointers: Any, inline: Any) -> Dict[str, Any]:
+    kwargs = {name: _deserialize(blob=blob) for name, blob in pointers.items()}
+    for name, blob in inline.items():
+        kwargs[name] = _deserialize(blob=blob, from_bytes=True)
+    return kwargs
+
+
+def inline_read_permissions(
+    node: AbstractNode, verify_key: VerifyKey
+) -> Dict[VerifyKey, Optional[UID]]:
+    """The read permissions an inline value would have had if it was saved on the
+    node by the sender, like SaveObjectAction does"""
+    read_permissions: Dict[VerifyKey, Optional[UID]] = {verify_key: None}
+    if node.verify_key is not None:
+        read_permissions[node.verify_key] = node.id
+    return read_permissions
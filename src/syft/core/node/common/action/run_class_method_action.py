@@ -20,9 +20,16 @@ from .....proto.core.node.common.action.run_class_method_pb2 import (
 from ....common.serde.deserialize import _deserialize
 from ....common.uid import UID
 from ....io.address import Address
+from ....pointer.pointer import Pointer
 from ....store.storeable_object import StorableObject
 from ...abstract.node import AbstractNode
 from .common import ImmediateActionWithoutReply
+from .inline_args import args_from_proto
+from .inline_args import args_to_proto
+from .inline_args import inline_read_permissions
+from .inline_args import isinlineable
+from .inline_args import kwargs_from_proto
+from .inline_args import kwargs_to_proto
 
 
 class RunClassMethodAction(ImmediateActionWithoutReply):
@@ -35,9 +42,11 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
          path: the dotted path to the method to call
          _self: a pointer to the object which the method should be applied to.
          args: args to pass to the function. They should be pointers to objects
-            located on the :class:`Node` that will execute the action.
+            located on the :class:`Node` that will execute the action, or small
+            literals which are sent inline.
          kwargs: kwargs to pass to the function. They should be pointers to objects
-            located on the :class:`Node` that will execute the action.
+            located on the :class:`Node` that will execute the action, or small
+            literals which are sent inline.
     """
 
     def __init__(
@@ -62,8 +71,8 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
 
     @staticmethod
     def intersect_keys(
-        left: Dict[VerifyKey, UID], right: Dict[VerifyKey, UID]
-    ) -> Dict[VerifyKey, UID]:
+        left: Dict[VerifyKey, Optional[UID]], right: Dict[VerifyKey, Optional[UID]]
+    ) -> Dict[VerifyKey, Optional[UID]]:
         # get the intersection of the dict keys, the value is the request_id
         # if the request_id is different for some reason we still want to keep it,
         # so only intersect the keys and then copy those over from the main dict
@@ -103,6 +112,18 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
 
         resolved_args = list()
         for arg in self.args:
+            if not isinstance(arg, Pointer):
+                if not isinlineable(value=arg):
+                    raise ValueError(
+                        f"args attribute of RunClassMethodAction should only contain Pointers "
+                        f"or inline literals. Got {arg} of type {type(arg)}"
+                    )
+                result_read_permissions = self.intersect_keys(
+                    result_read_permissions,
+                    inline_read_permissions(node=node, verify_key=verify_key),
+                )
+                resolved_args.append(arg)
+                continue
             r_arg = node.store[arg.id_at_location]
             result_read_permissions = self.intersect_keys(
                 result_read_permissions, r_arg.read_permissions
@@ -111,6 +132,18 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
 
         resolved_kwargs = {}
         for arg_name, arg in self.kwargs.items():
+            if not isinstance(arg, Pointer):
+                if not isinlineable(value=arg):
+                    raise ValueError(
+                        f"kwargs attribute of RunClassMethodAction should only contain Pointers "
+                        f"or inline literals. Got {arg} of type {type(arg)}"
+                    )
+                result_read_permissions = self.intersect_keys(
+                    result_read_permissions,
+                    inline_read_permissions(node=node, verify_key=verify_key),
+                )
+                resolved_kwargs[arg_name] = arg
+                continue
             r_arg = node.store[arg.id_at_location]
             result_read_permissions = self.intersect_keys(
                 result_read_permissions, r_arg.read_permissions
@@ -178,6 +211,7 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
             )
 
         node.store[self.id_at_location] = result
+        node.leases.track(verify_key=verify_key, key=self.id_at_location)
 
     @syft_decorator(typechecking=True)
     def _object2proto(self) -> RunClassMethodAction_PB:
@@ -196,14 +230,18 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
             object.
         """
 
+        args, inline_args = args_to_proto(args=self.args)
+        kwargs, inline_kwargs = kwargs_to_proto(kwargs=self.kwargs)
         return RunClassMethodAction_PB(
             path=self.path,
             _self=self._self.serialize(),
-            args=list(map(lambda x: x.serialize(), self.args)),
-            kwargs={k: v.serialize() for k, v in self.kwargs.items()},
+            args=args,
+            kwargs=kwargs,
             id_at_location=self.id_at_location.serialize(),
             address=self.address.serialize(),
             msg_id=self.id.serialize(),
+            inline_args=inline_args,
+            inline_kwargs=inline_kwargs,
         )
 
     @staticmethod
@@ -224,8 +262,8 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
         return RunClassMethodAction(
             path=proto.path,
             _self=_deserialize(blob=proto._self),
-            args=tuple(map(lambda x: _deserialize(blob=x), proto.args)),
-            kwargs={k: _deserialize(blob=v) for k, v in proto.kwargs.items()},
+            args=args_from_proto(pointers=proto.args, inline=proto.inline_args),
+            kwargs=kwargs_from_proto(pointers=proto.kwargs, inline=proto.inline_kwargs),
             id_at_location=_deserialize(blob=proto.id_at_location),
             address=_deserialize(blob=proto.address),
             msg_id=_deserialize(blob=proto.msg_id),
@@ -67,6 +67,7 @@ class SaveObjectAction(ImmediateActionWithoutReply, Serializable):
         )
 
         node.store[self.id_at_location] = storable_obj
+        node.leases.track(verify_key=verify_key, key=self.id_at_location)
 
     @syft_decorator(typechecking=True)
     def _object2proto(self) -> SaveObjectAction_PB:
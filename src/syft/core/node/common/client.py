@@ -1,11 +1,18 @@
 # stdlib
+import atexit
+from contextlib import contextmanager
 import sys
+import threading
+import time
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Union
+import weakref
 
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
@@ -20,6 +27,7 @@ from ....decorators import syft_decorator
 from ....lib import lib_ast
 from ....proto.core.node.common.client_pb2 import Client as Client_PB
 from ....proto.core.node.common.metadata_pb2 import Metadata as Metadata_PB
+from ....tracing import tracer
 from ....util import get_fully_qualified_name
 from ...common.message import EventualSyftMessageWithoutReply
 from ...common.message import ImmediateSyftMessageWithReply
@@ -37,8 +45,52 @@ from ...io.route import SoloRoute
 from ...io.virtual import VirtualClientConnection
 from ...node.common.service.obj_search_service import ObjectSearchMessage
 from ..abstract.node import AbstractNodeClient
+from .action.batched_action import BatchableAction
+from .action.batched_action import BatchedActionMessage
+from .action.common import EventualActionWithoutReply
+from .action.common import ImmediateActionWithoutReply
 from .action.exception_action import ExceptionMessage
+from .action.garbage_collect_batch_action import GarbageCollectBatchAction
+from .action.garbage_collect_object_action import GarbageCollectObjectAction
 from .service.child_node_lifecycle_service import RegisterChildNodeMessage
+from .service.lease_service import LeaseRenewalMessage
+
+# the clients which may have garbage collected pointers waiting for a batch
+# by id() because clients are not hashable
+_clients_to_flush: "weakref.WeakValueDictionary[int, Client]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _flush_gc_at_exit() -> None:
+    for client in list(_clients_to_flush.values()):
+        try:
+            client.flush_gc()
+        except Exception as e:
+            logger.error(f"Failed to flush garbage collection of {client}. {e}")
+
+
+atexit.register(_flush_gc_at_exit)
+
+
+def _flush_gc_of(client_ref: "weakref.ref[Client]") -> None:
+    client = client_ref()
+    if client is None:
+        return
+    try:
+        client.flush_gc()
+    except Exception as e:
+        logger.error(f"Failed to flush garbage collection of {client}. {e}")
+
+
+def _renew_lease_of(client_ref: "weakref.ref[Client]", heartbeat_secs: float) -> None:
+    client = client_ref()
+    if client is None:
+        return
+    try:
+        client._renew_lease(heartbeat_secs=heartbeat_secs)
+    except Exception as e:
+        logger.error(f"Failed to renew the lease of {client}. {e}")
 
 
 class Client(AbstractNodeClient):
@@ -81,6 +133,30 @@ class Client(AbstractNodeClient):
         else:
             self.verify_key = verify_key
 
+        # actions queued while pipelining, None when the client is not pipelining
+        self._pipelined_actions: Optional[List[BatchableAction]] = None
+        self._pipeline_max_size = 0
+        # the garbage collection timer queues actions too, so the queue is only
+        # changed and flushed while holding this lock
+        self._pipeline_lock = threading.RLock()
+
+        # the ids of garbage collected pointers which are sent to the node in batches
+        # of gc_batch_size, or gc_flush_interval seconds after the first of them was
+        # collected. With the default of 1 every pointer deletes its object as soon
+        # as it is garbage collected.
+        self.gc_batch_size = 1
+        self.gc_flush_interval: Optional[float] = None
+        self._collected_ids: List[UID] = []
+        self._gc_lock = threading.RLock()
+        # when the ids waiting for a batch are due to be sent, see gc_flush_interval
+        self._gc_due: Optional[float] = None
+        self._gc_timer: Optional[threading.Timer] = None
+        _clients_to_flush[id(self)] = self
+
+        # the lease on the objects of this client, see enable_leases
+        self.lease_duration: Optional[float] = None
+        self._lease_timer: Optional[threading.Timer] = None
+
         self.install_supported_frameworks()
 
         self.store = StoreClient(client=self)
@@ -114,22 +190,26 @@ class Client(AbstractNodeClient):
         return meta.node, meta.name, meta.id
 
     def install_supported_frameworks(self) -> None:
-        self.lib_ast = lib_ast.copy()
-        if self.lib_ast is not None:
-            self.lib_ast.set_client(self)
-
-            for attr_name, attr in self.lib_ast.attrs.items():
-                setattr(self, attr_name, attr)
-                if attr_name == "syft":
-                    try:
-                        lib_attr = getattr(attr, "lib", None)
-                        if lib_attr is not None:
-                            python_attr = getattr(lib_attr, "python", None)
-                            if python_attr is not None:
-                                # not working
-                                setattr(self, "python", python_attr)  # type ignore
-                    except Exception as e:
-                        print(f"Failed to set python attribute on client. {e}")
+        # syft relative
+        # syft.ast can only be imported once syft.lib has finished building lib_ast
+        from ....ast.proxy import bind
+
+        # the lib_ast is shared by all clients, we only bind a view of it to this one
+        self.lib_ast = bind(attr=lib_ast, client=self)
+
+        for attr_name in lib_ast.attrs.keys():
+            attr = getattr(self.lib_ast, attr_name)
+            setattr(self, attr_name, attr)
+            if attr_name == "syft":
+                try:
+                    lib_attr = getattr(attr, "lib", None)
+                    if lib_attr is not None:
+                        python_attr = getattr(lib_attr, "python", None)
+                        if python_attr is not None:
+                            # not working
+                            setattr(self, "python", python_attr)  # type ignore
+                except Exception as e:
+                    print(f"Failed to set python attribute on client. {e}")
 
     def add_me_to_my_address(self) -> None:
         raise NotImplementedError
@@ -204,6 +284,196 @@ class Client(AbstractNodeClient):
         """This client points to an node, this returns the id of that node."""
         raise NotImplementedError
 
+    @contextmanager
+    def pipeline(self, max_batch_size: int = 64) -> Iterator["Client"]:
+        """Send the actions created inside the block as batches.
+
+        Instead of signing and sending every action which has no reply (such as
+        the RunClassMethodAction sent by each pointer method call) on its own,
+        they are queued and sent as BatchedActionMessages holding up to
+        max_batch_size actions, with a single signature each. The node executes
+        the actions in the order they were queued.
+
+        The queue is flushed when it is full, before any other message is sent
+        (so a .get() inside the block still sees the result of every earlier
+        action) and when the block exits.
+
+        :param max_batch_size: the number of queued actions which triggers a flush
+        :type max_batch_size: int
+        """
+        with self._pipeline_lock:
+            nested = self._pipelined_actions is not None
+            if not nested:
+                self._pipelined_actions = []
+                self._pipeline_max_size = max_batch_size
+
+        if nested:
+            # already pipelining, the outermost block flushes
+            yield self
+            return
+
+        try:
+            yield self
+        finally:
+            with self._pipeline_lock:
+                try:
+                    # the garbage collected pointers go with the last batch
+                    self.flush_gc()
+                    self.flush_actions()
+                finally:
+                    self._pipelined_actions = None
+
+    @syft_decorator(typechecking=True)
+    def flush_actions(self, route_index: int = 0) -> None:
+        """Send the actions queued by pipeline() as one BatchedActionMessage"""
+        with self._pipeline_lock:
+            if not self._pipelined_actions:
+                return
+
+            actions = self._pipelined_actions
+            self._pipelined_actions = []
+            msg = BatchedActionMessage(actions=actions, address=self.address)
+            self._send_signed_msg_without_reply(
+                msg=msg.sign(signing_key=self.signing_key), route_index=route_index
+            )
+
+    def _queue_action(self, msg: SyftMessage) -> bool:
+        # returns True if msg was queued for the next batch instead of being sent
+        with self._pipeline_lock:
+            if self._pipelined_actions is None:
+                return False
+
+            # only actions for the node of this client go in its batches
+            if (
+                isinstance(msg, (ImmediateActionWithoutReply, EventualActionWithoutReply))
+                and not isinstance(msg, BatchedActionMessage)
+                and msg.address == self.address
+            ):
+                self._pipelined_actions.append(msg)
+                if len(self._pipelined_actions) >= self._pipeline_max_size:
+                    self.flush_actions()
+                return True
+
+            # anything else has to wait for the queued actions to reach the node
+            self.flush_actions()
+            return False
+
+    def gc_object(self, id_at_location: UID) -> None:
+        """Delete the object of a garbage collected pointer on the node, straight away
+        or with the next batch, see gc_batch_size and gc_flush_interval.
+
+        A partial batch is sent by a timer once gc_flush_interval has passed, or
+        earlier with the next message sent by this client, the lease heartbeat or
+        when a pipeline() block exits. While pipelining the batch is queued behind
+        the actions of the pipeline, which may still use the objects."""
+        if self.gc_batch_size <= 1:
+            msg = GarbageCollectObjectAction(
+                id_at_location=id_at_location, address=self.address
+            )
+            self.send_eventual_msg_without_reply(msg=msg)
+            return
+
+        with self._gc_lock:
+            self._collected_ids.append(id_at_location)
+            full = len(self._collected_ids) >= self.gc_batch_size
+            if not full and self._gc_due is None and self.gc_flush_interval is not None:
+                self._gc_due = time.time() + self.gc_flush_interval
+                # the timer only holds a weak reference, like the lease heartbeat
+                self._gc_timer = threading.Timer(
+                    self.gc_flush_interval,
+                    _flush_gc_of,
+                    kwargs={"client_ref": weakref.ref(self)},
+                )
+                self._gc_timer.daemon = True
+                self._gc_timer.start()
+        if full:
+            self.flush_gc()
+
+    def flush_gc(self) -> None:
+        """Send the ids of the garbage collected pointers waiting for a batch as one
+        GarbageCollectBatchAction"""
+        with self._gc_lock:
+            self._gc_due = None
+            if self._gc_timer is not None:
+                self._gc_timer.cancel()
+                self._gc_timer = None
+            ids, self._collected_ids = self._collected_ids, []
+        if not ids:
+            return
+
+        msg = GarbageCollectBatchAction(ids_at_location=ids, address=self.address)
+        self.send_eventual_msg_without_reply(msg=msg)
+
+    def _flush_gc_if_due(self) -> None:
+        # called before sending a message and by the lease heartbeat
+        gc_due = self._gc_due
+        if gc_due is not None and time.time() >= gc_due:
+            self.flush_gc()
+
+    def enable_leases(
+        self, duration_secs: float = 60.0, heartbeat_secs: Optional[float] = None
+    ) -> None:
+        """Have the node delete the objects created by this client once it has not
+        heard from it for duration_secs, like when the process crashed before its
+        pointers were garbage collected. A heartbeat renews the lease every
+        heartbeat_secs, a third of the duration by default, for as long as this client
+        is alive.
+
+        :param duration_secs: how long the node keeps the objects without a heartbeat
+        :type duration_secs: float
+        :param heartbeat_secs: how often the lease is renewed
+        :type heartbeat_secs: Optional[float]
+        """
+        self.lease_duration = duration_secs
+        self._renew_lease(
+            heartbeat_secs=heartbeat_secs
+            if heartbeat_secs is not None
+            else duration_secs / 3
+        )
+
+    def disable_leases(self) -> None:
+        """Stop renewing the lease, the node keeps the objects of this client until
+        they are garbage collected"""
+        self.lease_duration = None
+        if self._lease_timer is not None:
+            self._lease_timer.cancel()
+            self._lease_timer = None
+        self._send_lease_renewal(duration_secs=0.0)
+
+    def _renew_lease(self, heartbeat_secs: float) -> None:
+        if self.lease_duration is None:
+            return
+        self._send_lease_renewal(duration_secs=self.lease_duration)
+        self._flush_gc_if_due()
+
+        # the timer only holds a weak reference, so that the heartbeat stops when
+        # this client is gone
+        self._lease_timer = threading.Timer(
+            heartbeat_secs,
+            _renew_lease_of,
+            kwargs={"client_ref": weakref.ref(self), "heartbeat_secs": heartbeat_secs},
+        )
+        self._lease_timer.daemon = True
+        self._lease_timer.start()
+
+    def _send_lease_renewal(self, duration_secs: float) -> None:
+        msg = LeaseRenewalMessage(address=self.address, duration_secs=duration_secs)
+        # sent straight away, a heartbeat must not flush the actions of a pipeline
+        # from its timer thread
+        self._send_signed_msg_without_reply(
+            msg=msg.sign(signing_key=self.signing_key),
+            route_index=self.default_route_index,
+        )
+
+    def _trace_signing(self, msg: SyftMessage) -> None:
+        tracer.trace(
+            event="client.sign",
+            message=lambda: f"> {self.pprint} Signing {msg.pprint} with "
+            + f"{self.key_emoji(key=self.signing_key.verify_key)}",
+            msg_type=type(msg).__name__,
+            msg_id=msg.id,
+        )
+
     # TODO fix the msg type but currently tensor needs SyftMessage
     @syft_decorator(typechecking=True)
     def send_immediate_msg_with_reply(
@@ -212,13 +482,11 @@ class Client(AbstractNodeClient):
         route_index: int = 0,
     ) -> SyftMessage:
         route_index = route_index or self.default_route_index
+        self._flush_gc_if_due()
+        self._queue_action(msg=msg)
 
         if isinstance(msg, ImmediateSyftMessageWithReply):
-            output = (
-                f"> {self.pprint} Signing {msg.pprint} with "
-                + f"{self.key_emoji(key=self.signing_key.verify_key)}"
-            )
-            logger.debug(output)
+            self._trace_signing(msg=msg)
             msg = msg.sign(signing_key=self.signing_key)
 
         response = self.routes[route_index].send_immediate_msg_with_reply(msg=msg)
@@ -247,15 +515,25 @@ class Client(AbstractNodeClient):
         route_index: int = 0,
     ) -> None:
         route_index = route_index or self.default_route_index
+        self._flush_gc_if_due()
+        if self._queue_action(msg=msg):
+            return
 
         if isinstance(msg, ImmediateSyftMessageWithoutReply):
-            output = (
-                f"> {self.pprint} Signing {msg.pprint} with "
-                + f"{self.key_emoji(key=self.signing_key.verify_key)}"
-            )
-            logger.debug(output)
+            self._trace_signing(msg=msg)
             msg = msg.sign(signing_key=self.signing_key)
-        logger.debug(f"> Sending {msg.pprint} {self.pprint} ➡️  {msg.address.pprint}")
+        self._send_signed_msg_without_reply(msg=msg, route_index=route_index)
+
+    def _send_signed_msg_without_reply(
+        self, msg: SignedImmediateSyftMessageWithoutReply, route_index: int
+    ) -> None:
+        tracer.trace(
+            event="client.send",
+            message=lambda: f"> Sending {msg.pprint} {self.pprint} ➡️  "
+            + msg.address.pprint,
+            msg_type=msg.obj_type,
+            msg_id=msg.id,
+        )
         self.routes[route_index].send_immediate_msg_without_reply(msg=msg)
 
     @syft_decorator(typechecking=True)
@@ -263,17 +541,42 @@ class Client(AbstractNodeClient):
         self, msg: EventualSyftMessageWithoutReply, route_index: int = 0
     ) -> None:
         route_index = route_index or self.default_route_index
-        output = (
-            f"> {self.pprint} Signing {msg.pprint} with "
-            + f"{self.key_emoji(key=self.signing_key.verify_key)}"
-        )
-        logger.debug(output)
+        self._flush_gc_if_due()
+        if self._queue_action(msg=msg):
+            return
+
+        self._trace_signing(msg=msg)
         signed_msg: SignedEventualSyftMessageWithoutReply = msg.sign(
             signing_key=self.signing_key
         )
 
         self.routes[route_index].send_eventual_msg_without_reply(msg=signed_msg)
 
+    def add_request_status_listener(
+        self,
+        request_id: UID,
+        callback: Callable[[Any], None],
+        route_index: int = 0,
+    ) -> bool:
+        """Have callback called with the RequestStatus of a request to the node once it
+        is accepted or denied. Returns False if the route can't push it."""
+        route_index = route_index or self.default_route_index
+        return self.routes[route_index].add_request_status_listener(
+            address=self.address, request_id=request_id, callback=callback
+        )
+
+    def remove_request_status_listener(
+        self,
+        request_id: UID,
+        callback: Callable[[Any], None],
+        route_index: int = 0,
+    ) -> None:
+        """Forget a callback given to add_request_status_listener"""
+        route_index = route_index or self.default_route_index
+        self.routes[route_index].remove_request_status_listener(
+            address=self.address, request_id=request_id, callback=callback
+        )
+
     @syft_decorator(typechecking=True)
     def __repr__(self) -> str:
         return f"<Client pointing to node with id:{self.id}>"
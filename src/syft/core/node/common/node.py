@@ -9,6 +9,7 @@ Do NOT (without talking to trask):
 """
 
 # stdlib
+import threading
 from typing import Any
 from typing import Dict
 from typing import List
@@ -25,6 +26,7 @@ from nacl.signing import VerifyKey
 # syft relative
 from ....decorators import syft_decorator
 from ....lib import lib_ast
+from ....tracing import tracer
 from ....util import get_subclasses
 from ...common.message import EventualSyftMessageWithoutReply
 from ...common.message import ImmediateSyftMessageWithReply
@@ -42,14 +44,17 @@ from ...io.route import SoloRoute
 from ...io.virtual import create_virtual_connection
 from ...store import DiskObjectStore
 from ...store import MemoryStore
+from ...store import TieredObjectStore
 from ..abstract.node import AbstractNode
 from .action.exception_action import ExceptionMessage
 from .action.exception_action import UnknownPrivateException
 from .client import Client
 from .metadata import Metadata
+from .object_leases import ObjectLeases
 from .service.auth import AuthorizationException
 from .service.child_node_lifecycle_service import ChildNodeLifecycleService
 from .service.heritage_update_service import HeritageUpdateService
+from .service.lease_service import LeaseService
 from .service.msg_forwarding_service import SignedMessageWithReplyForwardingService
 from .service.msg_forwarding_service import SignedMessageWithoutReplyForwardingService
 from .service.node_service import EventualNodeServiceWithoutReply
@@ -101,6 +106,8 @@ class Node(AbstractNode):
         signing_key: Optional[SigningKey] = None,
         verify_key: Optional[VerifyKey] = None,
         db_path: Optional[str] = None,
+        store_options: Optional[Dict[str, Any]] = None,
+        max_memory_bytes: Optional[int] = None,
     ):
 
         # The node has a name - it exists purely to help the
@@ -118,9 +125,19 @@ class Node(AbstractNode):
         # become quite numerous (or otherwise fill up RAM).
         # self.store is the elastic memory.
 
-        if db_path is not None:
+        if db_path is not None and max_memory_bytes is not None:
+            # keep the most recently used objects in memory and the rest on disk
+            self.store = TieredObjectStore(
+                max_memory_bytes=max_memory_bytes,
+                db_path=db_path,
+                store_options=store_options,
+            )
+            logger.debug(f"Opened TieredObjectStore at {db_path}.")
+        elif db_path is not None:
             try:
-                self.store = DiskObjectStore(db_path=db_path)
+                # store_options are passed on to the DiskObjectStore, like the
+                # sqlite pragmas or commit_every and commit_interval for write-behind
+                self.store = DiskObjectStore(db_path=db_path, **(store_options or {}))
                 log = f"Opened DiskObjectStore at {db_path}."
                 logger.debug(log)
             except Exception as e:
@@ -131,6 +148,14 @@ class Node(AbstractNode):
             log = "Created MemoryStore."
             logger.debug(log)
 
+        # held while a message is processed, so that the messages of different
+        # threads, like the ones of the web server, and the sweeps of expired leases
+        # don't change the store at the same time
+        self.store_lock = threading.RLock()
+
+        # the objects of clients which hold a lease are deleted when it expires
+        self.leases = ObjectLeases(store=self.store, store_lock=self.store_lock)
+
         # We need to register all the services once a node is created
         # On the off chance someone forgot to do this (super unlikely)
         # this flag exists to check it.
@@ -197,6 +222,7 @@ class Node(AbstractNode):
         self.immediate_services_without_reply.append(
             ImmediateObjectSearchPermissionUpdateService
         )
+        self.immediate_services_without_reply.append(LeaseService)
 
         # TODO: Support ImmediateNodeServiceWithReply Parent Class
         # for services which run immediately and return a reply
@@ -252,6 +278,8 @@ class Node(AbstractNode):
         self.in_memory_client_registry = {}
         # TODO: remove hacky signaling_msgs when SyftMessages become Storable.
         self.signaling_msgs = {}
+        # peer id -> callbacks called when a signaling message for the peer is pushed
+        self.signaling_listeners = {}
 
         # For logging the number of messages received
         self.message_counter = 0
@@ -302,7 +330,11 @@ class Node(AbstractNode):
 
     @property
     def known_child_nodes(self) -> List[Address]:
-        logger.debug(f"> {self.pprint} Getting known Children Nodes")
+        tracer.trace(
+            event="node.known_child_nodes",
+            message=lambda: f"> {self.pprint} Getting known Children Nodes",
+            node=self.name,
+        )
         if self.child_type_client_type is not None:
             return [
                 client
@@ -323,7 +355,11 @@ class Node(AbstractNode):
                 )
             ]
         else:
-            logger.debug(f"> Node {self.pprint} has no children")
+            tracer.trace(
+                event="node.no_child_nodes",
+                message=lambda: f"> Node {self.pprint} has no children",
+                node=self.name,
+            )
             return []
 
     @syft_decorator(typechecking=True)
@@ -338,8 +374,13 @@ class Node(AbstractNode):
         # so we need to catch them here and respond with a special exception
         # message reply
         try:
-            logger.debug(
-                f"> Received with Reply {msg.message.pprint} {msg.message.id} @ {self.pprint}"
+            tracer.trace(
+                event="node.recv_immediate_msg_with_reply",
+                message=lambda: f"> Received with Reply {msg.message.pprint} "
+                + f"{msg.message.id} @ {self.pprint}",
+                node=self.name,
+                msg_type=type(msg.message).__name__,
+                msg_id=msg.message.id,
             )
             # try to process message
             response = self.process_message(
@@ -378,19 +419,27 @@ class Node(AbstractNode):
         # maybe I shouldn't have created process_message because it screws up
         # all the type inference.
         res_msg = response.sign(signing_key=self.signing_key)  # type: ignore
-        output = (
-            f"> {self.pprint} Signing {res_msg.pprint} with "
-            + f"{self.key_emoji(key=self.signing_key.verify_key)}"  # type: ignore
+        tracer.trace(
+            event="node.sign_reply",
+            message=lambda: f"> {self.pprint} Signing {res_msg.pprint} with "
+            + f"{self.key_emoji(key=self.signing_key.verify_key)}",  # type: ignore
+            node=self.name,
+            msg_type=type(response).__name__,
+            msg_id=response.id if response is not None else None,
         )
-        logger.debug(output)
         return res_msg
 
     @syft_decorator(typechecking=True)
     def recv_immediate_msg_without_reply(
         self, msg: SignedImmediateSyftMessageWithoutReply
     ) -> None:
-        logger.debug(
-            f"> Received without Reply {msg.message.pprint} {msg.message.id} @ {self.pprint}"
+        tracer.trace(
+            event="node.recv_immediate_msg_without_reply",
+            message=lambda: f"> Received without Reply {msg.message.pprint} "
+            + f"{msg.message.id} @ {self.pprint}",
+            node=self.name,
+            msg_type=type(msg.message).__name__,
+            msg_id=msg.message.id,
         )
         try:
             self.process_message(
@@ -454,16 +503,33 @@ class Node(AbstractNode):
 
         self.message_counter += 1
 
-        logger.debug(f"> Processing 📨 {msg.pprint} @ {self.pprint} {msg.message}")
+        tracer.trace(
+            event="node.process_message",
+            message=lambda: f"> Processing 📨 {msg.pprint} @ {self.pprint} "
+            + f"{msg.message}",
+            node=self.name,
+            msg_type=type(msg.message).__name__,
+            msg_id=msg.message.id,
+        )
         if self.message_is_for_me(msg=msg):
-            logger.debug(
-                f"> Recipient Found {msg.pprint}{msg.address.target_emoji()} == {self.pprint}"
+            tracer.trace(
+                event="node.recipient_found",
+                message=lambda: f"> Recipient Found {msg.pprint}"
+                + f"{msg.address.target_emoji()} == {self.pprint}",
+                node=self.name,
+                msg_id=msg.message.id,
             )
             # Process Message here
             if not msg.is_valid:
                 logger.error(f"Message is not valid. {msg}")
                 raise Exception("Message is not valid.")
 
+            # forwarding nodes route on the unsigned routing header, make sure it
+            # matches the address which was signed along with the message
+            if msg.message.address != msg.address:
+                logger.error(f"Message address does not match its header. {msg}")
+                raise Exception("Message address does not match its routing header.")
+
             try:  # we use try/except here because it's marginally faster in Python
                 service = router[type(msg.message)]
             except KeyError as e:
@@ -476,16 +542,21 @@ class Node(AbstractNode):
                 self.ensure_services_have_been_registered_error_if_not()
                 raise KeyError(log)
 
-            result = service.process(
-                node=self,
-                msg=msg.message,
-                verify_key=msg.verify_key,
-            )
+            with self.store_lock:
+                result = service.process(
+                    node=self,
+                    msg=msg.message,
+                    verify_key=msg.verify_key,
+                )
             return result
 
         else:
-            logger.debug(
-                f"> Recipient Not Found ↪️ {msg.pprint}{msg.address.target_emoji()} != {self.pprint}"
+            tracer.trace(
+                event="node.recipient_not_found",
+                message=lambda: f"> Recipient Not Found ↪️ {msg.pprint}"
+                + f"{msg.address.target_emoji()} != {self.pprint}",
+                node=self.name,
+                msg_id=msg.message.id,
             )
             # Forward message onwards
             if issubclass(type(msg), SignedImmediateSyftMessageWithReply):
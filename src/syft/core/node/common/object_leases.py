@@ -0,0 +1,184 @@
+# stdlib
+import threading
+import time
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+
+# third party
+from loguru import logger
+from nacl.signing import VerifyKey
+
+# syft relative
+from ...common.uid import UID
+from ...store import ObjectStore
+from ...store.store_tiered import object_size
+
+# how often the node looks for expired leases while any are held
+SWEEP_INTERVAL = 10.0
+
+
+class ObjectLeases:
+    """
+    Leases on the objects of the clients which asked for one, so that the objects of a
+    client which went away without garbage collecting its pointers, like a crashed
+    notebook or a dropped Duet session, are reclaimed instead of staying in the store
+    forever.
+
+    A client holds one lease for all of its objects, the ones created by its actions
+    while it holds the lease, and renews it with a LeaseRenewalMessage heartbeat. Once
+    a lease has expired the next sweep deletes the objects of the client which are
+    still in the store. While any lease is held a background timer sweeps every
+    sweep_interval seconds, so the objects are reclaimed even when the node receives no
+    more messages, which is what happens once the client is gone. A sweep holds the
+    store_lock of the node, which the node holds while it processes a message, so it
+    never changes the store at the same time as a message.
+
+    Clients which never asked for a lease keep their objects until they are garbage
+    collected, like before.
+
+    Attributes:
+        reclaimed_objects (int): the number of objects deleted by sweeps.
+        reclaimed_bytes (int): the estimated size of the data of those objects.
+        expired_leases (int): the number of leases which expired.
+    """
+
+    def __init__(
+        self,
+        store: ObjectStore,
+        sweep_interval: float = SWEEP_INTERVAL,
+        store_lock: Optional[threading.RLock] = None,
+    ):
+        self.store = store
+        self.store_lock = threading.RLock() if store_lock is None else store_lock
+        self.sweep_interval = sweep_interval
+        # verify_key -> when its lease expires
+        self._expiry: Dict[VerifyKey, float] = {}
+        # verify_key -> the objects created while it held a lease
+        self._owned: Dict[VerifyKey, Set[UID]] = {}
+        # object id -> the verify_key whose lease covers it
+        self._owner: Dict[UID, VerifyKey] = {}
+        self._lock = threading.RLock()
+        self._sweep_timer: Optional[threading.Timer] = None
+
+        self.reclaimed_objects = 0
+        self.reclaimed_bytes = 0
+        self.expired_leases = 0
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def __contains__(self, verify_key: VerifyKey) -> bool:
+        return verify_key in self._expiry
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "leases": len(self._expiry),
+            "leased_objects": len(self._owner),
+            "expired_leases": self.expired_leases,
+            "reclaimed_objects": self.reclaimed_objects,
+            "reclaimed_bytes": self.reclaimed_bytes,
+        }
+
+    def renew(
+        self, verify_key: VerifyKey, duration_secs: float, now: Optional[float] = None
+    ) -> None:
+        """Extend the lease of verify_key to duration_secs from now, a duration of 0
+        or less ends the lease and leaves its objects in the store"""
+        if duration_secs <= 0:
+            self.end(verify_key=verify_key)
+            return
+
+        now = time.time() if now is None else now
+        with self._lock:
+            self._expiry[verify_key] = now + duration_secs
+            self._owned.setdefault(verify_key, set())
+            self._schedule_sweep()
+
+    def end(self, verify_key: VerifyKey) -> None:
+        """Stop leasing the objects of verify_key without deleting them"""
+        with self._lock:
+            self._expiry.pop(verify_key, None)
+            for key in self._owned.pop(verify_key, set()):
+                self._owner.pop(key, None)
+
+    def track(self, verify_key: VerifyKey, key: UID) -> None:
+        """Put the object stored at key under the lease of verify_key, if it has one"""
+        if verify_key not in self._expiry:
+            return
+        with self._lock:
+            owned = self._owned.get(verify_key, None)
+            if owned is not None:
+                owned.add(key)
+                self._owner[key] = verify_key
+
+    def release(self, key: UID) -> None:
+        """Stop tracking an object which was deleted, like by garbage collection"""
+        if key not in self._owner:
+            return
+        with self._lock:
+            verify_key = self._owner.pop(key, None)
+            if verify_key is not None:
+                self._owned.get(verify_key, set()).discard(key)
+
+    def objects_of(self, verify_key: VerifyKey) -> List[UID]:
+        with self._lock:
+            return list(self._owned.get(verify_key, set()))
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Delete the objects of the leases which expired before now and return how
+        many were deleted"""
+        now = time.time() if now is None else now
+        with self._lock:
+            expired = [vk for vk, expiry in self._expiry.items() if expiry < now]
+            keys: List[UID] = []
+            for verify_key in expired:
+                del self._expiry[verify_key]
+                for key in self._owned.pop(verify_key, set()):
+                    self._owner.pop(key, None)
+                    keys.append(key)
+            self.expired_leases += len(expired)
+
+        reclaimed_bytes = 0
+        present = []
+        with self.store_lock:
+            for key in keys:
+                obj = self.store.get_object(key=key)
+                if obj is not None:
+                    reclaimed_bytes += object_size(obj=obj)
+                    present.append(key)
+            if present:
+                self.store.delete_many(keys=present)
+
+        self.reclaimed_objects += len(present)
+        self.reclaimed_bytes += reclaimed_bytes
+        if present:
+            logger.info(
+                f"Reclaimed {len(present)} objects ({reclaimed_bytes} bytes) of "
+                + f"{len(expired)} expired leases."
+            )
+        return len(present)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._sweep_timer is not None:
+                self._sweep_timer.cancel()
+                self._sweep_timer = None
+
+    def _schedule_sweep(self) -> None:
+        if self._sweep_timer is None and self._expiry:
+            self._sweep_timer = threading.Timer(self.sweep_interval, self._run_sweep)
+            self._sweep_timer.daemon = True
+            self._sweep_timer.start()
+
+    def _run_sweep(self) -> None:
+        with self._lock:
+            self._sweep_timer = None
+        try:
+            self.sweep()
+        except Exception as e:
+            logger.error(f"Failed to sweep expired leases. {e}")
+        with self._lock:
+            self._schedule_sweep()
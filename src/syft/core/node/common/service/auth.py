@@ -3,10 +3,10 @@ from typing import Callable
 from typing import Optional
 
 # third party
-from loguru import logger
 from nacl.signing import VerifyKey
 
 # syft relative
+from .....tracing import tracer
 from ....common.message import SyftMessage
 from ...abstract.node import AbstractNode
 
@@ -25,21 +25,36 @@ def service_auth(
         def process(
             node: AbstractNode, msg: SyftMessage, verify_key: VerifyKey
         ) -> Optional[SyftMessage]:
-            logger.debug(f"> Checking {msg.pprint} 🔑 Matches {node.pprint} root 🗝")
+            tracer.trace(
+                event="auth.check",
+                message=lambda: f"> Checking {msg.pprint} 🔑 Matches "
+                + f"{node.pprint} root 🗝",
+                msg_type=type(msg).__name__,
+                msg_id=msg.id,
+            )
 
             if root_only:
-                keys = (
-                    f"> Matching 🔑 {node.key_emoji(key=verify_key)}  == "
-                    + f"{node.key_emoji(key=node.root_verify_key)}  🗝"
+                tracer.trace(
+                    event="auth.match_root",
+                    message=lambda: f"> Matching 🔑 {node.key_emoji(key=verify_key)}"
+                    + f"  == {node.key_emoji(key=node.root_verify_key)}  🗝",
+                    msg_id=msg.id,
                 )
-                logger.debug(keys)
                 if verify_key != node.root_verify_key:
-                    logger.debug(f"> ❌ Auth FAILED {msg.pprint}")
+                    tracer.trace(
+                        event="auth.failed",
+                        message=lambda: f"> ❌ Auth FAILED {msg.pprint}",
+                        msg_id=msg.id,
+                    )
                     raise AuthorizationException(
                         "You are not Authorized to access this service"
                     )
                 else:
-                    logger.debug(f"> ✅ Auth Succeeded {msg.pprint} 🔑 == 🗝")
+                    tracer.trace(
+                        event="auth.succeeded",
+                        message=lambda: f"> ✅ Auth Succeeded {msg.pprint} 🔑 == 🗝",
+                        msg_id=msg.id,
+                    )
 
             elif existing_users_only:
                 if verify_key not in node.guest_verify_key_registry:
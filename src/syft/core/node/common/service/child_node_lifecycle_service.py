@@ -13,6 +13,7 @@ from .....decorators import syft_decorator
 from .....proto.core.node.common.service.child_node_lifecycle_service_pb2 import (
     RegisterChildNodeMessage as RegisterChildNodeMessage_PB,
 )
+from .....tracing import tracer
 from ....common.message import ImmediateSyftMessageWithoutReply
 from ....common.serde.deserialize import _deserialize
 from ....common.uid import UID
@@ -38,7 +39,11 @@ class RegisterChildNodeMessage(ImmediateSyftMessageWithoutReply):
 
     @syft_decorator(typechecking=True)
     def _object2proto(self) -> RegisterChildNodeMessage_PB:
-        logger.debug(f"> {self.icon} -> Proto 🔢")
+        tracer.trace(
+            event="message.to_proto",
+            message=lambda: f"> {self.icon} -> Proto 🔢",
+            msg_id=self.id,
+        )
         return RegisterChildNodeMessage_PB(
             lookup_id=self.lookup_id.serialize(),  # TODO: not sure if this is needed anymore
             child_node_client_address=self.child_node_client_address.serialize(),
@@ -56,7 +61,11 @@ class RegisterChildNodeMessage(ImmediateSyftMessageWithoutReply):
             address=_deserialize(blob=proto.address),
             msg_id=_deserialize(blob=proto.msg_id),
         )
-        logger.debug(f"> {msg.icon} <- 🔢 Proto")
+        tracer.trace(
+            event="message.from_proto",
+            message=lambda: f"> {msg.icon} <- 🔢 Proto",
+            msg_id=msg.id,
+        )
         return msg
 
     @staticmethod
@@ -75,19 +84,24 @@ class ChildNodeLifecycleService(ImmediateNodeServiceWithoutReply):
     def process(
         node: AbstractNode, msg: RegisterChildNodeMessage, verify_key: VerifyKey
     ) -> None:
-        logger.debug(
-            f"> Executing {ChildNodeLifecycleService.pprint()} {msg.pprint} on {node.pprint}"
+        tracer.trace(
+            event="child_node.register",
+            message=lambda: f"> Executing {ChildNodeLifecycleService.pprint()} "
+            + f"{msg.pprint} on {node.pprint}",
+            node=node.name,
+            msg_id=msg.id,
         )
         addr = msg.child_node_client_address
         lookup_id = msg.lookup_id  # TODO: Fix, see above
 
         node.store[lookup_id] = StorableObject(id=lookup_id, data=addr)
 
-        logger.debug(
-            (
-                f"> Saving 💾 {addr.pprint} {addr.target_emoji()} with "
-                + f"Key: {lookup_id} ➡️ {type(node.store)}"
-            )
+        tracer.trace(
+            event="child_node.save",
+            message=lambda: f"> Saving 💾 {addr.pprint} {addr.target_emoji()} with "
+            + f"Key: {lookup_id} ➡️ {type(node.store)}",
+            node=node.name,
+            lookup_id=lookup_id,
         )
 
         # Step 2: update the child node and its descendants with our node.id in their
@@ -102,10 +116,13 @@ class ChildNodeLifecycleService(ImmediateNodeServiceWithoutReply):
         # now that its a serialized address there are no pointers in memory to the
         # original child clients send_immediate_msg_without_reply function so
         # there is no way to invoke it
-        logger.debug(
-            f"> Sending 👪 Update from {node.pprint} back to {addr.target_emoji()}"
+        tracer.trace(
+            event="child_node.heritage_update",
+            message=lambda: f"> Sending 👪 Update from {node.pprint} back to "
+            + f"{addr.target_emoji()}, it contains {type(node.address)} {node.address}",
+            node=node.name,
+            msg_id=msg.id,
         )
-        logger.debug("> Update Contains", type(node.address), node.address)
         heritage_msg = HeritageUpdateMessage(
             new_ancestry_address=node.address, address=msg.child_node_client_address
         )
@@ -115,7 +132,12 @@ class ChildNodeLifecycleService(ImmediateNodeServiceWithoutReply):
             in_memory_client = node.in_memory_client_registry[location]
             # we need to sign here with the current node not the destination side
             in_memory_client.send_immediate_msg_without_reply(msg=heritage_msg)
-            logger.debug(f"> Forwarding {msg.pprint} to {addr.target_emoji()}")
+            tracer.trace(
+                event="node.forward",
+                message=lambda: f"> Forwarding {msg.pprint} to {addr.target_emoji()}",
+                node=node.name,
+                msg_id=msg.id,
+            )
             return None
         except Exception as e:
             logger.error(f"{location} not on nodes in_memory_client. {e}")
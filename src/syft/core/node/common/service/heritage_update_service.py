@@ -10,7 +10,6 @@ from typing import Optional
 
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
-from loguru import logger
 from nacl.signing import VerifyKey
 
 # syft relative
@@ -18,6 +17,7 @@ from .....decorators import syft_decorator
 from .....proto.core.node.common.service.heritage_update_service_pb2 import (
     HeritageUpdateMessage as HeritageUpdateMessage_PB,
 )
+from .....tracing import tracer
 from ....common.message import ImmediateSyftMessageWithoutReply
 from ....common.serde.deserialize import _deserialize
 from ....common.uid import UID
@@ -68,8 +68,12 @@ class HeritageUpdateService(ImmediateNodeServiceWithoutReply):
     def process(
         node: AbstractNode, msg: HeritageUpdateMessage, verify_key: VerifyKey
     ) -> None:
-        logger.debug(
-            f"> Executing {HeritageUpdateService.pprint()} {msg.pprint} on {node.pprint}"
+        tracer.trace(
+            event="heritage_update.process",
+            message=lambda: f"> Executing {HeritageUpdateService.pprint()} "
+            + f"{msg.pprint} on {node.pprint}",
+            node=node.name,
+            msg_id=msg.id,
         )
         addr = msg.new_ancestry_address
 
@@ -89,10 +93,23 @@ class HeritageUpdateService(ImmediateNodeServiceWithoutReply):
                     in_memory_client = node.in_memory_client_registry[location_id]
                     # we need to sign here with the current node not the destination side
                     in_memory_client.send_immediate_msg_without_reply(msg=msg)
-                    logger.debug(f"> Flowing {msg.pprint} to {addr.target_emoji()}")
+                    tracer.trace(
+                        event="node.forward",
+                        message=lambda: f"> Flowing {msg.pprint} to "
+                        + addr.target_emoji(),
+                        node=node.name,
+                        msg_id=msg.id,
+                    )
                     return None
                 except Exception as e:
-                    logger.debug(f"{location_id} not on nodes in_memory_client. {e}")
+                    error = e
+                    tracer.trace(
+                        event="node.forward_failed",
+                        message=lambda: f"{location_id} not on nodes "
+                        + f"in_memory_client. {error}",
+                        node=node.name,
+                        msg_id=msg.id,
+                    )
                     pass
             except Exception as e:
                 print(e)
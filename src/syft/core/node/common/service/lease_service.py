@@ -0,0 +1,67 @@
+# stdlib
+from typing import List
+from typing import Optional
+from typing import Type
+
+# third party
+from google.protobuf.reflection import GeneratedProtocolMessageType
+from nacl.signing import VerifyKey
+from typing_extensions import final
+
+# syft relative
+from .....decorators.syft_decorator_impl import syft_decorator
+from .....proto.core.node.common.service.lease_service_pb2 import (
+    LeaseRenewalMessage as LeaseRenewalMessage_PB,
+)
+from ....common.message import ImmediateSyftMessageWithoutReply
+from ....common.serde.deserialize import _deserialize
+from ....common.uid import UID
+from ....io.address import Address
+from ...abstract.node import AbstractNode
+from .auth import service_auth
+from .node_service import ImmediateNodeServiceWithoutReply
+
+
+@final
+class LeaseRenewalMessage(ImmediateSyftMessageWithoutReply):
+    """The heartbeat which keeps the objects of the sender alive for another
+    duration_secs, a duration of 0 ends the lease without deleting them."""
+
+    def __init__(
+        self, address: Address, duration_secs: float, msg_id: Optional[UID] = None
+    ):
+        super().__init__(address=address, msg_id=msg_id)
+        self.duration_secs = duration_secs
+
+    @syft_decorator(typechecking=True)
+    def _object2proto(self) -> LeaseRenewalMessage_PB:
+        return LeaseRenewalMessage_PB(
+            msg_id=self.id.serialize(),
+            address=self.address.serialize(),
+            duration_secs=self.duration_secs,
+        )
+
+    @staticmethod
+    def _proto2object(proto: LeaseRenewalMessage_PB) -> "LeaseRenewalMessage":
+        return LeaseRenewalMessage(
+            msg_id=_deserialize(blob=proto.msg_id),
+            address=_deserialize(blob=proto.address),
+            duration_secs=proto.duration_secs,
+        )
+
+    @staticmethod
+    def get_protobuf_schema() -> GeneratedProtocolMessageType:
+        return LeaseRenewalMessage_PB
+
+
+class LeaseService(ImmediateNodeServiceWithoutReply):
+    @staticmethod
+    @service_auth(guests_welcome=True)
+    def process(
+        node: AbstractNode, msg: LeaseRenewalMessage, verify_key: VerifyKey
+    ) -> None:
+        node.leases.renew(verify_key=verify_key, duration_secs=msg.duration_secs)
+
+    @staticmethod
+    def message_handler_types() -> List[Type[LeaseRenewalMessage]]:
+        return [LeaseRenewalMessage]
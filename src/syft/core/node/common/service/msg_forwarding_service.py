@@ -2,11 +2,9 @@
 from typing import List
 from typing import Optional
 
-# third party
-from loguru import logger
-
 # syft relative
 from .....decorators import syft_decorator
+from .....tracing import tracer
 from ....common.message import ImmediateSyftMessageWithReply
 from ....common.message import ImmediateSyftMessageWithoutReply
 from ....common.message import SignedImmediateSyftMessageWithReply
@@ -24,7 +22,13 @@ class SignedMessageWithoutReplyForwardingService(SignedNodeServiceWithoutReply):
         node: AbstractNode, msg: SignedImmediateSyftMessageWithoutReply
     ) -> Optional[SignedMessageT]:
         addr = msg.address
-        logger.debug(f"> Forwarding WithoutReply {msg.pprint} to {addr.target_emoji()}")
+        tracer.trace(
+            event="node.forward",
+            message=lambda: f"> Forwarding WithoutReply {msg.pprint} to "
+            + addr.target_emoji(),
+            node=node.name,
+            msg_id=msg.id,
+        )
         # order is important, vm, device, domain, network
         for scope_id in [addr.vm_id, addr.device_id, addr.domain_id, addr.network_id]:
             if scope_id is not None and scope_id in node.store:
@@ -47,7 +51,11 @@ class SignedMessageWithoutReplyForwardingService(SignedNodeServiceWithoutReply):
                 addr.network_id,
             ]:
                 if scope_id is not None:
-                    logger.debug(f"> Lookup: {scope_id.emoji()}")
+                    tracer.trace(
+                        event="node.forward_lookup",
+                        message=lambda: f"> Lookup: {scope_id.emoji()}",
+                        scope_id=scope_id,
+                    )
                     if scope_id in node.in_memory_client_registry:
                         in_memory_client = node.in_memory_client_registry[scope_id]
                         return in_memory_client.send_immediate_msg_without_reply(
@@ -57,7 +65,12 @@ class SignedMessageWithoutReplyForwardingService(SignedNodeServiceWithoutReply):
             # TODO: Need to not catch blanket exceptions
             print(f"{addr} not on nodes in_memory_client. {e}")
             pass
-        logger.debug(f"> ❌ {node.pprint} 🤷🏾‍♀️ {addr.target_emoji()}")
+        tracer.trace(
+            event="node.forward_failed",
+            message=lambda: f"> ❌ {node.pprint} 🤷🏾‍♀️ {addr.target_emoji()}",
+            node=node.name,
+            msg_id=msg.id,
+        )
         raise Exception("Address unknown - cannot forward message. Throwing it away.")
 
     @staticmethod
@@ -77,7 +90,13 @@ class SignedMessageWithReplyForwardingService(SignedNodeServiceWithReply):
         # ) -> SignedMessageT:
         # TODO: Add verify_key?
         addr = msg.address
-        logger.debug(f"> Forwarding WithReply {msg.pprint} to {addr.target_emoji()}")
+        tracer.trace(
+            event="node.forward",
+            message=lambda: f"> Forwarding WithReply {msg.pprint} to "
+            + addr.target_emoji(),
+            node=node.name,
+            msg_id=msg.id,
+        )
 
         # order is important, vm, device, domain, network
         for scope_id in [addr.vm_id, addr.device_id, addr.domain_id, addr.network_id]:
@@ -101,7 +120,11 @@ class SignedMessageWithReplyForwardingService(SignedNodeServiceWithReply):
                 addr.network_id,
             ]:
                 if scope_id is not None:
-                    logger.debug(f"> Lookup: {scope_id.emoji()}")
+                    tracer.trace(
+                        event="node.forward_lookup",
+                        message=lambda: f"> Lookup: {scope_id.emoji()}",
+                        scope_id=scope_id,
+                    )
                     if scope_id in node.in_memory_client_registry:
                         in_memory_client = node.in_memory_client_registry[scope_id]
                         return in_memory_client.send_immediate_msg_without_reply(
@@ -111,7 +134,12 @@ class SignedMessageWithReplyForwardingService(SignedNodeServiceWithReply):
             # TODO: Need to not catch blanket exceptions
             print(f"{addr} not on nodes in_memory_client. {e}")
             pass
-        logger.debug(f"> ❌ {node.pprint} 🤷🏾‍♀️ {addr.target_emoji()}")
+        tracer.trace(
+            event="node.forward_failed",
+            message=lambda: f"> ❌ {node.pprint} 🤷🏾‍♀️ {addr.target_emoji()}",
+            node=node.name,
+            msg_id=msg.id,
+        )
         raise Exception("Address unknown - cannot forward message. Throwing it away.")
 
     @staticmethod
@@ -21,6 +21,7 @@ from .....proto.core.node.common.service.object_search_permission_update_message
 )
 from ....common.message import ImmediateSyftMessageWithoutReply
 from ....common.serde.deserialize import _deserialize
+from ....common.signature import get_verify_key
 from ....common.uid import UID
 from ....io.address import Address
 from ...abstract.node import AbstractNode
@@ -88,7 +89,7 @@ class ObjectSearchPermissionUpdateMessage(ImmediateSyftMessageWithoutReply):
         return ObjectSearchPermissionUpdateMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            target_verify_key=VerifyKey(proto.target_verify_key),
+            target_verify_key=get_verify_key(proto.target_verify_key),
             target_object_id=_deserialize(blob=proto.target_object_id),
             add_instead_of_remove=proto.add_instead_of_remove,
         )
@@ -122,10 +123,13 @@ class ImmediateObjectSearchPermissionUpdateService(ImmediateNodeServiceWithoutRe
         msg: ObjectSearchPermissionUpdateMessage,
         verify_key: VerifyKey,
     ) -> None:
+        obj = node.store[msg.target_object_id]
         if msg.add_instead_of_remove:
-            node.store[msg.target_object_id].search_permissions[verify_key] = msg.id
+            obj.search_permissions[verify_key] = msg.id
         else:
-            node.store[msg.target_object_id].search_permissions.pop(verify_key, None)
+            obj.search_permissions.pop(verify_key, None)
+        # store it again so that the search index sees the new permissions
+        node.store[msg.target_object_id] = obj
 
     @staticmethod
     def message_handler_types() -> List[Type[ObjectSearchPermissionUpdateMessage]]:
@@ -24,7 +24,6 @@ from .....proto.core.node.common.service.object_search_message_pb2 import (
     ObjectSearchReplyMessage as ObjectSearchReplyMessage_PB,
 )
 from .....util import obj2pointer_type
-from ....common.group import VerifyAll
 from ....common.message import ImmediateSyftMessageWithReply
 from ....common.message import ImmediateSyftMessageWithoutReply
 from ....common.serde.deserialize import _deserialize
@@ -195,27 +194,18 @@ class ImmediateObjectSearchService(ImmediateNodeServiceWithReply):
         results: List[Pointer] = list()
 
         try:
-            for obj in node.store.get_objects_of_type(obj_type=object):
-                # if this tensor allows anyone to search for it, then one of its keys
-                # has an All() class in it.
-                contains_all_in_permissions = False
-                for key in obj.search_permissions.keys():
-                    if isinstance(key, VerifyAll):
-                        contains_all_in_permissions = True
-
-                if (
-                    verify_key in obj.search_permissions.keys()
-                    or verify_key == node.root_verify_key
-                    or contains_all_in_permissions
-                ):
-                    ptr_type = obj2pointer_type(obj=obj.data)
-                    ptr = ptr_type(
-                        client=node,
-                        id_at_location=obj.id,
-                        tags=obj.tags,
-                        description=obj.description,
-                    )
-                    results.append(ptr)
+            # root can find everything, anyone else the objects which they or All()
+            # are allowed to search for, which the store has indexed
+            searchable_by = None if verify_key == node.root_verify_key else verify_key
+            for obj in node.store.search(searchable_by=searchable_by):
+                ptr_type = obj2pointer_type(obj=obj.data)
+                ptr = ptr_type(
+                    client=node,
+                    id_at_location=obj.id,
+                    tags=obj.tags,
+                    description=obj.description,
+                )
+                results.append(ptr)
         except Exception as e:
             logger.error(f"Error searching store. {e}")
 
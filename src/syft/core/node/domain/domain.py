@@ -1,10 +1,10 @@
 # stdlib
-import asyncio
-import time
+import threading
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
 from typing import Union
 
@@ -16,6 +16,7 @@ from nacl.signing import VerifyKey
 # syft relative
 from ....decorators.syft_decorator_impl import syft_decorator
 from ....lib.python import String
+from ....tracing import tracer
 from ...common.message import SignedMessage
 from ...common.message import SyftMessage
 from ...common.uid import UID
@@ -27,6 +28,8 @@ from ..common.node import Node
 from ..device import Device
 from ..device import DeviceClient
 from .client import DomainClient
+from .request_handlers import RequestHandlers
+from .request_queue import RequestQueue
 from .service import RequestAnswerMessageService
 from .service import RequestMessage
 from .service import RequestService
@@ -36,6 +39,9 @@ from .service.get_all_requests_service import GetAllRequestsService
 from .service.request_handler_service import GetAllRequestHandlersService
 from .service.request_handler_service import UpdateRequestHandlerService
 
+# a request which a handler failed to accept or deny is checked again after this
+HANDLER_RETRY_SECS = 5.0
+
 
 class Domain(Node):
     domain: SpecificLocation
@@ -57,6 +63,8 @@ class Domain(Node):
         verify_key: Optional[VerifyKey] = None,
         root_key: Optional[VerifyKey] = None,
         db_path: Optional[str] = None,
+        store_options: Optional[Dict[str, Any]] = None,
+        max_memory_bytes: Optional[int] = None,
     ):
         super().__init__(
             name=name,
@@ -67,6 +75,8 @@ class Domain(Node):
             signing_key=signing_key,
             verify_key=verify_key,
             db_path=db_path,
+            store_options=store_options,
+            max_memory_bytes=max_memory_bytes,
         )
         # specific location with name
         self.domain = SpecificLocation(name=self.name)
@@ -80,7 +90,9 @@ class Domain(Node):
         self.immediate_services_with_reply.append(GetAllRequestsService)
         self.immediate_services_with_reply.append(GetAllRequestHandlersService)
 
-        self.requests: List[RequestMessage] = list()
+        # requests are checked against the handlers when they arrive
+        self.requests = RequestQueue(on_append=self._request_arrived)
+        self.requests.index_accepted(store=self.store)
         # available_device_types = set()
         # TODO: add available compute types
 
@@ -88,18 +100,27 @@ class Domain(Node):
         # TODO: add default compute type
 
         self._register_services()
-        self.request_handlers: List[Dict[str, Any]] = []
-        self.handled_requests: Dict[Any, float] = {}
+        self._request_handlers = RequestHandlers()
+        self._retry_request_ids: Set[UID] = set()
+        self._retry_timer: Optional[threading.Timer] = None
+        self._retry_lock = threading.Lock()
 
         self.post_init()
 
-        # run the handlers in an asyncio future
-        asyncio.ensure_future(self.run_handlers())
-
     @property
     def icon(self) -> str:
         return "🏰"
 
+    @property
+    def request_handlers(self) -> List[Dict[str, Any]]:
+        return self._request_handlers.handlers
+
+    @request_handlers.setter
+    def request_handlers(self, handlers: List[Dict[str, Any]]) -> None:
+        # a new handler can apply to the requests which are already waiting
+        self._request_handlers.replace(handlers=handlers)
+        self.run_handlers()
+
     @property
     def id(self) -> UID:
         return self.domain.id
@@ -121,40 +142,21 @@ class Domain(Node):
     def set_request_status(
         self, message_request_id: UID, status: RequestStatus, client: Client
     ) -> bool:
-        for req in self.requests:
-            if req.request_id == message_request_id:
-                req.owner_client_if_available = client
-                if status == RequestStatus.Accepted:
-                    req.accept()
-                    return True
-                elif status == RequestStatus.Rejected:
-                    req.deny()
-                    return True
+        req = self.requests.get(request_id=message_request_id)
+        if req is not None:
+            req.owner_client_if_available = client
+            if status == RequestStatus.Accepted:
+                req.accept()
+                return True
+            elif status == RequestStatus.Rejected:
+                req.deny()
+                return True
 
         return False
 
     @syft_decorator(typechecking=True)
     def get_request_status(self, message_request_id: UID) -> RequestStatus:
-        # is it still pending
-        for req in self.requests:
-            if req.request_id == message_request_id:
-                return RequestStatus.Pending
-
-        # check if it was accepted
-        # TODO remove brute search of all store objects
-        # Currently theres no way to find which object to check the permissions
-        # to find the stored request_id
-        for obj_id in self.store.keys():
-            for _, request_id in self.store[obj_id].read_permissions.items():
-                if request_id == message_request_id:
-                    return RequestStatus.Accepted
-
-            for _, request_id in self.store[obj_id].search_permissions.items():
-                if request_id == message_request_id:
-                    return RequestStatus.Accepted
-
-        # must have been rejected
-        return RequestStatus.Rejected
+        return self.requests.get_status(request_id=message_request_id, store=self.store)
 
     @syft_decorator(typechecking=True)
     def _get_object(self, request: RequestMessage) -> Optional[Any]:
@@ -190,12 +192,20 @@ class Domain(Node):
         return (allowed, elements)
 
     def _accept(self, request: RequestMessage) -> None:
-        logger.debug(f"Calling accept on request: {request.id}")
+        tracer.trace(
+            event="request.accept",
+            message=lambda: f"Calling accept on request: {request.id}",
+            request_id=request.id,
+        )
         request.destination_node_if_available = self
         request.accept()
 
     def _deny(self, request: RequestMessage) -> None:
-        logger.debug(f"Calling deny on request: {request.id}")
+        tracer.trace(
+            event="request.deny",
+            message=lambda: f"Calling deny on request: {request.id}",
+            request_id=request.id,
+        )
         request.destination_node_if_available = self
         request.deny()
 
@@ -218,8 +228,11 @@ class Domain(Node):
     def check_handler(
         self, handler: Dict[Union[str, String], Any], request: RequestMessage
     ) -> bool:
-        logger.debug(
-            f"HANDLER Check handler {handler} against {request.name} {request.request_id}"
+        tracer.trace(
+            event="request_handler.check",
+            message=lambda: f"HANDLER Check handler {handler} against {request.name} "
+            + f"{request.request_id}",
+            request_id=request.id,
         )
         name = handler.get("name", None)
         action = handler.get("action", None)
@@ -229,8 +242,11 @@ class Domain(Node):
 
         if name is not None and name != request.name.strip().lower():
             # valid name doesnt match so ignore this handler
-            logger.debug(
-                f"HANDLER Ignoring request handler {handler} against {request}"
+            tracer.trace(
+                event="request_handler.ignore",
+                message=lambda: f"HANDLER Ignoring request handler {handler} against "
+                + f"{request}",
+                request_id=request.id,
             )
             return False
 
@@ -239,7 +255,11 @@ class Domain(Node):
         obj = None
         if print_local or log_local or element_quota:
             obj = self._get_object(request=request)
-            logger.debug(f"> HANDLER Got object {obj} for checking")
+            tracer.trace(
+                event="request_handler.get_object",
+                message=lambda: f"> HANDLER Got object {obj} for checking",
+                request_id=request.id,
+            )
 
         # we only want to accept or deny once
         handled = False
@@ -247,8 +267,11 @@ class Domain(Node):
         # check quota and reject first
         if element_quota is not None:
             if not self._try_deduct_quota(handler=handler, obj=obj):
-                logger.debug(
-                    f"> HANDLER Rejecting {request} element_quota={handler['element_quota']}"
+                tracer.trace(
+                    event="request_handler.reject",
+                    message=lambda: f"> HANDLER Rejecting {request} "
+                    + f"element_quota={handler['element_quota']}",
+                    request_id=request.id,
                 )
                 self._deny(request=request)
                 handled = True
@@ -256,7 +279,11 @@ class Domain(Node):
         # if not rejected based on quota keep checking
         if not handled:
             if action == "accept":
-                logger.debug(f"Check accept {handler} against {request}")
+                tracer.trace(
+                    event="request_handler.accept",
+                    message=lambda: f"Check accept {handler} against {request}",
+                    request_id=request.id,
+                )
                 self._accept(request=request)
                 handled = True
             elif action == "deny":
@@ -277,74 +304,58 @@ class Domain(Node):
             if log_local:
                 logger.info(log)
 
-        # block the loop from handling this again, until the cleanup removes it
-        # after a period of timeout
-        if handled:
-            self.handled_requests[request.id] = time.time()
         return handled
 
-    def clean_up_handlers(self) -> None:
-        # this makes sure handlers with timeout expire
-        now = time.time()
-        alive_handlers = []
-        if len(self.request_handlers) > 0:
-            for handler in self.request_handlers:
-                timeout_secs = handler.get("timeout_secs", -1)
-                if timeout_secs != -1:
-                    created_time = handler.get("created_time", 0)
-                    if now - created_time > timeout_secs:
-                        continue
-                alive_handlers.append(handler)
-        self.request_handlers = alive_handlers
-
-    def clean_up_requests(self) -> None:
-        # this allows a request to be re-handled if the handler somehow failed
-        now = time.time()
-        processing_wait_secs = 5
-        reqs_to_remove = []
-        for req in self.handled_requests.keys():
-            handle_time = self.handled_requests[req]
-            if now - handle_time > processing_wait_secs:
-                reqs_to_remove.append(req)
-
-        for req in reqs_to_remove:
-            self.handled_requests.__delitem__(req)
-
-        alive_requests: List[RequestMessage] = []
-        for request in self.requests:
-            if request.timeout_secs is not None and request.timeout_secs > -1:
-                if request.arrival_time is None:
-                    logger.critical(
-                        f"HANDLER Request has no arrival time. {request.id}"
-                    )
-                    request.set_arrival_time(arrival_time=time.time())
-                arrival_time = getattr(request, "arrival_time", float(now))
-                if now - arrival_time > request.timeout_secs:
-                    # this request has expired
-                    continue
-            alive_requests.append(request)
-
-        self.requests = alive_requests
+    def _request_arrived(self, request: RequestMessage) -> None:
+        self.run_handlers(requests=[request])
 
-    @syft_decorator(typechecking=True)
-    async def run_handlers(self) -> None:
-        while True:
-            await asyncio.sleep(0.01)
-            try:
-                # logger.debug("running HANDLER")
-                self.clean_up_handlers()
-                self.clean_up_requests()
-                if len(self.request_handlers) > 0:
-                    for request in self.requests:
-                        # check if we have previously already handled this in an earlier iter
-                        if request.id not in self.handled_requests:
-                            for handler in self.request_handlers:
-                                handled = self.check_handler(
-                                    handler=handler, request=request
-                                )
-                                if handled:
-                                    # we handled the request so we can exit the loop
-                                    break
-            except Exception as excp2:
-                # logger.critical(f"HANDLER loop exception. {lol}")
-                print("HANDLER Exception in the while loop!!", excp2)
+    def run_handlers(self, requests: Optional[List[RequestMessage]] = None) -> None:
+        """Check the pending requests, or just the given ones, against the handlers
+        which apply to their name, the first handler which accepts or denies a
+        request handles it"""
+        if len(self._request_handlers) == 0:
+            return
+
+        for request in self.requests if requests is None else requests:
+            handlers = self._request_handlers.for_name(
+                name=request.name.strip().lower()
+            )
+            failed = False
+            for handler in handlers:
+                # an earlier handler may have accepted or denied it
+                if request.id not in self.requests:
+                    break
+                try:
+                    if self.check_handler(handler=handler, request=request):
+                        # still waiting if accepting or denying it didn't work
+                        failed = request.id in self.requests
+                        break
+                except Exception as e:
+                    logger.critical(f"HANDLER Exception checking {request.id}. {e}")
+                    failed = True
+
+            if failed and request.id in self.requests:
+                self._retry_later(request_id=request.id)
+
+    def _retry_later(self, request_id: UID) -> None:
+        with self._retry_lock:
+            self._retry_request_ids.add(request_id)
+            if self._retry_timer is None:
+                self._retry_timer = threading.Timer(
+                    HANDLER_RETRY_SECS, self._retry_failed
+                )
+                self._retry_timer.daemon = True
+                self._retry_timer.start()
+
+    def _retry_failed(self) -> None:
+        with self._retry_lock:
+            self._retry_timer = None
+            request_ids = self._retry_request_ids
+            self._retry_request_ids = set()
+
+        # the timer thread must not run a handler while a message is processed
+        with self.store_lock:
+            requests = [self.requests.get(request_id=uid) for uid in request_ids]
+            self.run_handlers(
+                requests=[request for request in requests if request is not None]
+            )
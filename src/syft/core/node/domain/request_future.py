@@ -0,0 +1,132 @@
+# stdlib
+import threading
+import time
+from typing import Callable
+from typing import List
+from typing import Optional
+
+# third party
+from loguru import logger
+
+# syft relative
+from ...common.uid import UID
+from ..common.client import Client
+from .service.request_answer_message import RequestAnswerMessage
+from .service.request_message import RequestStatus
+
+# polling starts fast so that handlers which answer straight away are seen quickly
+# and backs off so that waiting clients don't keep the node busy
+FIRST_POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 2.0
+
+
+class RequestFuture:
+    """
+    A handle on a request which was sent to a Domain, which is completed with the
+    RequestStatus once the request is accepted or denied.
+
+    When the connection to the Domain can push, the Domain calls back as soon as the
+    request is resolved. Otherwise the status is polled with RequestAnswerMessages,
+    backing off exponentially from FIRST_POLL_INTERVAL up to MAX_POLL_INTERVAL.
+
+    The future has to be created before the request is sent, so that a request which
+    is resolved while it is being sent, like by a request handler, is not missed.
+    """
+
+    def __init__(self, request_id: UID, client: Client) -> None:
+        self.request_id = request_id
+        self.client = client
+        self._status: Optional[RequestStatus] = None
+        self._done = threading.Event()
+        self._callbacks: List[Callable[["RequestFuture"], None]] = []
+        self._lock = threading.Lock()
+        self.pushed = client.add_request_status_listener(
+            request_id=request_id, callback=self.set_status
+        )
+
+    def __repr__(self) -> str:
+        return f"<RequestFuture: {self.request_id} {self.status.name}>"
+
+    @property
+    def status(self) -> RequestStatus:
+        return RequestStatus.Pending if self._status is None else self._status
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def set_status(self, status: RequestStatus) -> None:
+        if status == RequestStatus.Pending:
+            return
+        with self._lock:
+            if self._status is not None:
+                return
+            self._status = status
+            callbacks, self._callbacks = self._callbacks, []
+        self._done.set()
+        for callback in callbacks:
+            callback(self)
+
+    def add_done_callback(self, callback: Callable[["RequestFuture"], None]) -> None:
+        with self._lock:
+            if self._status is None:
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def check(self) -> RequestStatus:
+        """Ask the Domain for the status of the request"""
+        msg = RequestAnswerMessage(
+            request_id=self.request_id,
+            address=self.client.address,
+            reply_to=self.client.address,
+        )
+        response = self.client.send_immediate_msg_with_reply(msg=msg)
+        self.set_status(status=response.status)
+        if self.done():
+            # the request may have been resolved, or rejected as a duplicate,
+            # without the Domain calling the listener
+            self._remove_listener()
+        return self.status
+
+    def _remove_listener(self) -> None:
+        if self.pushed:
+            self.pushed = False
+            self.client.remove_request_status_listener(
+                request_id=self.request_id, callback=self.set_status
+            )
+
+    def result(self, timeout_secs: Optional[float] = None) -> RequestStatus:
+        """Wait until the request is resolved or timeout_secs have passed and return
+        its status, which is still Pending after a timeout"""
+        deadline = None if timeout_secs is None else time.time() + timeout_secs
+
+        def remaining() -> Optional[float]:
+            return None if deadline is None else max(0.0, deadline - time.time())
+
+        try:
+            # the request can be resolved, or rejected as a duplicate, before a
+            # listener is called
+            if not self.done():
+                self.check()
+
+            if self.pushed:
+                if not self._done.wait(timeout=remaining()):
+                    # nobody waits for the status anymore
+                    self._remove_listener()
+                return self.status
+
+            interval = FIRST_POLL_INTERVAL
+            while not self.done():
+                wait = remaining()
+                if wait is not None and wait <= 0:
+                    break
+                if self._done.wait(
+                    timeout=interval if wait is None else min(interval, wait)
+                ):
+                    break
+                self.check()
+                interval = min(interval * 2, MAX_POLL_INTERVAL)
+        except Exception as e:
+            logger.error(f"Exception while waiting for request {self.request_id}. {e}")
+
+        return self.status
@@ -0,0 +1,76 @@
+# stdlib
+import heapq
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+class RequestHandlers:
+    """
+    The request handlers of a Domain, indexed by the request name they apply to so
+    that a request is only checked against the handlers for its name and the ones
+    without a name, in the order they were added.
+
+    Handlers with a timeout_secs are kept in a heap by their deadline and expire when
+    they are used, so nothing has to poll them.
+    """
+
+    def __init__(self) -> None:
+        # order -> handler, the same dicts the services hand out, so that changes
+        # like an element_quota going down are kept
+        self._handlers: Dict[int, Dict[str, Any]] = {}
+        # name -> order of its handlers, None is for the handlers without a name
+        self._by_name: Dict[Optional[str], List[int]] = {}
+        # (deadline, order) of the handlers with a timeout
+        self._deadlines: List[Tuple[float, int]] = []
+        self._added = 0
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._handlers)
+
+    @property
+    def handlers(self) -> List[Dict[str, Any]]:
+        self._expire()
+        return list(self._handlers.values())
+
+    def replace(self, handlers: List[Dict[str, Any]]) -> None:
+        """Index a new list of handlers, which is how the services change them"""
+        self._handlers.clear()
+        self._by_name.clear()
+        self._deadlines.clear()
+
+        for handler in handlers:
+            order = self._added
+            self._added += 1
+            self._handlers[order] = handler
+            self._by_name.setdefault(handler.get("name", None), []).append(order)
+
+            timeout_secs = handler.get("timeout_secs", -1)
+            if timeout_secs != -1:
+                deadline = handler.get("created_time", 0) + timeout_secs
+                heapq.heappush(self._deadlines, (deadline, order))
+
+    def for_name(self, name: str) -> List[Dict[str, Any]]:
+        """The handlers which apply to requests called name, in the order they were
+        added"""
+        self._expire()
+        orders = self._by_name.get(name, []) + self._by_name.get(None, [])
+        return [self._handlers[order] for order in sorted(orders)]
+
+    def expire(self, now: float) -> None:
+        """Remove the handlers which have been around longer than their timeout"""
+        while self._deadlines and self._deadlines[0][0] < now:
+            _, order = heapq.heappop(self._deadlines)
+            handler = self._handlers.pop(order)
+            name = handler.get("name", None)
+            self._by_name[name].remove(order)
+            if not self._by_name[name]:
+                del self._by_name[name]
+
+    def _expire(self) -> None:
+        if self._deadlines:
+            self.expire(now=time.time())
@@ -0,0 +1,185 @@
+# stdlib
+from collections import OrderedDict
+import heapq
+import time
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# third party
+from loguru import logger
+from nacl.signing import VerifyKey
+
+# syft relative
+from ...common.uid import UID
+from ...store import ObjectStore
+from .service.request_message import RequestMessage
+from .service.request_message import RequestStatus
+
+
+class RequestQueue:
+    """
+    The requests a Domain has received, indexed so that looking up the status of a
+    request, accepting or denying it and cleaning up do not have to scan every
+    request or every object in the store.
+
+    It still behaves like the list it replaces, iterating, len() and indexing go over
+    the pending requests in the order they arrived.
+
+    Requests with a timeout are kept in a heap by their deadline and expire when the
+    queue is used, so nothing has to poll it. on_append is called with every request
+    which is added, which is how the Domain runs its request handlers.
+
+    Listeners can be added for a request_id, even before the request arrives, and are
+    called once with the RequestStatus when the request is accepted, denied or expires.
+    """
+
+    def __init__(
+        self, on_append: Optional[Callable[[RequestMessage], None]] = None
+    ) -> None:
+        self.on_append = on_append
+        # request_id -> request, in order of arrival
+        self._pending: OrderedDict[UID, RequestMessage] = OrderedDict()
+        # object_id -> request_id -> request
+        self._pending_by_object: Dict[UID, Dict[UID, RequestMessage]] = {}
+        # request_id -> object_id of the accepted requests
+        self._accepted: Dict[UID, UID] = {}
+        # (deadline, arrival order, request_id) of the requests with a timeout
+        self._deadlines: List[Tuple[float, int, UID]] = []
+        self._arrivals = 0
+        # request_id -> callbacks waiting for the request to be resolved
+        self._listeners: Dict[UID, List[Callable[[RequestStatus], None]]] = {}
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._pending)
+
+    def __iter__(self) -> Iterator[RequestMessage]:
+        self._expire()
+        # a copy, so that requests can be accepted or denied while iterating
+        return iter(list(self._pending.values()))
+
+    def __getitem__(self, index: int) -> RequestMessage:
+        self._expire()
+        return list(self._pending.values())[index]
+
+    def __contains__(self, request_id: UID) -> bool:
+        self._expire()
+        return request_id in self._pending
+
+    def __repr__(self) -> str:
+        return repr(list(self._pending.values()))
+
+    def get(self, request_id: UID) -> Optional[RequestMessage]:
+        self._expire()
+        return self._pending.get(request_id, None)
+
+    def append(self, request: RequestMessage) -> None:
+        self._pending[request.id] = request
+        self._pending_by_object.setdefault(request.object_id, {})[request.id] = request
+
+        if request.timeout_secs is not None and request.timeout_secs > -1:
+            if request.arrival_time is None:
+                logger.critical(f"HANDLER Request has no arrival time. {request.id}")
+                request.set_arrival_time(arrival_time=time.time())
+            deadline = float(request.arrival_time) + request.timeout_secs  # type: ignore
+            heapq.heappush(self._deadlines, (deadline, self._arrivals, request.id))
+            self._arrivals += 1
+
+        if self.on_append is not None:
+            self.on_append(request)
+
+    def remove(self, request_id: UID) -> Optional[RequestMessage]:
+        """Remove a pending request, like when it is denied or expires"""
+        request = self._remove(request_id=request_id)
+        if request is not None:
+            self._notify(request_id=request_id, status=RequestStatus.Rejected)
+        return request
+
+    def accept(self, request_id: UID) -> Optional[RequestMessage]:
+        """Remove a pending request and remember that it was accepted"""
+        request = self._remove(request_id=request_id)
+        if request is not None:
+            self._accepted[request_id] = request.object_id
+            self._notify(request_id=request_id, status=RequestStatus.Accepted)
+        return request
+
+    def _remove(self, request_id: UID) -> Optional[RequestMessage]:
+        request = self._pending.pop(request_id, None)
+        if request is not None:
+            object_requests = self._pending_by_object.get(request.object_id, {})
+            object_requests.pop(request_id, None)
+            if not object_requests:
+                self._pending_by_object.pop(request.object_id, None)
+        return request
+
+    def add_listener(
+        self, request_id: UID, callback: Callable[[RequestStatus], None]
+    ) -> None:
+        self._listeners.setdefault(request_id, []).append(callback)
+
+    def remove_listener(
+        self, request_id: UID, callback: Callable[[RequestStatus], None]
+    ) -> None:
+        callbacks = self._listeners.get(request_id, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        if not callbacks:
+            self._listeners.pop(request_id, None)
+
+    def _notify(self, request_id: UID, status: RequestStatus) -> None:
+        for callback in self._listeners.pop(request_id, []):
+            try:
+                callback(status)
+            except Exception as e:
+                logger.error(f"Request status listener failed for {request_id}. {e}")
+
+    def requests_for_object(self, object_id: UID) -> List[RequestMessage]:
+        self._expire()
+        return list(self._pending_by_object.get(object_id, {}).values())
+
+    def has_request(self, object_id: UID, requester_verify_key: VerifyKey) -> bool:
+        self._expire()
+        return any(
+            request.requester_verify_key == requester_verify_key
+            for request in self._pending_by_object.get(object_id, {}).values()
+        )
+
+    def get_status(self, request_id: UID, store: ObjectStore) -> RequestStatus:
+        self._expire()
+        if request_id in self._pending:
+            return RequestStatus.Pending
+
+        # the permissions granted by an accepted request go away with the object
+        object_id = self._accepted.get(request_id, None)
+        if object_id is not None:
+            if object_id in store:
+                return RequestStatus.Accepted
+            del self._accepted[request_id]
+
+        # must have been rejected or expired
+        return RequestStatus.Rejected
+
+    def expire(self, now: float) -> None:
+        """Remove the requests which have waited longer than their timeout"""
+        while self._deadlines and self._deadlines[0][0] < now:
+            _, _, request_id = heapq.heappop(self._deadlines)
+            # requests which were accepted or denied are left in the heap
+            self.remove(request_id=request_id)
+
+    def _expire(self) -> None:
+        if self._deadlines:
+            self.expire(now=time.time())
+
+    def index_accepted(self, store: ObjectStore) -> None:
+        """Remember the requests accepted before the store was opened, which are the
+        request ids kept as the values of the permissions"""
+        for obj in store.values():
+            permissions = list(obj.read_permissions.values())
+            permissions += list(obj.search_permissions.values())
+            for request_id in permissions:
+                if isinstance(request_id, UID):
+                    self._accepted[request_id] = obj.id
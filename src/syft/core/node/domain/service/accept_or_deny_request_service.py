@@ -11,7 +11,6 @@ from typing import Type
 
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
-from loguru import logger
 from nacl.signing import VerifyKey
 from typing_extensions import final
 
@@ -20,6 +19,7 @@ from .....decorators.syft_decorator_impl import syft_decorator
 from .....proto.core.node.domain.service.accept_or_deny_request_message_pb2 import (
     AcceptOrDenyRequestMessage as AcceptOrDenyRequestMessage_PB,
 )
+from .....tracing import tracer
 from .....util import key_emoji
 from ....common.message import ImmediateSyftMessageWithoutReply
 from ....common.serde.deserialize import _deserialize
@@ -117,41 +117,49 @@ class AcceptOrDenyRequestService(ImmediateNodeServiceWithoutReply):
     def process(
         node: AbstractNode, msg: AcceptOrDenyRequestMessage, verify_key: VerifyKey
     ) -> None:
-        logger.debug((f"> Processing AcceptOrDenyRequestService on {node.pprint}"))
+        tracer.trace(
+            event="request.accept_or_deny",
+            message=lambda: f"> Processing AcceptOrDenyRequestService on {node.pprint}",
+            request_id=msg.request_id,
+            accept=msg.accept,
+        )
+        request_id = msg.request_id
+        req = node.requests.get(request_id=request_id)
+        if req is None:
+            return None
+
         if msg.accept:
-            request_id = msg.request_id
-            for req in node.requests:
-                if request_id == req.id:
-                    # you must be a root user to accept a request
-                    if verify_key == node.root_verify_key:
-                        node.store[req.object_id].read_permissions[
-                            req.requester_verify_key
-                        ] = req.id
-                        node.requests.remove(req)
-
-                        logger.debug(
-                            f"> Accepting Request:{request_id} {request_id.emoji()}"
-                        )
-                        logger.debug(
-                            "> Adding can_read for 🔑 "
-                            + f"{key_emoji(key=req.requester_verify_key)} to "
-                            + f"Store UID {req.object_id} {req.object_id.emoji()}"
-                        )
-                        return None
+            # you must be a root user to accept a request
+            if verify_key == node.root_verify_key:
+                obj = node.store[req.object_id]
+                obj.read_permissions[req.requester_verify_key] = req.id
+                # store it again so stores which keep a copy see the permission
+                node.store[req.object_id] = obj
+                node.requests.accept(request_id=request_id)
+
+                tracer.trace(
+                    event="request.accepted",
+                    message=lambda: f"> Accepting Request:{request_id} "
+                    + f"{request_id.emoji()} and adding can_read for 🔑 "
+                    + f"{key_emoji(key=req.requester_verify_key)} to "
+                    + f"Store UID {req.object_id} {req.object_id.emoji()}",
+                    request_id=request_id,
+                    object_id=req.object_id,
+                )
 
         else:
-            request_id = msg.request_id
-            for req in node.requests:
-                if request_id == req.id:
-                    # if you're a root user you can disable a request
-                    # also people can disable their own requets
-                    if (
-                        verify_key == node.root_verify_key
-                        or verify_key == req.requester_verify_key
-                    ):
-                        node.requests.remove(req)
-                        logger.debug(f"> Rejecting Request:{request_id}")
-                        return None
+            # if you're a root user you can disable a request
+            # also people can disable their own requets
+            if (
+                verify_key == node.root_verify_key
+                or verify_key == req.requester_verify_key
+            ):
+                node.requests.remove(request_id=request_id)
+                tracer.trace(
+                    event="request.rejected",
+                    message=lambda: f"> Rejecting Request:{request_id}",
+                    request_id=request_id,
+                )
 
     @staticmethod
     def message_handler_types() -> List[Type[AcceptOrDenyRequestMessage]]:
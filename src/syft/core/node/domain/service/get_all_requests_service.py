@@ -184,7 +184,7 @@ class GetAllRequestsService(ImmediateNodeServiceWithoutReply):
 
         if verify_key == node.root_verify_key:
             return GetAllRequestsResponseMessage(
-                requests=node.requests, address=msg.reply_to
+                requests=list(node.requests), address=msg.reply_to
             )
 
         # only return requests which concern the user asking
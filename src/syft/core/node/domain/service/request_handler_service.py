@@ -25,6 +25,7 @@ from .....proto.core.node.domain.service.request_handler_message_pb2 import (
 from .....proto.core.node.domain.service.request_handler_message_pb2 import (
     UpdateRequestHandlerMessage as UpdateRequestHandlerMessage_PB,
 )
+from .....tracing import tracer
 from ....common import UID
 from ....common.message import ImmediateSyftMessageWithReply
 from ....common.message import ImmediateSyftMessageWithoutReply
@@ -281,8 +282,11 @@ class UpdateRequestHandlerService(ImmediateNodeServiceWithoutReply):
         if verify_key == node.root_verify_key:
             replacement_handlers = []
             existing_handlers = getattr(node, "request_handlers", None)
-            logger.debug(
-                f"> Updating Request Handlers with existing: {existing_handlers}"
+            tracer.trace(
+                event="request_handler.update",
+                message=lambda: "> Updating Request Handlers with existing: "
+                + f"{existing_handlers}",
+                msg_id=msg.id,
             )
             new_keys = set(msg.handler.keys())
             new_values = msg.handler.values()
@@ -300,15 +304,28 @@ class UpdateRequestHandlerService(ImmediateNodeServiceWithoutReply):
                         replacement_handlers.append(existing_handler)
 
                 if msg.keep:
-                    logger.debug(f"> Adding a Request Handler with: {msg.handler}")
+                    tracer.trace(
+                        event="request_handler.add",
+                        message=lambda: "> Adding a Request Handler with: "
+                        + f"{msg.handler}",
+                        msg_id=msg.id,
+                    )
                     msg.handler["created_time"] = time.time()
                     replacement_handlers.append(msg.handler)
                 else:
-                    logger.debug(f"> Removing a Request Handler with: {msg.handler}")
+                    tracer.trace(
+                        event="request_handler.remove",
+                        message=lambda: "> Removing a Request Handler with: "
+                        + f"{msg.handler}",
+                        msg_id=msg.id,
+                    )
 
                 setattr(node, "request_handlers", replacement_handlers)
-                logger.debug(
-                    f"> Finished Updating Request Handlers with: {existing_handlers}"
+                tracer.trace(
+                    event="request_handler.updated",
+                    message=lambda: "> Finished Updating Request Handlers with: "
+                    + f"{existing_handlers}",
+                    msg_id=msg.id,
                 )
             else:
                 logger.error(f"> Node has no Request Handlers attribute: {type(node)}")
@@ -331,8 +348,11 @@ class GetAllRequestHandlersService(ImmediateNodeServiceWithoutReply):
         handlers: List[DictType[str, Any]] = []
         if verify_key == node.root_verify_key:
             existing_handlers = getattr(node, "request_handlers", None)
-            logger.debug(
-                f"> Getting all Existing Request Handlers: {existing_handlers}"
+            tracer.trace(
+                event="request_handler.get_all",
+                message=lambda: "> Getting all Existing Request Handlers: "
+                + f"{existing_handlers}",
+                msg_id=msg.id,
             )
             if existing_handlers is not None:
                 handlers = existing_handlers
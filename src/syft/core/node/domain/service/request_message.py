@@ -16,8 +16,10 @@ from .....decorators import syft_decorator
 from .....proto.core.node.domain.service.request_message_pb2 import (
     RequestMessage as RequestMessage_PB,
 )
+from .....tracing import tracer
 from ....common import UID
 from ....common.message import ImmediateSyftMessageWithoutReply
+from ....common.signature import get_verify_key
 from ....io.address import Address
 from ....node.common.client import Client
 from ....node.common.node import DuplicateRequestException
@@ -104,7 +106,11 @@ class RequestMessage(ImmediateSyftMessageWithoutReply):
             except Exception as e:
                 print(e)
                 logger.critical(f"Tried to {action_name} Message on Node. {e}")
-            logger.debug(f"{action_name} Request: " + str(self.id))
+            tracer.trace(
+                event="request.process",
+                message=lambda: f"{action_name} Request: " + str(self.id),
+                request_id=self.id,
+            )
         else:
             log = f"No way to dispatch {action_name} Message."
             logger.critical(log)
@@ -154,7 +160,7 @@ class RequestMessage(ImmediateSyftMessageWithoutReply):
             address=deserialize(blob=proto.target_address),
             object_id=deserialize(blob=proto.object_id),
             owner_address=deserialize(blob=proto.owner_address),
-            requester_verify_key=VerifyKey(proto.requester_verify_key),
+            requester_verify_key=get_verify_key(proto.requester_verify_key),
             timeout_secs=proto.timeout_secs,
         )
         request_msg.request_id = deserialize(blob=proto.request_id)
@@ -187,16 +193,14 @@ class RequestService(ImmediateNodeServiceWithoutReply):
 
         # since we reject/accept requests based on the ID, we don't want there to be
         # multiple requests with the same ID because this could cause security problems.
-        for req in node.requests:
-            # the same user has requested the same object so we raise a
-            # DuplicateRequestException
-            if (
-                req.object_id == msg.object_id
-                and req.requester_verify_key == msg.requester_verify_key
-            ):
-                raise DuplicateRequestException(
-                    f"You have already requested {msg.object_id}"
-                )
+        # the same user has requested the same object so we raise a
+        # DuplicateRequestException
+        if node.requests.has_request(
+            object_id=msg.object_id, requester_verify_key=msg.requester_verify_key
+        ):
+            raise DuplicateRequestException(
+                f"You have already requested {msg.object_id}"
+            )
 
         # using the local arrival time we can expire the request
         msg.set_arrival_time(arrival_time=time.time())
@@ -81,7 +81,6 @@ Example:
 
 """
 # stdlib
-import time
 from typing import Any
 from typing import List
 from typing import Optional
@@ -96,14 +95,12 @@ import syft as sy
 # syft relative
 from ...decorators.syft_decorator_impl import syft_decorator
 from ...proto.core.pointer.pointer_pb2 import Pointer as Pointer_PB
+from ...tracing import tracer
 from ..common.pointer import AbstractPointer
 from ..common.serde.deserialize import _deserialize
 from ..common.uid import UID
 from ..io.address import Address
 from ..node.abstract.node import AbstractNode
-from ..node.common.action.garbage_collect_object_action import (
-    GarbageCollectObjectAction,
-)
 from ..node.common.action.get_object_action import GetObjectAction
 from ..store.storeable_object import StorableObject
 
@@ -153,9 +150,11 @@ class Pointer(AbstractPointer):
         :rtype: StorableObject
         """
 
-        logger.debug(
-            f"> GetObjectAction for id_at_location={self.id_at_location} "
-            + f"with delete_obj={delete_obj}"
+        tracer.trace(
+            event="pointer.get",
+            message=lambda: "> GetObjectAction for "
+            + f"id_at_location={self.id_at_location} with delete_obj={delete_obj}",
+            id_at_location=self.id_at_location,
         )
         obj_msg = GetObjectAction(
             id_at_location=self.id_at_location,
@@ -273,7 +272,7 @@ class Pointer(AbstractPointer):
         points_to_type = sy.lib_ast(
             proto.points_to_object_with_path, return_callable=True
         )
-        pointer_type = getattr(points_to_type, proto.pointer_name)
+        pointer_type = points_to_type.pointer_type
         # WARNING: This is sending a serialized Address back to the constructor
         # which currently depends on a Client for send_immediate_msg_with_reply
         return pointer_type(
@@ -337,13 +336,17 @@ class Pointer(AbstractPointer):
         :param reason: The description of the request. This is the reason why you want to have
         access to the data.
         :type reason: str
+        :return: a RequestFuture which is completed with the RequestStatus once the request
+        is accepted or denied, or the RequestStatus itself when block is True.
 
         .. note::
             This method should be used when the remote data associated with the pointer wants to be
             downloaded locally (or use .get() on the pointer).
         """
         # syft relative
+        from ..node.domain.request_future import RequestFuture
         from ..node.domain.service import RequestMessage
+        from ..node.domain.service import RequestStatus
 
         # if you request non-blocking you don't need a timeout
         # if you request blocking you need a timeout, so lets set a default on here
@@ -363,82 +366,39 @@ class Pointer(AbstractPointer):
             timeout_secs=timeout_secs,
         )
 
+        # listen for the answer before sending, a handler can answer straight away
+        future = RequestFuture(request_id=msg.id, client=self.client)
         self.client.send_immediate_msg_without_reply(msg=msg)
 
-        # wait long enough for it to arrive and trigger a handler
-        time.sleep(0.1)
-
         if not block:
-            return None
+            return future
+
+        if timeout_secs is None:
+            timeout_secs = 30  # default if not explicitly set
+
+        output_string = "> Waiting for Blocking Request: "
+        if len(name) > 0:
+            output_string += f"  {name}"
+        if len(reason) > 0:
+            output_string += f": {reason}"
+        if len(name) > 0 or len(name) > 0:
+            if len(output_string) > 0 and output_string[-1] != ".":
+                output_string += "."
+        logger.debug(output_string)
+        if verbose:
+            print(f"\n{output_string}", end="")
+
+        status = future.result(timeout_secs=timeout_secs)
+        if status == RequestStatus.Pending:
+            log = f"\n> Blocking Request Timeout after {timeout_secs} seconds"
         else:
-            if timeout_secs is None:
-                timeout_secs = 30  # default if not explicitly set
-
-            # syft relative
-            from ..node.domain.service import RequestAnswerMessage
-            from ..node.domain.service import RequestStatus
-
-            output_string = "> Waiting for Blocking Request: "
-            if len(name) > 0:
-                output_string += f"  {name}"
-            if len(reason) > 0:
-                output_string += f": {reason}"
-            if len(name) > 0 or len(name) > 0:
-                if len(output_string) > 0 and output_string[-1] != ".":
-                    output_string += "."
-            logger.debug(output_string)
-            if verbose:
-                print(f"\n{output_string}", end="")
-            status = None
-            start = time.time()
-
-            last_check: float = 0.0
-            while True:
-                now = time.time()
-                try:
-                    # won't run on the first pass because status is None which allows
-                    # for remote request handlers to auto respond before timeout
-                    if now - start > timeout_secs:
-                        log = (
-                            f"\n> Blocking Request Timeout after {timeout_secs} seconds"
-                        )
-                        logger.debug(log)
-                        if verbose:
-                            print(log)
-                        return status
-
-                    # only check once every second
-                    if now - last_check > 1:
-                        last_check = now
-                        logger.debug(f"> Sending another Request Message {now - start}")
-                        status_msg = RequestAnswerMessage(
-                            request_id=msg.id,
-                            address=self.client.address,
-                            reply_to=self.client.address,
-                        )
-                        response = self.client.send_immediate_msg_with_reply(
-                            msg=status_msg
-                        )
-                        status = response.status
-                        if response.status == RequestStatus.Pending:
-                            time.sleep(0.1)
-                            if verbose:
-                                print(".", end="")
-                            continue
-                        else:
-                            # accepted or rejected lets exit
-                            status_text = "REJECTED"
-                            if status == RequestStatus.Accepted:
-                                status_text = "ACCEPTED"
-                            log = f" {status_text}"
-                            logger.debug(log)
-                            if verbose:
-                                print(log)
-                            return status
-                except Exception as e:
-                    logger.error(f"Exception while running blocking request. {e}")
-                    # escape the while loop
-                    return status
+            # accepted or rejected
+            status_text = "ACCEPTED" if status == RequestStatus.Accepted else "REJECTED"
+            log = f" {status_text}"
+        logger.debug(log)
+        if verbose:
+            print(log)
+        return status
 
     def check_access(self, node: AbstractNode, request_id: UID) -> any:  # type: ignore
         """Method that checks the status of an already made request. There are three possible
@@ -470,10 +430,5 @@ class Pointer(AbstractPointer):
             return
 
         if self.gc_enabled:
-            # Create the delete message
-            msg = GarbageCollectObjectAction(
-                id_at_location=self.id_at_location, address=self.client.address
-            )
-
-            # Send the message
-            self.client.send_eventual_msg_without_reply(msg=msg)
+            # delete the object now or with the client's next batch
+            self.client.gc_object(id_at_location=self.id_at_location)
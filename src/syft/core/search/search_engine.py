@@ -0,0 +1,164 @@
+# stdlib
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+# third party
+from nacl.signing import VerifyKey
+
+# syft relative
+from ..common.group import VerifyAll
+from ..common.storeable_object import AbstractStorableObject
+from ..common.uid import UID
+
+
+class _IndexEntry(NamedTuple):
+    data_type: type
+    tags: Tuple[str, ...]
+    searchable_by: Tuple[VerifyKey, ...]
+    searchable_by_all: bool
+
+
+class ObjectSearchEngine:
+    """
+    Secondary indexes over the objects of an ObjectStore, from the type of their data,
+    their tags and the keys which are allowed to search for them to the UIDs of the
+    objects. The store keeps it up to date in __setitem__, delete and clear, and a
+    query is an intersection of the matching sets instead of a scan of the store.
+
+    Search permissions are changed in place on the stored object, so whoever changes
+    them has to set the object in the store again to update the index.
+
+    Queries return the keys in the order the objects were first added, like iterating
+    over the store does.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[UID, _IndexEntry] = {}
+        self._order: Dict[UID, int] = {}
+        self._next_order = 0
+        self._by_type: Dict[type, Set[UID]] = {}
+        self._by_tag: Dict[str, Set[UID]] = {}
+        self._by_verify_key: Dict[VerifyKey, Set[UID]] = {}
+        self._by_all: Set[UID] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: UID) -> bool:
+        return key in self._entries
+
+    def add(self, key: UID, obj: AbstractStorableObject) -> None:
+        # updating an object keeps its place in the order
+        order = self._order.get(key, None)
+        self.remove(key=key)
+        if order is None:
+            order = self._next_order
+            self._next_order += 1
+        self._order[key] = order
+
+        tags = tuple(getattr(obj, "tags", None) or [])
+        searchable_by = []
+        searchable_by_all = False
+        for searcher in (getattr(obj, "search_permissions", None) or {}).keys():
+            # VerifyAll has no identity, any instance means everyone can search
+            if isinstance(searcher, VerifyAll):
+                searchable_by_all = True
+            else:
+                searchable_by.append(searcher)
+
+        entry = _IndexEntry(
+            data_type=type(getattr(obj, "data", None)),
+            tags=tags,
+            searchable_by=tuple(searchable_by),
+            searchable_by_all=searchable_by_all,
+        )
+        self._entries[key] = entry
+
+        self._by_type.setdefault(entry.data_type, set()).add(key)
+        for tag in entry.tags:
+            self._by_tag.setdefault(tag, set()).add(key)
+        for verify_key in entry.searchable_by:
+            self._by_verify_key.setdefault(verify_key, set()).add(key)
+        if entry.searchable_by_all:
+            self._by_all.add(key)
+
+    def remove(self, key: UID) -> None:
+        self._order.pop(key, None)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        _discard(index=self._by_type, value=entry.data_type, key=key)
+        for tag in entry.tags:
+            _discard(index=self._by_tag, value=tag, key=key)
+        for verify_key in entry.searchable_by:
+            _discard(index=self._by_verify_key, value=verify_key, key=key)
+        self._by_all.discard(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._order.clear()
+        self._by_type.clear()
+        self._by_tag.clear()
+        self._by_verify_key.clear()
+        self._by_all.clear()
+
+    def keys_of_type(self, obj_type: type) -> Set[UID]:
+        """The keys of the objects whose data is an instance of obj_type"""
+        keys: Set[UID] = set()
+        for data_type, type_keys in self._by_type.items():
+            if issubclass(data_type, obj_type):
+                keys |= type_keys
+        return keys
+
+    def keys_with_tag(self, tag: str) -> Set[UID]:
+        """The keys of the objects which have the tag"""
+        return self._by_tag.get(tag, set())
+
+    def keys_searchable_by(self, verify_key: VerifyKey) -> Set[UID]:
+        """The keys of the objects which verify_key is allowed to search for"""
+        return self._by_verify_key.get(verify_key, set()) | self._by_all
+
+    def query(
+        self,
+        obj_type: type = object,
+        tags: Optional[List[str]] = None,
+        searchable_by: Optional[VerifyKey] = None,
+    ) -> List[UID]:
+        """The keys of the objects matching all of the given conditions, an empty list
+        of tags or no searchable_by matches everything
+
+        Args:
+            obj_type (type): only objects whose data is an instance of obj_type.
+            tags (List[str]): only objects which have all of these tags.
+            searchable_by (VerifyKey): only objects this key is allowed to search for.
+        """
+        matches: List[Set[UID]] = []
+        if obj_type is not object:
+            matches.append(self.keys_of_type(obj_type=obj_type))
+        for tag in tags or []:
+            matches.append(self.keys_with_tag(tag=tag))
+        if searchable_by is not None:
+            matches.append(self.keys_searchable_by(verify_key=searchable_by))
+
+        keys: Iterable[UID]
+        if matches:
+            # hashing a UID is not free, so start from the smallest set
+            matches.sort(key=len)
+            keys = matches[0].intersection(*matches[1:])
+        else:
+            keys = self._order.keys()
+        return sorted(keys, key=self._order.__getitem__)
+
+
+def _discard(index: Dict, value: object, key: UID) -> None:
+    keys = index.get(value, None)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del index[value]
@@ -2,5 +2,6 @@
 from .store_disk import DiskObjectStore
 from .store_interface import ObjectStore
 from .store_memory import MemoryStore
+from .store_tiered import TieredObjectStore
 
-__all__ = ["DiskObjectStore", "ObjectStore", "MemoryStore"]
+__all__ = ["DiskObjectStore", "ObjectStore", "MemoryStore", "TieredObjectStore"]
@@ -1,8 +1,13 @@
 # stdlib
 from pathlib import Path
 import tempfile
+import threading
 from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 # third party
 from loguru import logger
@@ -13,28 +18,115 @@ from typing_extensions import Final
 from ...decorators import syft_decorator
 from ..common.serde.deserialize import _deserialize
 from ..common.uid import UID
+from ..search.search_engine import ObjectSearchEngine
 from .store_interface import ObjectStore
 from .storeable_object import StorableObject
 
+# the values of the SQLite synchronous pragma, by name or by number
+SYNCHRONOUS_VALUES = {"OFF", "NORMAL", "FULL", "EXTRA", 0, 1, 2, 3}
+
 
 # NOTE: This should not be used yet, this API will be done after the pygrid integration.
 class DiskObjectStore(ObjectStore):
-    def __init__(self, db_path: Optional[str] = None):
+    """
+    Class that implements an ObjectStore backed by a SQLite file.
+
+    By default every write is committed straight away. With write-behind (commit_every
+    greater than 1 and / or a commit_interval) writes are coalesced into group commits
+    which are made after commit_every writes or commit_interval seconds after the first
+    uncommitted write, whichever comes first. Reads always see uncommitted writes, but
+    they can be lost if the process dies before the next commit.
+
+    Args:
+        db_path (str): the SQLite file, a file in the temp directory by default.
+        journal_mode (str): the SQLite journal_mode pragma, like DELETE or WAL.
+        synchronous (str or int): the SQLite synchronous pragma, OFF, NORMAL, FULL or
+            EXTRA, or 0 to 3.
+        commit_every (int): the number of writes in a group commit.
+        commit_interval (float): the number of seconds a write can stay uncommitted.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        journal_mode: str = "DELETE",
+        synchronous: Optional[Union[str, int]] = None,
+        commit_every: int = 1,
+        commit_interval: Optional[float] = None,
+    ):
         super().__init__()
 
+        # the pragma can't be passed as a parameter, so only known values are used
+        if isinstance(synchronous, str):
+            synchronous = synchronous.upper()
+        if synchronous is not None and synchronous not in SYNCHRONOUS_VALUES:
+            raise ValueError(
+                "synchronous should be one of OFF, NORMAL, FULL, EXTRA or 0 to 3. "
+                + f"Got {synchronous}"
+            )
+
         if db_path is None:
             db_path = str(Path(f"{tempfile.gettempdir()}") / "test.sqlite")
 
-        self.db: Final = SqliteDict(db_path)
-        self.search_engine = None
+        self.db: Final = SqliteDict(db_path, journal_mode=journal_mode)
+        if synchronous is not None:
+            self.db.conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._search_engine = ObjectSearchEngine()
+        self._index_existing_objects()
+
+        self.commit_every = commit_every
+        self.commit_interval = commit_interval
+        self._uncommitted_writes = 0
+        self._commit_timer: Optional[threading.Timer] = None
+        self._commit_lock = threading.Lock()
+
+    def _index_existing_objects(self) -> None:
+        for key_string, blob in self.db.iteritems():
+            try:
+                value = _deserialize(blob=blob, from_bytes=True)
+            except Exception as e:
+                logger.warning(f"{type(self)} could not index {key_string} {e}")
+                continue
+            self._search_engine.add(key=UID.from_string(value=key_string), obj=value)
+
+    def _wrote(self) -> None:
+        with self._commit_lock:
+            self._uncommitted_writes += 1
+            if self._uncommitted_writes >= self.commit_every:
+                self._commit()
+            elif self.commit_interval is not None and self._commit_timer is None:
+                self._commit_timer = threading.Timer(self.commit_interval, self.commit)
+                self._commit_timer.daemon = True
+                self._commit_timer.start()
+
+    def _commit(self) -> None:
+        if self._commit_timer is not None:
+            self._commit_timer.cancel()
+            self._commit_timer = None
+        if self._uncommitted_writes > 0:
+            self._uncommitted_writes = 0
+            self.db.commit(blocking=False)
+
+    def commit(self, blocking: bool = False) -> None:
+        """Commit the writes which are waiting for a group commit, blocking waits until
+        they are on disk"""
+        with self._commit_lock:
+            self._commit()
+        if blocking:
+            # an empty blocking commit returns once the queued commit is done
+            self.db.commit(blocking=True)
+
+    def close(self) -> None:
+        self.commit(blocking=True)
+        self.db.close()
 
     def get_objects_of_type(self, obj_type: type) -> Iterable[StorableObject]:
-        # TODO: this wont fly long term
-        obj_types = []
-        for value in self.values():
-            if isinstance(value.data, obj_type):
-                obj_types.append(value)
-        return obj_types
+        return list(self.iter_objects_of_type(obj_type=obj_type))
+
+    def iter_objects_of_type(self, obj_type: type) -> Iterator[StorableObject]:
+        """Stream the objects whose data is an obj_type, one row at a time"""
+        for key in self._search_engine.query(obj_type=obj_type):
+            yield self.__getitem__(key)
 
     @syft_decorator(typechecking=True, prohibit_args=False)
     def __getitem__(self, key: UID) -> StorableObject:
@@ -56,7 +148,8 @@ class DiskObjectStore(ObjectStore):
         try:
             blob = value.serialize(to_bytes=True)
             self.db[str(key.value)] = blob
-            self.db.commit(blocking=False)
+            self._search_engine.add(key=key, obj=value)
+            self._wrote()
         except Exception as e:
             logger.trace(f"{type(self)} set item error {key} {type(value)} {e}")
             raise e
@@ -75,17 +168,28 @@ class DiskObjectStore(ObjectStore):
 
     @syft_decorator(typechecking=True)
     def keys(self) -> Iterable[UID]:
-        key_strings = self.db.keys()
-        return [UID.from_string(key_string) for key_string in key_strings]
+        return list(self.iterkeys())
 
     @syft_decorator(typechecking=True)
     def values(self) -> Iterable[StorableObject]:
-        values = []
-        for blob in self.db.values():
-            value = _deserialize(blob=blob, from_bytes=True)
-            values.append(value)
+        return list(self.itervalues())
+
+    def iterkeys(self) -> Iterator[UID]:
+        """Stream the keys of the store, one row at a time"""
+        for key_string in self.db.iterkeys():
+            yield UID.from_string(value=key_string)
 
-        return values
+    def itervalues(self) -> Iterator[StorableObject]:
+        """Stream the objects in the store, each row is only deserialized when it
+        is reached"""
+        for blob in self.db.itervalues():
+            yield _deserialize(blob=blob, from_bytes=True)
+
+    def iteritems(self) -> Iterator[Tuple[UID, StorableObject]]:
+        for key_string, blob in self.db.iteritems():
+            yield UID.from_string(value=key_string), _deserialize(
+                blob=blob, from_bytes=True
+            )
 
     @syft_decorator(typechecking=True)
     def __contains__(self, item: UID) -> bool:
@@ -97,15 +201,42 @@ class DiskObjectStore(ObjectStore):
             obj = self.get_object(key=key)
             if obj is not None:
                 del self.db[str(key.value)]
+                self._search_engine.remove(key=key)
+                self._wrote()
             else:
                 logger.critical(f"{type(self)} delete error {key}.")
         except Exception as e:
             logger.critical(f"{type(self)} Exception in delete {key}. {e}")
 
+    @syft_decorator(typechecking=True)
+    def delete_many(self, keys: List[UID]) -> None:
+        deleted = 0
+        for key in keys:
+            key_string = str(key.value)
+            try:
+                if key_string not in self.db:
+                    logger.critical(f"{type(self)} delete_many error {key}.")
+                    continue
+                del self.db[key_string]
+                self._search_engine.remove(key=key)
+                deleted += 1
+            except Exception as e:
+                logger.critical(f"{type(self)} Exception in delete_many {key}. {e}")
+        # the whole batch is one write for the group commit
+        if deleted:
+            self._wrote()
+
     @syft_decorator(typechecking=True, prohibit_args=False)
     def __delitem__(self, key: UID) -> None:
         self.delete(key=key)
 
     @syft_decorator(typechecking=True)
     def clear(self) -> None:
-        self.db.clear()
+        with self._commit_lock:
+            # clear commits the pending writes by itself
+            if self._commit_timer is not None:
+                self._commit_timer.cancel()
+                self._commit_timer = None
+            self._uncommitted_writes = 0
+            self.db.clear()
+            self._search_engine.clear()
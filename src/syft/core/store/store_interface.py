@@ -1,15 +1,19 @@
 # stdlib
 from abc import ABC
 from typing import Iterable
+from typing import List
+from typing import Optional
 from typing import Type
 
 # third party
 from loguru import logger
+from nacl.signing import VerifyKey
 
 # syft relative
 from ...decorators import syft_decorator
 from ..common.storeable_object import AbstractStorableObject
 from ..common.uid import UID
+from ..search.search_engine import ObjectSearchEngine
 from .storeable_object import StorableObject
 
 
@@ -18,8 +22,13 @@ class ObjectStore(ABC):
     ObjectStore is the common interface for all the stores that a Node can handle. This should
     provide a dict-like interface on handling data on a worker. Indexing should be always done
     by using UID objects, while de indexed value should always be a SerizableObject.
+
+    Every store keeps an ObjectSearchEngine in _search_engine up to date, which indexes the
+    objects by the type of their data, their tags and the keys allowed to search for them.
     """
 
+    _search_engine: ObjectSearchEngine
+
     @syft_decorator(typechecking=True)
     def __sizeof__(self) -> int:
         """
@@ -137,6 +146,19 @@ class ObjectStore(ABC):
         """
         raise NotImplementedError
 
+    @syft_decorator(typechecking=True)
+    def delete_many(self, keys: List[UID]) -> None:
+        """
+        Method to remove many objects from the store at once, like the objects of the
+        pointers a client garbage collected in a batch. Keys which are not in the store
+        are logged and skipped.
+
+        Args:
+            keys (List[UID]): the keys at which to delete the objects.
+        """
+        for key in keys:
+            self.delete(key=key)
+
     @syft_decorator(typechecking=True)
     def clear(self) -> None:
         """
@@ -164,6 +186,28 @@ class ObjectStore(ABC):
     def get_objects_of_type(self, obj_type: Type) -> Iterable[AbstractStorableObject]:
         raise NotImplementedError
 
+    def search(
+        self,
+        obj_type: type = object,
+        tags: Optional[List[str]] = None,
+        searchable_by: Optional[VerifyKey] = None,
+    ) -> List[AbstractStorableObject]:
+        """
+        Method to find objects with the indexes of the store instead of scanning it.
+
+        Args:
+            obj_type (type): only objects whose data is an instance of obj_type.
+            tags (List[str]): only objects which have all of these tags.
+            searchable_by (VerifyKey): only objects this key is allowed to search for.
+
+        Returns:
+            List[AbstractStorableObject]: the matching objects, in the order they were stored.
+        """
+        keys = self._search_engine.query(
+            obj_type=obj_type, tags=tags, searchable_by=searchable_by
+        )
+        return [self.__getitem__(key) for key in keys]
+
     @property
     def icon(self) -> str:
         return "🗃️"
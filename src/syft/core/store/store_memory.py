@@ -2,6 +2,7 @@
 from collections import OrderedDict
 from typing import Iterable
 from typing import KeysView
+from typing import List
 from typing import Optional
 from typing import ValuesView
 
@@ -14,6 +15,7 @@ from . import ObjectStore
 from ...decorators import syft_decorator
 from ..common.storeable_object import AbstractStorableObject
 from ..common.uid import UID
+from ..search.search_engine import ObjectSearchEngine
 
 
 class MemoryStore(ObjectStore):
@@ -22,8 +24,8 @@ class MemoryStore(ObjectStore):
 
     Attributes:
         _objects (dict): the dict that backs the storage of the MemoryStorage.
-        _search_engine (ObjectSearchEngine): the objects that handles searching by using tags or
-        description.
+        _search_engine (ObjectSearchEngine): the indexes which handle searching by the type of
+        the data, tags or search permissions.
     """
 
     __slots__ = ["_objects", "_search_engine"]
@@ -31,14 +33,14 @@ class MemoryStore(ObjectStore):
     def __init__(self) -> None:
         super().__init__()
         self._objects: OrderedDict[UID, AbstractStorableObject] = OrderedDict()
-        self._search_engine = None
+        self._search_engine = ObjectSearchEngine()
         self.post_init()
 
     def get_object(self, key: UID) -> Optional[AbstractStorableObject]:
         return self._objects.get(key, None)
 
     def get_objects_of_type(self, obj_type: type) -> Iterable[AbstractStorableObject]:
-        return [obj for obj in self.values() if isinstance(obj.data, obj_type)]
+        return self.search(obj_type=obj_type)
 
     @syft_decorator(typechecking=True)
     def __sizeof__(self) -> int:
@@ -75,6 +77,7 @@ class MemoryStore(ObjectStore):
     @syft_decorator(typechecking=True, prohibit_args=False)
     def __setitem__(self, key: UID, value: AbstractStorableObject) -> None:
         self._objects[key] = value
+        self._search_engine.add(key=key, obj=value)
 
     @syft_decorator(typechecking=True, prohibit_args=False)
     def delete(self, key: UID) -> None:
@@ -82,14 +85,24 @@ class MemoryStore(ObjectStore):
             obj = self.get_object(key=key)
             if obj is not None:
                 self._objects.__delitem__(key)
+                self._search_engine.remove(key=key)
             else:
                 logger.critical(f"{type(self)} __delitem__ error {key}.")
         except Exception as e:
             logger.critical(f"{type(self)} Exception in __delitem__ error {key}. {e}")
 
+    @syft_decorator(typechecking=True)
+    def delete_many(self, keys: List[UID]) -> None:
+        for key in keys:
+            if self._objects.pop(key, None) is None:
+                logger.critical(f"{type(self)} delete_many error {key}.")
+                continue
+            self._search_engine.remove(key=key)
+
     @syft_decorator(typechecking=True)
     def clear(self) -> None:
         self._objects.clear()
+        self._search_engine.clear()
 
     def _object2proto(self) -> GeneratedProtocolMessageType:
         pass
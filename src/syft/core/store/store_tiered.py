@@ -0,0 +1,235 @@
+# stdlib
+from collections import OrderedDict
+import sys
+import threading
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+
+# third party
+from loguru import logger
+import torch as th
+
+# syft relative
+from ...decorators import syft_decorator
+from ..common.storeable_object import AbstractStorableObject
+from ..common.uid import UID
+from .store_disk import DiskObjectStore
+from .store_interface import ObjectStore
+
+
+def object_size(obj: AbstractStorableObject) -> int:
+    """An estimate of the memory used by the data of a stored object. Tensors and
+    anything with parameters, like models, are counted by the size of their
+    elements, everything else by sys.getsizeof."""
+    data = getattr(obj, "data", None)
+    if isinstance(data, th.Tensor):
+        return data.element_size() * data.nelement()
+    parameters = getattr(data, "parameters", None)
+    if callable(parameters):
+        try:
+            return sum(p.element_size() * p.nelement() for p in parameters())
+        except Exception:
+            pass
+    return sys.getsizeof(data)
+
+
+class TieredObjectStore(ObjectStore):
+    """
+    Class that implements an ObjectStore which keeps the most recently used objects in
+    memory, up to max_memory_bytes, and spills the least recently used ones to a
+    DiskObjectStore. Objects on disk are moved back to memory when they are used.
+
+    Objects in memory can be changed in place, like their permissions, so they are
+    always written to disk when they are evicted.
+
+    Moving an object between the tiers takes a lock, so another thread never finds
+    an object that is in neither tier, or in both with the memory budget counted
+    wrong.
+
+    Attributes:
+        hits (int): the number of objects found in memory.
+        misses (int): the number of objects which had to be read from disk.
+        evictions (int): the number of objects spilled to disk.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int,
+        db_path: Optional[str] = None,
+        store_options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        super().__init__()
+        self.max_memory_bytes = max_memory_bytes
+        self.memory_bytes = 0
+        self._objects: OrderedDict[UID, AbstractStorableObject] = OrderedDict()
+        self._sizes: Dict[UID, int] = {}
+
+        self.disk = DiskObjectStore(db_path=db_path, **(store_options or {}))
+        # the keys on disk, so that lookups don't have to ask SQLite
+        self._disk_keys: Set[UID] = set(self.disk.iterkeys())
+        # reentrant because get_object looks the key up before getting it
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # one index over both tiers, the disk store keeps the evicted objects in it
+        self._search_engine = self.disk._search_engine
+        self.post_init()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "memory_objects": len(self._objects),
+                "memory_bytes": self.memory_bytes,
+                "disk_objects": len(self._disk_keys),
+            }
+
+    def _add_to_memory(self, key: UID, value: AbstractStorableObject) -> None:
+        self._remove_from_memory(key=key)
+        size = object_size(obj=value)
+        self._objects[key] = value
+        self._sizes[key] = size
+        self.memory_bytes += size
+        self._evict()
+
+    def _remove_from_memory(self, key: UID) -> Optional[AbstractStorableObject]:
+        value = self._objects.pop(key, None)
+        if value is not None:
+            self.memory_bytes -= self._sizes.pop(key)
+        return value
+
+    def _evict(self) -> None:
+        # spill the least recently used objects until we are under budget
+        while self.memory_bytes > self.max_memory_bytes and self._objects:
+            key, value = self._objects.popitem(last=False)
+            self.memory_bytes -= self._sizes.pop(key)
+            self.disk[key] = value
+            self._disk_keys.add(key)
+            self.evictions += 1
+
+    def get_object(self, key: UID) -> Optional[AbstractStorableObject]:
+        with self._lock:
+            if key in self:
+                return self.__getitem__(key=key)
+            return None
+
+    def get_objects_of_type(self, obj_type: type) -> Iterable[AbstractStorableObject]:
+        return self.search(obj_type=obj_type)
+
+    @syft_decorator(typechecking=True)
+    def __sizeof__(self) -> int:
+        return self.memory_bytes
+
+    @syft_decorator(typechecking=True)
+    def __str__(self) -> str:
+        return f"{type(self).__name__}({self.stats})"
+
+    @syft_decorator(typechecking=True)
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._disk_keys.union(self._objects.keys()))
+
+    @syft_decorator(typechecking=True)
+    def keys(self) -> Iterable[UID]:
+        with self._lock:
+            return list(self._objects.keys()) + [
+                key for key in self._disk_keys if key not in self._objects
+            ]
+
+    @syft_decorator(typechecking=True)
+    def values(self) -> Iterable[AbstractStorableObject]:
+        return list(self.itervalues())
+
+    def itervalues(self) -> Iterator[AbstractStorableObject]:
+        """The objects in memory and then the ones on disk, objects on disk are not
+        moved to memory while iterating"""
+        with self._lock:
+            in_memory = list(self._objects.values())
+            on_disk = [key for key in self._disk_keys if key not in self._objects]
+        yield from in_memory
+        for key in on_disk:
+            with self._lock:
+                # it may have been deleted or promoted since
+                if key not in self._disk_keys:
+                    continue
+                value = self._objects.get(key, None)
+                if value is None:
+                    value = self.disk[key]
+            yield value
+
+    @syft_decorator(typechecking=True, prohibit_args=False)
+    def __contains__(self, key: UID) -> bool:
+        with self._lock:
+            return key in self._objects or key in self._disk_keys
+
+    @syft_decorator(typechecking=True, prohibit_args=False)
+    def __getitem__(self, key: UID) -> AbstractStorableObject:
+        with self._lock:
+            value = self._objects.get(key, None)
+            if value is not None:
+                self.hits += 1
+                self._objects.move_to_end(key)
+                return value
+
+            if key not in self._disk_keys:
+                logger.critical(f"{type(self)} __getitem__ error {key}")
+                raise KeyError(key)
+
+            self.misses += 1
+            value = self.disk[key]
+            self._add_to_memory(key=key, value=value)
+            return value
+
+    @syft_decorator(typechecking=True, prohibit_args=False)
+    def __setitem__(self, key: UID, value: AbstractStorableObject) -> None:
+        with self._lock:
+            self._search_engine.add(key=key, obj=value)
+            self._add_to_memory(key=key, value=value)
+
+    @syft_decorator(typechecking=True, prohibit_args=False)
+    def delete(self, key: UID) -> None:
+        with self._lock:
+            value = self._remove_from_memory(key=key)
+            self._search_engine.remove(key=key)
+            if key in self._disk_keys:
+                self._disk_keys.discard(key)
+                self.disk.delete(key=key)
+            elif value is None:
+                logger.critical(f"{type(self)} __delitem__ error {key}.")
+
+    @syft_decorator(typechecking=True)
+    def delete_many(self, keys: List[UID]) -> None:
+        with self._lock:
+            disk_keys = []
+            for key in keys:
+                value = self._remove_from_memory(key=key)
+                self._search_engine.remove(key=key)
+                if key in self._disk_keys:
+                    self._disk_keys.discard(key)
+                    disk_keys.append(key)
+                elif value is None:
+                    logger.critical(f"{type(self)} delete_many error {key}.")
+            if disk_keys:
+                self.disk.delete_many(keys=disk_keys)
+
+    @syft_decorator(typechecking=True)
+    def clear(self) -> None:
+        with self._lock:
+            self._objects.clear()
+            self._sizes.clear()
+            self.memory_bytes = 0
+            self._disk_keys.clear()
+            self.disk.clear()
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -1,12 +1,13 @@
 # stdlib
-import pydoc
 from typing import Dict as DictType
 from typing import List
 from typing import Optional
 from typing import Type
 from typing import Union
+from typing import cast
 
 # third party
+from google.protobuf import symbol_database
 from google.protobuf.empty_pb2 import Empty as Empty_PB
 from google.protobuf.message import Message
 from google.protobuf.reflection import GeneratedProtocolMessageType
@@ -26,7 +27,9 @@ from ...util import get_fully_qualified_name
 from ...util import key_emoji
 from ..common.group import VerifyAll
 from ..common.serde.deserialize import _deserialize
+from ..common.serde.deserialize import lookup_serializable_type
 from ..common.serde.serializable import Serializable
+from ..common.signature import get_verify_key
 from ..common.storeable_object import AbstractStorableObject
 from ..common.uid import UID
 
@@ -105,12 +108,11 @@ class StorableObject(AbstractStorableObject):
             # Step 4: save the description into proto
             proto.description = self.data.description  # type: ignore
 
-        # QUESTION: Which one do we want, self.data.tags or self.tags or both???
-        if hasattr(self.data, "tags"):
-            # Step 5: save tags into proto if they exist
-            if self.data.tags is not None and self.tags is not None:  # type: ignore
-                for tag in self.tags:
-                    proto.tags.append(tag)
+        # Step 5: save tags into proto if they exist, the tags of the StorableObject
+        # are the ones the stores index so they have to survive a trip to disk
+        if self.tags is not None:
+            for tag in self.tags:
+                proto.tags.append(tag)
 
         # Step 6: save read permissions
         if self.read_permissions is not None and len(self.read_permissions.keys()) > 0:
@@ -138,10 +140,11 @@ class StorableObject(AbstractStorableObject):
         # Step 1: deserialize the ID
         id = _deserialize(blob=proto.id)
 
-        # TODO: FIX THIS SECURITY BUG!!! WE CANNOT USE
-        #  PYDOC.LOCATE!!!
         # Step 2: get the type of wrapper to use to deserialize
-        obj_type: StorableObject = pydoc.locate(proto.obj_type)  # type: ignore
+        obj_type = cast(
+            Type[StorableObject],
+            lookup_serializable_type(fully_qualified_name=proto.obj_type),
+        )
 
         # Step 3: get the protobuf type we deserialize for .data
         schematic_type = obj_type.get_data_protobuf_schema()
@@ -153,6 +156,12 @@ class StorableObject(AbstractStorableObject):
             if descriptor is not None and proto.data.Is(descriptor):
                 proto.data.Unpack(data)
             data = obj_type._data_proto2object(proto=data)
+        elif proto.data.type_url:
+            # a plain StorableObject can hold any Serializable, so we have to find
+            # the type of the packed proto by its name
+            data = symbol_database.Default().GetSymbol(proto.data.TypeName())()
+            proto.data.Unpack(data)
+            data = obj_type._data_proto2object(proto=data)
         else:
             data = None
 
@@ -299,7 +308,7 @@ class VerifyKeyWrapper(StorableObject):
 
     @staticmethod
     def _data_proto2object(proto: VerifyKeyWrapper_PB) -> VerifyKey:
-        return VerifyKey(proto.verify_key)
+        return get_verify_key(proto.verify_key)
 
     @staticmethod
     def get_data_protobuf_schema() -> GeneratedProtocolMessageType:
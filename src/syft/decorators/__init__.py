@@ -1,3 +1,5 @@
 # syft relative
 from .syft_decorator_impl import syft_decorator  # noqa: F401
+from .typecheck import get_typecheck_mode  # noqa: F401
+from .typecheck import set_typecheck_mode  # noqa: F401
 from .typecheck import type_hints  # noqa: F401
@@ -8,6 +8,7 @@ from typing import Optional
 from typing import Tuple
 
 # syft relative
+from .typecheck import get_typecheck_mode
 from .typecheck import type_hints
 
 # this flag is set in syft.__init__.py
@@ -24,6 +25,9 @@ def syft_decorator(
     def decorator(function: Callable) -> Callable:
 
         if typechecking:
+            # with typechecking off there is nothing left for the wrapper to do
+            if get_typecheck_mode() == "off" and not other_decorators:
+                return function
             function = type_hints(function, prohibit_args=prohibit_args)
 
         def wrapper(*args: Tuple[Any], **kwargs: Dict[Any, Any]) -> Callable:
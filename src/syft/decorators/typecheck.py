@@ -1,5 +1,6 @@
 # stdlib
 import inspect
+import os
 import typing
 from typing import Any
 from typing import Tuple
@@ -20,6 +21,41 @@ from typeguard import typechecked
 
 SKIP_RETURN_TYPE_HINTS = {"__init__"}
 
+# Typechecking modes:
+# - "full": build a typeguard wrapper and check the call on every invocation
+# - "compile_once": build the typeguard wrapper once when the function is decorated
+# - "off": functions decorated while the mode is "off" are returned undecorated and
+#   functions decorated before that skip all checks
+TYPECHECK_MODES = ("full", "compile_once", "off")
+TYPECHECK_MODE_ENV_VAR = "SYFT_TYPECHECK_MODE"
+
+# the mode is looked up on every call so it lives in a mutable container
+_typecheck_mode = [os.environ.get(TYPECHECK_MODE_ENV_VAR, "full")]
+if _typecheck_mode[0] not in TYPECHECK_MODES:
+    raise ValueError(
+        f"{TYPECHECK_MODE_ENV_VAR}={_typecheck_mode[0]} is not one of {TYPECHECK_MODES}"
+    )
+
+
+def set_typecheck_mode(mode: str) -> None:
+    """Select how functions decorated with type_hints are typechecked.
+
+    The mode can also be set before syft is imported with the SYFT_TYPECHECK_MODE
+    environment variable. Only functions decorated while the mode is "off" lose their
+    wrapper completely, so "off" is fastest when set through the environment variable.
+
+    :param mode: one of "full", "compile_once" or "off"
+    :type mode: str
+    """
+    if mode not in TYPECHECK_MODES:
+        raise ValueError(f"Typecheck mode {mode} is not one of {TYPECHECK_MODES}")
+    _typecheck_mode[0] = mode
+
+
+def get_typecheck_mode() -> str:
+    """Return the current typechecking mode, see set_typecheck_mode."""
+    return _typecheck_mode[0]
+
 
 def type_hints(
     decorated: typing.Callable, prohibit_args: bool = True
@@ -40,6 +76,9 @@ def type_hints(
     func(x = 1, y = 2)
     """
 
+    if _typecheck_mode[0] == "off":
+        return decorated
+
     literal_signature = inspect.signature(decorated)
 
     # Python 3.6 Forward References Self Fix
@@ -104,9 +143,19 @@ def type_hints(
                 f"function {decorated.__qualname__}."
             )
 
+    # this is the wrapper used in "compile_once" mode
+    typechecked_decorated = typechecked(decorated)
+
     def decorator(*args: Tuple[Any, ...], **kwargs: Any) -> type:
+        mode = _typecheck_mode[0]
+        if mode == "off":
+            return decorated(*args, **kwargs)
+
         if prohibit_args:
             check_args(*args, **kwargs)
+
+        if mode == "compile_once":
+            return typechecked_decorated(*args, **kwargs)
         return typechecked(decorated)(*args, **kwargs)
 
     decorator.__annotations__ = decorated.__annotations__
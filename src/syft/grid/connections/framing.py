@@ -0,0 +1,191 @@
+"""
+Framing of the messages sent over a WebRTC data channel.
+
+A message is split into records of at most one frame each, so that a large
+message like a model state_dict is sent as many frames of a bounded size
+instead of one channel message of any size. Records of small messages sent
+at the same time are packed together into one frame, so that a burst of
+small messages costs one channel message instead of one each.
+
+Every record starts with a header:
+
+    kind        1 byte     MESSAGE, REQUEST or REPLY
+    flags       1 byte     MORE if the message continues in a later record
+    number      4 bytes    the number of the message on this connection
+    request id  16 bytes   the id of the request a REQUEST or REPLY belongs to
+    length      4 bytes    the length of the data of the record
+
+The records of a message arrive in order, since the data channel is ordered,
+and the number of the message tells which message a record continues, so
+records of different messages may be interleaved.
+
+The receiving side only reassembles messages of up to MAX_MESSAGE_SIZE bytes
+and only MAX_PARTIAL_MESSAGES of them at a time. A peer which sends more
+breaks the framing and the Deframer raises a FramingError, as it does for a
+frame which ends in the middle of a record.
+"""
+
+# stdlib
+import struct
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from typing import Union
+
+MESSAGE = 0  # a message without reply
+REQUEST = 1  # a message with reply
+REPLY = 2  # the reply to a REQUEST
+NO_REQUEST = bytes(16)
+
+# the data of the record continues in a later record
+MORE = 1
+
+RECORD = struct.Struct("!BBI16sI")
+
+# the max-message-size a peer has to assume when the other one doesn't say
+# otherwise (RFC 8841), which every WebRTC implementation accepts
+MAX_FRAME_SIZE = 64 * 1024
+
+# a message isn't started in the room left in a frame smaller than this, the
+# frame is sent first
+MIN_RECORD_SIZE = 1024
+
+# the largest message which is reassembled, and how many messages can be
+# reassembled at the same time
+MAX_MESSAGE_SIZE = 1024 * 1024 * 1024
+MAX_PARTIAL_MESSAGES = 256
+
+# kind, request id, payload
+Message = Tuple[int, bytes, bytes]
+
+
+class FramingError(ValueError):
+    """The frames received from the peer can't be turned back into messages"""
+
+
+class Framer:
+    """Turns the messages to send into frames of at most max_frame_size bytes"""
+
+    def __init__(self, max_frame_size: int = MAX_FRAME_SIZE) -> None:
+        if max_frame_size < RECORD.size + MIN_RECORD_SIZE:
+            raise ValueError(
+                f"max_frame_size must be at least {RECORD.size + MIN_RECORD_SIZE}"
+            )
+        self.max_frame_size = max_frame_size
+        self._next_number = 0
+
+    def frames(self, messages: Iterable[Message]) -> Iterator[bytes]:
+        """Yields the frames of messages one at a time, so that only one frame of
+        a large message is copied at a time"""
+        parts: List[Union[bytes, memoryview]] = []
+        size = 0
+        for kind, request_id, payload in messages:
+            number = self._next_number
+            self._next_number = (number + 1) % 2 ** 32
+
+            data = memoryview(payload)
+            offset = 0
+            while True:
+                room = self.max_frame_size - size - RECORD.size
+                left = len(data) - offset
+                if parts and left > room and room < MIN_RECORD_SIZE:
+                    yield b"".join(parts)
+                    parts, size = [], 0
+                    continue
+
+                length = min(left, room)
+                more = length < left
+                parts.append(
+                    RECORD.pack(kind, MORE if more else 0, number, request_id, length)
+                )
+                parts.append(data[offset : offset + length])
+                size += RECORD.size + length
+                offset += length
+                if not more:
+                    break
+
+                yield b"".join(parts)
+                parts, size = [], 0
+
+        if parts:
+            yield b"".join(parts)
+
+
+class Deframer:
+    """Turns the frames received back into messages"""
+
+    def __init__(
+        self,
+        max_message_size: int = MAX_MESSAGE_SIZE,
+        max_partial_messages: int = MAX_PARTIAL_MESSAGES,
+    ) -> None:
+        self.max_message_size = max_message_size
+        self.max_partial_messages = max_partial_messages
+        # the records received so far of the messages which continue in later frames
+        self._partial: Dict[int, List[memoryview]] = {}
+        # the number of bytes received so far of those messages
+        self._partial_size: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._partial)
+
+    def feed(self, frame: bytes) -> List[Message]:
+        """Returns the messages which frame completes
+
+        :raises FramingError: if frame ends in the middle of a record, a message
+            is larger than max_message_size or more than max_partial_messages are
+            being reassembled, the partial messages are dropped
+        """
+        messages = []
+        view = memoryview(frame)
+        offset = 0
+        while offset < len(view):
+            if offset + RECORD.size > len(view):
+                self.reset()
+                raise FramingError("The frame ends in the header of a record")
+            kind, flags, number, request_id, length = RECORD.unpack_from(view, offset)
+            offset += RECORD.size
+            if offset + length > len(view):
+                self.reset()
+                raise FramingError(
+                    f"The record of message {number} is longer than the frame"
+                )
+            data = view[offset : offset + length]
+            offset += length
+
+            size = self._partial_size.get(number, 0) + len(data)
+            if size > self.max_message_size:
+                self.reset()
+                raise FramingError(
+                    f"Message {number} is larger than {self.max_message_size} bytes"
+                )
+
+            if flags & MORE:
+                chunks = self._partial.get(number, None)
+                if chunks is None:
+                    if len(self._partial) >= self.max_partial_messages:
+                        self.reset()
+                        raise FramingError(
+                            f"More than {self.max_partial_messages} partial messages"
+                        )
+                    chunks = self._partial[number] = []
+                chunks.append(data)
+                self._partial_size[number] = size
+                continue
+
+            chunks = self._partial.pop(number, None)
+            if chunks is None:
+                payload = bytes(data)
+            else:
+                del self._partial_size[number]
+                chunks.append(data)
+                payload = b"".join(chunks)
+            messages.append((kind, request_id, payload))
+        return messages
+
+    def reset(self) -> None:
+        """Drop the partial messages"""
+        self._partial.clear()
+        self._partial_size.clear()
@@ -1,5 +1,11 @@
+# stdlib
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 # third party
 import requests
+from requests.adapters import HTTPAdapter
 
 # syft relative
 from ...core.common.message import SignedImmediateSyftMessageWithReply
@@ -10,11 +16,55 @@ from ...core.io.connection import ClientConnection
 from ...decorators.syft_decorator_impl import syft_decorator
 from ...proto.core.node.common.metadata_pb2 import Metadata as Metadata_PB
 
+# how many keep-alive connections to the node are kept open, which is also how
+# many requests can be in flight at once
+DEFAULT_POOL_SIZE = 8
+
+# seconds to wait for the connection to the node, and for its reply (None waits
+# as long as the node takes to execute the message)
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = None
+
 
 class HTTPConnection(ClientConnection):
     @syft_decorator(typechecking=True)
-    def __init__(self, url: str) -> None:
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+        concurrent: bool = False,
+    ) -> None:
+        """
+        :param url: the address of the node, like http://localhost:5000
+        :param pool_size: how many keep-alive connections to the node are kept
+            open, a thread sending a message when all of them are in use waits
+        :param connect_timeout: seconds to wait for the connection to the node
+        :param read_timeout: seconds to wait for the reply of the node
+        :param concurrent: send the messages given to submit_immediate_msg_with_reply
+            from a pool of pool_size threads instead of the calling thread
+        """
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be 1 or more. Got {pool_size}.")
+
         self.base_url = url
+        self.timeout = (connect_timeout, read_timeout)
+
+        # Every message reuses one of the connections of the pool instead of
+        # opening a new TCP connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size, pool_block=True
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if concurrent:
+            self._executor = ThreadPoolExecutor(
+                max_workers=pool_size, thread_name_prefix="syft-http"
+            )
 
     @syft_decorator(typechecking=True)
     def send_immediate_msg_with_reply(
@@ -37,6 +87,28 @@ class HTTPConnection(ClientConnection):
         # Return SignedImmediateSyftMessageWithoutReply
         return response
 
+    def submit_immediate_msg_with_reply(
+        self, msg: SignedImmediateSyftMessageWithReply
+    ) -> Future:
+        """Sends high priority messages without blocking the calling thread.
+
+        In concurrent mode, up to pool_size messages are in flight at once and
+        the others wait for a free connection. Otherwise the message is sent
+        right away in the calling thread.
+
+        :return: a Future which is completed with the response of the node
+        :rtype: Future
+        """
+        if self._executor is not None:
+            return self._executor.submit(self.send_immediate_msg_with_reply, msg=msg)
+
+        future: Future = Future()
+        try:
+            future.set_result(self.send_immediate_msg_with_reply(msg=msg))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
     @syft_decorator(typechecking=True)
     def send_immediate_msg_without_reply(
         self, msg: SignedImmediateSyftMessageWithoutReply
@@ -76,10 +148,11 @@ class HTTPConnection(ClientConnection):
         """
 
         # Perform HTTP request using base_url as a root address
-        r = requests.post(
+        r = self.session.post(
             url=self.base_url,
             data=msg.binary(),
             headers={"Content-Type": "application/octet-stream"},
+            timeout=self.timeout,
         )
 
         # Return request's response object
@@ -93,7 +166,15 @@ class HTTPConnection(ClientConnection):
         :return: returns node metadata
         :rtype: str of bytes
         """
-        data: bytes = requests.get(self.base_url + "/metadata").content
+        data: bytes = self.session.get(
+            self.base_url + "/metadata", timeout=self.timeout
+        ).content
         metadata_pb = Metadata_PB()
         metadata_pb.ParseFromString(data)
         return metadata_pb
+
+    def close(self) -> None:
+        """Closes the connections of the pool, after the messages in flight"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self.session.close()
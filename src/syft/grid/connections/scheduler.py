@@ -0,0 +1,167 @@
+"""
+Priority scheduling of the messages sent over a WebRTC data channel.
+
+The messages waiting to be sent are queued by priority class, and the
+frames of the highest class with messages waiting are sent first, one frame
+at a time. So a small request, like an ObjectSearchMessage or the approval of
+a Pointer.request, doesn't wait for a large tensor upload which started
+before it, just for the frame of the upload which is being sent.
+
+A message only overtakes messages it doesn't depend on. A message which
+refers to an object which a bulk message still waiting to be sent stores on
+the other peer, like ptr.get() right after x.send(), is queued behind that
+bulk message instead.
+"""
+
+# stdlib
+from collections import Counter
+from collections import deque
+from typing import Any
+from typing import Deque
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# syft relative
+from ...core.common.message import SignedEventualSyftMessageWithoutReply
+from ...core.common.message import SignedMessage
+from ...core.common.serde.deserialize import lookup_serializable_type
+from ...core.common.serde.envelope import read_data_message
+from .framing import Framer
+from .framing import MAX_FRAME_SIZE
+from .framing import MESSAGE
+
+# the priority classes, from the highest to the lowest
+CONTROL = 0  # immediate messages, like requests and their replies
+EVENTUAL = 1  # eventual actions, like garbage collection
+BULK = 2  # object transfers and other messages larger than a frame
+PRIORITIES = [CONTROL, EVENTUAL, BULK]
+
+# kind, request id, message
+Outgoing = Tuple[int, bytes, Any]
+
+
+def priority_of(kind: int, msg: Any) -> int:
+    if not isinstance(msg, SignedMessage):
+        # like the bye message, which goes after everything else
+        return BULK
+    if len(msg.serialized_message) > MAX_FRAME_SIZE:
+        return BULK
+    if kind == MESSAGE and isinstance(msg, SignedEventualSyftMessageWithoutReply):
+        return EVENTUAL
+    return CONTROL
+
+
+def stored_id(msg: Any) -> Optional[bytes]:
+    """The id of the object which msg stores on the other peer, like the
+    id_at_location of a SaveObjectAction, read from the protobuf of the message
+    without deserializing the object. None if it can't tell."""
+    if not isinstance(msg, SignedMessage):
+        return None
+    try:
+        obj_type, content = read_data_message(blob=msg.serialized_message)
+        schema = lookup_serializable_type(fully_qualified_name=obj_type)
+        proto = schema.get_protobuf_schema().FromString(content)
+        if "id_at_location" not in proto.DESCRIPTOR.fields_by_name:
+            return None
+        if not proto.HasField("id_at_location"):
+            return None
+        return proto.id_at_location.value
+    except Exception:
+        return None
+
+
+class Scheduler:
+    """The messages waiting to be sent over a connection. Only the loop of the
+    connection uses it, messages are classified with priority_of and stored_id
+    beforehand, which may take a while for a large message."""
+
+    def __init__(self, framer: Framer) -> None:
+        self.framer = framer
+        self._queues: List[Deque[Outgoing]] = [deque() for _ in PRIORITIES]
+
+        # the frames of the messages of each class being sent, and those messages
+        self._frames: List[Optional[Iterator[bytes]]] = [None for _ in PRIORITIES]
+        self._sending: List[List[Outgoing]] = [[] for _ in PRIORITIES]
+
+        # the ids of the objects which the bulk messages waiting or being sent
+        # store, and how many of them store objects it can't tell
+        self._bulk_ids: Counter = Counter()
+        self._bulk_unknown = 0
+        self._bulk_stored: Deque[Optional[bytes]] = deque()
+
+    def __len__(self) -> int:
+        """The number of messages which aren't completely sent yet"""
+        return sum(len(queue) for queue in self._queues) + sum(
+            len(sending) for sending in self._sending
+        )
+
+    def put(
+        self, message: Outgoing, priority: int, stored: Optional[bytes] = None
+    ) -> None:
+        """Queue message in its priority class, or behind the bulk messages it
+        depends on. stored is the stored_id of a bulk message."""
+        if priority != BULK and self._depends_on_bulk(msg=message[2]):
+            priority = BULK
+            stored = stored_id(msg=message[2])
+
+        if priority == BULK:
+            if stored is None:
+                self._bulk_unknown += 1
+            else:
+                self._bulk_ids[stored] += 1
+            self._bulk_stored.append(stored)
+        self._queues[priority].append(message)
+
+    def next_frame(self) -> Optional[Tuple[int, bytes]]:
+        """The priority and the next frame to send, None if there's nothing to send"""
+        for priority in PRIORITIES:
+            while True:
+                frames = self._frames[priority]
+                if frames is None:
+                    queue = self._queues[priority]
+                    if not queue:
+                        break
+                    # the messages queued meanwhile share frames
+                    sending = list(queue)
+                    queue.clear()
+                    self._sending[priority] = sending
+                    frames = self.framer.frames(
+                        (kind, request_id, msg.to_bytes())
+                        for kind, request_id, msg in sending
+                    )
+                    self._frames[priority] = frames
+
+                frame = next(frames, None)
+                if frame is not None:
+                    return priority, frame
+                self._sent(priority=priority)
+        return None
+
+    def _sent(self, priority: int) -> None:
+        sent = self._sending[priority]
+        self._frames[priority] = None
+        self._sending[priority] = []
+        if priority != BULK:
+            return
+
+        # the bulk messages are sent in the order they were queued
+        for _ in sent:
+            stored = self._bulk_stored.popleft()
+            if stored is None:
+                self._bulk_unknown -= 1
+            else:
+                self._bulk_ids[stored] -= 1
+                if self._bulk_ids[stored] == 0:
+                    del self._bulk_ids[stored]
+
+    def _depends_on_bulk(self, msg: Any) -> bool:
+        if self._bulk_unknown > 0:
+            return True
+        if not self._bulk_ids:
+            return False
+        if not isinstance(msg, SignedMessage):
+            return True
+        blob = msg.serialized_message
+        return any(stored in blob for stored in self._bulk_ids)
@@ -78,10 +78,17 @@ Signaling Steps:
 
 # stdlib
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import partial
 import random
-import time
+import threading
 from typing import Any
+from typing import Awaitable
+from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 # third party
@@ -96,12 +103,26 @@ from loguru import logger
 from ...core.common.message import SignedEventualSyftMessageWithoutReply
 from ...core.common.message import SignedImmediateSyftMessageWithReply
 from ...core.common.message import SignedImmediateSyftMessageWithoutReply
+from ...core.common.message import SignedMessage
+from ...core.common.message import verify_signed_messages
 from ...core.common.serde.deserialize import _deserialize
+from ...core.common.serde.serializable import Serializable
 from ...core.io.address import Address
 from ...core.io.connection import BidirectionalConnection
 from ...core.node.abstract.node import AbstractNode
 from ...decorators.syft_decorator_impl import syft_decorator
 from ..services.signaling_service import CloseConnectionMessage
+from .framing import Deframer
+from .framing import Framer
+from .framing import FramingError
+from .framing import MESSAGE
+from .framing import NO_REQUEST
+from .framing import REPLY
+from .framing import REQUEST
+from .scheduler import BULK
+from .scheduler import Scheduler
+from .scheduler import priority_of
+from .scheduler import stored_id
 
 try:
     # stdlib
@@ -111,7 +132,22 @@ except ImportError:  # pragma: no cover
     from asyncio.events import _get_running_loop as get_running_loop  # pragma: no cover
 
 
-message_cooldown = 0.0
+# Flow control: the producer stops sending frames while more than
+# BUFFERED_AMOUNT_HIGH bytes are waiting in the data channel and resumes once
+# they drained to BUFFERED_AMOUNT_LOW. The frames of bulk messages already
+# stop at BULK_BUFFERED_AMOUNT_HIGH, so that little is ahead of the frame of
+# a small request which comes in during a large transfer.
+BUFFERED_AMOUNT_HIGH = 1024 * 1024
+BULK_BUFFERED_AMOUNT_HIGH = 256 * 1024
+BUFFERED_AMOUNT_LOW = 128 * 1024
+
+# how long closing the connection waits for the queued messages to be sent
+CLOSE_TIMEOUT = 1.0
+
+# how long send_immediate_msg_with_reply waits for a reply by default, so that
+# a reply which is lost or can't be read fails the request instead of blocking
+# the thread forever
+REPLY_TIMEOUT = 300.0
 
 
 class WebRTCConnection(BidirectionalConnection):
@@ -130,35 +166,43 @@ class WebRTCConnection(BidirectionalConnection):
         self.node = node
 
         # EventLoop that manages async tasks (producer/consumer)
-        # This structure is global and needs to be
-        # defined beforehand.
-        try:
-            self.loop = get_running_loop()
-            log = "♫♫♫ > ...using a running event loop..."
-            logger.debug(log)
-            print(log)
-        except RuntimeError as e:
-            self.loop = None
-            log = f"♫♫♫ > ...error getting a running event Loop... {e}"
-            logger.error(log)
-            print(log)
+        # The connection runs its own loop on a daemon thread for as long
+        # as it lives, so that aiortc, the producer and the requests in flight
+        # keep running between calls and any thread or coroutine can send
+        # through the connection without running an event loop of its own.
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self.loop.run_forever, name="WebRTCConnection", daemon=True
+        )
+        self._loop_thread.start()
+
+        # Requests in flight by the id of their message, the consumer resolves
+        # their futures with the replies from the other peer.
+        self._pending: Dict[bytes, asyncio.Future] = {}
+
+        # Messages from the other peer are handed to the node one at a time, in
+        # the order they arrived, on a worker thread so that the loop keeps
+        # sending and receiving while the node processes them.
+        self._node_executor = ThreadPoolExecutor(max_workers=1)
+
+        # Every message is sent as one or more frames of a bounded size, see
+        # framing.py
+        self._deframer = Deframer()
+
+        # Message pool
+        # The messages waiting to be sent by priority class, the producer
+        # sends the frames of the highest one first, see scheduler.py
+        self.producer_pool = Scheduler(framer=Framer())
 
-        if self.loop is None:
-            log = "♫♫♫ > ...creating a new event loop..."
-            print(log)
-            logger.debug(log)
-            self.loop = asyncio.new_event_loop()
-
-        # Message pool (High Priority)
-        # These queues will be used to manage
-        # async  messages.
         try:
-            self.producer_pool: asyncio.Queue = asyncio.Queue(
-                loop=self.loop,
-            )  # Request Messages / Request Responses
-            self.consumer_pool: asyncio.Queue = asyncio.Queue(
-                loop=self.loop,
-            )  # Request Responses
+            # The events are created on the loop of the connection, which they
+            # belong to, since Event no longer takes a loop argument
+            # Set when messages are put in the producer pool
+            self._producer_ready = self._create_event()
+
+            # Set by the data channel when its buffered amount drops to
+            # BUFFERED_AMOUNT_LOW
+            self._buffered_amount_low = self._create_event()
 
             # Initialize a PeerConnection structure
             self.peer_connection = RTCPeerConnection()
@@ -169,6 +213,7 @@ class WebRTCConnection(BidirectionalConnection):
             # was established.
             self.channel: Optional[RTCDataChannel] = None
             self._client_address: Optional[Address] = None
+            self.__producer_task: Optional[asyncio.Task] = None
 
             # asyncio.ensure_future(self.heartbeat())
 
@@ -186,10 +231,15 @@ class WebRTCConnection(BidirectionalConnection):
         :return: returns a signaling offer payload containing local description.
         :rtype: str
         """
+        # aiortc has to run on the loop of the connection
+        if get_running_loop() is not self.loop:
+            return await self._in_loop(self._set_offer())
+
         try:
             # Use the Peer Connection structure to
             # set the channel as a RTCDataChannel.
             self.channel = self.peer_connection.createDataChannel("datachannel")
+            self._watch_buffered_amount(channel=self.channel)
 
             # This method will be called by as a callback
             # function by the aioRTC lib when the when
@@ -233,12 +283,15 @@ class WebRTCConnection(BidirectionalConnection):
         :return: returns a signaling answer payload containing local description.
         :rtype: str
         """
+        if get_running_loop() is not self.loop:
+            return await self._in_loop(self._set_answer(payload=payload))
 
         try:
 
             @self.peer_connection.on("datachannel")
             def on_datachannel(channel: RTCDataChannel) -> None:
                 self.channel = channel
+                self._watch_buffered_amount(channel=channel)
 
                 self.__producer_task = asyncio.ensure_future(self.producer())
 
@@ -254,6 +307,9 @@ class WebRTCConnection(BidirectionalConnection):
 
     @syft_decorator(typechecking=True)
     async def _process_answer(self, payload: str) -> Union[str, None]:
+        if get_running_loop() is not self.loop:
+            return await self._in_loop(self._process_answer(payload=payload))
+
         # Converts payload received by
         # the other peer in aioRTC Object
         # instance.
@@ -304,13 +360,22 @@ class WebRTCConnection(BidirectionalConnection):
                 # If self.producer_pool is empty
                 # give up task queue priority, giving
                 # computing time to the next task.
-                msg = await self.producer_pool.get()
-
-                await asyncio.sleep(message_cooldown)
-                # If self.producer_pool.get() returned a message
-                # send it as a binary using the RTCDataChannel.
-                # logger.critical(f"> Sending MSG {msg.message} ID: {msg.id}")
-                self.channel.send(msg.to_bytes())  # type: ignore
+                next_frame = self.producer_pool.next_frame()
+                if next_frame is None:
+                    self._producer_ready.clear()
+                    await self._producer_ready.wait()
+                    continue
+
+                # Send the frame as a binary using the RTCDataChannel,
+                # as long as it isn't holding too much already.
+                priority, data = next_frame
+                high = BUFFERED_AMOUNT_HIGH
+                if priority == BULK:
+                    high = BULK_BUFFERED_AMOUNT_HIGH
+                while self.channel.bufferedAmount > high:  # type: ignore
+                    self._buffered_amount_low.clear()
+                    await self._buffered_amount_low.wait()
+                self.channel.send(data)  # type: ignore
         except Exception as e:
             log = f"Got an exception in WebRTCConnection producer. {e}"
             logger.error(log)
@@ -321,7 +386,7 @@ class WebRTCConnection(BidirectionalConnection):
             # Build Close Message to warn the other peer
             bye_msg = CloseConnectionMessage(address=Address())
 
-            self.channel.send(bye_msg.to_bytes())  # type: ignore
+            self._enqueue(message=(MESSAGE, NO_REQUEST, bye_msg))
 
             # Finish async tasks related with this connection
             self._finish_coroutines()
@@ -332,57 +397,173 @@ class WebRTCConnection(BidirectionalConnection):
 
     def _finish_coroutines(self) -> None:
         try:
-            asyncio.run(self.peer_connection.close())
-            self.__producer_task.cancel()
+            asyncio.run_coroutine_threadsafe(
+                self._close_peer_connection(), self.loop
+            ).result()
+            self.loop.call_soon_threadsafe(self.loop.stop)
         except Exception as e:
             log = f"Got an exception in WebRTCConnection _finish_coroutines. {e}"
             logger.error(log)
             raise e
 
+    async def _close_peer_connection(self) -> None:
+        # let the producer send what is left in the queue, like the bye message
+        if self.channel is not None and self.channel.readyState == "open":
+            try:
+                await asyncio.wait_for(self._flush(), timeout=CLOSE_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("Closed the WebRTC connection before flushing it.")
+
+        await self.peer_connection.close()
+        if self.__producer_task is not None:
+            self.__producer_task.cancel()
+            await asyncio.gather(self.__producer_task, return_exceptions=True)
+
+        # the replies of the requests in flight won't come anymore
+        for reply in self._pending.values():
+            if not reply.done():
+                reply.set_exception(ConnectionError("The WebRTC connection closed."))
+        self._node_executor.shutdown(wait=False)
+
+    async def _flush(self) -> None:
+        while len(self.producer_pool) > 0 or self.channel.bufferedAmount > 0:  # type: ignore
+            await asyncio.sleep(0.01)
+
     @syft_decorator(typechecking=True)
     async def consumer(self, msg: bin) -> None:  # type: ignore
         try:
-            # Async task to receive/process messages sent by the other side.
-            # These messages will be sent by the other peer
+            # Async task to receive/process frames sent by the other side.
+            # Their messages will be sent by the other peer
             # as a service requests or responses for requests made by
             # this connection previously (ImmediateSyftMessageWithReply).
+            loop = get_running_loop()
+
+            # The messages the frame completes are handed to the node
+            # before anything is awaited, so that the messages of the next
+            # frames can't overtake them.
+            handling: List[Tuple[int, bytes, asyncio.Future]] = []
+            closing = False
+            try:
+                completed = self._deframer.feed(frame=msg)
+            except FramingError as e:
+                # the peer sends more than we reassemble, stop listening to it
+                logger.error(f"Closing the WebRTC connection. {e}")
+                completed = []
+                closing = True
+            received = [
+                (kind, request_id, _deserialize(blob=payload, from_bytes=True))
+                for kind, request_id, payload in completed
+            ]
+
+            # The signatures of the requests the frame completes are verified
+            # together, on the verification pool when one is set, ahead of
+            # them on the node executor, so is_valid is a cache hit for each.
+            signed = [
+                _msg
+                for kind, _, _msg in received
+                if kind != REPLY and isinstance(_msg, SignedMessage)
+            ]
+            verified: Optional[asyncio.Future] = None
+            if len(signed) > 1:
+                verified = loop.run_in_executor(
+                    self._node_executor, verify_signed_messages, signed
+                )
+
+            for kind, request_id, _msg in received:
+                # A reply resolves the future of the request it belongs to,
+                # which lives on the loop of the connection.
+                if kind == REPLY:
+                    self.loop.call_soon_threadsafe(self._resolve, request_id, _msg)
+                    continue
 
-            # Deserialize the received message
-            _msg = _deserialize(blob=msg, from_bytes=True)
+                if isinstance(_msg, CloseConnectionMessage):
+                    closing = True
+                    continue
 
-            # Check if it's NOT  a response generated by a previous request
-            # made by the client instance that uses this connection as a route.
-            # PS: The "_client_address" attribute will be defined during
-            # Node Client initialization.
-            if _msg.address != self._client_address:
-                # If it's a new service request, route it properly
+                # Otherwise it's a new service request, route it properly
                 # using the node instance owned by this connection.
 
                 # Immediate message with reply
                 if isinstance(_msg, SignedImmediateSyftMessageWithReply):
-                    reply = self.recv_immediate_msg_with_reply(msg=_msg)
-                    await self.producer_pool.put(reply)
+                    recv = partial(self.recv_immediate_msg_with_reply, msg=_msg)
 
                 # Immediate message without reply
                 elif isinstance(_msg, SignedImmediateSyftMessageWithoutReply):
-                    self.recv_immediate_msg_without_reply(msg=_msg)
-
-                elif isinstance(_msg, CloseConnectionMessage):
-                    # Just finish async tasks related with this connection
-                    self._finish_coroutines()
+                    recv = partial(self.recv_immediate_msg_without_reply, msg=_msg)
 
                 # Eventual message without reply
                 else:
-                    self.recv_eventual_msg_without_reply(msg=_msg)
-
-            # If it's true, the message will have the client's address as destination.
-            else:
-                await self.consumer_pool.put(_msg)
+                    recv = partial(self.recv_eventual_msg_without_reply, msg=_msg)
+
+                handled = loop.run_in_executor(self._node_executor, recv)
+                handling.append((kind, request_id, handled))
+
+            if verified is not None:
+                try:
+                    await verified
+                except Exception as e:
+                    # is_valid verifies each message again when it is handled
+                    logger.error(f"Verifying the signatures of a frame failed. {e}")
+
+            for kind, request_id, handled in handling:
+                reply = await handled
+                if kind == REQUEST:
+                    self._enqueue(message=(REPLY, request_id, reply))
+
+            if closing:
+                # Just finish async tasks related with this connection
+                if loop is self.loop:
+                    await self._close_peer_connection()
+                else:
+                    await self._in_loop(self._close_peer_connection())
+                self.loop.call_soon_threadsafe(self.loop.stop)
         except Exception as e:
             log = f"Got an exception in WebRTCConnection consumer. {e}"
             logger.error(log)
             raise e
 
+    def _resolve(self, request_id: bytes, reply: Any) -> None:
+        future = self._pending.get(request_id, None)
+        if future is None or future.done():
+            logger.warning(f"Dropped a reply to an unknown request {reply}.")
+            return
+        future.set_result(reply)
+
+    def _enqueue(self, message: Tuple[int, bytes, Serializable]) -> None:
+        # queue a message for the producer from any thread, a large message is
+        # classified by the thread sending it rather than on the loop
+        kind, _, msg = message
+        priority = priority_of(kind=kind, msg=msg)
+        stored = stored_id(msg=msg) if priority == BULK else None
+        self.loop.call_soon_threadsafe(self._put, message, priority, stored)
+
+    def _put(
+        self,
+        message: Tuple[int, bytes, Serializable],
+        priority: int,
+        stored: Optional[bytes],
+    ) -> None:
+        self.producer_pool.put(message=message, priority=priority, stored=stored)
+        self._producer_ready.set()
+
+    def _watch_buffered_amount(self, channel: RTCDataChannel) -> None:
+        channel.bufferedAmountLowThreshold = BUFFERED_AMOUNT_LOW
+
+        @channel.on("bufferedamountlow")
+        def on_buffered_amount_low() -> None:
+            self._buffered_amount_low.set()
+
+    def _create_event(self) -> asyncio.Event:
+        async def create() -> asyncio.Event:
+            return asyncio.Event()
+
+        return asyncio.run_coroutine_threadsafe(create(), self.loop).result()
+
+    async def _in_loop(self, coro: Awaitable[Any]) -> Any:
+        # await a coroutine on the loop of the connection from another loop
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)  # type: ignore
+        return await asyncio.wrap_future(future)
+
     @syft_decorator(typechecking=True)
     def recv_immediate_msg_with_reply(
         self, msg: SignedImmediateSyftMessageWithReply
@@ -396,11 +577,11 @@ class WebRTCConnection(BidirectionalConnection):
         try:
             r = random.randint(0, 100000)
             logger.debug(
-                f"> Before recv_immediate_msg_with_reply {r} {msg.message} {type(msg.message)}"
+                f"> Before recv_immediate_msg_with_reply {r} {msg.obj_type} {msg.id}"
             )
             reply = self.node.recv_immediate_msg_with_reply(msg=msg)
             logger.debug(
-                f"> After recv_immediate_msg_with_reply {r} {msg.message} {type(msg.message)}"
+                f"> After recv_immediate_msg_with_reply {r} {msg.obj_type} {msg.id}"
             )
             return reply
         except Exception as e:
@@ -416,11 +597,11 @@ class WebRTCConnection(BidirectionalConnection):
         try:
             r = random.randint(0, 100000)
             logger.debug(
-                f"> Before recv_immediate_msg_without_reply {r} {msg.message} {type(msg.message)}"
+                f"> Before recv_immediate_msg_without_reply {r} {msg.obj_type} {msg.id}"
             )
             self.node.recv_immediate_msg_without_reply(msg=msg)
             logger.debug(
-                f"> After recv_immediate_msg_without_reply {r} {msg.message} {type(msg.message)}"
+                f"> After recv_immediate_msg_without_reply {r} {msg.obj_type} {msg.id}"
             )
         except Exception as e:
             log = f"Got an exception in WebRTCConnection recv_immediate_msg_without_reply. {e}"
@@ -441,15 +622,27 @@ class WebRTCConnection(BidirectionalConnection):
 
     @syft_decorator(typechecking=False)
     def send_immediate_msg_with_reply(
-        self, msg: SignedImmediateSyftMessageWithReply
-    ) -> SignedImmediateSyftMessageWithReply:
+        self,
+        msg: SignedImmediateSyftMessageWithReply,
+        timeout: Optional[float] = REPLY_TIMEOUT,
+    ) -> SignedImmediateSyftMessageWithoutReply:
         """Sends high priority messages and wait for their responses.
+        Many threads can wait for their replies at the same time.
 
-        :return: returns an instance of SignedImmediateSyftMessageWithReply.
-        :rtype: SignedImmediateSyftMessageWithReply
+        :param timeout: seconds to wait for the reply, None waits forever
+        :return: returns an instance of SignedImmediateSyftMessageWithoutReply.
+        :rtype: SignedImmediateSyftMessageWithoutReply
         """
         try:
-            return asyncio.run(self.send_sync_message(msg=msg))
+            request = asyncio.run_coroutine_threadsafe(
+                self._request(msg=msg), self.loop
+            )
+            try:
+                return request.result(timeout=timeout)
+            except FutureTimeoutError:
+                # cancelling the request removes it from _pending on the loop
+                request.cancel()
+                raise
         except Exception as e:
             log = f"Got an exception in WebRTCConnection send_immediate_msg_with_reply. {e}"
             logger.error(log)
@@ -461,9 +654,7 @@ class WebRTCConnection(BidirectionalConnection):
     ) -> None:
         """" Sends high priority messages without waiting for their reply. """
         try:
-            # asyncio.run(self.producer_pool.put_nowait(msg))
-            self.producer_pool.put_nowait(msg)
-            time.sleep(message_cooldown)
+            self._enqueue(message=(MESSAGE, NO_REQUEST, msg))
         except Exception as e:
             log = f"Got an exception in WebRTCConnection send_immediate_msg_without_reply. {e}"
             logger.error(log)
@@ -475,8 +666,7 @@ class WebRTCConnection(BidirectionalConnection):
     ) -> None:
         """" Sends low priority messages without waiting for their reply. """
         try:
-            asyncio.run(self.producer_pool.put(msg))
-            time.sleep(message_cooldown)
+            self._enqueue(message=(MESSAGE, NO_REQUEST, msg))
         except Exception as e:
             log = f"Got an exception in WebRTCConnection send_eventual_msg_without_reply. {e}"
             logger.error(log)
@@ -486,64 +676,34 @@ class WebRTCConnection(BidirectionalConnection):
     async def send_sync_message(
         self, msg: SignedImmediateSyftMessageWithReply
     ) -> SignedImmediateSyftMessageWithoutReply:
-        """Send sync messages generically.
+        """Send sync messages generically, from any event loop. Many coroutines
+        can wait for their replies at the same time.
 
         :return: returns an instance of SignedImmediateSyftMessageWithoutReply.
         :rtype: SignedImmediateSyftMessageWithoutReply
         """
         try:
-            # To ensure the sequence of sending / receiving messages
-            # it's necessary to keep only a unique reference for reading
-            # inputs (producer) and outputs (consumer).
-            r = random.randint(0, 100000)
-            # To be able to perform this method synchronously (waiting for the reply)
-            # without blocking async methods, we need to use queues.
-
-            # Enqueue the message to be sent to the target.
-            logger.debug(f"> Before send_sync_message producer_pool.put blocking {r}")
-            # self.producer_pool.put_nowait(msg)
-            await self.producer_pool.put(msg)
-            logger.debug(f"> After send_sync_message producer_pool.put blocking {r}")
-
-            # Wait for the response checking the consumer queue.
-            logger.debug(
-                f"> Before send_sync_message consumer_pool.get blocking {r} {msg}"
-            )
-            logger.debug(
-                f"> Before send_sync_message consumer_pool.get blocking {r} {msg.message}"
-            )
-            # before = time.time()
-            # timeout_secs = 15
-
-            response = await self.consumer_pool.get()
-
-            #  asyncio.run()
-            # self.async_check(before=before, timeout_secs=timeout_secs, r=r)
-
-            logger.debug(f"> After send_sync_message consumer_pool.get blocking {r}")
-            return response
+            if get_running_loop() is self.loop:
+                return await self._request(msg=msg)
+            return await self._in_loop(self._request(msg=msg))
         except Exception as e:
-            log = f"Got an exception in WebRTCConnection send_eventual_msg_without_reply. {e}"
+            log = f"Got an exception in WebRTCConnection send_sync_message. {e}"
             logger.error(log)
             raise e
 
-    async def async_check(
-        self, before: float, timeout_secs: int, r: float
+    async def _request(
+        self, msg: SignedImmediateSyftMessageWithReply
     ) -> SignedImmediateSyftMessageWithoutReply:
-        while True:
-            await asyncio.sleep(message_cooldown)
-            try:
-                response = self.consumer_pool.get_nowait()
-                return response
-            except Exception as e:
-                now = time.time()
-                logger.debug(
-                    f"> During send_sync_message consumer_pool.get blocking {r}. {e}"
-                )
-                if now - before > timeout_secs:
-                    log = f"send_sync_message timeout {timeout_secs} {r}"
-                    logger.critical(log)
-                    raise Exception(log)
+        # Send a request tagged with the id of its message and wait for the
+        # consumer to resolve the future of that id with the reply.
+        request_id = msg.id.value.bytes
+        reply = self.loop.create_future()
+        self._pending[request_id] = reply
+        try:
+            self._enqueue(message=(REQUEST, request_id, msg))
+            return await reply
+        finally:
+            self._pending.pop(request_id, None)
 
     # async def heartbeat(self) -> None:
     #     producer_watermark = 0
@@ -551,7 +711,7 @@ class WebRTCConnection(BidirectionalConnection):
     #     while True:
     #         await asyncio.sleep(5)
     #         try:
-    #             psize = self.producer_pool.qsize()
+    #             psize = len(self.producer_pool)
     #             csize = self.consumer_pool.qsize()
     #             async_task_count = len(asyncio.all_tasks())
     #             producer_watermark = max(producer_watermark, psize)
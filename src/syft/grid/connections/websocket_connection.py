@@ -0,0 +1,330 @@
+"""
+Signaling over websockets.
+
+A WebSocketServer serves a node, like the Network of a signaling server, next
+to its HTTP routes, and a WebSocketConnection is a client connection to it.
+Every websocket message is the 16 byte id of a request, or NO_REQUEST, followed
+by a serialized SignedMessage, and the reply to a request comes back with the
+id of the request. So replies don't have to come back in the order of the
+requests.
+
+The server doesn't answer a pull request for signaling messages which finds
+none with SignalingRequestsNotFound, it holds it until a signaling message for
+the peer is pushed, over a websocket or not, and answers it then. So the peers
+get the offer and the answer of each other the moment they are pushed instead
+of polling for them. A pull request which is held for HOLD_TIMEOUT seconds is
+answered with SignalingRequestsNotFound after all.
+"""
+
+# stdlib
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import partial
+import threading
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# third party
+from loguru import logger
+import requests
+import websockets
+
+# syft relative
+from ...core.common.message import SignedEventualSyftMessageWithoutReply
+from ...core.common.message import SignedImmediateSyftMessageWithReply
+from ...core.common.message import SignedImmediateSyftMessageWithoutReply
+from ...core.common.message import SyftMessage
+from ...core.common.serde.deserialize import _deserialize
+from ...core.io.connection import ClientConnection
+from ...core.node.abstract.node import AbstractNode
+from ...decorators.syft_decorator_impl import syft_decorator
+from ..services.signaling_service import AnswerPullRequestMessage
+from ..services.signaling_service import OfferPullRequestMessage
+from ..services.signaling_service import SignalingRequestsNotFound
+
+NO_REQUEST = bytes(16)
+
+# seconds to wait for the websocket of the server
+CONNECT_TIMEOUT = 10.0
+
+# seconds the server holds a pull request which found no signaling message
+HOLD_TIMEOUT = 30.0
+
+# seconds to wait for the reply to a request, longer than a pull request is held
+REPLY_TIMEOUT = 300.0
+
+# the largest websocket message a client or the server reads, signaling messages
+# are much smaller
+MAX_MESSAGE_SIZE = 16 * 2 ** 20
+
+PULL_REQUESTS = (OfferPullRequestMessage, AnswerPullRequestMessage)
+
+
+def get_websocket_url(url: str) -> Optional[str]:
+    """The url of the websocket the node at the HTTP url serves, None if it
+    doesn't serve one"""
+    try:
+        r = requests.get(url + "/websocket", timeout=CONNECT_TIMEOUT)
+    except requests.RequestException:
+        return None
+    if r.status_code != 200:
+        return None
+    return r.text
+
+
+class WebSocketConnection(ClientConnection):
+    @syft_decorator(typechecking=True)
+    def __init__(self, url: str) -> None:
+        self.url = url
+
+        # The connection runs its own loop on a daemon thread, so that the
+        # replies are received while any thread sends through it.
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self.loop.run_forever, name="WebSocketConnection", daemon=True
+        )
+        self._loop_thread.start()
+
+        # Requests in flight by the id of their message
+        self._pending: Dict[bytes, asyncio.Future] = {}
+
+        try:
+            self._run(self._connect())
+        except Exception as e:
+            log = f"Got an exception in WebSocketConnection connecting to {url}. {e}"
+            logger.error(log)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            raise e
+
+    async def _connect(self) -> None:
+        self.websocket = await asyncio.wait_for(
+            websockets.connect(self.url, max_size=MAX_MESSAGE_SIZE), CONNECT_TIMEOUT
+        )
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    async def _receive(self) -> None:
+        try:
+            async for data in self.websocket:
+                if isinstance(data, str):
+                    logger.warning("Dropping a text message, replies are binary.")
+                    continue
+                reply = self._pending.pop(data[:16], None)
+                if reply is None or reply.done():
+                    logger.warning("Dropping a reply to an unknown request.")
+                    continue
+                reply.set_result(data[16:])
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            # the replies of the requests in flight won't come anymore
+            for reply in self._pending.values():
+                if not reply.done():
+                    reply.set_exception(ConnectionError("The websocket was closed."))
+            self._pending.clear()
+
+    async def _request(self, msg: SyftMessage) -> bytes:
+        if self._receiver.done():
+            raise ConnectionError("The websocket was closed.")
+
+        request_id = msg.id.value.bytes
+        reply = self.loop.create_future()
+        self._pending[request_id] = reply
+        try:
+            await self._send(data=request_id + msg.binary())
+            return await reply
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _send(self, data: bytes) -> None:
+        try:
+            await self.websocket.send(data)
+        except websockets.ConnectionClosed as e:
+            raise ConnectionError(f"The websocket was closed. {e}")
+
+    def _run(self, coro: Awaitable[Any]) -> Any:
+        # run a coroutine on the loop of the connection from any thread
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()  # type: ignore
+
+    @syft_decorator(typechecking=True)
+    def send_immediate_msg_with_reply(
+        self,
+        msg: SignedImmediateSyftMessageWithReply,
+        timeout: Optional[float] = REPLY_TIMEOUT,
+    ) -> SignedImmediateSyftMessageWithoutReply:
+        """Sends high priority messages and wait for their responses. A pull
+        request for signaling messages is answered once there is one.
+
+        :param timeout: seconds to wait for the reply, None waits forever
+        """
+        request = asyncio.run_coroutine_threadsafe(self._request(msg=msg), self.loop)
+        try:
+            blob = request.result(timeout=timeout)
+        except FutureTimeoutError:
+            # cancelling the request removes it from _pending on the loop
+            request.cancel()
+            raise
+        return _deserialize(blob=blob, from_bytes=True)
+
+    @syft_decorator(typechecking=True)
+    def send_immediate_msg_without_reply(
+        self, msg: SignedImmediateSyftMessageWithoutReply
+    ) -> None:
+        """Sends high priority messages without waiting for their reply."""
+        self._run(self._send(data=NO_REQUEST + msg.binary()))
+
+    @syft_decorator(typechecking=True)
+    def send_eventual_msg_without_reply(
+        self, msg: SignedEventualSyftMessageWithoutReply
+    ) -> None:
+        """Sends low priority messages without waiting for their reply."""
+        self._run(self._send(data=NO_REQUEST + msg.binary()))
+
+    def close(self) -> None:
+        if not self.loop.is_running():
+            return
+        self._run(self._close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._loop_thread.join()
+
+    async def _close(self) -> None:
+        await self.websocket.close()
+        await self._receiver
+
+
+class WebSocketServer:
+    """Serves node over websockets, on a loop on a daemon thread. The messages are
+    handed to the node on one worker thread, so a slow service doesn't hold up
+    the loop and the messages of all websockets are processed one at a time."""
+
+    def __init__(self, node: AbstractNode) -> None:
+        self.node = node
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self.loop.run_forever, name="WebSocketServer", daemon=True
+        )
+        self._node_executor = ThreadPoolExecutor(max_workers=1)
+        self._server: Any = None
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Serves the node on host and port, any free port if port is 0"""
+        self._loop_thread.start()
+        self._server = asyncio.run_coroutine_threadsafe(
+            self._serve(host=host, port=port), self.loop
+        ).result()
+
+    async def _serve(self, host: str, port: int) -> Any:
+        return await websockets.serve(
+            self._handle, host, port, max_size=MAX_MESSAGE_SIZE
+        )
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._loop_thread.join()
+        self._node_executor.shutdown(wait=False)
+
+    async def _recv(self, recv: Callable[..., Any], msg: Any) -> Any:
+        # hand a message to the node on the node executor
+        return await self.loop.run_in_executor(
+            self._node_executor, partial(recv, msg=msg)
+        )
+
+    async def _stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, websocket: Any, path: str = "") -> None:
+        # the pull requests which found no signaling message yet by request id,
+        # with the SignalingRequestsNotFound reply they get if they are held too
+        # long and the timer which sends it, and the peers they pull for
+        held: Dict[
+            bytes,
+            Tuple[SignedImmediateSyftMessageWithReply, Any, asyncio.TimerHandle],
+        ] = {}
+        peers: List[str] = []
+
+        async def answer_held() -> None:
+            for request_id, (msg, _, _) in list(held.items()):
+                if request_id not in held:
+                    continue
+                reply = await self._recv(self.node.recv_immediate_msg_with_reply, msg)
+                if isinstance(reply.message, SignalingRequestsNotFound):
+                    continue
+                if request_id not in held:
+                    # it expired while the node looked for a signaling message
+                    continue
+                held.pop(request_id)[2].cancel()
+                await websocket.send(request_id + reply.serialize(to_bytes=True))
+
+        async def send_not_found(request_id: bytes, reply: Any) -> None:
+            try:
+                await websocket.send(request_id + reply.serialize(to_bytes=True))
+            except websockets.ConnectionClosed:
+                pass
+
+        def expire(request_id: bytes) -> None:
+            if request_id in held:
+                _, reply, _ = held.pop(request_id)
+                asyncio.ensure_future(send_not_found(request_id, reply))
+
+        def pushed() -> None:
+            # called by PushSignalingService, on whichever thread the push came in
+            self.loop.call_soon_threadsafe(asyncio.ensure_future, answer_held())
+
+        try:
+            async for data in websocket:
+                if isinstance(data, str):
+                    logger.warning("Dropping a text message, requests are binary.")
+                    continue
+                request_id = data[:16]
+                msg = _deserialize(blob=data[16:], from_bytes=True)
+                if request_id == NO_REQUEST:
+                    if isinstance(msg, SignedImmediateSyftMessageWithoutReply):
+                        await self._recv(
+                            self.node.recv_immediate_msg_without_reply, msg
+                        )
+                    else:
+                        await self._recv(self.node.recv_eventual_msg_without_reply, msg)
+                    continue
+
+                pull = msg.message
+                if isinstance(pull, PULL_REQUESTS) and pull.host_peer not in peers:
+                    # listen before pulling, so that a push in between isn't missed
+                    listeners = self.node.signaling_listeners.setdefault(
+                        pull.host_peer, []
+                    )
+                    listeners.append(pushed)
+                    peers.append(pull.host_peer)
+
+                reply = await self._recv(self.node.recv_immediate_msg_with_reply, msg)
+                if isinstance(pull, PULL_REQUESTS) and isinstance(
+                    reply.message, SignalingRequestsNotFound
+                ):
+                    timer = self.loop.call_later(HOLD_TIMEOUT, expire, request_id)
+                    held[request_id] = (msg, reply, timer)
+                    continue
+                await websocket.send(request_id + reply.serialize(to_bytes=True))
+        except websockets.ConnectionClosed:
+            pass
+        except Exception as e:
+            log = f"Got an exception in WebSocketServer. {e}"
+            logger.error(log)
+        finally:
+            for _, _, timer in held.values():
+                timer.cancel()
+            held.clear()
+            for peer in peers:
+                listeners = self.node.signaling_listeners.get(peer, [])
+                listeners.remove(pushed)
+                if not listeners:
+                    del self.node.signaling_listeners[peer]
@@ -30,6 +30,9 @@ ADDR_REPOSITORY = (
 
 LOGO_URL = os.path.abspath(Path(__file__) / "../../../img/logo.png")
 
+# seconds between checks of the loopback file for the id of the other peer
+LOOPBACK_POLL_INTERVAL = 0.05
+
 
 try:
     # third party
@@ -266,7 +269,7 @@ def launch_duet(
                     if "client_id" in loopback_config:
                         target_id = str(loopback_config["client_id"])
                     else:
-                        time.sleep(0.5)
+                        time.sleep(LOOPBACK_POLL_INTERVAL)
             except Exception as e:
                 print(e)
                 break
@@ -279,6 +282,7 @@ def launch_duet(
         signaling_client=signaling_client,
         offer=True,
     )
+    signaling_client.close()
     print()
     print("♫♫♫ > " + bcolors.OKGREEN + "CONNECTED!" + bcolors.ENDC)
     #     return duet, my_domain.get_root_client()
@@ -364,7 +368,7 @@ def join_duet(
                     ):
                         target_id = str(loopback_config["server_id"])
                     else:
-                        time.sleep(0.5)
+                        time.sleep(LOOPBACK_POLL_INTERVAL)
             except Exception as e:
                 print(e)
                 break
@@ -380,6 +384,7 @@ def join_duet(
         signaling_client=signaling_client,
         offer=False,
     )
+    signaling_client.close()
     print()
     print("♫♫♫ > " + bcolors.OKGREEN + "CONNECTED!" + bcolors.ENDC)
     # begin_duet_client_logger(duet.node)
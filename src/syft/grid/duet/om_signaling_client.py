@@ -8,10 +8,8 @@ WebRTC_HOST = (
 )
 
 
-def register(
-    url: str = WebRTC_HOST,
-) -> SignalingClient:
+def register(url: str = WebRTC_HOST, push: bool = True) -> SignalingClient:
     client = SignalingClient(
-        url=url, conn_type=HTTPConnection, client_type=NetworkClient
+        url=url, conn_type=HTTPConnection, client_type=NetworkClient, push=push
     )
     return client
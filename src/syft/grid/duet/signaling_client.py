@@ -1,4 +1,8 @@
+# stdlib
+from typing import Optional
+
 # third party
+from loguru import logger
 from nacl.signing import SigningKey
 
 # syft relative
@@ -8,12 +12,18 @@ from ...core.io.connection import ClientConnection
 from ...core.io.route import SoloRoute
 from ...core.node.common.client import Client
 from ...decorators.syft_decorator_impl import syft_decorator
+from ..connections.websocket_connection import WebSocketConnection
+from ..connections.websocket_connection import get_websocket_url
 from ..services.signaling_service import RegisterNewPeerMessage
 
 
 class SignalingClient(object):
     def __init__(
-        self, url: str, conn_type: ClientConnection, client_type: Client
+        self,
+        url: str,
+        conn_type: ClientConnection,
+        client_type: Client,
+        push: bool = True,
     ) -> None:
         # Load an Signing Key instance
         signing_key = SigningKey.generate()
@@ -30,8 +40,22 @@ class SignalingClient(object):
             metadata=conn._get_metadata()
         )
 
-        # Create a new Solo Route using the selected connection type
-        route = SoloRoute(destination=spec_location, connection=conn)
+        # Signaling messages are pushed over a websocket when the signaling
+        # server serves one, otherwise they are polled using the selected
+        # connection type
+        self.push_conn: Optional[WebSocketConnection] = None
+        ws_url = get_websocket_url(url=url) if push else None
+        if ws_url is not None:
+            try:
+                self.push_conn = WebSocketConnection(url=ws_url)
+            except Exception as e:
+                logger.warning(f"Polling for signaling messages instead. {e}")
+
+        # Create a new Solo Route
+        route = SoloRoute(
+            destination=spec_location,
+            connection=conn if self.push_conn is None else self.push_conn,
+        )
 
         # Create a new signaling client using the selected client type
         signaling_client = client_type(  # type: ignore
@@ -49,6 +73,16 @@ class SignalingClient(object):
     def address(self) -> Address:
         return self.__client.address
 
+    @property
+    def pushed(self) -> bool:
+        """Whether signaling messages are pushed to this client, a pull request
+        is then only answered once there is a signaling message for it"""
+        return self.push_conn is not None
+
+    def close(self) -> None:
+        if self.push_conn is not None:
+            self.push_conn.close()
+
     @syft_decorator(typechecking=True)
     def __register(self) -> None:
         _response = self.__client.send_immediate_msg_with_reply(
@@ -29,6 +29,7 @@ source code.
 
 # stdlib
 import asyncio
+from functools import partial
 from typing import Optional
 
 # third party
@@ -49,6 +50,10 @@ from ..services.signaling_service import OfferPullRequestMessage
 from ..services.signaling_service import SignalingAnswerMessage
 from ..services.signaling_service import SignalingOfferMessage
 
+# seconds between pull requests when the signaling server answers them straight
+# away, instead of once it has a signaling message
+PULL_INTERVAL = 0.5
+
 
 class Duet(DomainClient):
     def __init__(
@@ -173,6 +178,15 @@ class Duet(DomainClient):
                 [pull_task, push_task], return_when=asyncio.FIRST_COMPLETED
             )
 
+            # The signaling process ends with the pull task, let the push task
+            # send what's still queued, like the answer, before stopping it.
+            if push_task in pending:
+                pushed = asyncio.ensure_future(self._push_msg_queue.join())
+                await asyncio.wait(
+                    [pushed, push_task], return_when=asyncio.FIRST_COMPLETED
+                )
+                pushed.cancel()
+
             # Finish the pending one.
             for task in pending:
                 task.cancel()
@@ -195,7 +209,10 @@ class Duet(DomainClient):
                 msg = await self._push_msg_queue.get()
                 # If self.push_msg_queue.get() returned a message (SignalingOfferMessage,SignalingAnswerMessage)
                 # send it to the signaling server.
-                self.signaling_client.send_immediate_msg_without_reply(msg=msg)
+                try:
+                    self.signaling_client.send_immediate_msg_without_reply(msg=msg)
+                finally:
+                    self._push_msg_queue.task_done()
         except Exception as e:
             log = f"Got an exception in Duet push. {e}"
             logger.error(log)
@@ -214,8 +231,15 @@ class Duet(DomainClient):
                 msg = await self._pull_msg_queue.get()
 
                 # If self.push_msg_queue.get() returned a message (OfferPullRequestMessage,AnswerPullRequestMessage)
-                # send it to the signaling server.
-                _response = self.signaling_client.send_immediate_msg_with_reply(msg=msg)
+                # send it to the signaling server. When signaling messages are
+                # pushed, it only answers once it has one, so the request waits on
+                # another thread while the push task keeps running.
+                _response = await asyncio.get_event_loop().run_in_executor(
+                    None,
+                    partial(
+                        self.signaling_client.send_immediate_msg_with_reply, msg=msg
+                    ),
+                )
 
                 task = None
                 # If Signaling Offer Message was found
@@ -236,6 +260,7 @@ class Duet(DomainClient):
                 else:
                     # Just enqueue the request to be processed later.
                     self._pull_msg_queue.put_nowait(msg)
+                    await asyncio.sleep(PULL_INTERVAL)
 
                 # If we have tasks to execute
                 if task:
@@ -244,7 +269,6 @@ class Duet(DomainClient):
 
                 # Checks if the signaling process is over.
                 self._available = self._update_availability()
-                await asyncio.sleep(0.5)
         except Exception as e:
             log = f"Got an exception in Duet pull. {e}"
             logger.error(log)
@@ -296,7 +320,7 @@ class Duet(DomainClient):
             # Process received offer message updating target's remote address
             # Generates an answer request payload containing
             # local network description data/metadata (IP, MAC, Mask, etc...)
-            payload = asyncio.run(self.connection._set_answer(payload=msg.payload))
+            payload = await self.connection._set_answer(payload=msg.payload)
 
             # Save remote node's metadata in roder to create a SoloRoute.
             self._client_metadata = msg.host_metadata
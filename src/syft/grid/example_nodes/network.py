@@ -9,24 +9,36 @@ $ python src/syft/grid/example_nodes/network.py
 """
 # stdlib
 import os
+from typing import Optional
 
 # third party
 import flask
 from flask import Flask
 from flask import Response
 from nacl.encoding import HexEncoder
+from werkzeug.serving import WSGIRequestHandler
 
 # syft absolute
 from syft.core.common.message import SignedImmediateSyftMessageWithReply
 from syft.core.common.message import SignedImmediateSyftMessageWithoutReply
 from syft.core.common.serde.deserialize import _deserialize
 from syft.core.node.network.network import Network
+from syft.grid.connections.websocket_connection import WebSocketServer
 from syft.grid.services.signaling_service import PullSignalingService
 from syft.grid.services.signaling_service import PushSignalingService
 from syft.grid.services.signaling_service import RegisterDuetPeerService
 
 app = Flask(__name__)
 
+
+class KeepAliveRequestHandler(WSGIRequestHandler):
+    # HTTP/1.1 keeps the connections of the clients open between messages, and
+    # without Nagle's algorithm the body of a reply isn't held back until the
+    # client acknowledges its headers
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+
 network = Network(name="om-net")
 
 network.immediate_services_without_reply.append(PushSignalingService)
@@ -34,6 +46,10 @@ network.immediate_services_with_reply.append(PullSignalingService)
 network.immediate_services_with_reply.append(RegisterDuetPeerService)
 network._register_services()  # re-register all services including SignalingService
 
+# Signaling messages are pushed to the peers connected over websockets, the
+# server is started by run()
+websocket_server: Optional[WebSocketServer] = None
+
 
 @app.route("/metadata")
 def get_metadata() -> flask.Response:
@@ -47,6 +63,15 @@ def get_metadata() -> flask.Response:
     return r
 
 
+@app.route("/websocket")
+def get_websocket_url() -> flask.Response:
+    if websocket_server is None:
+        return Response(status=404)
+    scheme = "wss" if flask.request.scheme == "https" else "ws"
+    host = flask.request.host.rsplit(":", 1)[0]
+    return Response(response=f"{scheme}://{host}:{websocket_server.port}", status=200)
+
+
 @app.route("/", methods=["POST"])
 def process_network_msgs() -> flask.Response:
     data = flask.request.get_data()
@@ -77,15 +102,23 @@ def process_network_msgs() -> flask.Response:
 
 def run() -> None:
     global network
+    global websocket_server
     print("====================================")
     print("========== NODE ROOT KEY ===========")
     print("====================================")
     # this signing_key is to aid in local development and is not used in the real
     # PyGrid implementation
     PORT = os.getenv("PORT", 5000)
-    print(f"Starting Node on PORT: {PORT}")
+    WS_PORT = os.getenv("WS_PORT", int(PORT) + 1)
+    print(f"Starting Node on PORT: {PORT}, websocket on PORT: {WS_PORT}")
+    websocket_server = WebSocketServer(node=network)
+    websocket_server.start(host="0.0.0.0", port=int(WS_PORT))  # nosec
     print(network.signing_key.encode(encoder=HexEncoder).decode("utf-8"), "\n")
-    app.run(host="0.0.0.0", port=int(PORT))  # nosec
+    app.run(
+        host="0.0.0.0",  # nosec
+        port=int(PORT),
+        request_handler=KeepAliveRequestHandler,
+    )
 
 
 run()
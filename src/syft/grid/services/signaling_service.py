@@ -798,6 +798,11 @@ class PushSignalingService(ImmediateNodeServiceWithoutReply):
             # TODO: remove hacky signaling_msgs when SyftMessages become Storable.
             _peer_signaling[SyftMessage][msg.id] = msg
 
+            # Tell the peer's pull requests which are waiting for it, like the
+            # ones held by a WebSocketServer
+            for listener in list(node.signaling_listeners.get(msg.target_peer, [])):
+                listener()
+
     @staticmethod
     def message_handler_types() -> List[Type[ImmediateSyftMessageWithoutReply]]:
         return [SignalingOfferMessage, SignalingAnswerMessage]
@@ -508,8 +508,9 @@ def create_python_ast() -> Globals:
     add_classes(ast, classes)
     add_methods(ast, methods)
 
+    # the Pointer classes and the methods of each class are only built when they
+    # are first used, but every class needs send and serialize from the start
     for klass in ast.classes:
-        klass.create_pointer_class()
         klass.create_send_method()
         klass.create_serialization_methods()
         klass.create_storable_object_attr_convenience_methods()
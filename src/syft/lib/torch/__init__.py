@@ -1,4 +1,5 @@
 # stdlib
+from functools import lru_cache
 from typing import Dict
 from typing import Union
 
@@ -22,16 +23,24 @@ def get_return_type(support_dict: Union[str, Dict[str, str]]) -> str:
         return support_dict["return_type"]
 
 
+@lru_cache(maxsize=None)
+def parse_version(
+    version_string: str,
+) -> version.Version:
+    # the allowlist only uses a handful of different versions
+    return version.parse(version_string)
+
+
 def version_supported(support_dict: Union[str, Dict[str, str]]) -> bool:
     if isinstance(support_dict, str):
         return True
     else:
         # if we are on either side of the min or max versions we don't support this op
-        if "min_version" in support_dict and TORCH_VERSION < version.parse(
+        if "min_version" in support_dict and TORCH_VERSION < parse_version(
             support_dict["min_version"]
         ):
             return False
-        if "max_version" in support_dict and TORCH_VERSION > version.parse(
+        if "max_version" in support_dict and TORCH_VERSION > parse_version(
             support_dict["max_version"]
         ):
             return False
@@ -65,8 +74,9 @@ def create_torch_ast() -> Globals:
             # TODO: Replace with logging
             # print(f"Skipping {method} not supported in {TORCH_VERSION}")
 
+    # the Pointer classes and the methods of each class are only built when they
+    # are first used, but every class needs send and serialize from the start
     for klass in ast.classes:
-        klass.create_pointer_class()
         klass.create_send_method()
         klass.create_serialization_methods()
         klass.create_storable_object_attr_convenience_methods()
@@ -1,4 +1,8 @@
+# stdlib
+import sys
+
 # third party
+import numpy as np
 import torch as th
 
 # syft relative
@@ -25,30 +29,97 @@ TORCH_DTYPE_STR = {
 }
 TORCH_STR_DTYPE = {name: cls for cls, name in TORCH_DTYPE_STR.items()}
 
+# Element type of the raw buffer for each dtype string. Quantized tensors are
+# sent as their int_repr() and bfloat16 as the upper 16 bits of a float32,
+# since numpy has no bfloat16 type.
+RAW_DTYPE_NUMPY = {
+    "uint8": np.uint8,
+    "int8": np.int8,
+    "int16": np.int16,
+    "int32": np.int32,
+    "int64": np.int64,
+    "float16": np.float16,
+    "float32": np.float32,
+    "float64": np.float64,
+    "complex64": np.complex64,
+    "complex128": np.complex128,
+    "bool": np.bool_,
+    "qint8": np.int8,
+    "quint8": np.uint8,
+    "qint32": np.int32,
+    "bfloat16": np.uint16,
+}
+
 
 def protobuf_tensor_serializer(tensor: th.Tensor) -> TensorData:
-    """Strategy to serialize a tensor using Protobuf"""
+    """Strategy to serialize a tensor using Protobuf
+
+    The elements are written as one contiguous buffer into TensorData.data
+    instead of one protobuf value per element."""
     dtype = TORCH_DTYPE_STR[tensor.dtype]
 
     protobuf_tensor = TensorData()
 
+    tensor = tensor.detach().cpu().contiguous()
     if tensor.is_quantized:
         protobuf_tensor.is_quantized = True
         protobuf_tensor.scale = tensor.q_scale()
         protobuf_tensor.zero_point = tensor.q_zero_point()
-        data = th.flatten(tensor).int_repr().tolist()
+        array = tensor.int_repr().numpy()
+    elif tensor.dtype == th.bfloat16:
+        # bfloat16 is exactly the upper half of the equivalent float32
+        array = (tensor.float().numpy().view(np.uint32) >> 16).astype(np.uint16)
     else:
-        data = th.flatten(tensor).tolist()
+        array = tensor.numpy()
 
     protobuf_tensor.dtype = dtype
     protobuf_tensor.shape.extend(tensor.size())
-    getattr(protobuf_tensor, "contents_" + dtype).extend(data)
+    protobuf_tensor.strides.extend(tensor.stride())
+    protobuf_tensor.byte_order = sys.byteorder
+    protobuf_tensor.data = array.tobytes()
 
     return protobuf_tensor
 
 
+def _raw_buffer_deserializer(protobuf_tensor: TensorData) -> th.Tensor:
+    """Rebuild a tensor from the single bytes payload of TensorData.data"""
+    size = tuple(protobuf_tensor.shape)
+    np_dtype = np.dtype(RAW_DTYPE_NUMPY[protobuf_tensor.dtype])
+    if protobuf_tensor.byte_order != sys.byteorder:
+        np_dtype = np_dtype.newbyteorder(
+            "<" if protobuf_tensor.byte_order == "little" else ">"
+        )
+
+    # the protobuf bytes are immutable so we take a single writable copy of the
+    # whole buffer which the tensor will own, np.frombuffer itself does not copy
+    array = np.frombuffer(bytearray(protobuf_tensor.data), dtype=np_dtype)
+    if not array.dtype.isnative:
+        array = array.astype(array.dtype.newbyteorder("="))
+
+    if protobuf_tensor.dtype == "bfloat16":
+        array = (array.astype(np.uint32) << 16).view(np.float32)
+        flat_tensor = th.from_numpy(array).to(th.bfloat16)
+    else:
+        flat_tensor = th.from_numpy(array)
+
+    if len(protobuf_tensor.strides) == len(size):
+        tensor = flat_tensor.as_strided(size, tuple(protobuf_tensor.strides))
+    else:
+        tensor = flat_tensor.reshape(size)
+
+    if protobuf_tensor.is_quantized:
+        return th._make_per_tensor_quantized_tensor(
+            tensor, protobuf_tensor.scale, protobuf_tensor.zero_point
+        )
+    return tensor
+
+
 def protobuf_tensor_deserializer(protobuf_tensor: TensorData) -> th.Tensor:
     """Strategy to deserialize a binary input using Protobuf"""
+    if protobuf_tensor.byte_order:
+        return _raw_buffer_deserializer(protobuf_tensor=protobuf_tensor)
+
+    # tensors serialized without a byte_order use the repeated contents fields
     size = tuple(protobuf_tensor.shape)
     data = getattr(protobuf_tensor, "contents_" + protobuf_tensor.dtype)
 
@@ -46,8 +46,9 @@ def create_torchvision_ast() -> Globals:
                 f"Skipping torchvision.{method} not supported in {TORCHVISION_VERSION}"
             )
 
+    # the Pointer classes and the methods of each class are only built when they
+    # are first used, but every class needs send and serialize from the start
     for klass in ast.classes:
-        klass.create_pointer_class()
         klass.create_send_method()
         klass.create_serialization_methods()
         klass.create_storable_object_attr_convenience_methods()
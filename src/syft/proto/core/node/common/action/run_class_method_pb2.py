@@ -28,7 +28,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n4proto/core/node/common/action/run_class_method.proto\x12\x1csyft.core.node.common.action\x1a%proto/core/common/common_object.proto\x1a proto/core/pointer/pointer.proto\x1a\x1bproto/core/io/address.proto"\x92\x03\n\x14RunClassMethodAction\x12\x0c\n\x04path\x18\x01 \x01(\t\x12)\n\x05_self\x18\x02 \x01(\x0b\x32\x1a.syft.core.pointer.Pointer\x12(\n\x04\x61rgs\x18\x03 \x03(\x0b\x32\x1a.syft.core.pointer.Pointer\x12N\n\x06kwargs\x18\x04 \x03(\x0b\x32>.syft.core.node.common.action.RunClassMethodAction.KwargsEntry\x12-\n\x0eid_at_location\x18\x05 \x01(\x0b\x32\x15.syft.core.common.UID\x12&\n\x07\x61\x64\x64ress\x18\x06 \x01(\x0b\x32\x15.syft.core.io.Address\x12%\n\x06msg_id\x18\x07 \x01(\x0b\x32\x15.syft.core.common.UID\x1aI\n\x0bKwargsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12)\n\x05value\x18\x02 \x01(\x0b\x32\x1a.syft.core.pointer.Pointer:\x02\x38\x01\x62\x06proto3',
+    serialized_pb=b'\n4proto/core/node/common/action/run_class_method.proto\x12\x1csyft.core.node.common.action\x1a%proto/core/common/common_object.proto\x1a proto/core/pointer/pointer.proto\x1a\x1bproto/core/io/address.proto"\xb0\x05\n\x14RunClassMethodAction\x12\x0c\n\x04path\x18\x01 \x01(\t\x12)\n\x05_self\x18\x02 \x01(\x0b\x32\x1a.syft.core.pointer.Pointer\x12(\n\x04\x61rgs\x18\x03 \x03(\x0b\x32\x1a.syft.core.pointer.Pointer\x12N\n\x06kwargs\x18\x04 \x03(\x0b\x32>.syft.core.node.common.action.RunClassMethodAction.KwargsEntry\x12-\n\x0eid_at_location\x18\x05 \x01(\x0b\x32\x15.syft.core.common.UID\x12&\n\x07\x61\x64\x64ress\x18\x06 \x01(\x0b\x32\x15.syft.core.io.Address\x12%\n\x06msg_id\x18\x07 \x01(\x0b\x32\x15.syft.core.common.UID\x12W\n\x0binline_args\x18\x08 \x03(\x0b\x32\x42.syft.core.node.common.action.RunClassMethodAction.InlineArgsEntry\x12[\n\rinline_kwargs\x18\t \x03(\x0b\x32\x44.syft.core.node.common.action.RunClassMethodAction.InlineKwargsEntry\x1aI\n\x0bKwargsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12)\n\x05value\x18\x02 \x01(\x0b\x32\x1a.syft.core.pointer.Pointer:\x02\x38\x01\x1a\x31\n\x0fInlineArgsEntry\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a\x33\n\x11InlineKwargsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x62\x06proto3',
     dependencies=[
         proto_dot_core_dot_common_dot_common__object__pb2.DESCRIPTOR,
         proto_dot_core_dot_pointer_dot_pointer__pb2.DESCRIPTOR,
@@ -92,8 +92,126 @@ _RUNCLASSMETHODACTION_KWARGSENTRY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=518,
-    serialized_end=591,
+    serialized_start=700,
+    serialized_end=773,
+)
+
+_RUNCLASSMETHODACTION_INLINEARGSENTRY = _descriptor.Descriptor(
+    name="InlineArgsEntry",
+    full_name="syft.core.node.common.action.RunClassMethodAction.InlineArgsEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="syft.core.node.common.action.RunClassMethodAction.InlineArgsEntry.key",
+            index=0,
+            number=1,
+            type=13,
+            cpp_type=3,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="syft.core.node.common.action.RunClassMethodAction.InlineArgsEntry.value",
+            index=1,
+            number=2,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=775,
+    serialized_end=824,
+)
+
+_RUNCLASSMETHODACTION_INLINEKWARGSENTRY = _descriptor.Descriptor(
+    name="InlineKwargsEntry",
+    full_name="syft.core.node.common.action.RunClassMethodAction.InlineKwargsEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="syft.core.node.common.action.RunClassMethodAction.InlineKwargsEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="syft.core.node.common.action.RunClassMethodAction.InlineKwargsEntry.value",
+            index=1,
+            number=2,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=826,
+    serialized_end=877,
 )
 
 _RUNCLASSMETHODACTION = _descriptor.Descriptor(
@@ -237,10 +355,50 @@ _RUNCLASSMETHODACTION = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="inline_args",
+            full_name="syft.core.node.common.action.RunClassMethodAction.inline_args",
+            index=7,
+            number=8,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="inline_kwargs",
+            full_name="syft.core.node.common.action.RunClassMethodAction.inline_kwargs",
+            index=8,
+            number=9,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[
         _RUNCLASSMETHODACTION_KWARGSENTRY,
+        _RUNCLASSMETHODACTION_INLINEARGSENTRY,
+        _RUNCLASSMETHODACTION_INLINEKWARGSENTRY,
     ],
     enum_types=[],
     serialized_options=None,
@@ -249,13 +407,15 @@ _RUNCLASSMETHODACTION = _descriptor.Descriptor(
     extension_ranges=[],
     oneofs=[],
     serialized_start=189,
-    serialized_end=591,
+    serialized_end=877,
 )
 
 _RUNCLASSMETHODACTION_KWARGSENTRY.fields_by_name[
     "value"
 ].message_type = proto_dot_core_dot_pointer_dot_pointer__pb2._POINTER
 _RUNCLASSMETHODACTION_KWARGSENTRY.containing_type = _RUNCLASSMETHODACTION
+_RUNCLASSMETHODACTION_INLINEARGSENTRY.containing_type = _RUNCLASSMETHODACTION
+_RUNCLASSMETHODACTION_INLINEKWARGSENTRY.containing_type = _RUNCLASSMETHODACTION
 _RUNCLASSMETHODACTION.fields_by_name[
     "_self"
 ].message_type = proto_dot_core_dot_pointer_dot_pointer__pb2._POINTER
@@ -274,6 +434,12 @@ _RUNCLASSMETHODACTION.fields_by_name[
 _RUNCLASSMETHODACTION.fields_by_name[
     "msg_id"
 ].message_type = proto_dot_core_dot_common_dot_common__object__pb2._UID
+_RUNCLASSMETHODACTION.fields_by_name[
+    "inline_args"
+].message_type = _RUNCLASSMETHODACTION_INLINEARGSENTRY
+_RUNCLASSMETHODACTION.fields_by_name[
+    "inline_kwargs"
+].message_type = _RUNCLASSMETHODACTION_INLINEKWARGSENTRY
 DESCRIPTOR.message_types_by_name["RunClassMethodAction"] = _RUNCLASSMETHODACTION
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
@@ -290,6 +456,24 @@ RunClassMethodAction = _reflection.GeneratedProtocolMessageType(
                 # @@protoc_insertion_point(class_scope:syft.core.node.common.action.RunClassMethodAction.KwargsEntry)
             },
         ),
+        "InlineArgsEntry": _reflection.GeneratedProtocolMessageType(
+            "InlineArgsEntry",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _RUNCLASSMETHODACTION_INLINEARGSENTRY,
+                "__module__": "proto.core.node.common.action.run_class_method_pb2"
+                # @@protoc_insertion_point(class_scope:syft.core.node.common.action.RunClassMethodAction.InlineArgsEntry)
+            },
+        ),
+        "InlineKwargsEntry": _reflection.GeneratedProtocolMessageType(
+            "InlineKwargsEntry",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _RUNCLASSMETHODACTION_INLINEKWARGSENTRY,
+                "__module__": "proto.core.node.common.action.run_class_method_pb2"
+                # @@protoc_insertion_point(class_scope:syft.core.node.common.action.RunClassMethodAction.InlineKwargsEntry)
+            },
+        ),
         "DESCRIPTOR": _RUNCLASSMETHODACTION,
         "__module__": "proto.core.node.common.action.run_class_method_pb2"
         # @@protoc_insertion_point(class_scope:syft.core.node.common.action.RunClassMethodAction)
@@ -297,7 +481,11 @@ RunClassMethodAction = _reflection.GeneratedProtocolMessageType(
 )
 _sym_db.RegisterMessage(RunClassMethodAction)
 _sym_db.RegisterMessage(RunClassMethodAction.KwargsEntry)
+_sym_db.RegisterMessage(RunClassMethodAction.InlineArgsEntry)
+_sym_db.RegisterMessage(RunClassMethodAction.InlineKwargsEntry)
 
 
 _RUNCLASSMETHODACTION_KWARGSENTRY._options = None
+_RUNCLASSMETHODACTION_INLINEARGSENTRY._options = None
+_RUNCLASSMETHODACTION_INLINEKWARGSENTRY._options = None
 # @@protoc_insertion_point(module_scope)
@@ -28,7 +28,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n?proto/core/node/common/action/run_function_or_constructor.proto\x12\x1csyft.core.node.common.action\x1a%proto/core/common/common_object.proto\x1a proto/core/pointer/pointer.proto\x1a\x1bproto/core/io/address.proto"\xfb\x02\n\x1eRunFunctionOrConstructorAction\x12\x0c\n\x04path\x18\x01 \x01(\t\x12(\n\x04\x61rgs\x18\x02 \x03(\x0b\x32\x1a.syft.core.pointer.Pointer\x12X\n\x06kwargs\x18\x03 \x03(\x0b\x32H.syft.core.node.common.action.RunFunctionOrConstructorAction.KwargsEntry\x12-\n\x0eid_at_location\x18\x04 \x01(\x0b\x32\x15.syft.core.common.UID\x12&\n\x07\x61\x64\x64ress\x18\x05 \x01(\x0b\x32\x15.syft.core.io.Address\x12%\n\x06msg_id\x18\x06 \x01(\x0b\x32\x15.syft.core.common.UID\x1aI\n\x0bKwargsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12)\n\x05value\x18\x02 \x01(\x0b\x32\x1a.syft.core.pointer.Pointer:\x02\x38\x01\x62\x06proto3',
+    serialized_pb=b'\n?proto/core/node/common/action/run_function_or_constructor.proto\x12\x1csyft.core.node.common.action\x1a%proto/core/common/common_object.proto\x1a proto/core/pointer/pointer.proto\x1a\x1bproto/core/io/address.proto"\xad\x05\n\x1eRunFunctionOrConstructorAction\x12\x0c\n\x04path\x18\x01 \x01(\t\x12(\n\x04\x61rgs\x18\x02 \x03(\x0b\x32\x1a.syft.core.pointer.Pointer\x12X\n\x06kwargs\x18\x03 \x03(\x0b\x32H.syft.core.node.common.action.RunFunctionOrConstructorAction.KwargsEntry\x12-\n\x0eid_at_location\x18\x04 \x01(\x0b\x32\x15.syft.core.common.UID\x12&\n\x07\x61\x64\x64ress\x18\x05 \x01(\x0b\x32\x15.syft.core.io.Address\x12%\n\x06msg_id\x18\x06 \x01(\x0b\x32\x15.syft.core.common.UID\x12\x61\n\x0binline_args\x18\x07 \x03(\x0b\x32L.syft.core.node.common.action.RunFunctionOrConstructorAction.InlineArgsEntry\x12\x65\n\rinline_kwargs\x18\x08 \x03(\x0b\x32N.syft.core.node.common.action.RunFunctionOrConstructorAction.InlineKwargsEntry\x1aI\n\x0bKwargsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12)\n\x05value\x18\x02 \x01(\x0b\x32\x1a.syft.core.pointer.Pointer:\x02\x38\x01\x1a\x31\n\x0fInlineArgsEntry\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a\x33\n\x11InlineKwargsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x62\x06proto3',
     dependencies=[
         proto_dot_core_dot_common_dot_common__object__pb2.DESCRIPTOR,
         proto_dot_core_dot_pointer_dot_pointer__pb2.DESCRIPTOR,
@@ -92,8 +92,126 @@ _RUNFUNCTIONORCONSTRUCTORACTION_KWARGSENTRY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=506,
-    serialized_end=579,
+    serialized_start=708,
+    serialized_end=781,
+)
+
+_RUNFUNCTIONORCONSTRUCTORACTION_INLINEARGSENTRY = _descriptor.Descriptor(
+    name="InlineArgsEntry",
+    full_name="syft.core.node.common.action.RunFunctionOrConstructorAction.InlineArgsEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="syft.core.node.common.action.RunFunctionOrConstructorAction.InlineArgsEntry.key",
+            index=0,
+            number=1,
+            type=13,
+            cpp_type=3,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="syft.core.node.common.action.RunFunctionOrConstructorAction.InlineArgsEntry.value",
+            index=1,
+            number=2,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=783,
+    serialized_end=832,
+)
+
+_RUNFUNCTIONORCONSTRUCTORACTION_INLINEKWARGSENTRY = _descriptor.Descriptor(
+    name="InlineKwargsEntry",
+    full_name="syft.core.node.common.action.RunFunctionOrConstructorAction.InlineKwargsEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="syft.core.node.common.action.RunFunctionOrConstructorAction.InlineKwargsEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="syft.core.node.common.action.RunFunctionOrConstructorAction.InlineKwargsEntry.value",
+            index=1,
+            number=2,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=834,
+    serialized_end=885,
 )
 
 _RUNFUNCTIONORCONSTRUCTORACTION = _descriptor.Descriptor(
@@ -218,10 +336,50 @@ _RUNFUNCTIONORCONSTRUCTORACTION = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="inline_args",
+            full_name="syft.core.node.common.action.RunFunctionOrConstructorAction.inline_args",
+            index=6,
+            number=7,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="inline_kwargs",
+            full_name="syft.core.node.common.action.RunFunctionOrConstructorAction.inline_kwargs",
+            index=7,
+            number=8,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[
         _RUNFUNCTIONORCONSTRUCTORACTION_KWARGSENTRY,
+        _RUNFUNCTIONORCONSTRUCTORACTION_INLINEARGSENTRY,
+        _RUNFUNCTIONORCONSTRUCTORACTION_INLINEKWARGSENTRY,
     ],
     enum_types=[],
     serialized_options=None,
@@ -230,7 +388,7 @@ _RUNFUNCTIONORCONSTRUCTORACTION = _descriptor.Descriptor(
     extension_ranges=[],
     oneofs=[],
     serialized_start=200,
-    serialized_end=579,
+    serialized_end=885,
 )
 
 _RUNFUNCTIONORCONSTRUCTORACTION_KWARGSENTRY.fields_by_name[
@@ -239,6 +397,12 @@ _RUNFUNCTIONORCONSTRUCTORACTION_KWARGSENTRY.fields_by_name[
 _RUNFUNCTIONORCONSTRUCTORACTION_KWARGSENTRY.containing_type = (
     _RUNFUNCTIONORCONSTRUCTORACTION
 )
+_RUNFUNCTIONORCONSTRUCTORACTION_INLINEARGSENTRY.containing_type = (
+    _RUNFUNCTIONORCONSTRUCTORACTION
+)
+_RUNFUNCTIONORCONSTRUCTORACTION_INLINEKWARGSENTRY.containing_type = (
+    _RUNFUNCTIONORCONSTRUCTORACTION
+)
 _RUNFUNCTIONORCONSTRUCTORACTION.fields_by_name[
     "args"
 ].message_type = proto_dot_core_dot_pointer_dot_pointer__pb2._POINTER
@@ -254,6 +418,12 @@ _RUNFUNCTIONORCONSTRUCTORACTION.fields_by_name[
 _RUNFUNCTIONORCONSTRUCTORACTION.fields_by_name[
     "msg_id"
 ].message_type = proto_dot_core_dot_common_dot_common__object__pb2._UID
+_RUNFUNCTIONORCONSTRUCTORACTION.fields_by_name[
+    "inline_args"
+].message_type = _RUNFUNCTIONORCONSTRUCTORACTION_INLINEARGSENTRY
+_RUNFUNCTIONORCONSTRUCTORACTION.fields_by_name[
+    "inline_kwargs"
+].message_type = _RUNFUNCTIONORCONSTRUCTORACTION_INLINEKWARGSENTRY
 DESCRIPTOR.message_types_by_name[
     "RunFunctionOrConstructorAction"
 ] = _RUNFUNCTIONORCONSTRUCTORACTION
@@ -272,6 +442,24 @@ RunFunctionOrConstructorAction = _reflection.GeneratedProtocolMessageType(
                 # @@protoc_insertion_point(class_scope:syft.core.node.common.action.RunFunctionOrConstructorAction.KwargsEntry)
             },
         ),
+        "InlineArgsEntry": _reflection.GeneratedProtocolMessageType(
+            "InlineArgsEntry",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _RUNFUNCTIONORCONSTRUCTORACTION_INLINEARGSENTRY,
+                "__module__": "proto.core.node.common.action.run_function_or_constructor_pb2"
+                # @@protoc_insertion_point(class_scope:syft.core.node.common.action.RunFunctionOrConstructorAction.InlineArgsEntry)
+            },
+        ),
+        "InlineKwargsEntry": _reflection.GeneratedProtocolMessageType(
+            "InlineKwargsEntry",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _RUNFUNCTIONORCONSTRUCTORACTION_INLINEKWARGSENTRY,
+                "__module__": "proto.core.node.common.action.run_function_or_constructor_pb2"
+                # @@protoc_insertion_point(class_scope:syft.core.node.common.action.RunFunctionOrConstructorAction.InlineKwargsEntry)
+            },
+        ),
         "DESCRIPTOR": _RUNFUNCTIONORCONSTRUCTORACTION,
         "__module__": "proto.core.node.common.action.run_function_or_constructor_pb2"
         # @@protoc_insertion_point(class_scope:syft.core.node.common.action.RunFunctionOrConstructorAction)
@@ -279,7 +467,11 @@ RunFunctionOrConstructorAction = _reflection.GeneratedProtocolMessageType(
 )
 _sym_db.RegisterMessage(RunFunctionOrConstructorAction)
 _sym_db.RegisterMessage(RunFunctionOrConstructorAction.KwargsEntry)
+_sym_db.RegisterMessage(RunFunctionOrConstructorAction.InlineArgsEntry)
+_sym_db.RegisterMessage(RunFunctionOrConstructorAction.InlineKwargsEntry)
 
 
 _RUNFUNCTIONORCONSTRUCTORACTION_KWARGSENTRY._options = None
+_RUNFUNCTIONORCONSTRUCTORACTION_INLINEARGSENTRY._options = None
+_RUNFUNCTIONORCONSTRUCTORACTION_INLINEKWARGSENTRY._options = None
 # @@protoc_insertion_point(module_scope)
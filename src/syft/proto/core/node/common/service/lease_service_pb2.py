@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: proto/core/node/common/service/lease_service.proto
+"""Generated protocol buffer code."""
+# third party
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+# syft absolute
+from syft.proto.core.common import (
+    common_object_pb2 as proto_dot_core_dot_common_dot_common__object__pb2,
+)
+from syft.proto.core.io import address_pb2 as proto_dot_core_dot_io_dot_address__pb2
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+    name="proto/core/node/common/service/lease_service.proto",
+    package="syft.core.node.common.service",
+    syntax="proto3",
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+    serialized_pb=b'\n2proto/core/node/common/service/lease_service.proto\x12\x1dsyft.core.node.common.service\x1a%proto/core/common/common_object.proto\x1a\x1bproto/core/io/address.proto"{\n\x13LeaseRenewalMessage\x12%\n\x06msg_id\x18\x01 \x01(\x0b\x32\x15.syft.core.common.UID\x12&\n\x07\x61\x64\x64ress\x18\x02 \x01(\x0b\x32\x15.syft.core.io.Address\x12\x15\n\rduration_secs\x18\x03 \x01(\x01\x62\x06proto3',
+    dependencies=[
+        proto_dot_core_dot_common_dot_common__object__pb2.DESCRIPTOR,
+        proto_dot_core_dot_io_dot_address__pb2.DESCRIPTOR,
+    ],
+)
+
+
+_LEASERENEWALMESSAGE = _descriptor.Descriptor(
+    name="LeaseRenewalMessage",
+    full_name="syft.core.node.common.service.LeaseRenewalMessage",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="msg_id",
+            full_name="syft.core.node.common.service.LeaseRenewalMessage.msg_id",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="address",
+            full_name="syft.core.node.common.service.LeaseRenewalMessage.address",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="duration_secs",
+            full_name="syft.core.node.common.service.LeaseRenewalMessage.duration_secs",
+            index=2,
+            number=3,
+            type=1,
+            cpp_type=5,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=153,
+    serialized_end=276,
+)
+
+_LEASERENEWALMESSAGE.fields_by_name[
+    "msg_id"
+].message_type = proto_dot_core_dot_common_dot_common__object__pb2._UID
+_LEASERENEWALMESSAGE.fields_by_name[
+    "address"
+].message_type = proto_dot_core_dot_io_dot_address__pb2._ADDRESS
+DESCRIPTOR.message_types_by_name["LeaseRenewalMessage"] = _LEASERENEWALMESSAGE
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+LeaseRenewalMessage = _reflection.GeneratedProtocolMessageType(
+    "LeaseRenewalMessage",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _LEASERENEWALMESSAGE,
+        "__module__": "proto.core.node.common.service.lease_service_pb2"
+        # @@protoc_insertion_point(class_scope:syft.core.node.common.service.LeaseRenewalMessage)
+    },
+)
+_sym_db.RegisterMessage(LeaseRenewalMessage)
+
+
+# @@protoc_insertion_point(module_scope)
@@ -19,7 +19,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n\x1cproto/lib/torch/tensor.proto\x12\x0esyft.lib.torch"\xa4\x03\n\nTensorData\x12\r\n\x05shape\x18\x01 \x03(\x03\x12\r\n\x05\x64type\x18\x02 \x01(\t\x12\x14\n\x0cis_quantized\x18\x03 \x01(\x08\x12\r\n\x05scale\x18\x04 \x01(\x02\x12\x12\n\nzero_point\x18\x05 \x01(\x05\x12\x16\n\x0e\x63ontents_uint8\x18\x10 \x03(\r\x12\x15\n\rcontents_int8\x18\x11 \x03(\x05\x12\x16\n\x0e\x63ontents_int16\x18\x12 \x03(\x05\x12\x16\n\x0e\x63ontents_int32\x18\x13 \x03(\x05\x12\x16\n\x0e\x63ontents_int64\x18\x14 \x03(\x03\x12\x18\n\x10\x63ontents_float16\x18\x15 \x03(\x02\x12\x18\n\x10\x63ontents_float32\x18\x16 \x03(\x02\x12\x18\n\x10\x63ontents_float64\x18\x17 \x03(\x01\x12\x15\n\rcontents_bool\x18\x18 \x03(\x08\x12\x16\n\x0e\x63ontents_qint8\x18\x19 \x03(\x11\x12\x17\n\x0f\x63ontents_quint8\x18\x1a \x03(\r\x12\x17\n\x0f\x63ontents_qint32\x18\x1b \x03(\x11\x12\x19\n\x11\x63ontents_bfloat16\x18\x1c \x03(\x02"z\n\x0bTensorProto\x12*\n\x06tensor\x18\x01 \x01(\x0b\x32\x1a.syft.lib.torch.TensorData\x12\x15\n\rrequires_grad\x18\x02 \x01(\x08\x12(\n\x04grad\x18\x03 \x01(\x0b\x32\x1a.syft.lib.torch.TensorDatab\x06proto3',
+    serialized_pb=b'\n\x1cproto/lib/torch/tensor.proto\x12\x0esyft.lib.torch"\xd7\x03\n\nTensorData\x12\r\n\x05shape\x18\x01 \x03(\x03\x12\r\n\x05\x64type\x18\x02 \x01(\t\x12\x14\n\x0cis_quantized\x18\x03 \x01(\x08\x12\r\n\x05scale\x18\x04 \x01(\x02\x12\x12\n\nzero_point\x18\x05 \x01(\x05\x12\x0f\n\x07strides\x18\x06 \x03(\x03\x12\x12\n\nbyte_order\x18\x07 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x08 \x01(\x0c\x12\x16\n\x0e\x63ontents_uint8\x18\x10 \x03(\r\x12\x15\n\rcontents_int8\x18\x11 \x03(\x05\x12\x16\n\x0e\x63ontents_int16\x18\x12 \x03(\x05\x12\x16\n\x0e\x63ontents_int32\x18\x13 \x03(\x05\x12\x16\n\x0e\x63ontents_int64\x18\x14 \x03(\x03\x12\x18\n\x10\x63ontents_float16\x18\x15 \x03(\x02\x12\x18\n\x10\x63ontents_float32\x18\x16 \x03(\x02\x12\x18\n\x10\x63ontents_float64\x18\x17 \x03(\x01\x12\x15\n\rcontents_bool\x18\x18 \x03(\x08\x12\x16\n\x0e\x63ontents_qint8\x18\x19 \x03(\x11\x12\x17\n\x0f\x63ontents_quint8\x18\x1a \x03(\r\x12\x17\n\x0f\x63ontents_qint32\x18\x1b \x03(\x11\x12\x19\n\x11\x63ontents_bfloat16\x18\x1c \x03(\x02"z\n\x0bTensorProto\x12*\n\x06tensor\x18\x01 \x01(\x0b\x32\x1a.syft.lib.torch.TensorData\x12\x15\n\rrequires_grad\x18\x02 \x01(\x08\x12(\n\x04grad\x18\x03 \x01(\x0b\x32\x1a.syft.lib.torch.TensorDatab\x06proto3',
 )
 
 
@@ -126,10 +126,67 @@ _TENSORDATA = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="strides",
+            full_name="syft.lib.torch.TensorData.strides",
+            index=5,
+            number=6,
+            type=3,
+            cpp_type=2,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="byte_order",
+            full_name="syft.lib.torch.TensorData.byte_order",
+            index=6,
+            number=7,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="data",
+            full_name="syft.lib.torch.TensorData.data",
+            index=7,
+            number=8,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
         _descriptor.FieldDescriptor(
             name="contents_uint8",
             full_name="syft.lib.torch.TensorData.contents_uint8",
-            index=5,
+            index=8,
             number=16,
             type=13,
             cpp_type=3,
@@ -148,7 +205,7 @@ _TENSORDATA = _descriptor.Descriptor(
         _descriptor.FieldDescriptor(
             name="contents_int8",
             full_name="syft.lib.torch.TensorData.contents_int8",
-            index=6,
+            index=9,
             number=17,
             type=5,
             cpp_type=1,
@@ -167,7 +224,7 @@ _TENSORDATA = _descriptor.Descriptor(
         _descriptor.FieldDescriptor(
             name="contents_int16",
             full_name="syft.lib.torch.TensorData.contents_int16",
-            index=7,
+            index=10,
             number=18,
             type=5,
             cpp_type=1,
@@ -186,7 +243,7 @@ _TENSORDATA = _descriptor.Descriptor(
         _descriptor.FieldDescriptor(
             name="contents_int32",
             full_name="syft.lib.torch.TensorData.contents_int32",
-            index=8,
+            index=11,
             number=19,
             type=5,
             cpp_type=1,
@@ -205,7 +262,7 @@ _TENSORDATA = _descriptor.Descriptor(
         _descriptor.FieldDescriptor(
             name="contents_int64",
             full_name="syft.lib.torch.TensorData.contents_int64",
-            index=9,
+            index=12,
             number=20,
             type=3,
             cpp_type=2,
@@ -224,7 +281,7 @@ _TENSORDATA = _descriptor.Descriptor(
         _descriptor.FieldDescriptor(
             name="contents_float16",
             full_name="syft.lib.torch.TensorData.contents_float16",
-            index=10,
+            index=13,
             number=21,
             type=2,
             cpp_type=6,
@@ -243,7 +300,7 @@ _TENSORDATA = _descriptor.Descriptor(
         _descriptor.FieldDescriptor(
             name="contents_float32",
             full_name="syft.lib.torch.TensorData.contents_float32",
-            index=11,
+            index=14,
             number=22,
             type=2,
             cpp_type=6,
@@ -262,7 +319,7 @@ _TENSORDATA = _descriptor.Descriptor(
         _descriptor.FieldDescriptor(
             name="contents_float64",
             full_name="syft.lib.torch.TensorData.contents_float64",
-            index=12,
+            index=15,
             number=23,
             type=1,
             cpp_type=5,
@@ -281,7 +338,7 @@ _TENSORDATA = _descriptor.Descriptor(
         _descriptor.FieldDescriptor(
             name="contents_bool",
             full_name="syft.lib.torch.TensorData.contents_bool",
-            index=13,
+            index=16,
             number=24,
             type=8,
             cpp_type=7,
@@ -300,7 +357,7 @@ _TENSORDATA = _descriptor.Descriptor(
         _descriptor.FieldDescriptor(
             name="contents_qint8",
             full_name="syft.lib.torch.TensorData.contents_qint8",
-            index=14,
+            index=17,
             number=25,
             type=17,
             cpp_type=1,
@@ -319,7 +376,7 @@ _TENSORDATA = _descriptor.Descriptor(
         _descriptor.FieldDescriptor(
             name="contents_quint8",
             full_name="syft.lib.torch.TensorData.contents_quint8",
-            index=15,
+            index=18,
             number=26,
             type=13,
             cpp_type=3,
@@ -338,7 +395,7 @@ _TENSORDATA = _descriptor.Descriptor(
         _descriptor.FieldDescriptor(
             name="contents_qint32",
             full_name="syft.lib.torch.TensorData.contents_qint32",
-            index=16,
+            index=19,
             number=27,
             type=17,
             cpp_type=1,
@@ -357,7 +414,7 @@ _TENSORDATA = _descriptor.Descriptor(
         _descriptor.FieldDescriptor(
             name="contents_bfloat16",
             full_name="syft.lib.torch.TensorData.contents_bfloat16",
-            index=17,
+            index=20,
             number=28,
             type=2,
             cpp_type=6,
@@ -383,7 +440,7 @@ _TENSORDATA = _descriptor.Descriptor(
     extension_ranges=[],
     oneofs=[],
     serialized_start=49,
-    serialized_end=469,
+    serialized_end=520,
 )
 
 
@@ -461,8 +518,8 @@ _TENSORPROTO = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=471,
-    serialized_end=593,
+    serialized_start=522,
+    serialized_end=644,
 )
 
 _TENSORPROTO.fields_by_name["tensor"].message_type = _TENSORDATA
@@ -0,0 +1,93 @@
+"""Debug tracing for the message hot path.
+
+Debug messages on the hot path (creating, signing, routing and processing
+messages) used to be built eagerly with f-strings, so the emojis, pprints and
+reprs they contain were computed for every message even though logging is off
+by default. Instead, call sites pass the tracer a function building the message:
+
+    tracer.trace("node.process", lambda: f"> Processing {msg.pprint}", msg_id=msg.id)
+
+When tracing is off this costs a call which returns right away and nothing is
+formatted. When it is on the event can be logged through loguru (the lambda is only
+called then) and/or recorded as a structured TraceEvent in a bounded in-memory ring
+buffer, which is much cheaper than formatting and writing a log line.
+"""
+
+# stdlib
+from collections import deque
+import time
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+# third party
+from loguru import logger
+
+DEFAULT_BUFFER_SIZE = 10000
+
+
+class TraceEvent(NamedTuple):
+    timestamp: float
+    event: str
+    fields: Dict[str, Any]
+
+
+class Tracer:
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        # send the formatted message of each event to logger.debug
+        self.log = False
+        # keep each event in the events ring buffer
+        self.record = False
+        # log or record, trace does nothing when this is False
+        self.enabled = False
+        self.events: Deque[TraceEvent] = deque(maxlen=buffer_size)
+
+    def configure(
+        self,
+        log: Optional[bool] = None,
+        record: Optional[bool] = None,
+        buffer_size: Optional[int] = None,
+    ) -> None:
+        """Turn logging and/or recording of events on or off, None leaves it as is"""
+        if log is not None:
+            self.log = log
+        if record is not None:
+            self.record = record
+        if buffer_size is not None:
+            self.events = deque(self.events, maxlen=buffer_size)
+        self.enabled = self.log or self.record
+
+    def trace(self, event: str, message: Callable[[], str], **fields: Any) -> None:
+        """Log and/or record an event, does nothing unless the tracer is enabled
+
+        :param event: a short dotted name for the kind of event, like node.process
+        :type event: str
+        :param message: builds the log line, it is only called if logging is on
+        :type message: Callable[[], str]
+        :param fields: the structured data which is kept in the ring buffer
+        """
+        if not self.enabled:
+            return
+        if self.record:
+            self.events.append(
+                TraceEvent(timestamp=time.time(), event=event, fields=fields)
+            )
+        if self.log:
+            # depth=1 so loguru reports the caller instead of this method
+            logger.opt(depth=1).debug(message())
+
+    def get_events(self, event: Optional[str] = None) -> List[TraceEvent]:
+        """The recorded events, oldest first, optionally only those named event"""
+        if event is None:
+            return list(self.events)
+        return [e for e in self.events if e.event == event]
+
+    def clear(self) -> None:
+        self.events.clear()
+
+
+tracer = Tracer()
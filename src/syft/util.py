@@ -1,6 +1,8 @@
 # stdlib
 from random import randint
+from typing import Dict
 from typing import List
+from typing import Tuple
 from typing import Union
 
 # third party
@@ -114,7 +116,8 @@ def get_fully_qualified_name(obj: object) -> str:
     return fqn
 
 
-@syft_decorator(typechecking=True)
+# not typechecked, it is called for every class in the AST when syft is imported
+# and there is nothing to check about arguments which can be any object
 def aggressive_set_attr(obj: object, name: str, attr: object) -> None:
     """Different objects prefer different types of monkeypatching - try them all"""
 
@@ -124,6 +127,11 @@ def aggressive_set_attr(obj: object, name: str, attr: object) -> None:
         curse(obj, name, attr)
 
 
+# (type, fully qualified name) -> pointer class, the lookups in the lib_ast are much
+# slower than this and give the same pointer class for every object of a type
+_pointer_type_cache: Dict[Tuple[type, str], type] = {}
+
+
 def obj2pointer_type(obj: object) -> type:
     try:
         fqn = get_fully_qualified_name(obj=obj)
@@ -137,6 +145,12 @@ def obj2pointer_type(obj: object) -> type:
             fqn = "syft.lib.python._SyNone"
         else:
             fqn = get_fully_qualified_name(obj=type(obj))
+
+    cache_key = (type(obj), fqn)
+    pointer_type = _pointer_type_cache.get(cache_key, None)
+    if pointer_type is not None:
+        return pointer_type
+
     try:
         ref = syft.lib_ast(fqn, return_callable=True)
     except Exception:
@@ -147,7 +161,9 @@ def obj2pointer_type(obj: object) -> type:
             logger.critical(f"Cannot find {type(obj)} {fqn} in lib_ast. {e}")
         # TODO maybe return AnyPointer?
 
-    return ref.pointer_type
+    pointer_type = ref.pointer_type
+    _pointer_type_cache[cache_key] = pointer_type
+    return pointer_type
 
 
 @syft_decorator(typechecking=True)
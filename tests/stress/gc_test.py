@@ -1,12 +1,17 @@
 # stdlib
 import gc
+import time
+from typing import Any
 
 # third party
+import pytest
 import torch
 
 # syft absolute
 import syft as sy
 
+POINTERS = 10_000
+
 
 def test_same_var_for_ptr_gc() -> None:
     """
@@ -58,3 +63,101 @@ def test_send_same_obj_gc() -> None:
 
     gc.collect()
     assert len(alice.store) == 0
+
+
+def test_batched_gc() -> None:
+    """
+    Test that a client with a gc_batch_size deletes the objects of its
+    garbage collected pointers once the batch is full or flushed
+    """
+    x = torch.tensor([1, 2, 3, 4])
+
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_client()
+    alice_client.gc_batch_size = 10
+
+    ptr = [x.send(alice_client) for _ in range(15)]
+    del ptr
+    gc.collect()
+
+    # one batch of 10 was sent, 5 are waiting for the next one
+    assert len(alice.store) == 5
+
+    alice_client.flush_gc()
+    assert len(alice.store) == 0
+
+
+def test_gc_flush_when_idle() -> None:
+    """
+    Test that a partial batch is sent once gc_flush_interval has passed, even when
+    the client sends nothing else
+    """
+    x = torch.tensor([1, 2, 3, 4])
+
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_client()
+    alice_client.gc_batch_size = 10
+    alice_client.gc_flush_interval = 0.1
+
+    ptr = [x.send(alice_client) for _ in range(3)]
+    del ptr
+    gc.collect()
+
+    deadline = time.time() + 5
+    while len(alice.store) > 0 and time.time() < deadline:
+        time.sleep(0.05)
+    assert len(alice.store) == 0
+
+
+def test_gc_flush_on_pipeline_exit() -> None:
+    """
+    Test that a partial batch is sent with the last batch of a pipeline
+    """
+    x = torch.tensor([1, 2, 3, 4])
+
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_client()
+    alice_client.gc_batch_size = 10
+
+    y_ptr = x.send(alice_client)
+    with alice_client.pipeline():
+        del y_ptr
+        gc.collect()
+        assert len(alice.store) == 1
+    assert len(alice.store) == 0
+
+
+def count_gc_messages(alice: sy.VirtualMachine) -> Any:
+    received = []
+    recv = alice.recv_eventual_msg_without_reply
+
+    def counting_recv(msg: Any) -> None:
+        received.append(msg)
+        recv(msg=msg)
+
+    alice.recv_eventual_msg_without_reply = counting_recv  # type: ignore
+    return received
+
+
+def collect_pointers(gc_batch_size: int) -> int:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+    alice_client.gc_batch_size = gc_batch_size
+
+    with alice_client.pipeline(max_batch_size=256):
+        ptr = [torch.tensor([i]).send(alice_client) for i in range(POINTERS)]
+    assert len(alice.store) == POINTERS
+
+    received = count_gc_messages(alice=alice)
+    del ptr
+    gc.collect()
+    alice_client.flush_gc()
+
+    assert len(alice.store) == 0
+    return len(received)
+
+
+@pytest.mark.slow
+def test_batched_gc_messages() -> None:
+    assert collect_pointers(gc_batch_size=1) == POINTERS
+    assert collect_pointers(gc_batch_size=1000) == POINTERS // 1000
@@ -0,0 +1,75 @@
+# stdlib
+from concurrent.futures import ThreadPoolExecutor
+
+# third party
+import torch as th
+
+# syft absolute
+from syft.ast.globals import Globals
+from syft.ast.klass import Class
+
+
+def test_lib_ast_is_built_lazily() -> None:
+    ast = Globals()
+    ast.add_path(
+        path="torch.nn.Linear",
+        framework_reference=th,
+        return_type_name="torch.nn.Linear",
+    )
+    ast.add_path(
+        path="torch.nn.Linear.train",
+        framework_reference=th,
+        return_type_name="torch.nn.Linear",
+    )
+
+    torch_module = ast.attrs["torch"]
+    # nothing below torch has been built yet
+    assert torch_module._attrs == {}
+    assert len(torch_module._pending_paths) == 2
+
+    klass = ast("torch.nn.Linear", return_callable=True)
+    assert isinstance(klass, Class)
+    assert klass.ref is th.nn.Linear
+    assert torch_module._pending_paths == []
+    # the methods of the class and its Pointer class are still not built
+    assert klass._attrs == {}
+    assert getattr(klass, klass.pointer_name, None) is None
+
+    assert "train" in klass.pointer_type.__dict__
+    assert klass.pointer_type is klass.pointer_type
+
+
+def test_lookup_by_type_builds_the_lib_ast() -> None:
+    ast = Globals()
+    ast.add_path(
+        path="torch.nn.Linear",
+        framework_reference=th,
+        return_type_name="torch.nn.Linear",
+    )
+
+    # torch.nn.Linear is torch.nn.modules.linear.Linear
+    klass = ast(
+        "torch.nn.modules.linear.Linear", return_callable=True, obj_type=th.nn.Linear
+    )
+    assert klass.path_and_name == "torch.nn.Linear"
+
+
+def test_lib_ast_is_built_once_by_concurrent_threads() -> None:
+    ast = Globals()
+    for path in ["torch.nn.Linear", "torch.nn.Linear.train", "torch.nn.Linear.eval"]:
+        ast.add_path(
+            path=path,
+            framework_reference=th,
+            return_type_name="torch.nn.Linear",
+        )
+
+    def pointer_type() -> type:
+        return ast("torch.nn.Linear", return_callable=True).pointer_type
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pointer_types = list(executor.map(lambda _: pointer_type(), range(32)))
+
+    # every thread gets the same Pointer class with all of its methods
+    assert len(set(pointer_types)) == 1
+    assert "train" in pointer_types[0].__dict__
+    assert "eval" in pointer_types[0].__dict__
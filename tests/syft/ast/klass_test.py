@@ -0,0 +1,66 @@
+# stdlib
+from typing import Any
+from typing import List
+
+# third party
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.ast.klass import PointerMethod
+from syft.ast.klass import PointerProperty
+from syft.core.node.common.action.run_class_method_action import RunClassMethodAction
+
+
+def test_pointer_class_attrs_are_descriptors() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+    ptr = th.tensor([1, 2, 3]).send(alice_client)
+
+    pointer_type = type(ptr)
+    assert isinstance(pointer_type.__dict__["add"], PointerMethod)
+    assert isinstance(pointer_type.__dict__["T"], PointerProperty)
+    assert pointer_type.__dict__["add"].path_and_name == "torch.Tensor.add"
+
+    # plain attributes of the pointer are not dispatched to the remote object
+    assert "id_at_location" not in pointer_type.__dict__
+    assert ptr.id_at_location is ptr.id_at_location
+
+
+def test_pointer_method_runs_on_the_remote_object() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+    x = th.tensor([1, 2, 3])
+    x_ptr = x.send(alice_client)
+
+    sent: List[Any] = []
+    send = alice_client.send_immediate_msg_without_reply
+
+    def counting_send(msg: Any) -> None:
+        sent.append(msg)
+        send(msg=msg)
+
+    alice_client.send_immediate_msg_without_reply = counting_send  # type: ignore
+
+    method = type(x_ptr).__dict__["add"]
+    y_ptr = x_ptr.add(x_ptr)
+
+    assert type(y_ptr) is type(x_ptr)
+    assert y_ptr.id_at_location != x_ptr.id_at_location
+    assert [type(msg) for msg in sent] == [RunClassMethodAction]
+    assert sent[0].path == "torch.Tensor.add"
+    # the pointer class of the result is looked up once and kept
+    assert method._return_pointer_type is type(x_ptr)
+    assert y_ptr.get().equal(x + x)
+
+
+def test_pointer_property_runs_on_access() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+    x = th.tensor([[1, 2], [3, 4]])
+    x_ptr = x.send(alice_client)
+
+    t_ptr = x_ptr.T
+
+    assert type(t_ptr) is type(x_ptr)
+    assert t_ptr.get().equal(x.T)
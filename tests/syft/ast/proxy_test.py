@@ -0,0 +1,40 @@
+# third party
+import pytest
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.ast.proxy import AttributeProxy
+
+
+def test_clients_share_lib_ast() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+    bob = sy.VirtualMachine(name="bob")
+    bob_client = bob.get_root_client()
+
+    assert isinstance(alice_client.torch, AttributeProxy)
+    assert alice_client.torch.attr is sy.lib_ast.torch
+    assert bob_client.torch.Tensor.attr is sy.lib_ast.torch.Tensor
+    assert (
+        alice_client.lib_ast("torch.Tensor", return_callable=True).pointer_type
+        is bob_client.torch.Tensor.pointer_type
+    )
+
+    with pytest.raises(AttributeError):
+        alice_client.torch.Tensor = None
+
+
+def test_proxy_runs_on_its_client() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+    bob = sy.VirtualMachine(name="bob")
+    bob_client = bob.get_root_client()
+
+    alice_ptr = alice_client.torch.Tensor([1, 2, 3])
+    bob_ptr = bob_client.torch.Tensor([4, 5, 6])
+
+    assert alice_ptr.client is alice_client
+    assert bob_ptr.client is bob_client
+    assert th.equal(alice_ptr.get(), th.Tensor([1, 2, 3]))
+    assert th.equal(bob_ptr.get(), th.Tensor([4, 5, 6]))
@@ -6,6 +6,7 @@ from nacl.signing import VerifyKey
 import syft as sy
 from syft import ReprMessage
 from syft.core.common.message import SignedImmediateSyftMessageWithoutReply
+from syft.proto.util.data_message_pb2 import DataMessage
 from syft.util import get_fully_qualified_name
 
 
@@ -19,7 +20,7 @@ def get_signed_message_bytes() -> bytes:
     # return a signed message fixture containing the uid from get_uid
     blob = (
         b"\n?syft.core.common.message.SignedImmediateSyftMessageWithoutReply"
-        + b"\x12\xad\x02\n\x12\n\x10\x8c3\x19,\xcd\xd3\xf3N\xe2\xb0\xc6\tU\xdf\x02u\x12"
+        + b"\x12\xda\x02\n\x12\n\x10\x8c3\x19,\xcd\xd3\xf3N\xe2\xb0\xc6\tU\xdf\x02u\x12"
         + b"6syft.core.node.common.service.repr_service.ReprMessage"
         + b"\x1a@@\x82\x13\xfaC\xfb=\x01H\x853\x1e\xceE+\xc6\xb5\rX\x16Z\xb8l\x02\x10"
         + b"\x8algj\xd6U\x11]\xe9R\x0ei\xd8\xca\xb9\x00=\xa1\xeeoEa\xe2C\xa0\x960\xf7A"
@@ -28,6 +29,8 @@ def get_signed_message_bytes() -> bytes:
         + b"syft.core.node.common.service.repr_service.ReprMessage\x12A\n\x12\n\x10"
         + b"\x8c3\x19,\xcd\xd3\xf3N\xe2\xb0\xc6\tU\xdf\x02u\x12+\n\x0bGoofy KirchH\x01R"
         + b"\x1a\n\x12\n\x10\xfb\x1b\xb0g[\xb7LI\xbe\xce\xe7\x00\xab\n\x15\x14\x12\x04Test"
+        + b"2+\n\x0bGoofy KirchH\x01R\x1a\n\x12\n\x10\xfb\x1b\xb0g[\xb7LI\xbe\xce\xe7"
+        + b"\x00\xab\n\x15\x14\x12\x04Test"
     )
     return blob
 
@@ -230,3 +233,56 @@ def test_get_message() -> None:
     obj = get_repr_message()
 
     assert nonveri_msg == obj
+
+
+def test_signed_message_to_bytes_matches_proto() -> None:
+    """Tests that writing the inner message straight into the envelope gives the
+    same bytes as serializing the full SignedMessage proto"""
+
+    sig_msg = get_repr_message().sign(signing_key=get_signing_key())
+    expected = DataMessage(
+        obj_type=get_fully_qualified_name(obj=sig_msg),
+        content=sig_msg.proto().SerializeToString(),
+    ).SerializeToString()
+
+    assert sig_msg.to_bytes() == expected
+
+    buffer = bytearray()
+    sig_msg.serialize_into(buffer=buffer)
+    assert bytes(buffer) == expected
+
+    sig_msg_again = sy.deserialize(blob=memoryview(buffer), from_bytes=True)
+    assert sig_msg_again == sig_msg
+    assert sig_msg_again.message == sig_msg.message
+    assert sig_msg_again.is_valid is True
+
+
+def test_signed_message_routing_header() -> None:
+    """Tests that the address of a SignedMessage is read from the routing header
+    without deserializing the message itself"""
+
+    sig_msg = sy.deserialize(blob=get_signed_message_bytes(), from_bytes=True)
+
+    assert sig_msg.cached_deseralized_message is None
+    assert sig_msg.address == get_repr_message().address
+    assert sig_msg.is_valid is True
+    assert sig_msg.message == get_repr_message()
+
+
+def test_signed_message_without_routing_header() -> None:
+    """Tests that a SignedMessage serialized without the routing header can still
+    be deserialized"""
+
+    sig_msg = get_repr_message().sign(signing_key=get_signing_key())
+    proto = sig_msg.proto()
+    proto.ClearField("address")
+    blob = DataMessage(
+        obj_type=get_fully_qualified_name(obj=sig_msg),
+        content=proto.SerializeToString(),
+    ).SerializeToString()
+
+    sig_msg_again = sy.deserialize(blob=blob, from_bytes=True)
+
+    assert sig_msg_again.address == sig_msg.address
+    assert sig_msg_again.message == sig_msg.message
+    assert sig_msg_again.is_valid is True
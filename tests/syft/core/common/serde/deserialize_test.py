@@ -1,8 +1,15 @@
+# stdlib
+import sys
+
 # third party
 from pytest import raises
 
 # syft absolute
 from syft.core.common.serde.deserialize import _deserialize
+from syft.core.common.serde.deserialize import lookup_serializable_type
+from syft.core.common.serde.serializable import SERIALIZABLE_TYPES
+from syft.core.common.uid import UID
+from syft.util import get_fully_qualified_name
 
 
 def test_fail_deserialize_no_format() -> None:
@@ -13,3 +20,20 @@ def test_fail_deserialize_no_format() -> None:
 def test_fail_deserialize_wrong_format() -> None:
     with raises(TypeError, match="You tried to deserialize an unsupported type."):
         _deserialize(blob="to deserialize")
+
+
+def test_serializable_types_registry() -> None:
+    uid = UID()
+    obj_type = get_fully_qualified_name(obj=uid)
+
+    assert SERIALIZABLE_TYPES[obj_type] is UID
+    assert lookup_serializable_type(fully_qualified_name=obj_type) is UID
+    assert _deserialize(blob=uid.serialize(to_bytes=True), from_bytes=True) == uid
+
+
+def test_lookup_serializable_type_falls_back_to_module_walk() -> None:
+    # modules are not Serializable so they are only found by walking syft
+    assert (
+        lookup_serializable_type(fully_qualified_name="syft.core.common.uid")
+        is sys.modules["syft.core.common.uid"]
+    )
@@ -3,9 +3,15 @@
 import pytest
 
 # syft absolute
+from syft.core.common.object import ObjectWithID
+from syft.core.common.serde.deserialize import _deserialize
+from syft.core.common.serde.envelope import read_data_message
+
 # from syft.core.common.uid import UID
 from syft.core.common.serde.serializable import Serializable
 from syft.core.common.serde.serialize import _serialize
+from syft.proto.util.data_message_pb2 import DataMessage
+from syft.util import get_fully_qualified_name
 
 # import syft as sy
 
@@ -21,3 +27,46 @@ def test_object_with_no_serialize_wrapper() -> None:
 
     with pytest.raises(Exception):
         _serialize(TestObject())
+
+
+def test_to_bytes_matches_data_message() -> None:
+    """
+    Test that the envelope written by serialize(to_bytes=True) and serialize_into is
+    the same as serializing a DataMessage.
+    """
+
+    obj = ObjectWithID()
+    expected = DataMessage(
+        obj_type=get_fully_qualified_name(obj=obj),
+        content=obj.serialize().SerializeToString(),
+    ).SerializeToString()
+
+    assert obj.serialize(to_bytes=True) == expected
+
+    buffer = bytearray(b"prefix")
+    written = obj.serialize_into(buffer=buffer)
+
+    assert written == len(expected)
+    assert bytes(buffer) == b"prefix" + expected
+
+
+def test_deserialize_memoryview_slice() -> None:
+    """
+    Test that objects can be deserialized from a slice of a larger buffer.
+    """
+
+    first = ObjectWithID()
+    second = ObjectWithID()
+
+    buffer = bytearray()
+    first_len = first.serialize_into(buffer=buffer)
+    second.serialize_into(buffer=buffer)
+
+    view = memoryview(buffer)
+    obj_type, content = read_data_message(blob=view[first_len:])
+
+    assert obj_type == get_fully_qualified_name(obj=second)
+    assert isinstance(content, memoryview)
+
+    assert _deserialize(blob=view[:first_len], from_bytes=True) == first
+    assert _deserialize(blob=view[first_len:], from_bytes=True) == second
@@ -0,0 +1,90 @@
+# third party
+from nacl.signing import SigningKey
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.core.common.message import verify_signed_messages
+from syft.core.common.signature import SignatureCache
+from syft.core.common.signature import get_verify_key
+from syft.core.common.signature import set_verification_workers
+from syft.core.io.address import Address
+from syft.core.node.common.service.repr_service import ReprMessage
+
+
+def get_signed_messages(count: int) -> list:
+    signing_key = SigningKey.generate()
+    return [
+        ReprMessage(address=Address()).sign(signing_key=signing_key)
+        for _ in range(count)
+    ]
+
+
+def test_verify_keys_are_interned() -> None:
+    signing_key = SigningKey.generate()
+    key_bytes = bytes(signing_key.verify_key)
+
+    assert get_verify_key(key_bytes) is get_verify_key(bytes(key_bytes))
+    assert get_verify_key(key_bytes) == signing_key.verify_key
+
+    sig_msg = get_signed_messages(count=1)[0]
+    msg_a = sy.deserialize(blob=sig_msg.to_bytes(), from_bytes=True)
+    msg_b = sy.deserialize(blob=sig_msg.to_bytes(), from_bytes=True)
+    assert msg_a.verify_key is msg_b.verify_key
+
+
+def test_signature_cache_skips_verified_signatures() -> None:
+    cache = SignatureCache(max_size=2)
+    signing_key = SigningKey.generate()
+    signed = signing_key.sign(b"hello")
+
+    assert cache.verify(
+        verify_key=signing_key.verify_key,
+        signature=signed.signature,
+        message=signed.message,
+    )
+    assert len(cache) == 1
+
+    # the same signature next to other bytes is still checked, and rejected
+    assert not cache.verify(
+        verify_key=signing_key.verify_key,
+        signature=signed.signature,
+        message=b"goodbye",
+    )
+    assert not cache.verify(
+        verify_key=SigningKey.generate().verify_key,
+        signature=signed.signature,
+        message=signed.message,
+    )
+    assert len(cache) == 1
+
+    # the cache is bounded
+    for message in [b"a", b"b", b"c"]:
+        signed = signing_key.sign(message)
+        assert cache.verify(
+            verify_key=signing_key.verify_key,
+            signature=signed.signature,
+            message=message,
+        )
+    assert len(cache) == 2
+
+
+@pytest.mark.parametrize("workers", [0, 4])
+def test_verify_signed_messages(workers: int) -> None:
+    msgs = get_signed_messages(count=8)
+    msgs[3].signature = bytes(64)
+    msgs[5].serialized_message += b"a"
+
+    set_verification_workers(workers=workers)
+    try:
+        results = verify_signed_messages(msgs=msgs)
+    finally:
+        set_verification_workers(workers=0)
+
+    assert results == [msg.is_valid for msg in msgs]
+    assert results == [True, True, True, False, True, False, True, True]
+
+
+def test_set_verification_workers_rejects_negative() -> None:
+    with pytest.raises(ValueError):
+        set_verification_workers(workers=-1)
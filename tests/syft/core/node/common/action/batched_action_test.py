@@ -0,0 +1,154 @@
+# third party
+from nacl.signing import VerifyKey
+import pytest
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.common.uid import UID
+from syft.core.node.abstract.node import AbstractNode
+from syft.core.node.common.action.batched_action import BatchedActionMessage
+from syft.core.node.common.action.common import ImmediateActionWithoutReply
+from syft.core.node.common.action.garbage_collect_object_action import (
+    GarbageCollectObjectAction,
+)
+from syft.core.node.common.action.get_object_action import GetObjectAction
+from syft.core.node.common.action.save_object_action import SaveObjectAction
+
+
+def test_batched_action_serde() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_client()
+
+    actions = [
+        SaveObjectAction(
+            id_at_location=UID(), obj=th.tensor([1, 2]), address=alice_client.address
+        ),
+        GarbageCollectObjectAction(id_at_location=UID(), address=alice_client.address),
+    ]
+    msg = BatchedActionMessage(actions=actions, address=alice_client.address)
+
+    msg2 = sy.deserialize(blob=msg.serialize(to_bytes=True), from_bytes=True)
+
+    assert msg2.id == msg.id
+    assert msg2.address == msg.address
+    assert [type(action) for action in msg2.actions] == [
+        SaveObjectAction,
+        GarbageCollectObjectAction,
+    ]
+    assert [action.id_at_location for action in msg2.actions] == [
+        action.id_at_location for action in actions
+    ]
+
+
+def test_pipeline_sends_one_batch() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+
+    x = th.tensor([1.0, 2.0, 3.0])
+    x_ptr = x.send(alice_client)
+
+    message_counter = alice.message_counter
+    with alice_client.pipeline():
+        y_ptr = x_ptr + 1
+        z_ptr = y_ptr * 2
+        w_ptr = z_ptr.sum()
+        # nothing has been sent yet
+        assert alice.message_counter == message_counter
+
+    # the three actions arrived in a single message
+    assert alice.message_counter == message_counter + 1
+    assert w_ptr.get() == ((x + 1) * 2).sum()
+
+
+def test_pipeline_flushes_before_reply_and_when_full() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+
+    x = th.tensor([1.0, 2.0, 3.0])
+    x_ptr = x.send(alice_client)
+
+    message_counter = alice.message_counter
+    # every + runs the method with the int sent inline
+    with alice_client.pipeline(max_batch_size=2):
+        y_ptr = x_ptr + 1
+        z_ptr = y_ptr + 1
+        # the batch was full
+        assert alice.message_counter == message_counter + 1
+
+        w_ptr = z_ptr + 1
+        # get has to flush the queue before asking for the result
+        assert th.equal(w_ptr.get(), x + 3)
+
+
+class FailingAction(ImmediateActionWithoutReply):
+    def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
+        raise ValueError("failing action")
+
+
+def test_batch_runs_past_failing_action() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+
+    id_at_location = UID()
+    actions = [
+        FailingAction(address=alice_client.address),
+        SaveObjectAction(
+            id_at_location=id_at_location,
+            obj=th.tensor([1, 2]),
+            address=alice_client.address,
+        ),
+    ]
+    msg = BatchedActionMessage(actions=actions, address=alice_client.address)
+    msg.execute_action(node=alice, verify_key=alice_client.verify_key)
+
+    # the action after the failing one still ran
+    assert id_at_location in alice.store
+
+
+def test_batch_rejects_actions_with_reply() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_client()
+
+    get_action = GetObjectAction(
+        id_at_location=UID(),
+        address=alice_client.address,
+        reply_to=alice_client.address,
+    )
+    with pytest.raises(TypeError):
+        BatchedActionMessage(actions=[get_action], address=alice_client.address)
+
+    batch = BatchedActionMessage(actions=[], address=alice_client.address)
+    with pytest.raises(TypeError):
+        BatchedActionMessage(actions=[batch], address=alice_client.address)
+
+
+def test_batch_rejects_actions_for_another_node() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+    bob = sy.VirtualMachine(name="bob")
+    bob_client = bob.get_root_client()
+
+    id_at_location = UID()
+    actions = [
+        SaveObjectAction(
+            id_at_location=id_at_location,
+            obj=th.tensor([1, 2]),
+            address=bob_client.address,
+        )
+    ]
+    with pytest.raises(ValueError):
+        BatchedActionMessage(actions=actions, address=alice_client.address)
+
+    # a batch forged on the wire is rejected when the receiving node deserializes it
+    batch = BatchedActionMessage(actions=actions, address=bob_client.address)
+    proto = batch._object2proto()
+    proto.address.CopyFrom(alice_client.address._object2proto())
+    with pytest.raises(ValueError):
+        BatchedActionMessage._proto2object(proto)
+    assert id_at_location not in alice.store
+
+    # a pipelining client doesn't queue actions for another node
+    with alice_client.pipeline():
+        assert not alice_client._queue_action(msg=actions[0])
+        assert alice_client._pipelined_actions == []
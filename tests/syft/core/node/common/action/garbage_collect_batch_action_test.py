@@ -0,0 +1,22 @@
+# syft absolute
+import syft as sy
+from syft.core.common.uid import UID
+from syft.core.io.address import Address
+from syft.core.io.location import SpecificLocation
+from syft.core.node.common.action.garbage_collect_batch_action import (
+    GarbageCollectBatchAction,
+)
+
+
+def test_garbage_collect_batch_action_serde() -> None:
+    uids = [UID() for _ in range(3)]
+    addr = Address(network=SpecificLocation(), device=SpecificLocation())
+
+    msg = GarbageCollectBatchAction(ids_at_location=uids, address=addr)
+
+    blob = msg.serialize()
+
+    msg2 = sy.deserialize(blob=blob)
+
+    assert msg2.ids_at_location == msg.ids_at_location
+    assert msg2.address == msg.address
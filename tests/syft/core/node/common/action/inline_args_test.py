@@ -0,0 +1,133 @@
+# third party
+import pytest
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.common.uid import UID
+from syft.core.node.common.action.function_or_constructor_action import (
+    RunFunctionOrConstructorAction,
+)
+from syft.core.node.common.action.inline_args import INLINE_MAX_BYTES
+from syft.core.node.common.action.inline_args import isinlineable
+from syft.core.node.common.action.run_class_method_action import RunClassMethodAction
+from syft.lib.python.util import downcast
+
+
+def test_isinlineable() -> None:
+    assert isinlineable(value=downcast(value=1))
+    assert isinlineable(value=downcast(value=0.5))
+    assert isinlineable(value=downcast(value=None))
+    assert isinlineable(value=downcast(value=[-1, 28 * 28]))
+    assert isinlineable(value=downcast(value={"dim": (1, 2)}))
+
+    # only downcast literals are sent inline
+    assert not isinlineable(value=1)
+    assert not isinlineable(value=th.tensor([1, 2, 3]))
+    assert not isinlineable(value=downcast(value="x" * (INLINE_MAX_BYTES + 1)))
+    assert not isinlineable(value=downcast(value=list(range(INLINE_MAX_BYTES))))
+
+
+def test_run_class_method_action_inline_args_serde() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_client()
+    x_ptr = th.tensor([[1, 2], [3, 4]]).send(alice_client)
+    y_ptr = th.tensor([1, 1]).send(alice_client)
+
+    msg = RunClassMethodAction(
+        path="torch.Tensor.add",
+        _self=x_ptr,
+        args=[y_ptr, downcast(value=2)],
+        kwargs={"alpha": downcast(value=3)},
+        id_at_location=UID(),
+        address=alice_client.address,
+        msg_id=UID(),
+    )
+
+    blob = msg.serialize()
+    msg2 = sy.deserialize(blob=blob)
+
+    assert msg2.args[0].id_at_location == y_ptr.id_at_location
+    assert msg2.args[1] == 2
+    assert msg2.kwargs == {"alpha": 3}
+    assert msg2.id_at_location == msg.id_at_location
+
+
+def test_literal_args_are_not_stored() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+    x_ptr = th.rand(2, 28, 28).send(alice_client)
+
+    sent = []
+    send = alice_client.send_immediate_msg_without_reply
+
+    def counting_send(msg: object) -> None:
+        sent.append(msg)
+        send(msg=msg)
+
+    alice_client.send_immediate_msg_without_reply = counting_send  # type: ignore
+
+    result_ptr = x_ptr.view(-1, 28 * 28).sum(dim=1)
+    sum_ptr = alice_client.torch.add(x_ptr, 1, alpha=2)
+
+    assert [type(msg) for msg in sent] == [
+        RunClassMethodAction,
+        RunClassMethodAction,
+        RunFunctionOrConstructorAction,
+    ]
+    assert result_ptr.get().shape == (2,)
+    assert sum_ptr.get().shape == (2, 28, 28)
+
+
+def test_big_literal_args_are_stored() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+    x_ptr = th.tensor([1.0, 2.0]).send(alice_client)
+
+    sent = []
+    send = alice_client.send_immediate_msg_without_reply
+
+    def counting_send(msg: object) -> None:
+        sent.append(msg)
+        send(msg=msg)
+
+    alice_client.send_immediate_msg_without_reply = counting_send  # type: ignore
+
+    values = [float(i) for i in range(INLINE_MAX_BYTES)]
+    result_ptr = x_ptr.new_tensor(values)
+
+    assert len(sent) == 2
+    assert result_ptr.get().shape == (INLINE_MAX_BYTES,)
+
+
+def test_run_class_method_action_rejects_big_inline_args() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+    x_ptr = th.tensor([1.0, 2.0]).send(alice_client)
+
+    values = downcast(value=[float(i) for i in range(INLINE_MAX_BYTES)])
+    msg = RunClassMethodAction(
+        path="torch.Tensor.new_tensor",
+        _self=x_ptr,
+        args=[values],
+        kwargs={},
+        id_at_location=UID(),
+        address=alice_client.address,
+        msg_id=UID(),
+    )
+
+    with pytest.raises(ValueError):
+        msg.execute_action(node=alice, verify_key=alice_client.verify_key)
+
+    msg = RunClassMethodAction(
+        path="torch.Tensor.new_tensor",
+        _self=x_ptr,
+        args=[],
+        kwargs={"data": values},
+        id_at_location=UID(),
+        address=alice_client.address,
+        msg_id=UID(),
+    )
+
+    with pytest.raises(ValueError):
+        msg.execute_action(node=alice, verify_key=alice_client.verify_key)
@@ -0,0 +1,96 @@
+# stdlib
+import time
+
+# third party
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.node.common.service.lease_service import LeaseRenewalMessage
+
+
+def test_lease_renewal_message_serde() -> None:
+    bob_vm = sy.VirtualMachine(name="Bob")
+    bob_vm_client = bob_vm.get_client()
+
+    msg = LeaseRenewalMessage(address=bob_vm_client.address, duration_secs=30.0)
+
+    blob = msg.serialize()
+    msg2 = sy.deserialize(blob=blob)
+
+    assert msg.id == msg2.id
+    assert msg.address == msg2.address
+    assert msg2.duration_secs == 30.0
+
+
+def test_expired_lease_is_reclaimed() -> None:
+    bob_vm = sy.VirtualMachine(name="Bob")
+    bob_vm_client = bob_vm.get_client()
+    other_client = bob_vm.get_client()
+
+    bob_vm_client.enable_leases(duration_secs=60.0)
+    ptr = th.tensor([1, 2, 3]).send(bob_vm_client)
+    result_ptr = ptr + ptr
+    other_ptr = th.tensor([4, 5, 6]).send(other_client)
+    assert len(bob_vm.store) == 3
+    assert len(bob_vm.leases.objects_of(verify_key=bob_vm_client.verify_key)) == 2
+
+    # the heartbeats keep the objects alive
+    assert bob_vm.leases.sweep(now=time.time() + 30) == 0
+    assert len(bob_vm.store) == 3
+
+    # the client went away without garbage collecting its pointers
+    bob_vm_client._lease_timer.cancel()  # type: ignore
+    ptr.gc_enabled = False
+    result_ptr.gc_enabled = False
+
+    assert bob_vm.leases.sweep(now=time.time() + 120) == 2
+    assert len(bob_vm.store) == 1
+    assert other_ptr.id_at_location in bob_vm.store
+    assert bob_vm.leases.reclaimed_objects == 2
+    assert bob_vm.leases.reclaimed_bytes == 2 * 3 * 8
+
+
+def test_disabled_lease_keeps_objects() -> None:
+    bob_vm = sy.VirtualMachine(name="Bob")
+    bob_vm_client = bob_vm.get_client()
+
+    bob_vm_client.enable_leases(duration_secs=60.0)
+    ptr = th.tensor([1, 2, 3]).send(bob_vm_client)
+    bob_vm_client.disable_leases()
+
+    assert bob_vm_client.verify_key not in bob_vm.leases
+    assert bob_vm.leases.sweep(now=time.time() + 120) == 0
+    assert ptr.id_at_location in bob_vm.store
+
+
+def test_garbage_collected_objects_are_released() -> None:
+    bob_vm = sy.VirtualMachine(name="Bob")
+    bob_vm_client = bob_vm.get_client()
+
+    bob_vm_client.enable_leases(duration_secs=60.0)
+    ptr = th.tensor([1, 2, 3]).send(bob_vm_client)
+    assert bob_vm.leases.stats["leased_objects"] == 1
+
+    del ptr
+    assert len(bob_vm.store) == 0
+    assert bob_vm.leases.stats["leased_objects"] == 0
+    bob_vm_client.disable_leases()
+
+
+def test_background_sweep() -> None:
+    bob_vm = sy.VirtualMachine(name="Bob")
+    bob_vm.leases.sweep_interval = 0.05
+    bob_vm_client = bob_vm.get_client()
+
+    bob_vm_client.enable_leases(duration_secs=0.1)
+    bob_vm_client._lease_timer.cancel()  # type: ignore
+    ptr = th.tensor([1, 2, 3]).send(bob_vm_client)
+    ptr.gc_enabled = False
+
+    # the client is gone, no more messages arrive and the node still reclaims
+    deadline = time.time() + 5
+    while len(bob_vm.store) > 0 and time.time() < deadline:
+        time.sleep(0.05)
+    assert len(bob_vm.store) == 0
+    assert bob_vm.leases.expired_leases == 1
@@ -0,0 +1,102 @@
+# stdlib
+import threading
+import time
+from typing import Any
+
+# third party
+import pytest
+import torch as th
+
+# syft absolute
+from syft.core.node.domain import Domain
+from syft.core.node.domain.request_future import RequestFuture
+from syft.core.node.domain.service import RequestStatus
+
+
+def accept_later(domain: Domain, client: Any, delay: float) -> threading.Thread:
+    def accept() -> None:
+        time.sleep(delay)
+        domain.requests[0].owner_client_if_available = client
+        domain.requests[0].accept()
+
+    thread = threading.Thread(target=accept)
+    thread.start()
+    return thread
+
+
+@pytest.mark.asyncio
+def test_status_is_pushed_on_a_virtual_connection() -> None:
+    domain = Domain(name="remote domain")
+    client = domain.get_root_client()
+    ptr = th.tensor([1, 2, 3]).send(client)
+
+    future = ptr.request(name="My Request", reason="push")
+    assert isinstance(future, RequestFuture)
+    assert future.pushed
+    assert not future.done()
+    assert future.status == RequestStatus.Pending
+
+    done = []
+    future.add_done_callback(done.append)
+    domain.requests[0].owner_client_if_available = client
+    domain.requests[0].deny()
+
+    assert future.done()
+    assert future.status == RequestStatus.Rejected
+    assert done == [future]
+
+
+@pytest.mark.asyncio
+def test_blocking_get_returns_when_accepted() -> None:
+    domain = Domain(name="remote domain")
+    client = domain.get_root_client()
+    ptr = th.tensor([1, 2, 3]).send(client)
+
+    thread = accept_later(domain=domain, client=client, delay=0.2)
+    start = time.time()
+    result = ptr.get(request_block=True, timeout_secs=10, name="My Request")
+    thread.join()
+
+    assert (result == th.tensor([1, 2, 3])).all()
+    assert time.time() - start < 5
+
+
+@pytest.mark.asyncio
+def test_status_is_polled_when_it_cannot_be_pushed() -> None:
+    domain = Domain(name="remote domain")
+    client = domain.get_root_client()
+    ptr = th.tensor([1, 2, 3]).send(client)
+    client.add_request_status_listener = lambda **kwargs: False
+
+    future = ptr.request(name="My Request", reason="poll")
+    assert not future.pushed
+
+    thread = accept_later(domain=domain, client=client, delay=0.2)
+    assert future.result(timeout_secs=10) == RequestStatus.Accepted
+    thread.join()
+
+
+@pytest.mark.asyncio
+def test_result_times_out_as_pending() -> None:
+    domain = Domain(name="remote domain")
+    client = domain.get_root_client()
+    ptr = th.tensor([1, 2, 3]).send(client)
+
+    future = ptr.request(name="My Request", reason="nobody answers")
+    assert future.result(timeout_secs=0.1) == RequestStatus.Pending
+    assert not future.done()
+    # the Domain forgets the listener of a future nobody waits on anymore
+    assert domain.requests._listeners == {}
+
+
+@pytest.mark.asyncio
+def test_duplicate_request_leaves_no_listener() -> None:
+    domain = Domain(name="remote domain")
+    client = domain.get_root_client()
+    ptr = th.tensor([1, 2, 3]).send(client)
+
+    first = ptr.request(name="My Request", reason="first")
+    # the same client asking again for the object is rejected without being queued
+    duplicate = ptr.request(name="My Request", reason="again")
+    assert duplicate.result(timeout_secs=1) == RequestStatus.Rejected
+    assert list(domain.requests._listeners.keys()) == [first.request_id]
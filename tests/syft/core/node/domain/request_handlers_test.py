@@ -0,0 +1,101 @@
+# stdlib
+import time
+from typing import Any
+from typing import List
+
+# third party
+import torch as th
+
+# syft absolute
+from syft.core.common.uid import UID
+from syft.core.node.domain import Domain
+from syft.core.node.domain import domain as domain_module
+from syft.core.node.domain.request_handlers import RequestHandlers
+from syft.core.node.domain.service import RequestMessage
+from syft.core.node.domain.service import RequestStatus
+
+
+def test_handlers_for_name_keep_their_order() -> None:
+    handlers = RequestHandlers()
+    everything = {"action": "deny", "timeout_secs": -1}
+    named = {"action": "accept", "name": "mean", "timeout_secs": -1}
+    other = {"action": "accept", "name": "sum", "timeout_secs": -1}
+    handlers.replace(handlers=[everything, named, other])
+
+    assert handlers.for_name(name="mean") == [everything, named]
+    assert handlers.for_name(name="max") == [everything]
+    assert handlers.handlers == [everything, named, other]
+
+
+def test_handlers_expire() -> None:
+    handlers = RequestHandlers()
+    now = time.time()
+    short = {"action": "accept", "timeout_secs": 1, "created_time": now}
+    forever = {"action": "accept", "timeout_secs": -1, "created_time": now}
+    handlers.replace(handlers=[short, forever])
+
+    handlers.expire(now=now + 2)
+    assert handlers.handlers == [forever]
+    assert handlers.for_name(name="") == [forever]
+
+
+def test_requests_are_handled_when_they_arrive() -> None:
+    domain = Domain(name="remote domain")
+    root_client = domain.get_root_client()
+    root_client.requests.add_handler(action="accept", name="accept me")
+    root_client.requests.add_handler(action="deny")
+    assert len(domain.request_handlers) == 2
+
+    accepted = th.tensor([1, 2, 3]).send(root_client)
+    accepted.request(name="Accept Me", reason="the named handler comes first")
+    denied = th.tensor([1, 2, 3]).send(root_client)
+    denied.request(name="Something else", reason="only the deny handler applies")
+
+    # no event loop has to run, the handlers ran when the requests arrived
+    assert len(domain.requests) == 0
+    # accepting replaces the permission the sender got when saving with the request id
+    obj = domain.store[accepted.id_at_location]
+    assert obj.read_permissions[root_client.verify_key] is not None
+    obj = domain.store[denied.id_at_location]
+    assert obj.read_permissions[root_client.verify_key] is None
+
+
+def test_new_handlers_apply_to_waiting_requests() -> None:
+    domain = Domain(name="remote domain")
+    root_client = domain.get_root_client()
+    ptr = th.tensor([1, 2, 3]).send(root_client)
+    ptr.request(name="My Request", reason="waiting for a handler")
+    request_id = domain.requests[0].id
+
+    root_client.requests.add_handler(action="accept")
+    assert domain.get_request_status(message_request_id=request_id) == (
+        RequestStatus.Accepted
+    )
+
+
+def test_failed_handler_is_retried(monkeypatch: Any) -> None:
+    monkeypatch.setattr(domain_module, "HANDLER_RETRY_SECS", 0.1)
+    domain = Domain(name="remote domain")
+    root_client = domain.get_root_client()
+
+    accept = domain._accept
+    calls: List[UID] = []
+
+    def failing_accept(request: RequestMessage) -> None:
+        calls.append(request.id)
+        if len(calls) == 1:
+            raise ValueError("failing accept")
+        accept(request=request)
+
+    monkeypatch.setattr(domain, "_accept", failing_accept)
+    root_client.requests.add_handler(action="accept")
+    ptr = th.tensor([1, 2, 3]).send(root_client)
+    ptr.request(name="My Request", reason="the first accept fails")
+    request_id = domain.requests[0].id
+    assert len(calls) == 1
+
+    time.sleep(1)
+    assert len(calls) == 2
+    assert domain.get_request_status(message_request_id=request_id) == (
+        RequestStatus.Accepted
+    )
@@ -0,0 +1,107 @@
+# stdlib
+import time
+
+# third party
+from nacl.signing import SigningKey
+import pytest
+import torch as th
+
+# syft absolute
+from syft.core.common import UID
+from syft.core.io.address import Address
+from syft.core.node.domain import Domain
+from syft.core.node.domain.request_queue import RequestQueue
+from syft.core.node.domain.service import RequestMessage
+from syft.core.node.domain.service import RequestStatus
+from syft.core.store.store_memory import MemoryStore
+from syft.core.store.storeable_object import StorableObject
+
+
+def make_request(object_id: UID, timeout_secs: int = -1) -> RequestMessage:
+    address = Address()
+    return RequestMessage(
+        object_id=object_id,
+        address=address,
+        owner_address=address,
+        requester_verify_key=SigningKey.generate().verify_key,
+        timeout_secs=timeout_secs,
+    )
+
+
+def test_request_queue_status() -> None:
+    store = MemoryStore()
+    obj = StorableObject(
+        id=UID(), data=th.tensor([1]), read_permissions={}, search_permissions={}
+    )
+    store[obj.id] = obj
+
+    queue = RequestQueue()
+    accepted = make_request(object_id=obj.id)
+    denied = make_request(object_id=obj.id)
+    queue.append(accepted)
+    queue.append(denied)
+
+    assert len(queue) == 2
+    assert queue[0] is accepted
+    assert queue.requests_for_object(object_id=obj.id) == [accepted, denied]
+    assert queue.has_request(
+        object_id=obj.id, requester_verify_key=denied.requester_verify_key
+    )
+    assert queue.get_status(request_id=accepted.id, store=store) == (
+        RequestStatus.Pending
+    )
+
+    queue.accept(request_id=accepted.id)
+    queue.remove(request_id=denied.id)
+    assert len(queue) == 0
+    assert queue.requests_for_object(object_id=obj.id) == []
+    assert queue.get_status(request_id=accepted.id, store=store) == (
+        RequestStatus.Accepted
+    )
+    assert queue.get_status(request_id=denied.id, store=store) == (
+        RequestStatus.Rejected
+    )
+
+    # the permission goes away with the object
+    store.delete(key=obj.id)
+    assert queue.get_status(request_id=accepted.id, store=store) == (
+        RequestStatus.Rejected
+    )
+
+
+def test_request_queue_expire() -> None:
+    queue = RequestQueue()
+    request = make_request(object_id=UID(), timeout_secs=1)
+    request.set_arrival_time(arrival_time=time.time())
+    forever = make_request(object_id=UID())
+    queue.append(request)
+    queue.append(forever)
+
+    queue.expire(now=time.time() + 2)
+    assert list(queue) == [forever]
+
+
+@pytest.mark.asyncio
+def test_domain_accepts_with_index() -> None:
+    domain = Domain(name="remote domain")
+    root_client = domain.get_root_client()
+    ptr = th.tensor([1, 2, 3]).send(root_client)
+    ptr.request(name="My Request", reason="I'd lke to see this pointer")
+
+    request = domain.requests[0]
+    assert domain.requests.get(request_id=request.id) is request
+    assert domain.get_request_status(message_request_id=request.id) == (
+        RequestStatus.Pending
+    )
+
+    assert domain.set_request_status(
+        message_request_id=request.id,
+        status=RequestStatus.Accepted,
+        client=root_client,
+    )
+    assert domain.get_request_status(message_request_id=request.id) == (
+        RequestStatus.Accepted
+    )
+    obj = domain.store[ptr.id_at_location]
+    assert obj.read_permissions[request.requester_verify_key] == request.id
+    assert len(domain.requests) == 0
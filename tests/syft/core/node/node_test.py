@@ -209,3 +209,26 @@ def test_send_message_from_network_client_to_vm() -> None:
     bob_network_client.send_immediate_msg_without_reply(
         msg=sy.ReprMessage(address=bob_vm.address)
     )
+
+
+def test_routing_header_must_match_message_address() -> None:
+    # Send ✉️ addressed to 🍰 2 with a routing header pointing at 🍰
+
+    bob_vm = sy.VirtualMachine(name="Bob")
+    bob_vm_client = bob_vm.get_client()
+    bob_vm.root_verify_key = bob_vm_client.verify_key  # inject 📡🔑 as 📍🗝
+
+    bob_vm_2 = sy.VirtualMachine(name="Bob 2")
+
+    sig_msg = sy.ReprMessage(address=bob_vm_2.address).sign(
+        signing_key=bob_vm_client.signing_key
+    )
+    sig_msg = sy.deserialize(blob=sig_msg.serialize(to_bytes=True), from_bytes=True)
+    sig_msg.address = bob_vm.address
+
+    # the header alone says the ✉️ is for 🍰, the signed ✉️ says otherwise
+    assert bob_vm.message_is_for_me(msg=sig_msg)
+    with pytest.raises(Exception, match="routing header"):
+        bob_vm.process_message(
+            msg=sig_msg, router=bob_vm.immediate_msg_without_reply_router
+        )
@@ -0,0 +1,138 @@
+"""In this test suite, we evaluate the ObjectSearchEngine, the indexes the stores
+keep to find objects by the type of their data, their tags and who can search
+for them.
+"""
+
+# stdlib
+from pathlib import Path
+from typing import Any
+from typing import List
+
+# third party
+from nacl.signing import SigningKey
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.common import UID
+from syft.core.common.group import VerifyAll
+from syft.core.node.common.service.obj_search_permission_service import (
+    ImmediateObjectSearchPermissionUpdateService,
+)
+from syft.core.node.common.service.obj_search_permission_service import (
+    ObjectSearchPermissionUpdateMessage,
+)
+from syft.core.search.search_engine import ObjectSearchEngine
+from syft.core.store import DiskObjectStore
+from syft.core.store import TieredObjectStore
+from syft.core.store.store_memory import MemoryStore
+from syft.core.store.storeable_object import StorableObject
+
+
+def generate_obj(
+    data: Any, tags: List[str], search_permissions: dict
+) -> StorableObject:
+    return StorableObject(
+        id=UID(),
+        data=data,
+        tags=tags,
+        read_permissions={},
+        search_permissions=search_permissions,
+    )
+
+
+def test_query_intersects_indexes() -> None:
+    alice = SigningKey.generate().verify_key
+    bob = SigningKey.generate().verify_key
+
+    tensor = generate_obj(th.tensor([1]), ["a", "b"], {alice: None})
+    public = generate_obj(th.tensor([2]), ["a"], {VerifyAll(): None})
+    integer = generate_obj(sy.lib.python.Int(3), ["b"], {bob: None})
+
+    engine = ObjectSearchEngine()
+    for obj in [tensor, public, integer]:
+        engine.add(key=obj.id, obj=obj)
+
+    assert engine.query() == [tensor.id, public.id, integer.id]
+    assert engine.query(obj_type=th.Tensor) == [tensor.id, public.id]
+    assert engine.query(tags=["a", "b"]) == [tensor.id]
+    assert engine.query(tags=["c"]) == []
+
+    # a different VerifyAll instance, like one which was deserialized, still counts
+    assert engine.query(searchable_by=alice) == [tensor.id, public.id]
+    assert engine.query(searchable_by=bob, obj_type=th.Tensor) == [public.id]
+
+    # updating keeps the order but replaces the indexed values
+    tensor.tags = ["c"]
+    engine.add(key=tensor.id, obj=tensor)
+    assert engine.query(tags=["c"]) == [tensor.id]
+    assert engine.query(tags=["a"]) == [public.id]
+    assert engine.query() == [tensor.id, public.id, integer.id]
+
+    engine.remove(key=public.id)
+    assert engine.query(searchable_by=bob) == [integer.id]
+    assert engine._by_all == set()
+
+    engine.clear()
+    assert len(engine) == 0
+    assert engine.query() == []
+
+
+def test_stores_keep_index_up_to_date(tmp_path: Path) -> None:
+    alice = SigningKey.generate().verify_key
+    stores = [
+        MemoryStore(),
+        DiskObjectStore(db_path=str(tmp_path / "disk.sqlite")),
+        TieredObjectStore(max_memory_bytes=8, db_path=str(tmp_path / "tier.sqlite")),
+    ]
+
+    for store in stores:
+        objs = [
+            generate_obj(th.tensor([i]), ["x"], {alice: UID()}) for i in range(3)
+        ] + [generate_obj(sy.lib.python.Int(1), ["x"], {})]
+        for obj in objs:
+            store[obj.id] = obj
+
+        found = store.search(obj_type=th.Tensor, searchable_by=alice)
+        assert [obj.id for obj in found] == [obj.id for obj in objs[:3]]
+        assert len(store.get_objects_of_type(obj_type=sy.lib.python.Int)) == 1
+
+        store.delete(key=objs[0].id)
+        assert [obj.id for obj in store.search(tags=["x"])] == [
+            obj.id for obj in objs[1:]
+        ]
+
+        store.clear()
+        assert store.search() == []
+
+
+def test_disk_store_indexes_existing_objects(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "store.sqlite")
+    store = DiskObjectStore(db_path=db_path)
+    obj = generate_obj(th.tensor([1]), ["x"], {VerifyAll(): UID()})
+    store[obj.id] = obj
+    store.close()
+
+    reopened = DiskObjectStore(db_path=db_path)
+    assert [o.id for o in reopened.search(tags=["x"])] == [obj.id]
+    reopened.close()
+
+
+def test_permission_updates_are_indexed() -> None:
+    bob_phone = sy.Device(name="Bob's iPhone")
+    bob_phone_client = bob_phone.get_client()
+    ptr = th.tensor([1, 2, 3]).send(bob_phone_client)
+    assert bob_phone.store.search(searchable_by=bob_phone.verify_key) == []
+
+    for add_instead_of_remove in [True, False]:
+        msg = ObjectSearchPermissionUpdateMessage(
+            add_instead_of_remove=add_instead_of_remove,
+            target_verify_key=bob_phone_client.verify_key,
+            target_object_id=ptr.id_at_location,
+            address=bob_phone_client.address,
+        )
+        ImmediateObjectSearchPermissionUpdateService.process(
+            node=bob_phone, msg=msg, verify_key=bob_phone.verify_key
+        )
+        found = bob_phone.store.search(searchable_by=bob_phone.verify_key)
+        assert len(found) == (1 if add_instead_of_remove else 0)
@@ -0,0 +1,139 @@
+"""In this test suite, we evaluate the DiskObjectStore class, in particular the
+write-behind group commits and the streaming iteration.
+"""
+
+# stdlib
+from pathlib import Path
+import sqlite3
+import time
+from typing import List
+from typing import Tuple
+
+# third party
+import pytest
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.common import UID
+from syft.core.store.store_disk import DiskObjectStore
+from syft.core.store.storeable_object import StorableObject
+
+
+def generate_id_obj(
+    data: th.Tensor, description: str, tags: List[str]
+) -> Tuple[UID, StorableObject]:
+    id = UID()
+    obj = StorableObject(id=id, data=data, description=description, tags=tags)
+
+    return id, obj
+
+
+def committed_rows(db_path: str) -> int:
+    # a second connection only sees what has been committed
+    connection = sqlite3.connect(db_path)
+    try:
+        return connection.execute('SELECT COUNT(*) FROM "unnamed"').fetchone()[0]
+    finally:
+        connection.close()
+
+
+def test_write_behind_commits_by_count(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "store.sqlite")
+    store = DiskObjectStore(db_path=db_path, journal_mode="WAL", commit_every=3)
+
+    for i in range(2):
+        id, obj = generate_id_obj(
+            data=th.Tensor([i]), description="Dummy tensor", tags=["dummy"]
+        )
+        store[id] = obj
+
+    # the writes can be read back before they are committed
+    assert len(store) == 2
+    assert th.equal(store[id].data, th.Tensor([1]))
+    assert committed_rows(db_path=db_path) == 0
+
+    id, obj = generate_id_obj(
+        data=th.Tensor([2]), description="Dummy tensor", tags=["dummy"]
+    )
+    store[id] = obj
+    store.db.commit(blocking=True)
+    assert committed_rows(db_path=db_path) == 3
+    store.close()
+
+
+def test_write_behind_commits_by_time(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "store.sqlite")
+    store = DiskObjectStore(
+        db_path=db_path, journal_mode="WAL", commit_every=100, commit_interval=0.05
+    )
+
+    id, obj = generate_id_obj(
+        data=th.Tensor([1]), description="Dummy tensor", tags=["dummy"]
+    )
+    store[id] = obj
+
+    deadline = time.time() + 5
+    while committed_rows(db_path=db_path) == 0 and time.time() < deadline:
+        time.sleep(0.05)
+    assert committed_rows(db_path=db_path) == 1
+    store.close()
+
+
+def test_streaming_iteration(tmp_path: Path) -> None:
+    store = DiskObjectStore(db_path=str(tmp_path / "store.sqlite"))
+    id1, obj1 = generate_id_obj(
+        data=th.Tensor([1, 2, 3]), description="Dummy tensor", tags=["dummy"]
+    )
+    id2, obj2 = generate_id_obj(
+        data=sy.lib.python.List([1, 2, 3]), description="Dummy list", tags=["dummy"]
+    )
+    store[id1] = obj1
+    store[id2] = obj2
+
+    keys = store.iterkeys()
+    assert next(keys) == id1
+    assert next(keys) == id2
+
+    tensors = store.iter_objects_of_type(obj_type=th.Tensor)
+    assert next(tensors).id == id1
+    assert list(tensors) == []
+
+    assert [key for key, _ in store.iteritems()] == [id1, id2]
+    assert store.keys() == [id1, id2]
+    store.close()
+
+
+def test_delete_many_is_one_write(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "store.sqlite")
+    store = DiskObjectStore(db_path=db_path, journal_mode="WAL", commit_every=2)
+    ids = []
+    for i in range(3):
+        id, obj = generate_id_obj(
+            data=th.Tensor([i]), description="Dummy tensor", tags=["dummy"]
+        )
+        store[id] = obj
+        ids.append(id)
+    store.commit(blocking=True)
+
+    store.delete_many(keys=ids[:2] + [UID()])
+    assert store.keys() == [ids[2]]
+    assert [obj.id for obj in store.search(tags=["dummy"])] == [ids[2]]
+    # both deletions wait for the same group commit
+    assert store._uncommitted_writes == 1
+    store.close()
+
+
+def test_synchronous_pragma(tmp_path: Path) -> None:
+    for synchronous in ["off", "NORMAL", 2]:
+        store = DiskObjectStore(
+            db_path=str(tmp_path / f"{synchronous}.sqlite"), synchronous=synchronous
+        )
+        store.close()
+
+    with pytest.raises(ValueError):
+        DiskObjectStore(
+            db_path=str(tmp_path / "bad.sqlite"), synchronous="OFF; DROP TABLE unnamed"
+        )
+    with pytest.raises(ValueError):
+        DiskObjectStore(db_path=str(tmp_path / "bad.sqlite"), synchronous=4)
@@ -0,0 +1,134 @@
+"""In this test suite, we evaluate the TieredObjectStore class, which keeps the
+most recently used objects in memory and spills the rest to disk.
+"""
+
+# stdlib
+from pathlib import Path
+import threading
+from typing import List
+
+# third party
+from nacl.signing import SigningKey
+import torch as th
+
+# syft absolute
+from syft.core.common import UID
+from syft.core.store import ObjectStore
+from syft.core.store import TieredObjectStore
+from syft.core.store.storeable_object import StorableObject
+
+# a float tensor of 16 elements is 64 bytes
+BUDGET = 150
+
+
+def generate_obj(value: float) -> StorableObject:
+    # like SaveObjectAction, give each object its own permission dicts
+    return StorableObject(
+        id=UID(),
+        data=th.full((16,), value),
+        tags=["dummy"],
+        read_permissions={},
+        search_permissions={},
+    )
+
+
+def test_spill_and_promote(tmp_path: Path) -> None:
+    store = TieredObjectStore(
+        max_memory_bytes=BUDGET, db_path=str(tmp_path / "store.sqlite")
+    )
+    assert isinstance(store, ObjectStore)
+
+    objs = [generate_obj(value=float(i)) for i in range(3)]
+    for obj in objs:
+        store[obj.id] = obj
+
+    # only two fit in memory, the oldest was spilled to disk
+    assert len(store) == 3
+    assert store.stats["memory_objects"] == 2
+    assert store.evictions == 1
+    assert objs[0].id in store
+
+    # reading it back moves it to memory and spills the least recently used one
+    assert th.equal(store[objs[0].id].data, th.full((16,), 0.0))
+    assert store.misses == 1
+    assert store.evictions == 2
+
+    assert th.equal(store[objs[0].id].data, th.full((16,), 0.0))
+    assert store.hits == 1
+    assert store.memory_bytes <= BUDGET
+
+    assert set(store.keys()) == {obj.id for obj in objs}
+    assert len(store.get_objects_of_type(obj_type=th.Tensor)) == 3
+
+
+def test_changes_in_memory_are_spilled(tmp_path: Path) -> None:
+    store = TieredObjectStore(
+        max_memory_bytes=BUDGET, db_path=str(tmp_path / "store.sqlite")
+    )
+    obj = generate_obj(value=1.0)
+    store[obj.id] = obj
+    verify_key = SigningKey.generate().verify_key
+    store[obj.id].read_permissions[verify_key] = UID()
+
+    for _ in range(2):
+        other = generate_obj(value=2.0)
+        store[other.id] = other
+
+    assert obj.id not in store._objects
+    assert verify_key in store[obj.id].read_permissions
+
+    store.delete(key=obj.id)
+    assert obj.id not in store
+    assert len(store) == 2
+
+    store.clear()
+    assert len(store) == 0
+
+
+def test_delete_many(tmp_path: Path) -> None:
+    store = TieredObjectStore(
+        max_memory_bytes=BUDGET, db_path=str(tmp_path / "store.sqlite")
+    )
+    objs = [generate_obj(value=float(i)) for i in range(4)]
+    for obj in objs:
+        store[obj.id] = obj
+    # the first objects were spilled to disk
+    assert objs[0].id not in store._objects
+
+    store.delete_many(keys=[objs[0].id, objs[3].id])
+    assert set(store.keys()) == {objs[1].id, objs[2].id}
+    assert [obj.id for obj in store.search(tags=["dummy"])] == [
+        objs[1].id,
+        objs[2].id,
+    ]
+
+
+def test_concurrent_promotion(tmp_path: Path) -> None:
+    store = TieredObjectStore(
+        max_memory_bytes=BUDGET, db_path=str(tmp_path / "store.sqlite")
+    )
+    objs = [generate_obj(value=float(i)) for i in range(8)]
+    for obj in objs:
+        store[obj.id] = obj
+
+    errors: List[Exception] = []
+
+    def use_all(offset: int) -> None:
+        try:
+            for i in range(200):
+                obj = objs[(i + offset) % len(objs)]
+                # every get promotes an object and evicts another one
+                assert th.equal(store[obj.id].data, obj.data)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=use_all, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert set(store.keys()) == {obj.id for obj in objs}
+    assert store.memory_bytes == sum(store._sizes.values())
+    assert store.memory_bytes <= BUDGET
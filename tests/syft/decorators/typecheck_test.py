@@ -8,6 +8,8 @@ from typing import Union
 import pytest
 
 # syft absolute
+from syft.decorators import get_typecheck_mode
+from syft.decorators import set_typecheck_mode
 from syft.decorators import syft_decorator
 
 
@@ -82,3 +84,50 @@ def test_ret_type() -> None:
         func()
 
     assert str(e.value) == "type of the return value must be int; got float instead"
+
+
+def test_typecheck_compile_once_mode() -> None:
+    @syft_decorator(typechecking=True)
+    def func(x: int, y: int) -> int:
+        return x + y
+
+    previous_mode = get_typecheck_mode()
+    set_typecheck_mode(mode="compile_once")
+    try:
+        assert func(x=1, y=2) == 3
+
+        with pytest.raises(TypeError) as e:
+            func(x="test", y=2)
+
+        assert str(e.value) == 'type of argument "x" must be int; got str instead'
+    finally:
+        set_typecheck_mode(mode=previous_mode)
+
+
+def test_typecheck_off_mode() -> None:
+    @syft_decorator(typechecking=True)
+    def func(x: int, y: int) -> int:
+        return x + y
+
+    previous_mode = get_typecheck_mode()
+    set_typecheck_mode(mode="off")
+    try:
+        # functions decorated before the mode changed skip the checks
+        assert func(x="a", y="b") == "ab"
+        assert func("a", "b") == "ab"
+
+        # functions decorated now are not wrapped at all
+        def raw(x: int) -> int:
+            return x
+
+        assert syft_decorator(typechecking=True)(raw) is raw
+    finally:
+        set_typecheck_mode(mode=previous_mode)
+
+    with pytest.raises(TypeError):
+        func(x="a", y="b")
+
+
+def test_typecheck_unknown_mode() -> None:
+    with pytest.raises(ValueError):
+        set_typecheck_mode(mode="sometimes")
@@ -0,0 +1,127 @@
+# third party
+import pytest
+
+# syft absolute
+from syft.grid.connections.framing import Deframer
+from syft.grid.connections.framing import Framer
+from syft.grid.connections.framing import FramingError
+from syft.grid.connections.framing import MESSAGE
+from syft.grid.connections.framing import NO_REQUEST
+from syft.grid.connections.framing import RECORD
+from syft.grid.connections.framing import REPLY
+from syft.grid.connections.framing import REQUEST
+
+
+def test_small_messages_share_a_frame() -> None:
+    messages = [
+        (MESSAGE, NO_REQUEST, b"a" * 100),
+        (REQUEST, bytes(range(16)), b"b" * 200),
+        (REPLY, bytes(range(16)), b""),
+    ]
+    frames = list(Framer().frames(messages))
+
+    assert len(frames) == 1
+    assert len(frames[0]) == 3 * RECORD.size + 300
+    assert Deframer().feed(frame=frames[0]) == messages
+
+
+def test_large_message_is_chunked() -> None:
+    payload = bytes(range(256)) * 1000
+    framer = Framer(max_frame_size=4096)
+    deframer = Deframer()
+
+    frames = list(framer.frames([(MESSAGE, NO_REQUEST, payload)]))
+    assert len(frames) == len(payload) // (4096 - RECORD.size) + 1
+    assert all(len(frame) <= 4096 for frame in frames)
+
+    # the message is complete with its last frame
+    for frame in frames[:-1]:
+        assert deframer.feed(frame=frame) == []
+        assert len(deframer) == 1
+    assert deframer.feed(frame=frames[-1]) == [(MESSAGE, NO_REQUEST, payload)]
+    assert len(deframer) == 0
+
+
+def test_messages_after_a_large_one_fill_its_last_frame() -> None:
+    messages = [
+        (MESSAGE, NO_REQUEST, b"a" * 5000),
+        (MESSAGE, NO_REQUEST, b"b" * 100),
+        (MESSAGE, NO_REQUEST, b"c" * 5000),
+    ]
+    framer = Framer(max_frame_size=4096)
+    deframer = Deframer()
+
+    frames = list(framer.frames(messages))
+    assert len(frames) == 3
+    received = [message for frame in frames for message in deframer.feed(frame=frame)]
+    assert received == messages
+
+
+def test_interleaved_records() -> None:
+    framer = Framer(max_frame_size=2048)
+    deframer = Deframer()
+    large = [(MESSAGE, NO_REQUEST, b"a" * 5000), (MESSAGE, NO_REQUEST, b"b" * 5000)]
+
+    first = framer.frames(large[:1])
+    second = framer.frames(large[1:])
+    received = []
+    for frames in zip(first, second):
+        for frame in frames:
+            received.extend(deframer.feed(frame=frame))
+
+    assert received == large
+
+
+def test_message_too_large() -> None:
+    framer = Framer(max_frame_size=2048)
+    deframer = Deframer(max_message_size=4096)
+
+    frames = list(framer.frames([(MESSAGE, NO_REQUEST, b"a" * 5000)]))
+    deframer.feed(frame=frames[0])
+    deframer.feed(frame=frames[1])
+    with pytest.raises(FramingError):
+        deframer.feed(frame=frames[2])
+    assert len(deframer) == 0
+
+
+def test_too_many_partial_messages() -> None:
+    deframer = Deframer(max_partial_messages=2)
+    framers = [Framer(max_frame_size=2048) for _ in range(3)]
+    # every framer numbers its messages from 0, so number them apart
+    for number, framer in enumerate(framers):
+        framer._next_number = number
+
+    first_frames = [
+        next(framer.frames([(MESSAGE, NO_REQUEST, b"a" * 5000)])) for framer in framers
+    ]
+    deframer.feed(frame=first_frames[0])
+    deframer.feed(frame=first_frames[1])
+    with pytest.raises(FramingError):
+        deframer.feed(frame=first_frames[2])
+    assert len(deframer) == 0
+
+
+def test_truncated_record_header() -> None:
+    framer = Framer(max_frame_size=2048)
+    deframer = Deframer()
+    frames = list(framer.frames([(MESSAGE, NO_REQUEST, b"a" * 5000)]))
+    deframer.feed(frame=frames[0])
+    (small,) = framer.frames([(MESSAGE, NO_REQUEST, b"b")])
+
+    # a whole record followed by the first bytes of the header of another one
+    with pytest.raises(FramingError):
+        deframer.feed(frame=small + bytes(RECORD.size - 1))
+    assert len(deframer) == 0
+
+
+def test_record_longer_than_frame() -> None:
+    deframer = Deframer()
+    (frame,) = Framer().frames([(MESSAGE, NO_REQUEST, b"a" * 100)])
+
+    with pytest.raises(FramingError):
+        deframer.feed(frame=frame[:-1])
+
+
+def test_max_frame_size_too_small() -> None:
+    with pytest.raises(ValueError):
+        Framer(max_frame_size=RECORD.size)
@@ -0,0 +1,109 @@
+# stdlib
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import threading
+from typing import Any
+from typing import Generator
+from typing import Set
+
+# third party
+from nacl.signing import SigningKey
+import pytest
+
+# syft absolute
+from syft.core.common.serde.deserialize import _deserialize
+from syft.core.io.address import Address
+from syft.core.node.network.client import NetworkClient
+from syft.core.node.network.network import Network
+from syft.grid.connections.http_connection import HTTPConnection
+from syft.grid.services.signaling_service import RegisterDuetPeerService
+from syft.grid.services.signaling_service import RegisterNewPeerMessage
+
+# the client ports of the TCP connections the node was sent messages over
+client_ports: Set[int] = set()
+
+
+@pytest.fixture(scope="module")
+def url() -> Generator[str, None, None]:
+    # a Network node behind an HTTP/1.1 server which keeps connections alive
+    network = Network(name="test-net")
+    network.immediate_services_with_reply.append(RegisterDuetPeerService)
+    network._register_services()
+
+    class NodeRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            metadata = network.get_metadata_for_client()
+            self.reply(data=metadata.serialize().SerializeToString())
+
+        def do_POST(self) -> None:
+            client_ports.add(self.client_address[1])
+            data = self.rfile.read(int(self.headers["Content-Length"]))
+            msg = _deserialize(blob=data, from_bytes=True)
+            reply = network.recv_immediate_msg_with_reply(msg=msg)
+            self.reply(data=reply.serialize(to_bytes=True))
+
+        def reply(self, data: bytes) -> None:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), NodeRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def register(conn: HTTPConnection) -> RegisterNewPeerMessage:
+    spec_location, _, _ = NetworkClient.deserialize_client_metadata_from_node(
+        metadata=conn._get_metadata()
+    )
+    return RegisterNewPeerMessage(
+        address=Address(network=spec_location), reply_to=Address()
+    ).sign(signing_key=SigningKey.generate())
+
+
+def test_keep_alive(url: str) -> None:
+    conn = HTTPConnection(url=url)
+    msg = register(conn)
+    client_ports.clear()
+
+    for _ in range(5):
+        reply = conn.send_immediate_msg_with_reply(msg=msg)
+        assert reply.message.peer_id
+
+    # the messages were sent over one connection
+    assert len(client_ports) == 1
+    conn.close()
+
+
+def test_concurrent(url: str) -> None:
+    conn = HTTPConnection(url=url, pool_size=4, concurrent=True)
+    msg = register(conn)
+
+    futures = [conn.submit_immediate_msg_with_reply(msg=msg) for _ in range(16)]
+    peer_ids = {future.result().message.peer_id for future in futures}
+    assert len(peer_ids) == 16
+    conn.close()
+
+
+def test_submit_without_concurrent_mode(url: str) -> None:
+    conn = HTTPConnection(url=url)
+    msg = register(conn)
+
+    future = conn.submit_immediate_msg_with_reply(msg=msg)
+    assert future.done()
+    assert future.result().message.peer_id
+    conn.close()
+
+
+def test_invalid_pool_size(url: str) -> None:
+    with pytest.raises(ValueError):
+        HTTPConnection(url=url, pool_size=0)
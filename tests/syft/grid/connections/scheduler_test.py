@@ -0,0 +1,123 @@
+# stdlib
+from typing import Any
+from typing import List
+from typing import Optional
+
+# third party
+from nacl.signing import SigningKey
+import torch as th
+
+# syft absolute
+from syft.core.common.uid import UID
+from syft.core.io.address import Address
+from syft.core.node.common.action.garbage_collect_object_action import (
+    GarbageCollectObjectAction,
+)
+from syft.core.node.common.action.get_object_action import GetObjectAction
+from syft.core.node.common.action.save_object_action import SaveObjectAction
+from syft.core.node.common.service.obj_search_service import ObjectSearchMessage
+from syft.grid.connections.framing import Deframer
+from syft.grid.connections.framing import Framer
+from syft.grid.connections.framing import MESSAGE
+from syft.grid.connections.framing import NO_REQUEST
+from syft.grid.connections.framing import REQUEST
+from syft.grid.connections.scheduler import BULK
+from syft.grid.connections.scheduler import CONTROL
+from syft.grid.connections.scheduler import EVENTUAL
+from syft.grid.connections.scheduler import Scheduler
+from syft.grid.connections.scheduler import priority_of
+from syft.grid.connections.scheduler import stored_id
+
+signing_key = SigningKey.generate()
+address = Address()
+
+
+def save(id_at_location: UID) -> Any:
+    # a message larger than a frame
+    return SaveObjectAction(
+        id_at_location=id_at_location, obj=th.rand(2 ** 16), address=address
+    ).sign(signing_key=signing_key)
+
+
+def search() -> Any:
+    return ObjectSearchMessage(address=address, reply_to=address).sign(
+        signing_key=signing_key
+    )
+
+
+def put(scheduler: Scheduler, kind: int, msg: Any) -> None:
+    priority = priority_of(kind=kind, msg=msg)
+    stored = stored_id(msg=msg) if priority == BULK else None
+    scheduler.put(message=(kind, NO_REQUEST, msg), priority=priority, stored=stored)
+
+
+def sent(scheduler: Scheduler, deframer: Optional[Deframer] = None) -> List[bytes]:
+    # the payloads of the messages in the order they are completely sent
+    deframer = Deframer() if deframer is None else deframer
+    payloads = []
+    while True:
+        next_frame = scheduler.next_frame()
+        if next_frame is None:
+            return payloads
+        payloads += [payload for _, _, payload in deframer.feed(next_frame[1])]
+
+
+def test_priority_of() -> None:
+    id_at_location = UID()
+    gc = GarbageCollectObjectAction(id_at_location=UID(), address=address).sign(
+        signing_key=signing_key
+    )
+
+    assert priority_of(kind=REQUEST, msg=search()) == CONTROL
+    assert priority_of(kind=MESSAGE, msg=gc) == EVENTUAL
+    assert priority_of(kind=MESSAGE, msg=save(id_at_location)) == BULK
+    assert stored_id(msg=save(id_at_location)) == id_at_location.value.bytes
+    assert stored_id(msg=search()) is None
+
+
+def test_control_overtakes_bulk() -> None:
+    scheduler = Scheduler(framer=Framer())
+    upload = save(UID())
+    request = search()
+
+    deframer = Deframer()
+    put(scheduler, kind=MESSAGE, msg=upload)
+    priority, frame = scheduler.next_frame()  # type: ignore
+    assert priority == BULK
+    assert deframer.feed(frame) == []
+
+    # the request is sent before the rest of the upload
+    put(scheduler, kind=REQUEST, msg=request)
+    assert len(scheduler) == 2
+    assert sent(scheduler, deframer) == [request.to_bytes(), upload.to_bytes()]
+    assert len(scheduler) == 0
+
+
+def test_dependent_message_waits_for_bulk() -> None:
+    scheduler = Scheduler(framer=Framer())
+    id_at_location = UID()
+    upload = save(id_at_location)
+    get = GetObjectAction(
+        id_at_location=id_at_location, address=address, reply_to=address
+    ).sign(signing_key=signing_key)
+    request = search()
+
+    put(scheduler, kind=MESSAGE, msg=upload)
+    put(scheduler, kind=REQUEST, msg=get)
+    put(scheduler, kind=REQUEST, msg=request)
+
+    assert sent(scheduler) == [request.to_bytes(), upload.to_bytes(), get.to_bytes()]
+
+    # once the upload is sent, nothing waits for it anymore
+    put(scheduler, kind=MESSAGE, msg=save(UID()))
+    put(scheduler, kind=REQUEST, msg=get)
+    assert sent(scheduler)[0] == get.to_bytes()
+
+
+def test_bulk_messages_keep_their_order() -> None:
+    scheduler = Scheduler(framer=Framer())
+    uploads = [save(UID()) for _ in range(3)]
+    for upload in uploads:
+        put(scheduler, kind=MESSAGE, msg=upload)
+
+    assert sent(scheduler) == [upload.to_bytes() for upload in uploads]
@@ -1,5 +1,12 @@
 # stdlib
+import asyncio
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import json
+import threading
+import time
+from typing import Any
+from typing import List
+from typing import Tuple
 
 # third party
 from aiortc import RTCSessionDescription
@@ -7,13 +14,48 @@ from aiortc.contrib.signaling import object_from_string
 from nacl.signing import SigningKey
 import nest_asyncio
 import pytest
+import torch as th
 
 # syft absolute
+from syft.core.common.message import SignedMessage
+from syft.core.common.message import verify_signed_messages
+from syft.core.common.uid import UID
+from syft.core.io.address import Address
+from syft.core.io.location import SpecificLocation
+from syft.core.node.common.action.get_object_action import GetObjectAction
+from syft.core.node.common.action.save_object_action import SaveObjectAction
+from syft.core.node.common.service.obj_search_service import ObjectSearchMessage
 from syft.core.node.common.service.repr_service import ReprMessage
 from syft.core.node.domain.domain import Domain
+from syft.grid.connections import webrtc
+from syft.grid.connections.framing import Framer
+from syft.grid.connections.framing import MAX_FRAME_SIZE
+from syft.grid.connections.framing import MESSAGE
+from syft.grid.connections.framing import NO_REQUEST
+from syft.grid.connections.framing import REPLY
 from syft.grid.connections.webrtc import WebRTCConnection
 
 
+def get_loopback_pair() -> Tuple[WebRTCConnection, WebRTCConnection, SigningKey]:
+    # a connection to a Domain over an aiortc pair in this process
+    signing_key = SigningKey.generate()
+    domain = Domain(name="responder")
+    domain.root_verify_key = signing_key.verify_key
+
+    requester = WebRTCConnection(node=Domain(name="requester"))
+    responder = WebRTCConnection(node=domain)
+
+    offer_payload = asyncio.run(requester._set_offer())
+    answer_payload = asyncio.run(responder._set_answer(payload=offer_payload))
+    asyncio.run(requester._process_answer(payload=answer_payload))
+
+    deadline = time.time() + 10
+    while requester.channel.readyState != "open" or responder.channel is None:  # type: ignore
+        assert time.time() < deadline
+        time.sleep(0.01)
+    return requester, responder, signing_key
+
+
 def get_signing_key() -> SigningKey:
     # return a the signing key used to sign the get_signed_message_bytes fixture
     key = "e89ff2e651b42393b6ecb5956419088781309d953d72bd73a0968525a3a6a951"
@@ -73,6 +115,172 @@ async def test_consumer_request() -> None:
     test_domain.root_verify_key = signing_key.verify_key
     signed_msg = msg.sign(signing_key=signing_key)
 
-    msg_bin = signed_msg.to_bytes()
+    (msg_bin,) = Framer().frames([(MESSAGE, NO_REQUEST, signed_msg.to_bytes())])
+
+    await webrtc_node.consumer(msg=msg_bin)
+
+
+def test_concurrent_requests() -> None:
+    requester, responder, signing_key = get_loopback_pair()
+    errors: List[Exception] = []
+
+    def send_requests() -> None:
+        # every reply goes to the reply_to address of its own request
+        reply_to = Address(vm=SpecificLocation())
+        try:
+            for _ in range(5):
+                msg = ObjectSearchMessage(
+                    address=responder.node.address, reply_to=reply_to
+                ).sign(signing_key=signing_key)
+                reply = requester.send_immediate_msg_with_reply(msg=msg)
+                assert reply.message.address == reply_to
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=send_requests) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert requester._pending == {}
+
+    requester.close()
+    responder._loop_thread.join(timeout=5)
+    assert not responder._loop_thread.is_alive()
+
+
+@pytest.mark.asyncio
+async def test_consumer_verifies_frame_in_batch(monkeypatch: Any) -> None:
+    nest_asyncio.apply()
+
+    test_domain = Domain(name="test")
+    webrtc_node = WebRTCConnection(node=test_domain)
+    signing_key = SigningKey.generate()
+    test_domain.root_verify_key = signing_key.verify_key
+
+    batches: List[int] = []
+
+    def verify(msgs: List[SignedMessage]) -> List[bool]:
+        batches.append(len(msgs))
+        return verify_signed_messages(msgs)
+
+    monkeypatch.setattr(webrtc, "verify_signed_messages", verify)
 
+    # the messages of one frame are verified together, before any is handled
+    msgs = [
+        ReprMessage(address=test_domain.address).sign(signing_key=signing_key)
+        for _ in range(3)
+    ]
+    (msg_bin,) = Framer().frames(
+        [(MESSAGE, NO_REQUEST, msg.to_bytes()) for msg in msgs]
+    )
     await webrtc_node.consumer(msg=msg_bin)
+    assert batches == [3]
+
+
+@pytest.mark.asyncio
+async def test_consumer_handles_frame_when_batch_verification_fails(
+    monkeypatch: Any,
+) -> None:
+    nest_asyncio.apply()
+
+    test_domain = Domain(name="test")
+    webrtc_node = WebRTCConnection(node=test_domain)
+    signing_key = SigningKey.generate()
+    test_domain.root_verify_key = signing_key.verify_key
+
+    def verify(msgs: List[SignedMessage]) -> List[bool]:
+        raise RuntimeError("verification pool is gone")
+
+    monkeypatch.setattr(webrtc, "verify_signed_messages", verify)
+
+    handled: List[SignedMessage] = []
+    recv = test_domain.recv_immediate_msg_without_reply
+
+    def counting_recv(msg: SignedMessage) -> None:
+        handled.append(msg)
+        recv(msg=msg)
+
+    monkeypatch.setattr(test_domain, "recv_immediate_msg_without_reply", counting_recv)
+
+    # the failure is awaited and logged, each message is still verified and handled
+    msgs = [
+        ReprMessage(address=test_domain.address).sign(signing_key=signing_key)
+        for _ in range(2)
+    ]
+    (msg_bin,) = Framer().frames(
+        [(MESSAGE, NO_REQUEST, msg.to_bytes()) for msg in msgs]
+    )
+    await webrtc_node.consumer(msg=msg_bin)
+    assert len(handled) == 2
+
+
+@pytest.mark.asyncio
+async def test_stray_reply_is_dropped() -> None:
+    nest_asyncio.apply()
+
+    test_domain = Domain(name="test")
+    webrtc_node = WebRTCConnection(node=test_domain)
+
+    signing_key = SigningKey.generate()
+    msg = ReprMessage(address=test_domain.address).sign(signing_key=signing_key)
+    (msg_bin,) = Framer().frames([(REPLY, bytes(range(16)), msg.to_bytes())])
+    await webrtc_node.consumer(msg=msg_bin)
+    assert webrtc_node._pending == {}
+
+
+def test_request_times_out() -> None:
+    test_domain = Domain(name="test")
+    webrtc_node = WebRTCConnection(node=test_domain)
+    signing_key = SigningKey.generate()
+
+    # there is no peer, so the reply never comes
+    msg = ObjectSearchMessage(
+        address=test_domain.address, reply_to=test_domain.address
+    ).sign(signing_key=signing_key)
+    with pytest.raises(FutureTimeoutError):
+        webrtc_node.send_immediate_msg_with_reply(msg=msg, timeout=0.1)
+
+    # the request is forgotten on the loop once it was cancelled
+    deadline = time.time() + 5
+    while webrtc_node._pending != {}:
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+def test_large_message() -> None:
+    requester, responder, signing_key = get_loopback_pair()
+    sent_frames: List[int] = []
+    send = requester.channel.send  # type: ignore
+
+    def counting_send(data: bytes) -> None:
+        sent_frames.append(len(data))
+        send(data)
+
+    requester.channel.send = counting_send  # type: ignore
+
+    # a tensor of 8 MB is sent in frames of a bounded size
+    tensor = th.rand(2 ** 21)
+    id_at_location = UID()
+    msg = SaveObjectAction(
+        id_at_location=id_at_location, obj=tensor, address=responder.node.address
+    ).sign(signing_key=signing_key)
+    requester.send_immediate_msg_without_reply(msg=msg)
+
+    # a request for the tensor doesn't overtake the message storing it
+    get = GetObjectAction(
+        id_at_location=id_at_location,
+        address=responder.node.address,
+        reply_to=Address(),
+        delete_obj=False,
+    ).sign(signing_key=signing_key)
+    reply = requester.send_immediate_msg_with_reply(msg=get)
+
+    assert th.equal(reply.message.obj.data, tensor)
+    assert len(sent_frames) > 8 * 1024 * 1024 // MAX_FRAME_SIZE
+    assert max(sent_frames) <= MAX_FRAME_SIZE
+    assert len(responder._deframer) == 0
+
+    requester.close()
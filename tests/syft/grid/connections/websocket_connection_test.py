@@ -0,0 +1,179 @@
+# stdlib
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait
+import time
+from typing import Any
+from typing import Generator
+from typing import Tuple
+
+# third party
+from nacl.signing import SigningKey
+import pytest
+
+# syft absolute
+from syft.core.io.address import Address
+from syft.core.node.network.network import Network
+from syft.grid.connections import websocket_connection
+from syft.grid.connections.websocket_connection import WebSocketConnection
+from syft.grid.connections.websocket_connection import WebSocketServer
+from syft.grid.services.signaling_service import AnswerPullRequestMessage
+from syft.grid.services.signaling_service import OfferPullRequestMessage
+from syft.grid.services.signaling_service import PullSignalingService
+from syft.grid.services.signaling_service import PushSignalingService
+from syft.grid.services.signaling_service import RegisterDuetPeerService
+from syft.grid.services.signaling_service import RegisterNewPeerMessage
+from syft.grid.services.signaling_service import SignalingOfferMessage
+from syft.grid.services.signaling_service import SignalingRequestsNotFound
+
+Peer = Tuple[WebSocketConnection, SigningKey, str]
+
+
+@pytest.fixture
+def server() -> Generator[WebSocketServer, None, None]:
+    network = Network(name="test-net")
+    network.immediate_services_without_reply.append(PushSignalingService)
+    network.immediate_services_with_reply.append(PullSignalingService)
+    network.immediate_services_with_reply.append(RegisterDuetPeerService)
+    network._register_services()
+
+    server = WebSocketServer(node=network)
+    server.start()
+    yield server
+    server.stop()
+
+
+def connect(server: WebSocketServer) -> Peer:
+    conn = WebSocketConnection(url=f"ws://127.0.0.1:{server.port}")
+    signing_key = SigningKey.generate()
+    reply = conn.send_immediate_msg_with_reply(
+        msg=RegisterNewPeerMessage(
+            address=server.node.address, reply_to=Address()
+        ).sign(signing_key=signing_key)
+    )
+    return conn, signing_key, reply.message.peer_id
+
+
+def offer(server: WebSocketServer, host: Peer, target: Peer) -> SignalingOfferMessage:
+    return SignalingOfferMessage(
+        address=server.node.address,
+        payload="SDP",
+        host_metadata=server.node.get_metadata_for_client(),
+        target_peer=target[2],
+        host_peer=host[2],
+    )
+
+
+def pull_offer(server: WebSocketServer, host: Peer, target: Peer) -> Any:
+    conn, signing_key, peer_id = host
+    return conn.send_immediate_msg_with_reply(
+        msg=OfferPullRequestMessage(
+            address=server.node.address,
+            target_peer=target[2],
+            host_peer=peer_id,
+            reply_to=Address(),
+        ).sign(signing_key=signing_key)
+    )
+
+
+def test_pull_is_answered_once_pushed(server: WebSocketServer) -> None:
+    alice, bob = connect(server), connect(server)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        reply = executor.submit(pull_offer, server, bob, alice)
+        # the pull request is held until there is an offer for bob
+        wait([reply], timeout=0.2)
+        assert not reply.done()
+
+        msg = offer(server, host=alice, target=bob)
+        alice[0].send_immediate_msg_without_reply(msg=msg.sign(signing_key=alice[1]))
+        assert reply.result(timeout=5).message == msg
+
+    alice[0].close()
+    bob[0].close()
+    # the listeners of closed websockets are removed
+    deadline = time.time() + 5
+    while server.node.signaling_listeners and time.time() < deadline:
+        time.sleep(0.01)
+    assert server.node.signaling_listeners == {}
+
+
+def test_pull_is_answered_when_pushed_elsewhere(server: WebSocketServer) -> None:
+    alice, bob = connect(server), connect(server)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        reply = executor.submit(pull_offer, server, bob, alice)
+        wait([reply], timeout=0.2)
+        assert not reply.done()
+
+        # like an offer pushed over HTTP
+        msg = offer(server, host=alice, target=bob)
+        server.node.recv_immediate_msg_without_reply(msg=msg.sign(signing_key=alice[1]))
+        assert reply.result(timeout=5).message == msg
+
+    alice[0].close()
+    bob[0].close()
+
+
+def test_pull_finds_message_pushed_before(server: WebSocketServer) -> None:
+    alice, bob = connect(server), connect(server)
+
+    msg = offer(server, host=alice, target=bob)
+    alice[0].send_immediate_msg_without_reply(msg=msg.sign(signing_key=alice[1]))
+    assert pull_offer(server, host=bob, target=alice).message == msg
+
+    # other pulls aren't answered by it
+    conn, signing_key, peer_id = alice
+    answer_pull = AnswerPullRequestMessage(
+        address=server.node.address,
+        target_peer=bob[2],
+        host_peer=peer_id,
+        reply_to=Address(),
+    ).sign(signing_key=signing_key)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        reply = executor.submit(conn.send_immediate_msg_with_reply, msg=answer_pull)
+        alice[0].close()
+        with pytest.raises(ConnectionError):
+            reply.result(timeout=5)
+
+    bob[0].close()
+
+
+def test_held_pull_expires(server: WebSocketServer, monkeypatch: Any) -> None:
+    monkeypatch.setattr(websocket_connection, "HOLD_TIMEOUT", 0.1)
+    alice, bob = connect(server), connect(server)
+
+    # nothing is pushed, the held pull is answered with not found after all
+    reply = pull_offer(server, host=bob, target=alice)
+    assert isinstance(reply.message, SignalingRequestsNotFound)
+
+    # a push after that doesn't go to the expired pull
+    msg = offer(server, host=alice, target=bob)
+    alice[0].send_immediate_msg_without_reply(msg=msg.sign(signing_key=alice[1]))
+    assert pull_offer(server, host=bob, target=alice).message == msg
+
+    alice[0].close()
+    bob[0].close()
+
+
+def test_request_times_out(server: WebSocketServer) -> None:
+    alice, bob = connect(server), connect(server)
+    conn, signing_key, peer_id = bob
+
+    pull = OfferPullRequestMessage(
+        address=server.node.address,
+        target_peer=alice[2],
+        host_peer=peer_id,
+        reply_to=Address(),
+    ).sign(signing_key=signing_key)
+    with pytest.raises(FutureTimeoutError):
+        conn.send_immediate_msg_with_reply(msg=pull, timeout=0.2)
+
+    # the request which timed out is forgotten
+    deadline = time.time() + 5
+    while conn._pending and time.time() < deadline:
+        time.sleep(0.01)
+    assert conn._pending == {}
+
+    alice[0].close()
+    bob[0].close()
@@ -139,6 +139,8 @@ def test_torch_garbage_method_creates_pointer() -> None:
     assert len(alice.store) == 1
 
     gc.disable()
-    x_ptr + 2
+    y_ptr = x_ptr + 2
 
-    assert len(alice.store) == 3
+    # the literal 2 is sent inline with the call, only the result is stored
+    assert len(alice.store) == 2
+    assert y_ptr.get().equal(x + 2)
@@ -0,0 +1,98 @@
+# stdlib
+import sys
+
+# third party
+import numpy as np
+import pytest
+import torch as th
+
+# syft absolute
+from syft.lib.torch.tensor_util import protobuf_tensor_deserializer
+from syft.lib.torch.tensor_util import protobuf_tensor_serializer
+from syft.proto.lib.torch.tensor_pb2 import TensorData
+
+raw_dtypes = [
+    th.uint8,
+    th.int8,
+    th.int16,
+    th.int32,
+    th.int64,
+    th.float16,
+    th.float32,
+    th.float64,
+    th.bool,
+    th.bfloat16,
+]
+
+
+@pytest.mark.parametrize("dtype", raw_dtypes)
+def test_raw_buffer_serde(dtype: th.dtype) -> None:
+    x = (th.arange(-12, 12) % 7).reshape(2, 3, 4).to(dtype)
+
+    proto = protobuf_tensor_serializer(x)
+
+    assert proto.byte_order == sys.byteorder
+    assert len(proto.data) == x.numel() * x.element_size()
+    assert len(proto.contents_float32) == 0
+
+    x2 = protobuf_tensor_deserializer(proto)
+
+    assert x2.dtype == x.dtype
+    assert x2.shape == x.shape
+    assert th.equal(x2, x)
+
+
+@pytest.mark.parametrize("dtype", [th.qint8, th.quint8, th.qint32])
+def test_raw_buffer_quantized_serde(dtype: th.dtype) -> None:
+    x = th.quantize_per_tensor(th.rand(3, 4), scale=0.1, zero_point=3, dtype=dtype)
+
+    x2 = protobuf_tensor_deserializer(protobuf_tensor_serializer(x))
+
+    assert x2.dtype == x.dtype
+    assert x2.q_scale() == pytest.approx(x.q_scale())
+    assert x2.q_zero_point() == x.q_zero_point()
+    assert th.equal(x2.int_repr(), x.int_repr())
+
+
+def test_raw_buffer_non_contiguous_serde() -> None:
+    x = th.arange(12.0).reshape(3, 4).t()
+    assert not x.is_contiguous()
+
+    x2 = protobuf_tensor_deserializer(protobuf_tensor_serializer(x))
+
+    assert th.equal(x2, x)
+    # the deserialized tensor must own writable memory
+    x2.add_(1)
+    assert th.equal(x2, x + 1)
+
+
+def test_raw_buffer_swapped_byte_order() -> None:
+    x = th.tensor([1.5, -2.25, 3.0], dtype=th.float64)
+    other_order = "big" if sys.byteorder == "little" else "little"
+    swapped = x.numpy().astype(x.numpy().dtype.newbyteorder())
+
+    proto = protobuf_tensor_serializer(x)
+    proto.byte_order = other_order
+    proto.data = swapped.tobytes()
+
+    assert th.equal(protobuf_tensor_deserializer(proto), x)
+
+
+def test_repeated_contents_still_readable() -> None:
+    proto = TensorData(dtype="float32", shape=[2, 2])
+    proto.contents_float32.extend([1.0, 2.0, 3.0, 4.0])
+
+    x = protobuf_tensor_deserializer(proto)
+
+    assert th.equal(x, th.tensor([[1.0, 2.0], [3.0, 4.0]]))
+
+    proto = TensorData(
+        dtype="qint8", shape=[3], is_quantized=True, scale=0.5, zero_point=1
+    )
+    proto.contents_qint8.extend([1, 3, 5])
+
+    x = protobuf_tensor_deserializer(proto)
+
+    assert x.dtype == th.qint8
+    assert th.equal(x.int_repr(), th.tensor([1, 3, 5], dtype=th.int8))
+    assert np.allclose(x.dequantize().numpy(), [0.0, 1.0, 2.0])
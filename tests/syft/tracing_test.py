@@ -0,0 +1,85 @@
+# third party
+from loguru import logger
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.tracing import Tracer
+from syft.tracing import tracer
+
+
+def test_disabled_tracer_does_not_format() -> None:
+    assert tracer.enabled is False
+
+    calls = []
+
+    def message() -> str:
+        calls.append(1)
+        return "formatted"
+
+    local_tracer = Tracer()
+    # a disabled tracer neither formats nor records anything
+    local_tracer.trace(event="test", message=message, value=0)
+    assert calls == []
+    assert local_tracer.get_events() == []
+
+    local_tracer.configure(record=True)
+    local_tracer.trace(event="test", message=message, value=1)
+
+    # recording keeps the fields and never formats the message
+    assert calls == []
+    assert local_tracer.get_events()[0].fields == {"value": 1}
+
+    local_tracer.configure(record=False)
+    assert local_tracer.enabled is False
+
+
+def test_tracer_ring_buffer_is_bounded() -> None:
+    local_tracer = Tracer(buffer_size=3)
+    local_tracer.configure(record=True)
+
+    for i in range(5):
+        local_tracer.trace(event=f"event_{i % 2}", message=str, i=i)
+
+    assert [e.fields["i"] for e in local_tracer.get_events()] == [2, 3, 4]
+    assert [e.fields["i"] for e in local_tracer.get_events(event="event_0")] == [2, 4]
+
+    local_tracer.configure(buffer_size=2)
+    assert [e.fields["i"] for e in local_tracer.get_events()] == [3, 4]
+
+    local_tracer.clear()
+    assert local_tracer.get_events() == []
+
+
+def test_tracer_records_node_events() -> None:
+    alice = sy.VirtualMachine(name="alice")
+    alice_client = alice.get_root_client()
+
+    tracer.configure(record=True)
+    try:
+        ptr = th.tensor([1, 2, 3]).send(alice_client)
+    finally:
+        tracer.configure(record=False)
+
+    events = tracer.get_events(event="node.recv_immediate_msg_without_reply")
+    tracer.clear()
+
+    assert len(events) == 1
+    assert events[0].fields["node"] == "alice"
+    assert events[0].fields["msg_type"] == "SaveObjectAction"
+    assert ptr.get_copy() is not None
+
+
+def test_tracer_logs_through_loguru() -> None:
+    lines = []
+    handler_id = logger.add(lines.append, level="DEBUG", format="{message}")
+    tracer.configure(log=True)
+    try:
+        alice = sy.VirtualMachine(name="alice")
+        alice_client = alice.get_root_client()
+        th.tensor([1, 2, 3]).send(alice_client)
+    finally:
+        tracer.configure(log=False)
+        logger.remove(handler_id)
+
+    assert any(line.startswith("> Received without Reply") for line in lines)